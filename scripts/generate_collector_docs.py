@@ -308,8 +308,8 @@ def generate_markdown(collectors: list[dict[str, Any]]) -> str:
     lines.append("This page summarizes the collectors that ship with the exporter.")
     lines.append("")
     lines.append(
-        "Each collector owns one or more scheduler endpoint groups and runs its own"
-        " group-clocked loop; the adaptive scheduler solves a per-group interval (floored"
+        "Each collector owns one or more scheduler endpoint groups and is run by the"
+        " central dispatcher when one is due; the adaptive scheduler solves a per-group interval (floored"
         " at that group's volatility floor) from the configured request budget, so cadence"
         " is derived rather than assigned from a fixed tier. See the"
         " [Scheduler Architecture](../observability/scheduler.md) page for details."
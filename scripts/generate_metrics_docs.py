@@ -25,6 +25,9 @@ EXCLUDED_CLASS_NAMES = {
 CONDITIONAL_NOTES = {
     "ClientsCollector": "Requires MERAKI_EXPORTER_CLIENTS__ENABLED=true",
     "WebhookHandler": "Requires MERAKI_EXPORTER_WEBHOOKS__ENABLED=true",
+    "WebhookRefreshCoordinator": (
+        "Requires MERAKI_EXPORTER_WEBHOOKS__ENABLED=true and WEBHOOKS__REFRESH_ON_EVENTS=true"
+    ),
 }
 
 INTERNAL_OWNERS = {
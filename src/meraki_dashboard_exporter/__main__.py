@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import sys
 
-import uvicorn
 from pydantic import ValidationError
 
 from .core.config import Settings
@@ -174,7 +173,9 @@ def main() -> None:
     if check_mode:
         _run_config_check(settings, probe=probe)
 
-    # Import the app creation function directly
+    # Server-only imports are deferred so --help/--check stay fast.
+    import uvicorn
+
     from .app import create_app
 
     # Reuse the already-built settings so Settings() is constructed exactly once
@@ -14,6 +14,7 @@ import meraki
 from prometheus_client import Counter
 
 from ..core.api_facade import MerakiApiFacade
+from ..core.concurrency_limiter import sdk_executor_workers
 from ..core.constants.metrics_constants import CollectorMetricName
 from ..core.logging import get_logger
 from ..core.metrics import LabelName
@@ -119,8 +120,10 @@ class AsyncMerakiClient:
         # This pool size is the real global concurrency ceiling for blocking
         # SDK calls (the per-tier concurrency_limit* knobs are bounded by it);
         # the former ``_semaphore`` (declared, never acquired) was removed.
+        # With the adaptive concurrency limiter enabled the pool is sized to
+        # its ceiling and the limiter bounds in-flight calls below that.
         try:
-            workers = int(getattr(settings.api, "executor_workers", 10))
+            workers = sdk_executor_workers(settings)
         except TypeError, ValueError:
             workers = 10
         self._executor = ThreadPoolExecutor(
@@ -10,7 +10,7 @@ from collections.abc import AsyncIterator
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import Any, cast
 
 import psutil  # type: ignore[import-untyped]
 from fastapi import FastAPI, HTTPException, Response
@@ -23,13 +23,14 @@ from starlette.requests import Request
 
 from .__version__ import __version__
 from .api.client import AsyncMerakiClient
-from .collectors.manager import CollectorManager
+from .collectors.manager import CollectorManager, calculate_collector_admission_limit
 from .core.build_info import register_build_info
 from .core.cardinality import CardinalityMonitor, setup_cardinality_endpoint
 from .core.config import Settings
 from .core.config_logger import log_startup_summary
 from .core.constants.metrics_constants import CollectorMetricName
 from .core.discovery import DiscoveryService, resolve_org_id
+from .core.dispatcher import CollectionDispatcher
 from .core.error_handling import StartupConfigurationError
 from .core.logging import get_logger, setup_logging
 from .core.metric_expiration import MetricExpirationManager
@@ -42,11 +43,9 @@ from .core.webhook_handler import (
     WebhookHandler,
     enforce_webhook_security,
 )
+from .core.webhook_refresh import CollectorRunner, WebhookRefreshCoordinator
 from .services.status import StatusService, build_effective_config
 
-if TYPE_CHECKING:
-    from .core.collector import MetricCollector
-
 logger = get_logger(__name__)
 
 # #277: cadence for the lightweight exporter process self-resource sampler
@@ -219,7 +218,10 @@ class ExporterApp:
         self._shutdown_lock = asyncio.Lock()
         self._shutdown_complete = False
         self._expiration_started = False
-        self._collector_tasks: dict[str, asyncio.Task[Any]] = {}
+        # Central earliest-deadline-first dispatcher driving every collector;
+        # created once the initial collection has run.
+        self._dispatcher: CollectionDispatcher | None = None
+        self._dispatch_task: asyncio.Task[None] | None = None
         self._start_time = time.time()
         self._discovery_summary: dict[str, Any] | None = None
 
@@ -239,17 +241,30 @@ class ExporterApp:
             # so a device_down webhook can flip meraki_device_up ahead of the poll.
             # Absent/disabled `device` collector => None => count-only degradation.
             device_collector = self.collector_manager.get_collector_by_class_name("DeviceCollector")
+            # Event-driven invalidation + targeted re-polls; its tasks join the
+            # background set so shutdown cancels a pending re-poll.
+            event_refresher = (
+                WebhookRefreshCoordinator(
+                    self.settings,
+                    cast("CollectorRunner", self.collector_manager),
+                    background_tasks=self._background_tasks,
+                )
+                if self.settings.webhooks.refresh_on_events
+                else None
+            )
             self.webhook_handler = WebhookHandler(
                 self.settings,
                 device_state_applier=cast(
                     "DeviceStateApplier | None",
                     device_collector,
                 ),
+                event_refresher=event_refresher,
             )
             logger.info(
                 "Webhook receiver enabled",
                 require_secret=self.settings.webhooks.require_secret,
                 device_state_fast_path=device_collector is not None,
+                event_refresh=event_refresher is not None,
             )
 
         # Initialize status service for /status endpoint
@@ -561,10 +576,10 @@ class ExporterApp:
                 logger.exception("Discovery failed, continuing with normal operation")
                 self._discovery_summary = {"errors": ["discovery_failed"]}
 
-            # Run a sequential first collection to avoid startup bursts
+            # Run a bounded-concurrency first collection to avoid startup bursts
             initial_collection_completed = False
             try:
-                logger.info("Starting initial sequential collection")
+                logger.info("Starting initial collection")
                 await self.collector_manager.collect_initial()
                 self._first_collection_complete = True
                 initial_collection_completed = True
@@ -578,23 +593,18 @@ class ExporterApp:
             # Emit one-time startup summary after discovery + initial collection
             self._log_startup_summary()
 
-            # Start one group-clocked collection loop per collector (#631). Each
-            # loop wakes at its collector's earliest-due endpoint group, so every
-            # group runs at exactly its solved interval.
-            for collector in self.collector_manager.collectors:
-                task = asyncio.create_task(
-                    self._collector_loop(
-                        collector, initial_run_completed=initial_collection_completed
-                    )
-                )
-                self._collector_tasks[collector.__class__.__name__] = task
-                self._background_tasks.add(task)
-                task.add_done_callback(self._background_tasks.discard)
+            # Start the central dispatcher: one task runs every collector when
+            # its earliest-due endpoint group is due (#631), most urgent first.
+            task = asyncio.create_task(
+                self._dispatch_loop(initial_run_completed=initial_collection_completed)
+            )
+            self._dispatch_task = task
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
 
             logger.info(
-                "Started per-collector group-clocked loops",
-                task_count=len(self._collector_tasks),
-                collectors=list(self._collector_tasks.keys()),
+                "Started collection dispatcher",
+                collectors=[c.__class__.__name__ for c in self.collector_manager.collectors],
             )
 
             # Start the adaptive scheduler resolve loop (#617). Same background-
@@ -628,70 +638,38 @@ class ExporterApp:
             self._startup_configuration_error = error
             logger.error("Startup configuration validation failed", error=str(error))
 
-    async def _interruptible_sleep(self, seconds: float) -> None:
-        """Sleep in 1s increments, waking early on shutdown."""
-        remaining = float(seconds)
-        while remaining > 0 and not self._shutdown_event.is_set():
-            wait_time = min(1.0, remaining)
-            await asyncio.sleep(wait_time)
-            remaining -= wait_time
-
-    async def _collector_loop(
-        self,
-        collector: MetricCollector,
-        *,
-        initial_run_completed: bool,
-    ) -> None:
-        """Group-clocked collection loop for a single collector (#631).
-
-        Each iteration runs the collector once (its gates open exactly for the
-        groups that are due), then sleeps until the earliest-due of its enabled
-        endpoint groups, capped at one scheduler resolve period so re-solves /
-        AIMD / re-enabled groups are picked up promptly. Spurious early wakes are
-        cheap no-ops (the gates say "not due" and the loop sleeps again).
+    async def _dispatch_loop(self, *, initial_run_completed: bool) -> None:
+        """Run the central collection dispatcher until shutdown.
+
+        Every collector is dispatched when its earliest-due enabled endpoint
+        group is due (its gates then open exactly for the due groups), capped
+        at one scheduler resolve period so re-solves / AIMD / re-enabled groups
+        are picked up promptly. Admission (``max_concurrent_collectors``) and
+        priority are decided by the dispatcher alone.
 
         Parameters
         ----------
-        collector : MetricCollector
-            The collector this loop drives.
         initial_run_completed : bool
-            When True (the initial sequential collection already ran), the first
-            steady-state wake is delayed by the collector's deterministic phase
-            offset so collectors don't all fire together; skipped otherwise so
-            readiness after a cold start / restart stays fast (#591).
+            When True (the initial collection already ran), each
+            collector's first steady-state dispatch is delayed by its
+            deterministic phase offset so collectors don't all fire together;
+            skipped otherwise so readiness after a cold start / restart stays
+            fast (#591).
 
         """
-        manager = self.collector_manager
-        scheduler = manager.scheduler
-        name = collector.__class__.__name__
-        resolve_cap = float(self.settings.scheduler.resolve_interval_seconds)
-
+        dispatcher = CollectionDispatcher(
+            self.collector_manager,
+            max_concurrency=calculate_collector_admission_limit(self.settings),
+            resolve_cap_seconds=float(self.settings.scheduler.resolve_interval_seconds),
+        )
+        for collector in self.collector_manager.collectors:
+            delay = collector.phase_offset_seconds() if initial_run_completed else 0.0
+            dispatcher.add(collector, delay)
+        self._dispatcher = dispatcher
         try:
-            if initial_run_completed:
-                await self._interruptible_sleep(collector.phase_offset_seconds())
-
-            while not self._shutdown_event.is_set():
-                try:
-                    await manager.run_collector_once(collector)
-                except asyncio.CancelledError:
-                    logger.info("Collector loop cancelled", collector=name)
-                    raise
-                except Exception:
-                    # run_collector_once already swallows per-collector failures at
-                    # its own boundary (honest health via /ready + failure_streak);
-                    # anything reaching here is unexpected — log and keep looping.
-                    logger.exception("Error during collector run", collector=name)
-
-                # Sleep until this collector's earliest-due group, capped at one
-                # resolve period. None (no schedulable groups) => just re-check.
-                group_names = [g.name for g in collector.get_endpoint_groups()]
-                due_in = scheduler.seconds_until_due(group_names)
-                wait_seconds = resolve_cap if due_in is None else min(due_in, resolve_cap)
-                # Floor at 1s so a just-past due time can't spin the loop.
-                await self._interruptible_sleep(max(1.0, wait_seconds))
-
+            await dispatcher.run(self._shutdown_event)
         except asyncio.CancelledError:
-            logger.info("Collector loop cancelled, exiting cleanly", collector=name)
+            logger.info("Collection dispatcher cancelled, exiting cleanly")
             raise
 
     async def _wait_for_first_collection(self) -> None:
@@ -802,6 +780,9 @@ class ExporterApp:
             scheduler.resolve(shape)
             # Refresh per-collector cadence gauges to reflect the new intervals.
             self.collector_manager._emit_cadence_gauges()
+            # Collectors whose groups became due sooner are pulled forward.
+            if self._dispatcher is not None:
+                self._dispatcher.reschedule()
 
         logger.debug(
             "Starting scheduler resolve loop",
@@ -825,7 +806,7 @@ class ExporterApp:
                 except Exception:
                     logger.exception("Scheduler resolve loop iteration failed")
 
-                # Interruptible wait in 1s increments (mirrors the tier loops).
+                # Interruptible wait in 1s increments so shutdown is prompt.
                 remaining_time = check_interval
                 while remaining_time > 0 and not self._shutdown_event.is_set():
                     wait_time = min(1.0, remaining_time)
@@ -1045,10 +1026,13 @@ class ExporterApp:
         async def readiness() -> JSONResponse:
             """Readiness probe - returns 200 when initial collection is complete.
 
-            Returns 503 until every collector owning an enabled priority-<=3
-            endpoint group has completed a successful run (#631). Config-only
-            collectors (all priority-4 groups) are excluded so readiness probes
-            aren't blocked waiting on slow config data.
+            Returns 503 until ``collectors.readiness_quorum`` of the collectors
+            owning an enabled priority-<=3 endpoint group (all, by default)
+            have completed a successful run (#631). Config-only collectors (all
+            priority-4 groups) are excluded so readiness probes aren't blocked
+            waiting on slow config data. The body lists, per organization,
+            whether its inventory is warm and which gating endpoint groups are
+            serving fresh data.
             """
             exporter = app.state.exporter
             manager = exporter.collector_manager
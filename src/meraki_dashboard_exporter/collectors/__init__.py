@@ -1,12 +1,24 @@
-"""Metric collectors for Meraki Dashboard data."""
+"""Metric collectors for Meraki Dashboard data.
 
-from .alerts import AlertsCollector
-from .clients import ClientsCollector
-from .config import ConfigCollector
-from .device import DeviceCollector
-from .mt_sensor import MTSensorCollector
-from .network_health import NetworkHealthCollector  # noqa: F401
-from .organization import OrganizationCollector
+Collector classes are resolved lazily from the registry manifest, so importing
+this package (e.g. for ``collectors.manager``) does not import every collector.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from ..core.registry import COLLECTOR_MANIFEST
+
+if TYPE_CHECKING:
+    from .alerts import AlertsCollector
+    from .clients import ClientsCollector
+    from .config import ConfigCollector
+    from .device import DeviceCollector
+    from .mt_sensor import MTSensorCollector
+    from .network_health import NetworkHealthCollector
+    from .organization import OrganizationCollector
 
 __all__ = [
     "AlertsCollector",
@@ -17,3 +29,11 @@ __all__ = [
     "OrganizationCollector",
     "MTSensorCollector",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a collector class on first access."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{COLLECTOR_MANIFEST[name]}", __name__)
+    return getattr(module, name)
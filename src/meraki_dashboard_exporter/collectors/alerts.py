@@ -243,17 +243,20 @@ class AlertsCollector(MetricCollector):
         # the whole per-org assurance fan-out is skipped this heartbeat.
         if self._should_run_group(EndpointGroupName.ALERTS_ASSURANCE):
             # Collect alerts for each organization (bounded concurrency)
-            org_results = await process_in_batches_with_errors(
-                attempted_org_ids,
-                lambda org_id: self._collect_org_alerts(org_id, org_names.get(org_id, "unknown")),
-                batch_size=self.settings.api.network_batch_size,
-                delay_between_batches=self.settings.api.batch_delay,
-                item_description="organization alerts",
-                error_context_func=lambda org_id: {
-                    "org_id": org_id,
-                    "org_name": org_names.get(org_id, "unknown"),
-                },
-            )
+            with self._measure_group(EndpointGroupName.ALERTS_ASSURANCE):
+                org_results = await process_in_batches_with_errors(
+                    attempted_org_ids,
+                    lambda org_id: self._collect_org_alerts(
+                        org_id, org_names.get(org_id, "unknown")
+                    ),
+                    batch_size=self.settings.api.network_batch_size,
+                    delay_between_batches=self.settings.api.batch_delay,
+                    item_description="organization alerts",
+                    error_context_func=lambda org_id: {
+                        "org_id": org_id,
+                        "org_name": org_names.get(org_id, "unknown"),
+                    },
+                )
 
             # Count successful collections
             for _, result in org_results:
@@ -310,18 +313,19 @@ class AlertsCollector(MetricCollector):
                     "Collecting sensor alerts for filtered networks",
                     networks_with_sensors=len(sensor_networks),
                 )
-                sensor_results = await process_in_batches_with_errors(
-                    sensor_networks,
-                    self._collect_network_sensor_alerts,
-                    batch_size=self.settings.api.network_batch_size,
-                    delay_between_batches=self.settings.api.batch_delay,
-                    item_description="sensor alert network",
-                    error_context_func=lambda network: {
-                        "org_id": network.get("orgId"),
-                        "network_id": network.get("id"),
-                        "network_name": network.get("name"),
-                    },
-                )
+                with self._measure_group(EndpointGroupName.ALERTS_SENSOR_OVERVIEW):
+                    sensor_results = await process_in_batches_with_errors(
+                        sensor_networks,
+                        self._collect_network_sensor_alerts,
+                        batch_size=self.settings.api.network_batch_size,
+                        delay_between_batches=self.settings.api.batch_delay,
+                        item_description="sensor alert network",
+                        error_context_func=lambda network: {
+                            "org_id": network.get("orgId"),
+                            "network_id": network.get("id"),
+                            "network_name": network.get("name"),
+                        },
+                    )
 
                 # Count successful sensor alert collections
                 for _, result in sensor_results:
@@ -357,6 +361,7 @@ class AlertsCollector(MetricCollector):
 
         """
         if self.settings.meraki.org_id:
+            self._track_inventory_bypass("getOrganization")
             org = await facade_for(self).call(
                 "getOrganization",
                 self.api.organizations.getOrganization,
@@ -365,6 +370,7 @@ class AlertsCollector(MetricCollector):
             org = validate_response_format(org, expected_type=dict, operation="getOrganization")
             return [cast(dict[str, Any], org)]
         else:
+            self._track_inventory_bypass("getOrganizations")
             orgs = await facade_for(self).call(
                 "getOrganizations", self.api.organizations.getOrganizations
             )
@@ -625,6 +631,7 @@ class AlertsCollector(MetricCollector):
             List of networks (filtered) or None on error.
 
         """
+        self._track_inventory_bypass("getOrganizationNetworks")
         networks = await facade_for(self).call(
             "getOrganizationNetworks",
             self.api.organizations.getOrganizationNetworks,
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import heapq
 import time
-from typing import Any, ClassVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
+from urllib.parse import quote
 
 import structlog
 
@@ -11,6 +13,7 @@ from ..core.api_facade import facade_for
 from ..core.api_helpers import create_api_helper
 from ..core.api_models import NetworkClient
 from ..core.batch_processing import process_in_batches_with_errors
+from ..core.cohort import CohortRotation
 from ..core.collector import MetricCollector
 from ..core.constants import ClientMetricName
 from ..core.constants.metrics_constants import CollectorMetricName
@@ -27,12 +30,24 @@ from ..core.scheduler import EndpointGroup, EndpointGroupName
 from ..services.client_store import ClientStore
 from ..services.dns_resolver import DNSResolver
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from ..core.domain_models import ClientData
+
 logger = structlog.get_logger(__name__)
 
 # The sanitizer collapses repeated and edge underscores, so this reserved
 # label cannot collide with a genuine application name.
 _APPLICATION_OTHER_LABEL = "__other__"
 
+# getNetworkClientsApplicationUsage accepts up to 1000 client IDs per request,
+# but they travel as one comma-separated query parameter, and a long URI risks
+# an HTTP 414 (#525). Requests are packed up to this many encoded characters
+# of client IDs instead of a fixed count, so short IDs share fewer requests.
+_APP_USAGE_MAX_CLIENTS_PER_REQUEST = 1000
+_APP_USAGE_MAX_QUERY_CHARS = 4000
+
 # Per-network wireless-client cap used to estimate signal-quality demand (mirrors
 # APISettings.client_signal_quality_max_clients default; cost_fn takes only the
 # OrgShape, so the cap is encoded here rather than read from settings).
@@ -138,9 +153,17 @@ class ClientsCollector(MetricCollector):
 
         # Initialize DNS stats tracking
         self._last_dns_stats: dict[str, float] | None = None
+        # Client-store eviction counters already promoted to Prometheus.
+        self._last_store_evictions: dict[str, int] = {}
+        self._last_store_rejected = 0
         self._last_app_usage_by_network: dict[str, float] = {}
         # Per-network throttle for the sequential signal-quality fan-out (F-060).
         self._last_signal_quality_by_network: dict[str, float] = {}
+        # Rotating per-network slices of wireless clients, bounded by
+        # client_signal_quality_max_clients; clients only feed the group max age.
+        self._signal_quality_cohort = CohortRotation(
+            EndpointGroupName.CLIENTS_SIGNAL_QUALITY, export_entity_age=False
+        )
         # Per-collection aggregate counters for the INFO summary (F-171).
         self._collection_networks = 0
         self._collection_clients = 0
@@ -288,6 +311,18 @@ class ClientsCollector(MetricCollector):
             CollectorMetricName.CLIENT_DNS_LOOKUPS_TIMEOUT_TOTAL,
             "Total reverse-DNS lookups that exceeded clients.dns_timeout",
         )
+        self.dns_refresh_ahead = self._create_counter(
+            CollectorMetricName.CLIENT_DNS_REFRESH_AHEAD_TOTAL,
+            "Total background refresh-ahead re-resolutions of near-expiry DNS cache entries",
+        )
+        self.dns_refresh_ahead_failed = self._create_counter(
+            CollectorMetricName.CLIENT_DNS_REFRESH_AHEAD_FAILED_TOTAL,
+            "Total refresh-ahead re-resolutions that failed (entry kept until it expires)",
+        )
+        self.dns_refresh_ahead_seconds = self._create_counter(
+            CollectorMetricName.CLIENT_DNS_REFRESH_AHEAD_SECONDS_TOTAL,
+            "Cumulative seconds spent in background refresh-ahead reverse-DNS lookups",
+        )
 
         # Client store metrics
         self.client_store_total = self._create_gauge(
@@ -300,6 +335,20 @@ class ClientsCollector(MetricCollector):
             "Total number of networks with clients",
         )
 
+        self.client_store_evictions = self._create_counter(
+            CollectorMetricName.CLIENT_STORE_EVICTIONS_TOTAL,
+            "Total clients evicted from the client store by reason (lru/fair_share evict "
+            "the least recently seen clients to admit new ones; stale_network drops "
+            "networks not polled within clients.cache_ttl)",
+            labelnames=[LabelName.REASON],
+        )
+
+        self.client_store_rejected = self._create_counter(
+            CollectorMetricName.CLIENT_STORE_REJECTED_TOTAL,
+            "Total new clients the client store skipped because it was full and the "
+            "eviction policy could not make room",
+        )
+
         # Client capability metrics
         self.client_capabilities_count = self._create_gauge(
             ClientMetricName.WIRELESS_CLIENT_CAPABILITIES_COUNT,
@@ -397,12 +446,15 @@ class ClientsCollector(MetricCollector):
             return
 
         # Scheduler-gated as the ``clients_list`` group (#617 §2): the whole
-        # per-network getNetworkClients fan-out (and its downstream app-usage /
-        # signal-quality collection) is skipped this heartbeat until the group is
-        # due. The app-usage / signal-quality groups keep their own per-network
-        # interval gates layered on top.
-        if not self._should_run_group(EndpointGroupName.CLIENTS_LIST):
-            logger.debug("clients_list group not due this heartbeat; skipping client collection")
+        # per-network getNetworkClients fan-out (and its downstream signal-quality
+        # collection) is skipped this heartbeat until the group is due.
+        # Application usage runs on its own ``clients_app_usage`` cadence from the
+        # client store, so a due app-usage pass no longer waits for a list fetch.
+        # Each gate is evaluated once: ``should_run`` advances the attempt clock.
+        list_due = self._should_run_group(EndpointGroupName.CLIENTS_LIST)
+        app_usage_due = self._should_run_group(EndpointGroupName.CLIENTS_APP_USAGE)
+        if not list_due and not app_usage_due:
+            logger.debug("No client endpoint group due this heartbeat; skipping client collection")
             return
 
         # Reset per-collection aggregate counters (F-171 INFO summary).
@@ -446,8 +498,14 @@ class ClientsCollector(MetricCollector):
 
             # Process networks directly without batching to avoid lambda issues
             # Since we're already processing one org at a time, this is fine
-            if await self._process_network_batch(org_id, org_name, networks):
-                any_network_succeeded = True
+            if list_due:
+                with self._measure_group(EndpointGroupName.CLIENTS_LIST):
+                    if await self._process_network_batch(org_id, org_name, networks):
+                        any_network_succeeded = True
+
+            if app_usage_due:
+                with self._measure_group(EndpointGroupName.CLIENTS_APP_USAGE):
+                    await self._collect_org_application_usage(org_id, org_name, networks)
 
         # Record a successful clients_list cycle so the gate throttles the next,
         # but only when at least one network actually fetched (#629); otherwise
@@ -533,6 +591,9 @@ class ClientsCollector(MetricCollector):
                 "network_id": network.get("id"),
                 "network_name": network.get("name"),
             },
+            # A slow network (e.g. a 40s getNetworkClients) holds only its own
+            # slot instead of stalling the whole batch.
+            streaming=True,
         )
 
         # A per-network fetch counts as successful only when it returned the
@@ -655,17 +716,15 @@ class ClientsCollector(MetricCollector):
         # Update metrics
         await self._update_metrics(org_id, org_name, network_id, network_name, clients, hostnames)
 
-        # Collect application usage data
-        await self._collect_application_usage(org_id, org_name, network_id, network_name, clients)
-
         # Collect wireless signal quality data
-        await self._collect_wireless_signal_quality(
-            org_id, org_name, network_id, network_name, clients
-        )
+        with self._measure_group(EndpointGroupName.CLIENTS_SIGNAL_QUALITY):
+            await self._collect_wireless_signal_quality(
+                org_id, org_name, network_id, network_name, clients
+            )
 
         # The getNetworkClients fetch (the clients_list group) succeeded for this
-        # network; downstream app-usage / signal-quality collection belong to
-        # their own groups and their failures are swallowed independently (#629).
+        # network; downstream signal-quality collection belongs to its own group
+        # and its failures are swallowed independently (#629).
         return True
 
     def _apply_emission_cap(
@@ -877,6 +936,10 @@ class ClientsCollector(MetricCollector):
         the latter makes equal-traffic ties stable between scrapes. Configured
         allowlisted labels are retained in addition to the top-N. All remaining
         usage is summed into the reserved ``__other__`` label when enabled.
+
+        The top-N is taken with a bounded heap (``heapq.nsmallest``) rather than
+        a full sort, so a client with hundreds of applications costs
+        O(n log N) instead of O(n log n).
         """
         totals: dict[str, tuple[float, float]] = {}
         for row in application_usage:
@@ -890,35 +953,29 @@ class ClientsCollector(MetricCollector):
             self._sanitize_application_name(application)
             for application in self.settings.clients.application_allowlist
         }
-        ranked = sorted(
+        top = heapq.nsmallest(
+            self.settings.clients.application_top_n,
             totals,
             key=lambda application: (
                 -(totals[application][0] + totals[application][1]),
                 application,
             ),
         )
-        selected = set(ranked[: self.settings.clients.application_top_n]) | (
-            allowlist & totals.keys()
-        )
+        selected = set(top) | (allowlist & totals.keys())
         bounded = {application: totals[application] for application in selected}
 
-        if self.settings.clients.application_other_bucket:
-            other_received = sum(
-                received
-                for application, (received, _sent) in totals.items()
-                if application not in selected
+        if self.settings.clients.application_other_bucket and len(selected) < len(totals):
+            other_received = 0.0
+            other_sent = 0.0
+            for application, (received, sent) in totals.items():
+                if application not in selected:
+                    other_received += received
+                    other_sent += sent
+            selected_received, selected_sent = bounded.get(_APPLICATION_OTHER_LABEL, (0.0, 0.0))
+            bounded[_APPLICATION_OTHER_LABEL] = (
+                selected_received + other_received,
+                selected_sent + other_sent,
             )
-            other_sent = sum(
-                sent
-                for application, (_received, sent) in totals.items()
-                if application not in selected
-            )
-            if any(application not in selected for application in totals):
-                selected_received, selected_sent = bounded.get(_APPLICATION_OTHER_LABEL, (0.0, 0.0))
-                bounded[_APPLICATION_OTHER_LABEL] = (
-                    selected_received + other_received,
-                    selected_sent + other_sent,
-                )
 
         return bounded
 
@@ -1187,6 +1244,99 @@ class ClientsCollector(MetricCollector):
                 network_id=network_id,
             )
 
+    async def _collect_org_application_usage(
+        self,
+        org_id: str,
+        org_name: str,
+        networks: list[Any],
+    ) -> None:
+        """Collect application usage for an organization from the client store.
+
+        Runs on the ``clients_app_usage`` cadence independently of the client
+        list fetch: the client IDs come from the store populated by the last
+        ``getNetworkClients`` pass, so a heartbeat where only app usage is due
+        costs no list calls. ``getNetworkClientsApplicationUsage`` is scoped to
+        one network, so requests are packed per network (see
+        :meth:`_chunk_client_ids`).
+
+        Parameters
+        ----------
+        org_id : str
+            Organization ID.
+        org_name : str
+            Organization name.
+        networks : list[Any]
+            The organization's networks.
+
+        """
+        pending = [
+            (network, clients)
+            for network in networks
+            if (clients := self.client_store.get_network_clients(network["id"]))
+        ]
+        if not pending:
+            return
+
+        async def _process_network(
+            item: tuple[dict[str, Any], list[ClientData]],
+        ) -> None:
+            network, clients = item
+            await self._collect_application_usage(
+                org_id, org_name, network["id"], network["name"], clients
+            )
+
+        await process_in_batches_with_errors(
+            pending,
+            _process_network,
+            batch_size=self.settings.api.client_batch_size,
+            delay_between_batches=self.settings.api.batch_delay,
+            item_description="network",
+            error_context_func=lambda item: {
+                "org_id": org_id,
+                "org_name": org_name,
+                "network_id": item[0].get("id"),
+            },
+            streaming=True,
+        )
+
+    @staticmethod
+    def _chunk_client_ids(client_ids: Sequence[str]) -> list[list[str]]:
+        """Pack client IDs into as few application-usage requests as possible.
+
+        Each chunk holds at most ``_APP_USAGE_MAX_CLIENTS_PER_REQUEST`` IDs and
+        at most ``_APP_USAGE_MAX_QUERY_CHARS`` characters of the URL-encoded,
+        comma-separated ``clients`` parameter (#525).
+
+        Parameters
+        ----------
+        client_ids : Sequence[str]
+            Client IDs in request order.
+
+        Returns
+        -------
+        list[list[str]]
+            Consecutive chunks covering every ID exactly once.
+
+        """
+        chunks: list[list[str]] = []
+        chunk: list[str] = []
+        length = 0
+        for client_id in client_ids:
+            # An encoded comma (%2C) separates every ID after the first.
+            cost = len(quote(client_id, safe="")) + (3 if chunk else 0)
+            if chunk and (
+                length + cost > _APP_USAGE_MAX_QUERY_CHARS
+                or len(chunk) >= _APP_USAGE_MAX_CLIENTS_PER_REQUEST
+            ):
+                chunks.append(chunk)
+                chunk, length = [], 0
+                cost -= 3
+            chunk.append(client_id)
+            length += cost
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
     @with_error_handling(
         operation="Collect application usage",
         continue_on_error=True,
@@ -1199,7 +1349,7 @@ class ClientsCollector(MetricCollector):
         org_name: str,
         network_id: str,
         network_name: str,
-        clients: list[NetworkClient],
+        clients: Sequence[NetworkClient | ClientData],
     ) -> None:
         """Collect application usage data for clients.
 
@@ -1213,8 +1363,8 @@ class ClientsCollector(MetricCollector):
             Network ID.
         network_name : str
             Network name.
-        clients : list[NetworkClient]
-            List of clients.
+        clients : Sequence[NetworkClient | ClientData]
+            Clients of the network, fresh from the API or from the client store.
 
         """
         if not clients:
@@ -1225,8 +1375,9 @@ class ClientsCollector(MetricCollector):
         # ``client_app_usage_interval`` setting; the setting still pins the group
         # when the operator sets it explicitly (setting_pin).
         interval = self._group_interval(EndpointGroupName.CLIENTS_APP_USAGE)
+        started = time.time()
         last_run = self._last_app_usage_by_network.get(network_id, 0.0)
-        if interval > 0 and (time.time() - last_run) < interval:
+        if interval > 0 and (started - last_run) < interval:
             logger.debug(
                 "Skipping client application usage collection",
                 network_id=network_id,
@@ -1237,11 +1388,10 @@ class ClientsCollector(MetricCollector):
         # Per-series TTL for the app-usage group (#617 §1f).
         ttl = self._group_ttl_seconds(EndpointGroupName.CLIENTS_APP_USAGE)
 
-        # Extract client IDs
-        client_ids = [client.id for client in clients]
-
-        # Create a lookup map for client data
-        client_map = {client.id: client for client in clients}
+        # Client IDs, deduplicated in order; the set doubles as the lookup for
+        # filtering response rows.
+        client_ids = list(dict.fromkeys(client.id for client in clients))
+        known_ids = set(client_ids)
 
         logger.debug(
             "Fetching application usage data",
@@ -1249,13 +1399,8 @@ class ClientsCollector(MetricCollector):
             client_count=len(client_ids),
         )
 
-        # Batch client IDs for API calls. The API's documented per-request limit is
-        # 1000 client IDs, but passing that many as a comma-separated query param risks
-        # an HTTP 414 (URI Too Long) at scale -- cap well below that (#525).
-        batch_size = 100
-        for i in range(0, len(client_ids), batch_size):
-            batch_ids = client_ids[i : i + batch_size]
-
+        # Pack client IDs into as few requests as the URI budget allows (#525).
+        for i, batch_ids in enumerate(self._chunk_client_ids(client_ids)):
             try:
                 if i > 0:
                     self._track_api_call("getNetworkClientsApplicationUsage")
@@ -1280,7 +1425,7 @@ class ClientsCollector(MetricCollector):
                 # Process usage data for each client
                 for client_usage in usage_data:
                     client_id = client_usage.get("clientId")
-                    if not client_id or client_id not in client_map:
+                    if not client_id or client_id not in known_ids:
                         continue
 
                     # Bound the per-client application dimension before metric
@@ -1336,7 +1481,7 @@ class ClientsCollector(MetricCollector):
                 logger.error(
                     "Failed to fetch application usage data",
                     network_id=network_id,
-                    batch_start=i,
+                    batch_index=i,
                     batch_size=len(batch_ids),
                     error=str(e),
                 )
@@ -1344,10 +1489,11 @@ class ClientsCollector(MetricCollector):
                 # Continue with next batch
                 continue
 
-        self._last_app_usage_by_network[network_id] = time.time()
-        # The app-usage group's cadence is enforced locally per network rather
-        # than through ``_should_run_group``. Mark its successful local cycle so
-        # the outer collector loop can sleep until its solved deadline (#703).
+        # Stamp the pass start, not its end, so the per-network gate never trails
+        # the group mark below and skips the next due pass.
+        self._last_app_usage_by_network[network_id] = started
+        # Mark the group's successful local cycle so the dispatcher re-queues
+        # clients at its solved deadline (#703).
         self._mark_group_ran(EndpointGroupName.CLIENTS_APP_USAGE)
 
         logger.info(
@@ -1412,9 +1558,6 @@ class ClientsCollector(MetricCollector):
             )
             return
 
-        # Per-series TTL for the signal-quality group (#617 §1f).
-        ttl = self._group_ttl_seconds(EndpointGroupName.CLIENTS_SIGNAL_QUALITY)
-
         # Filter to only wireless clients
         wireless_clients = [
             client for client in clients if client.recentDeviceConnection == "Wireless"
@@ -1425,17 +1568,31 @@ class ClientsCollector(MetricCollector):
             return
 
         # F-060: cap the number of clients queried per network to bound the
-        # sequential per-client fan-out (0 disables the cap).
+        # sequential per-client fan-out (0 disables the cap). Over the cap, each
+        # run queries the clients with the oldest data, so the whole network is
+        # walked in rotating slices instead of always polling the same prefix.
         max_clients = self.settings.api.client_signal_quality_max_clients
-        clients_to_query = wireless_clients
-        if max_clients > 0 and len(wireless_clients) > max_clients:
-            logger.warning(
-                "Truncating wireless clients for signal quality collection",
+        due_ids = set(
+            self._signal_quality_cohort.select(
+                network_id, (client.id for client in wireless_clients), max_clients
+            )
+        )
+        clients_to_query = [client for client in wireless_clients if client.id in due_ids]
+        if len(clients_to_query) < len(wireless_clients):
+            logger.debug(
+                "Rotating wireless clients for signal quality collection",
                 network_id=network_id,
                 total_wireless_clients=len(wireless_clients),
                 limit=max_clients,
             )
-            clients_to_query = wireless_clients[:max_clients]
+
+        # Per-series TTL for the signal-quality group (#617 §1f), stretched to
+        # cover a full rotation of the network's clients.
+        ttl = self._signal_quality_cohort.scale_ttl(
+            network_id,
+            self._group_ttl_seconds(EndpointGroupName.CLIENTS_SIGNAL_QUALITY),
+            max_clients,
+        )
 
         logger.debug(
             "Fetching wireless signal quality data",
@@ -1466,6 +1623,7 @@ class ClientsCollector(MetricCollector):
                         operation="getNetworkWirelessSignalQualityHistory",
                     ),
                 )
+                self._signal_quality_cohort.mark_refreshed(network_id, client.id)
 
                 if not signal_data:
                     logger.debug(
@@ -1581,6 +1739,16 @@ class ClientsCollector(MetricCollector):
                 dns_stats["total_resolution_time"] - self._last_dns_stats["total_resolution_time"]
             )
             timeout_delta = dns_stats["lookup_timeouts"] - self._last_dns_stats["lookup_timeouts"]
+            refresh_delta = (
+                dns_stats["refresh_ahead_lookups"] - self._last_dns_stats["refresh_ahead_lookups"]
+            )
+            refresh_failed_delta = (
+                dns_stats["refresh_ahead_failures"] - self._last_dns_stats["refresh_ahead_failures"]
+            )
+            refresh_seconds_delta = (
+                dns_stats["refresh_ahead_resolution_time"]
+                - self._last_dns_stats["refresh_ahead_resolution_time"]
+            )
 
             # Increment counters by the delta using inc()
             if total_delta > 0:
@@ -1595,6 +1763,12 @@ class ClientsCollector(MetricCollector):
                 self.dns_resolution_seconds.inc(resolution_delta)
             if timeout_delta > 0:
                 self.dns_lookups_timeout.inc(timeout_delta)
+            if refresh_delta > 0:
+                self.dns_refresh_ahead.inc(refresh_delta)
+            if refresh_failed_delta > 0:
+                self.dns_refresh_ahead_failed.inc(refresh_failed_delta)
+            if refresh_seconds_delta > 0:
+                self.dns_refresh_ahead_seconds.inc(refresh_seconds_delta)
         else:
             # First run - set initial values by incrementing from 0
             if dns_stats["total_lookups"] > 0:
@@ -1609,6 +1783,12 @@ class ClientsCollector(MetricCollector):
                 self.dns_resolution_seconds.inc(dns_stats["total_resolution_time"])
             if dns_stats["lookup_timeouts"] > 0:
                 self.dns_lookups_timeout.inc(dns_stats["lookup_timeouts"])
+            if dns_stats["refresh_ahead_lookups"] > 0:
+                self.dns_refresh_ahead.inc(dns_stats["refresh_ahead_lookups"])
+            if dns_stats["refresh_ahead_failures"] > 0:
+                self.dns_refresh_ahead_failed.inc(dns_stats["refresh_ahead_failures"])
+            if dns_stats["refresh_ahead_resolution_time"] > 0:
+                self.dns_refresh_ahead_seconds.inc(dns_stats["refresh_ahead_resolution_time"])
 
         # Store current stats for next update
         self._last_dns_stats = dns_stats.copy()
@@ -1620,6 +1800,17 @@ class ClientsCollector(MetricCollector):
         self.client_store_total.set(store_stats["total_clients"])
         self.client_store_networks.set(store_stats["total_networks"])
 
+        # Eviction/refusal counts are cumulative in the store; promote deltas.
+        for reason, count in store_stats["evictions"].items():
+            eviction_delta = count - self._last_store_evictions.get(reason, 0)
+            if eviction_delta > 0:
+                self.client_store_evictions.labels(reason=reason).inc(eviction_delta)
+            self._last_store_evictions[reason] = count
+        rejected_delta = store_stats["rejected_new_clients"] - self._last_store_rejected
+        if rejected_delta > 0:
+            self.client_store_rejected.inc(rejected_delta)
+        self._last_store_rejected = store_stats["rejected_new_clients"]
+
         logger.debug(
             "Updated cache metrics",
             dns_cache_total=dns_stats["total_entries"],
@@ -1631,4 +1822,6 @@ class ClientsCollector(MetricCollector):
             dns_lookups_cached=dns_stats["cache_hits"],
             client_store_total=store_stats["total_clients"],
             client_store_networks=store_stats["total_networks"],
+            client_store_evictions=store_stats["evictions"],
+            client_store_rejected=store_stats["rejected_new_clients"],
         )
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from ..core.api_facade import facade_for
 from ..core.batch_processing import process_in_batches_with_errors
-from ..core.collector import MetricCollector
+from ..core.collector import MetricCollector, measured_group
 from ..core.constants import OrgMetricName
 from ..core.domain_models import ConfigurationChange
 from ..core.error_handling import (
@@ -176,6 +176,7 @@ class ConfigCollector(MetricCollector):
             return await self._fetch_organizations_direct() or []
         return await self.inventory.get_organizations()
 
+    @measured_group(EndpointGroupName.CONFIG_ORG)
     async def _collect_impl(self) -> None:
         """Collect configuration metrics."""
         start_time = time.time()
@@ -263,6 +264,7 @@ class ConfigCollector(MetricCollector):
         """
         if self.settings.meraki.org_id:
             # Single organization
+            self._track_inventory_bypass("getOrganization")
             org = await facade_for(self).call(
                 "getOrganization",
                 self.api.organizations.getOrganization,
@@ -274,6 +276,7 @@ class ConfigCollector(MetricCollector):
             return [cast(dict[str, Any], org)]
         else:
             # All accessible organizations
+            self._track_inventory_bypass("getOrganizations")
             organizations = await facade_for(self).call(
                 "getOrganizations", self.api.organizations.getOrganizations
             )
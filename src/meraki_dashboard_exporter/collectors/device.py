@@ -235,11 +235,20 @@ class DeviceCollector(MetricCollector):
             floor_seconds=900,
             cost_fn=lambda s: 2 * s.appliance_network_count,
         ),
+        # Fast MV lane: recent person count, 1 call/camera.
         EndpointGroup(
             name=EndpointGroupName.MV_ANALYTICS,
             priority=4,
             floor_seconds=900,
-            cost_fn=lambda s: 3 * s.camera_count,
+            cost_fn=lambda s: float(s.camera_count),
+        ),
+        # Slow MV lane: analytics zones + quality/retention, 2 calls/camera per
+        # interval, phase-rotated across cameras so each cycle fetches a slice.
+        EndpointGroup(
+            name=EndpointGroupName.MV_CONFIG,
+            priority=4,
+            floor_seconds=3600,
+            cost_fn=lambda s: 2 * s.camera_count,
         ),
         EndpointGroup(
             name=EndpointGroupName.MG_UPLINK_STATUS,
@@ -330,11 +339,11 @@ class DeviceCollector(MetricCollector):
             floor_seconds=900,
             cost_fn=lambda s: 2.0,
         ),
-        # Phase 4 (#305): 1 call/MV device
+        # Phase 4 (#305): 1 call/MV device per interval, phase-rotated like mv_config
         EndpointGroup(
             name=EndpointGroupName.MV_SENSE_CONFIG,
             priority=4,
-            floor_seconds=900,
+            floor_seconds=3600,
             cost_fn=lambda s: float(s.camera_count),
         ),
         # Phase 4 (#306): 1 org-wide onboarding-status call
@@ -677,11 +686,18 @@ class DeviceCollector(MetricCollector):
         # Process organizations in parallel with bounded concurrency. Backoff
         # gating happens here (before task creation) rather than inside the
         # worker so an all-in-backoff cycle can be distinguished from a
-        # genuine success (#509 frozen coordinator rule).
+        # genuine success (#509 frozen coordinator rule). With several orgs,
+        # every org starts at once and their fetches and per-device items share
+        # the same total in-flight budget through the weighted fair queue, so a
+        # huge org no longer holds a slot while small orgs wait behind it.
+        fair = self._start_fair_queue(
+            len(organizations),
+            self.settings.api.concurrency_limit * self.settings.api.device_batch_size,
+        )
         skipped_backoff = 0
         async with ManagedTaskGroup(
             name="device_collector_orgs",
-            max_concurrency=self.settings.api.concurrency_limit,
+            max_concurrency=(len(organizations) if fair else self.settings.api.concurrency_limit),
         ) as group:
             for org in organizations:
                 org_id = org["id"]
@@ -793,7 +809,8 @@ class DeviceCollector(MetricCollector):
                 device_lookup: dict[str, dict[str, Any]] = {}
 
                 # Fetch devices with error handling
-                devices = await self._fetch_devices(org_id)
+                async with self._org_slot(org_id):
+                    devices = await self._fetch_devices(org_id)
                 if devices is None:
                     raise CollectorError(
                         "Device fetch failed for organization",
@@ -817,7 +834,9 @@ class DeviceCollector(MetricCollector):
                     # (non-None, including a successful-empty []); a None return
                     # must leave the gate open so the next cycle retries instead of
                     # suppressing the refetch for the full solved interval.
-                    fetched = await self._fetch_device_availabilities(org_id)
+                    async with self._org_slot(org_id):
+                        with self._measure_group(EndpointGroupName.DEVICE_AVAILABILITY):
+                            fetched = await self._fetch_device_availabilities(org_id)
                     availabilities = fetched or []
                     if fetched is not None:
                         self._mark_group_ran(EndpointGroupName.DEVICE_AVAILABILITY)
@@ -841,7 +860,8 @@ class DeviceCollector(MetricCollector):
             }
 
             # Fetch network information for adding network names to devices
-            networks = await self._fetch_networks_for_poe(org_id)
+            async with self._org_slot(org_id):
+                networks = await self._fetch_networks_for_poe(org_id)
             network_map = {n["id"]: n["name"] for n in networks}
 
             # Group devices by type for batch processing
@@ -957,7 +977,7 @@ class DeviceCollector(MetricCollector):
                         )
                         await process_in_batches_with_errors(
                             ms_devices,
-                            self._collect_ms_device_with_timeout,
+                            self._fair_item(org_id, self._collect_ms_device_with_timeout),
                             batch_size=self.settings.api.device_batch_size,
                             delay_between_batches=self.settings.api.batch_delay,
                             spread_over_seconds=spread_window,
@@ -967,6 +987,7 @@ class DeviceCollector(MetricCollector):
                             item_description="MS device",
                             error_context_func=lambda device: {"serial": device["serial"]},
                             on_error=lambda error: self._track_error(categorize_error(error)),
+                            streaming=True,
                         )
 
                     if not used_fallback:
@@ -991,7 +1012,9 @@ class DeviceCollector(MetricCollector):
                             if not usage_result:
                                 await process_in_batches_with_errors(
                                     usage_devices,
-                                    self.ms_collector.collect_device_port_usage_metrics,
+                                    self._fair_item(
+                                        org_id, self.ms_collector.collect_device_port_usage_metrics
+                                    ),
                                     batch_size=self.settings.api.device_batch_size,
                                     delay_between_batches=self.settings.api.batch_delay,
                                     spread_over_seconds=spread_window,
@@ -1003,13 +1026,14 @@ class DeviceCollector(MetricCollector):
                                     on_error=lambda error: self._track_error(
                                         categorize_error(error)
                                     ),
+                                    streaming=True,
                                 )
                 else:
                     # Process devices in batches (configurable via device_batch_size)
                     used_fallback = True
                     await process_in_batches_with_errors(
                         ms_devices,
-                        self._collect_ms_device_with_timeout,
+                        self._fair_item(org_id, self._collect_ms_device_with_timeout),
                         batch_size=self.settings.api.device_batch_size,
                         delay_between_batches=self.settings.api.batch_delay,
                         spread_over_seconds=spread_window,
@@ -1019,13 +1043,14 @@ class DeviceCollector(MetricCollector):
                         item_description="MS device",
                         error_context_func=lambda device: {"serial": device["serial"]},
                         on_error=lambda error: self._track_error(categorize_error(error)),
+                        streaming=True,
                     )
 
                 # Collect packet statistics with smoothing and interval gating
                 if not used_fallback:
                     await process_in_batches_with_errors(
                         ms_devices,
-                        self.ms_collector._collect_packet_statistics,
+                        self._fair_item(org_id, self.ms_collector._collect_packet_statistics),
                         batch_size=self.settings.api.device_batch_size,
                         delay_between_batches=self.settings.api.batch_delay,
                         spread_over_seconds=spread_window,
@@ -1035,6 +1060,7 @@ class DeviceCollector(MetricCollector):
                         item_description="MS packet stats",
                         error_context_func=lambda device: {"serial": device["serial"]},
                         on_error=lambda error: self._track_error(categorize_error(error)),
+                        streaming=True,
                     )
 
             # Note: MR per-device collection has been replaced with org/network-level
@@ -1058,7 +1084,7 @@ class DeviceCollector(MetricCollector):
 
                     await process_in_batches_with_errors(
                         type_devices,
-                        make_collect_coroutine(device_type),
+                        self._fair_item(org_id, make_collect_coroutine(device_type)),
                         batch_size=self.settings.api.device_batch_size,
                         delay_between_batches=self.settings.api.batch_delay,
                         item_description=f"{device_type} device",
@@ -1416,21 +1442,22 @@ class DeviceCollector(MetricCollector):
             # retry and suppress the pair mid-cycle (#631).
             mx_vpn_due = self._should_run_group(EndpointGroupName.MX_VPN)
 
-            # Collect VPN health metrics (point-in-time statuses)
-            try:
-                await self.mx_collector.vpn_collector.collect(org_id, org_name, due=mx_vpn_due)
-            except Exception as exc:
-                logger.exception("Failed to collect MX VPN metrics")
-                self._track_error(categorize_error(exc))
+            with self._measure_group(EndpointGroupName.MX_VPN):
+                # Collect VPN health metrics (point-in-time statuses)
+                try:
+                    await self.mx_collector.vpn_collector.collect(org_id, org_name, due=mx_vpn_due)
+                except Exception as exc:
+                    logger.exception("Failed to collect MX VPN metrics")
+                    self._track_error(categorize_error(exc))
 
-            # Collect VPN history stats (usage volume + per-peer-pair latency)
-            try:
-                await self.mx_collector.vpn_collector.collect_vpn_stats(
-                    org_id, org_name, due=mx_vpn_due
-                )
-            except Exception as exc:
-                logger.exception("Failed to collect MX VPN stats")
-                self._track_error(categorize_error(exc))
+                # Collect VPN history stats (usage volume + per-peer-pair latency)
+                try:
+                    await self.mx_collector.vpn_collector.collect_vpn_stats(
+                        org_id, org_name, due=mx_vpn_due
+                    )
+                except Exception as exc:
+                    logger.exception("Failed to collect MX VPN stats")
+                    self._track_error(categorize_error(exc))
 
             # Collect security events (org-wide, single call per org)
             try:
@@ -1441,6 +1468,22 @@ class DeviceCollector(MetricCollector):
                 logger.exception("Failed to collect MX security events")
                 self._track_error(categorize_error(exc))
 
+            # Read the configuration-change log first so networks whose config
+            # changed are due in the per-network fan-out below. The unfiltered
+            # inventory maps template changes to the networks bound to them.
+            try:
+                all_networks = (
+                    await self.inventory.get_networks(org_id, unfiltered=True)
+                    if self.inventory
+                    else None
+                )
+                await self.mx_collector.firewall_collector.collect_config_changes(
+                    org_id, all_networks
+                )
+            except Exception as exc:
+                logger.exception("Failed to collect MX configuration changes")
+                self._track_error(categorize_error(exc))
+
             # Collect firewall rules (SLOW tier: per-network API calls)
             try:
                 networks: list[dict[str, Any]] = []
@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
 from ...core.api_facade import facade_for
+from ...core.collector import measured_group
 from ...core.error_handling import ErrorCategory, validate_response_format, with_error_handling
 from ...core.label_helpers import create_device_labels
 from ...core.logging import get_logger
@@ -85,6 +86,7 @@ class BaseDeviceCollector(SubCollectorMixin, ABC):
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.DEVICE_MEMORY)
     async def collect_memory_metrics(
         self, org_id: str, org_name: str, device_lookup: dict[str, dict[str, Any]] | None = None
     ) -> None:
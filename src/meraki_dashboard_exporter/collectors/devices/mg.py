@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any
 from pydantic import BaseModel, ConfigDict, Field
 
 from ...core.api_facade import facade_for
+from ...core.collector import measured_group
 from ...core.constants import MGMetricName
 from ...core.domain_models import CellularGatewayUplinkStatus
 from ...core.error_handling import ErrorCategory, validate_response_format, with_error_handling
@@ -660,6 +661,7 @@ class MGCollector(BaseDeviceCollector):
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MG_UPLINK_STATUS)
     async def _collect_uplink_status_details(
         self, org_id: str, org_name: str, device_lookup: dict[str, dict[str, Any]]
     ) -> None:
@@ -819,6 +821,7 @@ class MGCollector(BaseDeviceCollector):
             skipped_count=skipped,
         )
 
+    @measured_group(EndpointGroupName.MG_CELLULAR_CONFIG)
     async def _collect_cellular_config(
         self, org_id: str, org_name: str, device_lookup: dict[str, dict[str, Any]]
     ) -> None:
@@ -1046,6 +1049,7 @@ class MGCollector(BaseDeviceCollector):
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MG_ESIMS)
     async def _collect_esim_inventory(
         self, org_id: str, org_name: str, device_lookup: dict[str, dict[str, Any]]
     ) -> None:
@@ -1163,6 +1167,7 @@ class MGCollector(BaseDeviceCollector):
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MG_HA)
     async def _collect_ha_status(
         self, org_id: str, org_name: str, device_lookup: dict[str, dict[str, Any]]
     ) -> None:
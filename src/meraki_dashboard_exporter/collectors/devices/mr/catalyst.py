@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 from pydantic import BaseModel, ConfigDict
 
 from ....core.api_facade import facade_for
+from ....core.collector import measured_group
 from ....core.constants import MRMetricName
 from ....core.error_handling import ErrorCategory, validate_response_format, with_error_handling
 from ....core.logging import get_logger
@@ -136,6 +137,7 @@ class MRCatalystCollector:
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MR_WIRELESS_CONTROLLER)
     async def collect_wireless_controllers(self, org_id: str, org_name: str) -> None:
         """Collect the wireless-controller association for every Catalyst AP.
 
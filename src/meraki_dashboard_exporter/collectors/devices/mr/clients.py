@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from ....core.api_facade import facade_for
+from ....core.collector import measured_group
 from ....core.constants import MRMetricName
 from ....core.error_handling import ErrorCategory, validate_response_format, with_error_handling
 from ....core.label_helpers import create_device_labels
@@ -94,6 +95,7 @@ class MRClientsCollector:
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MR_CONNECTION_STATS)
     async def collect_connection_stats(
         self,
         org_id: str,
@@ -202,6 +204,7 @@ class MRClientsCollector:
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MR_WIRELESS_CLIENTS)
     async def collect_wireless_clients(
         self, org_id: str, org_name: str, device_lookup: dict[str, dict[str, Any]]
     ) -> None:
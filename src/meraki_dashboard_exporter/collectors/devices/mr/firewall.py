@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any, cast
 
 from ....core.api_facade import facade_for
 from ....core.async_utils import ManagedTaskGroup
+from ....core.collector import measured_group
 from ....core.constants import MRMetricName
 from ....core.domain_models import (
     WirelessSsid,
@@ -82,6 +83,7 @@ class MRFirewallCollector:
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MR_SSID_FIREWALL)
     async def collect_ssid_firewall(
         self,
         org_id: str,
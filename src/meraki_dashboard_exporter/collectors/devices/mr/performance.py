@@ -16,8 +16,10 @@ from typing import TYPE_CHECKING, Any, cast
 from pydantic import BaseModel, ConfigDict, Field
 
 from ....core.api_facade import facade_for
+from ....core.collector import measured_group
 from ....core.constants import MRMetricName
 from ....core.error_handling import ErrorCategory, validate_response_format, with_error_handling
+from ....core.history_cursor import HistoryCursorStore, HistoryWindow, parse_timestamp
 from ....core.label_helpers import create_device_labels, create_network_labels
 from ....core.logging import get_logger
 from ....core.logging_decorators import log_api_call
@@ -31,6 +33,14 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+# Power-mode history: the trailing window an AP's newest mode is taken from,
+# and how far each incremental poll reaches back before the previous one so
+# late-ingested events are not missed (duplicates merge by timestamp).
+_POWER_MODE_ENDPOINT = "getOrganizationWirelessDevicesPowerModeHistory"
+_POWER_MODE_TIMESPAN = 86400
+_POWER_MODE_OVERLAP_SECONDS = 300
+
+
 class _PowerModeEvent(BaseModel):
     """One power-mode change event for an AP (#325)."""
 
@@ -71,6 +81,9 @@ class MRPerformanceCollector:
         self.settings = parent.settings
         # Cache for packet metric values (for retention logic)
         self._packet_value_cache: dict[str, float] = {}
+        # Cursor + per-AP event rings for the power-mode history (fetch only
+        # events since the last poll instead of the whole day every cycle).
+        self._history = HistoryCursorStore()
         self._initialize_metrics()
 
     def _initialize_metrics(self) -> None:
@@ -404,6 +417,7 @@ class MRPerformanceCollector:
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MR_ETHERNET_STATUS)
     async def collect_ethernet_status(
         self, org_id: str, org_name: str, device_lookup: dict[str, dict[str, Any]]
     ) -> None:
@@ -614,6 +628,7 @@ class MRPerformanceCollector:
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MR_POWER_MODE)
     async def collect_power_mode(
         self, org_id: str, org_name: str, device_lookup: dict[str, dict[str, Any]]
     ) -> None:
@@ -638,19 +653,24 @@ class MRPerformanceCollector:
             return
         ttl = self.parent._group_ttl_seconds(EndpointGroupName.MR_POWER_MODE)
 
-        with LogContext(org_id=org_id):
-            raw_history = await facade_for(self).call(
-                "getOrganizationWirelessDevicesPowerModeHistory",
-                self.api.wireless.getOrganizationWirelessDevicesPowerModeHistory,
-                org_id,
-                total_pages="all",
-                timespan=86400,
+        window = self._history.window(org_id, _POWER_MODE_ENDPOINT, timespan=_POWER_MODE_TIMESPAN)
+        try:
+            with LogContext(org_id=org_id):
+                raw_history = await facade_for(self).call(
+                    _POWER_MODE_ENDPOINT,
+                    self.api.wireless.getOrganizationWirelessDevicesPowerModeHistory,
+                    org_id,
+                    total_pages="all",
+                    **(window.params or {}),
+                )
+            history = validate_response_format(
+                raw_history,
+                expected_type=list,
+                operation=_POWER_MODE_ENDPOINT,
             )
-        history = validate_response_format(
-            raw_history,
-            expected_type=list,
-            operation="getOrganizationWirelessDevicesPowerModeHistory",
-        )
+        except Exception:
+            self._history.reset(org_id, _POWER_MODE_ENDPOINT)
+            raise
 
         # Fetch succeeded — record the run so the gate can stretch (#617).
         self.parent._mark_group_ran(EndpointGroupName.MR_POWER_MODE)
@@ -662,32 +682,18 @@ class MRPerformanceCollector:
         )
         skipped = 0
 
-        for raw_row in history:
-            row = _PowerModeRow.model_validate(raw_row)
-
-            serial = row.serial
-            if not serial:
-                continue
-
-            network = row.network or {}
-            network_id = network.get("id", "")
+        rows = [_PowerModeRow.model_validate(raw_row) for raw_row in history]
+        for serial, network_id, model, power_mode in self._merge_power_mode_history(
+            org_id, rows, window
+        ):
             if allowed_network_ids is not None and network_id not in allowed_network_ids:
                 skipped += 1
                 continue
 
-            # Newest event's power mode (devices with no events are skipped).
-            events = [e for e in row.events if e.powerMode]
-            if not events:
-                continue
-            newest = max(events, key=lambda e: e.ts or "")
-            power_mode = newest.powerMode
-            if not power_mode:
-                continue
-
             device_info = device_lookup.get(serial, {"serial": serial})
             device_info["serial"] = serial
             device_info["networkId"] = network_id
-            device_info["model"] = device_info.get("model") or (row.model or "")
+            device_info["model"] = device_info.get("model") or model
 
             mode_labels = create_device_labels(
                 device_info, org_id=org_id, org_name=org_name, mode=power_mode
@@ -706,12 +712,91 @@ class MRPerformanceCollector:
                 skipped_count=skipped,
             )
 
+    def _merge_power_mode_history(
+        self, org_id: str, rows: list[_PowerModeRow], window: HistoryWindow
+    ) -> list[tuple[str, str, str, str]]:
+        """Fold power-mode events into the per-AP rings and read the newest mode.
+
+        Parameters
+        ----------
+        org_id : str
+            Organization ID.
+        rows : list[_PowerModeRow]
+            History rows from this poll.
+        window : HistoryWindow
+            The window that was requested.
+
+        Returns
+        -------
+        list[tuple[str, str, str, str]]
+            ``(serial, network_id, model, power_mode)`` for every AP with a
+            power-mode event in the trailing window. Events without a parseable
+            ``ts`` cannot be merged; the response is then read on its own and
+            the next poll fetches the full window.
+
+        """
+        timed: list[tuple[_PowerModeRow, list[tuple[float, str]]]] = []
+        for row in rows:
+            if not row.serial:
+                continue
+            events = []
+            for event in row.events:
+                if not event.powerMode:
+                    continue
+                ts = parse_timestamp(event.ts)
+                if ts is None:
+                    self._history.reset(org_id, _POWER_MODE_ENDPOINT)
+                    return self._newest_power_modes(rows)
+                events.append((ts, event.powerMode))
+            timed.append((row, events))
+
+        # Age out what earlier polls buffered; this poll's events are inside
+        # the window the API just applied.
+        self._history.prune(
+            org_id, _POWER_MODE_ENDPOINT, window.requested_at - _POWER_MODE_TIMESPAN
+        )
+        for row, events in timed:
+            ring = self._history.ring(org_id, _POWER_MODE_ENDPOINT, row.serial, maxlen=8)
+            ring.meta = ((row.network or {}).get("id", ""), row.model or "")
+            ring.seen_at = window.requested_at
+            for ts, power_mode in events:
+                ring.merge(ts, power_mode)
+        self._history.advance(
+            org_id, _POWER_MODE_ENDPOINT, window.requested_at - _POWER_MODE_OVERLAP_SECONDS
+        )
+
+        newest: list[tuple[str, str, str, str]] = []
+        for serial, ring in self._history.rings(org_id, _POWER_MODE_ENDPOINT).items():
+            modes = ring.values()
+            if modes:
+                network_id, model = ring.meta
+                newest.append((serial, network_id, model, modes[-1]))
+        return newest
+
+    @staticmethod
+    def _newest_power_modes(rows: list[_PowerModeRow]) -> list[tuple[str, str, str, str]]:
+        """Read each AP's newest power mode straight from one response."""
+        newest: list[tuple[str, str, str, str]] = []
+        for row in rows:
+            events = [e for e in row.events if e.powerMode]
+            if not row.serial or not events:
+                continue
+            power_mode = max(events, key=lambda e: e.ts or "").powerMode or ""
+            newest.append((
+                row.serial,
+                (row.network or {}).get("id", ""),
+                row.model or "",
+                power_mode,
+            ))
+        return newest
+
     @log_api_call("getOrganizationWirelessDevicesPacketLossByNetwork")
     @with_error_handling(
         operation="Collect MR packet loss",
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MR_PACKET_LOSS)
     async def collect_packet_loss(
         self, org_id: str, org_name: str, device_lookup: dict[str, dict[str, Any]]
     ) -> None:
@@ -1061,6 +1146,7 @@ class MRPerformanceCollector:
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MR_CPU_LOAD)
     async def collect_cpu_load(
         self, org_id: str, org_name: str, devices: list[dict[str, Any]]
     ) -> None:
@@ -1096,11 +1182,14 @@ class MRPerformanceCollector:
             # errored) must leave the gate open for a next-cycle retry.
             any_success = False
 
+            # Serial index built once per org cycle and shared by every batch.
+            device_index = {d["serial"]: d for d in mr_devices if d.get("serial")}
+
             # Process devices in batches (API requires batch processing)
             for i in range(0, len(mr_devices), batch_size):
                 batch = mr_devices[i : i + batch_size]
                 try:
-                    await self._process_cpu_load_batch(org_id, org_name, batch)
+                    await self._process_cpu_load_batch(org_id, org_name, batch, device_index)
                     any_success = True
                 except Exception:
                     logger.exception(
@@ -1133,7 +1222,11 @@ class MRPerformanceCollector:
 
     @log_api_call("getOrganizationWirelessDevicesSystemCpuLoadHistory")
     async def _process_cpu_load_batch(
-        self, org_id: str, org_name: str, devices: list[dict[str, Any]]
+        self,
+        org_id: str,
+        org_name: str,
+        devices: list[dict[str, Any]],
+        device_index: dict[str, dict[str, Any]] | None = None,
     ) -> list[dict[str, Any]]:
         """Process a batch of devices for CPU load metrics.
 
@@ -1145,6 +1238,9 @@ class MRPerformanceCollector:
             Organization name.
         devices : list[dict[str, Any]]
             Batch of devices to process.
+        device_index : dict[str, dict[str, Any]] | None
+            Serial-indexed map of the org's MR devices, built once per cycle
+            by ``collect_cpu_load``. Indexed from ``devices`` when omitted.
 
         Returns
         -------
@@ -1152,10 +1248,12 @@ class MRPerformanceCollector:
             List of device results.
 
         """
-        serials = [d.get("serial") for d in devices if d.get("serial")]
+        serials = [d["serial"] for d in devices if d.get("serial")]
 
         if not serials:
             return []
+        if device_index is None:
+            device_index = {d["serial"]: d for d in devices if d.get("serial")}
 
         # Let fetch/validation failures propagate: the caller (collect_cpu_load)
         # catches per-batch so it can distinguish a successful batch from a
@@ -1179,88 +1277,52 @@ class MRPerformanceCollector:
                 ),
             )
 
-        # Process CPU data for each device
-        for item in cpu_data:
-            serial = item.get("serial")
-            if not serial:
-                continue
-
-            # Find device info
-            device = next((d for d in devices if d.get("serial") == serial), None)
-            if not device:
+        # One pass extracts the (serial, load) columns; the emit pass then
+        # resolves each serial through the index instead of scanning the batch.
+        loaded_serials, loads = self._cpu_load_columns(cpu_data)
+        ttl = self.parent._group_ttl_seconds(EndpointGroupName.MR_CPU_LOAD)
+        for serial, cpu_load in zip(loaded_serials, loads, strict=True):
+            device = device_index.get(serial)
+            if device is None:
                 continue
-
-            # Extract CPU data
-            cpu_value = self._extract_cpu_data(item)
-            if cpu_value is None:
-                continue
-
-            # Process device CPU data
-            self._process_device_cpu_data(device, cpu_value, org_id, org_name)
+            self.parent._set_metric(
+                self._mr_cpu_load_5min,
+                create_device_labels(device, org_id=org_id, org_name=org_name),
+                cpu_load,
+                ttl_seconds=ttl,
+            )
 
         return cpu_data
 
-    def _extract_cpu_data(
-        self,
-        item: dict[str, Any],
-    ) -> float | None:
-        """Extract CPU load value from API response.
+    @staticmethod
+    def _cpu_load_columns(cpu_data: list[dict[str, Any]]) -> tuple[list[str], list[float]]:
+        """Extract each AP's most recent CPU load into parallel columns.
 
         Parameters
         ----------
-        item : dict[str, Any]
-            CPU data item from API.
+        cpu_data : list[dict[str, Any]]
+            CPU load history rows from the API.
 
         Returns
         -------
-        float | None
-            CPU load percentage or None if unavailable.
+        tuple[list[str], list[float]]
+            Serials and their latest ``load`` values; rows without a serial,
+            history or load are left out.
 
         """
-        # Get the most recent CPU reading
-        history = item.get("history", [])
-        if not history:
-            return None
-
-        # Use the last (most recent) reading
-        latest = history[-1]
-        cpu_load = latest.get("load")
-
-        # Return as float or None
-        if cpu_load is not None:
-            return float(cpu_load)
-        return None
-
-    def _process_device_cpu_data(
-        self,
-        device: dict[str, Any],
-        cpu_load: float,
-        org_id: str,
-        org_name: str,
-    ) -> None:
-        """Process and set CPU load metric for a device.
-
-        Parameters
-        ----------
-        device : dict[str, Any]
-            Device data.
-        cpu_load : float
-            CPU load percentage.
-        org_id : str
-            Organization ID.
-        org_name : str
-            Organization name.
-
-        """
-        device_labels = create_device_labels(device, org_id=org_id, org_name=org_name)
-
-        # Set CPU load metric - using P3.2 pattern
-        self.parent._set_metric(
-            self._mr_cpu_load_5min,
-            device_labels,
-            cpu_load,
-            ttl_seconds=self.parent._group_ttl_seconds(EndpointGroupName.MR_CPU_LOAD),
-        )
+        serials: list[str] = []
+        loads: list[float] = []
+        for item in cpu_data:
+            serial = item.get("serial")
+            history = item.get("history")
+            if not serial or not history:
+                continue
+            cpu_load = history[-1].get("load")
+            if cpu_load is None:
+                continue
+            serials.append(serial)
+            loads.append(float(cpu_load))
+        return serials, loads
 
     def _set_packet_metric_value(
         self, metric_name: str, labels: dict[str, str], value: float | None
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from ....core.api_facade import facade_for
+from ....core.collector import measured_group
 from ....core.constants import MRMetricName
 from ....core.domain_models import WirelessRfProfileAssignment
 from ....core.error_handling import ErrorCategory, validate_response_format, with_error_handling
@@ -64,6 +65,7 @@ class MRRfProfilesCollector:
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MR_RF_PROFILES)
     async def collect_rf_profile_assignments(self, org_id: str, org_name: str) -> None:
         """Collect the current RF profile assignment for every AP in the org.
 
@@ -8,6 +8,8 @@ from pydantic import BaseModel, ConfigDict
 
 from ....core.api_facade import facade_for
 from ....core.async_utils import ManagedTaskGroup
+from ....core.cohort import CohortRotation, cohort_budget
+from ....core.collector import measured_group
 from ....core.constants import MRMetricName
 from ....core.error_handling import ErrorCategory, validate_response_format, with_error_handling
 from ....core.label_helpers import create_device_labels
@@ -48,7 +50,8 @@ class MRSignalQualityCollector:
     filter using the inventory device rows' ``tags`` — zero extra calls) and can
     be disabled entirely via ``collect_ap_signal_quality``. Bounded by
     ``settings.api.concurrency_limit`` and gated on ``MR_SIGNAL_QUALITY`` (hourly
-    floor via the scheduler).
+    floor via the scheduler). With a ``mr_signal_quality`` call budget each run
+    polls only the APs with the oldest data (rotating per-org slices).
     """
 
     def __init__(self, parent: DeviceCollector) -> None:
@@ -63,6 +66,7 @@ class MRSignalQualityCollector:
         self.parent = parent
         self.api = parent.api
         self.settings = parent.settings
+        self._cohort = CohortRotation(EndpointGroupName.MR_SIGNAL_QUALITY)
         self._initialize_metrics()
 
     def _initialize_metrics(self) -> None:
@@ -123,6 +127,7 @@ class MRSignalQualityCollector:
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MR_SIGNAL_QUALITY)
     async def collect_signal_quality(
         self, org_id: str, org_name: str, devices: list[dict[str, Any]]
     ) -> None:
@@ -158,16 +163,23 @@ class MRSignalQualityCollector:
             self.parent._mark_group_ran(EndpointGroupName.MR_SIGNAL_QUALITY)
             return
 
-        ttl = self.parent._group_ttl_seconds(EndpointGroupName.MR_SIGNAL_QUALITY)
+        by_serial = {
+            device["serial"]: device
+            for device in selected
+            if device.get("serial") and device.get("networkId")
+        }
+        budget = cohort_budget(self.settings, EndpointGroupName.MR_SIGNAL_QUALITY)
+        due = self._cohort.select(org_id, by_serial, budget)
+        ttl = self._cohort.scale_ttl(
+            org_id, self.parent._group_ttl_seconds(EndpointGroupName.MR_SIGNAL_QUALITY), budget
+        )
 
         async with ManagedTaskGroup(
             name="mr_signal_quality_aps",
             max_concurrency=self.settings.api.concurrency_limit,
         ) as group:
-            for device in selected:
-                serial = device.get("serial", "")
-                if not serial or not device.get("networkId"):
-                    continue
+            for serial in due:
+                device = by_serial[serial]
                 await group.create_task(
                     self._collect_ap(org_id, org_name, device, ttl),
                     name=f"signal_quality_{serial}",
@@ -221,6 +233,7 @@ class MRSignalQualityCollector:
             expected_type=list,
             operation="getNetworkWirelessSignalQualityHistory",
         )
+        self._cohort.mark_refreshed(org_id, serial)
 
         rows = [_SignalQualityRow.model_validate(r) for r in history]
         candidates = [r for r in rows if r.snr is not None and r.rssi is not None]
@@ -12,6 +12,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from ....core.api_facade import facade_for
+from ....core.collector import measured_group
 from ....core.constants import MRMetricName
 from ....core.error_handling import ErrorCategory, validate_response_format, with_error_handling
 from ....core.label_helpers import create_device_labels
@@ -157,6 +158,7 @@ class MRWirelessCollector:
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MR_SSID_STATUS)
     async def collect_ssid_status(
         self, org_id: str, org_name: str, device_lookup: dict[str, dict[str, Any]]
     ) -> None:
@@ -298,6 +300,7 @@ class MRWirelessCollector:
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MR_SSID_USAGE)
     async def collect_ssid_usage(self, org_id: str, org_name: str) -> None:
         """Collect SSID usage metrics (org-level).
 
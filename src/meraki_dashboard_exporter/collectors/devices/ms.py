@@ -7,12 +7,16 @@ from typing import TYPE_CHECKING, Any
 
 from ...core.api_facade import facade_for
 from ...core.async_utils import ManagedTaskGroup
+from ...core.cohort import CohortRotation, cohort_budget
+from ...core.collector import measured_group
 from ...core.constants import MSMetricName
 from ...core.error_handling import ErrorCategory, validate_response_format, with_error_handling
+from ...core.history_cursor import HistoryCursorStore, HistoryWindow, parse_timestamp
 from ...core.label_helpers import create_device_labels, create_port_labels
 from ...core.logging import get_logger
 from ...core.logging_decorators import log_api_call
 from ...core.logging_helpers import LogContext
+from ...core.metric_expiration import freeze_labels
 from ...core.metrics import LabelName, create_labels
 from ...core.otel_tracing import trace_method
 from ...core.scheduler import EndpointGroupName
@@ -47,6 +51,13 @@ _8021X_STATUS_LABEL_ORDER = (
     LabelName.STATUS,
 )
 
+# Org-wide port usage history: the trailing window the usage/PoE metrics cover
+# and the pinned interval resolution, so full and incremental (t0) polls return
+# intervals that merge without overlap.
+_PORT_USAGE_ENDPOINT = "getOrganizationSwitchPortsUsageHistoryByDeviceByInterval"
+_PORT_USAGE_TIMESPAN = 3600
+_PORT_USAGE_INTERVAL = 300
+
 
 class MSCollector(BaseDeviceCollector):
     """Collector for Meraki MS (Switch) devices."""
@@ -63,6 +74,9 @@ class MSCollector(BaseDeviceCollector):
         super().__init__(parent)
         self._last_port_usage: dict[str, float] = {}
         self._last_packet_stats: dict[str, float] = {}
+        # Rotating per-org slices of switches when MS_PACKET_STATS has a call
+        # budget (scheduler.group_cohort_budgets).
+        self._packet_stats_cohort = CohortRotation(EndpointGroupName.MS_PACKET_STATS)
         self._org_port_status_supported: bool | None = None
         # Cached probe for the org-wide port usage/PoE endpoints (F-168).
         self._org_port_usage_supported: bool | None = None
@@ -77,6 +91,15 @@ class MSCollector(BaseDeviceCollector):
         # gate collect_stp_priorities to the SLOW cadence even though it is
         # invoked from the MEDIUM-tier DeviceCollector cycle (see F-037).
         self._last_stp_collection: float = 0.0
+        # Cursor + per-port interval rings for the org-wide usage history, so
+        # each poll fetches only the intervals completed since the last one.
+        self._history = HistoryCursorStore()
+        # Per serial, per port_id: (content fingerprint, series emitted for it).
+        # A port whose fingerprint is unchanged since the last cycle only has
+        # its series' expiration timestamps refreshed.
+        self._port_emissions: dict[str, dict[str, tuple[int, tuple[tuple[str, str], ...]]]] = {}
+        # Collects (metric_name, frozen_labels) while a port is being emitted.
+        self._port_emit_record: list[tuple[str, str]] | None = None
         self._initialize_metrics()
 
     def _initialize_metrics(self) -> None:
@@ -557,17 +580,26 @@ class MSCollector(BaseDeviceCollector):
     def _mark_port_usage_collected(self, serial: str) -> None:
         self._last_port_usage[serial] = time.time()
 
-    def _should_collect_packet_stats(self, serial: str) -> bool:
+    def _should_collect_packet_stats(self, serial: str, org_id: str = "") -> bool:
         # Interval sourced from the scheduler's solved MS_PACKET_STATS interval
         # (#617): floor 600s, stretchable, pinnable via ms_packet_stats_interval.
+        # With a call budget, only the org's current rotating slice is due.
         interval: float = self.parent._group_interval(EndpointGroupName.MS_PACKET_STATS)
         if interval <= 0:
             return True
         last = self._last_packet_stats.get(serial, 0.0)
-        return (time.time() - last) >= interval
+        if (time.time() - last) < interval:
+            return False
+        return self._packet_stats_cohort.admit(
+            org_id,
+            serial,
+            interval=interval,
+            budget=cohort_budget(self.settings, EndpointGroupName.MS_PACKET_STATS),
+        )
 
-    def _mark_packet_stats_collected(self, serial: str) -> None:
+    def _mark_packet_stats_collected(self, serial: str, org_id: str = "") -> None:
         self._last_packet_stats[serial] = time.time()
+        self._packet_stats_cohort.mark_refreshed(org_id, serial)
 
     def _emit_port_info(
         self,
@@ -606,7 +638,7 @@ class MSCollector(BaseDeviceCollector):
             port_id=port_id,
             port_name=port_name,
         )
-        self.parent._set_metric(
+        self._set_port_metric(
             self._ms_port_info,
             info_labels,
             1,
@@ -651,7 +683,7 @@ class MSCollector(BaseDeviceCollector):
             error_labels = create_port_labels(
                 device, port, org_id=org_id, org_name=org_name, error_type=error_type
             )
-            self.parent._set_metric(
+            self._set_port_metric(
                 self._switch_port_errors,
                 error_labels,
                 1,
@@ -663,7 +695,7 @@ class MSCollector(BaseDeviceCollector):
             warning_labels = create_port_labels(
                 device, port, org_id=org_id, org_name=org_name, warning_type=warning_type
             )
-            self.parent._set_metric(
+            self._set_port_metric(
                 self._switch_port_warnings,
                 warning_labels,
                 1,
@@ -745,7 +777,7 @@ class MSCollector(BaseDeviceCollector):
             stp_labels = create_port_labels(
                 device, port, org_id=org_id, org_name=org_name, state=state
             )
-            self.parent._set_metric(
+            self._set_port_metric(
                 self._switch_port_stp_state,
                 stp_labels,
                 1,
@@ -783,7 +815,7 @@ class MSCollector(BaseDeviceCollector):
 
         active = secure.get("active", False)
         active_labels = create_port_labels(device, port, org_id=org_id, org_name=org_name)
-        self.parent._set_metric(
+        self._set_port_metric(
             self._switch_port_8021x_active,
             active_labels,
             1 if active else 0,
@@ -797,7 +829,7 @@ class MSCollector(BaseDeviceCollector):
             status_labels = create_port_labels(
                 device, port, org_id=org_id, org_name=org_name, status=auth
             )
-            self.parent._set_metric(
+            self._set_port_metric(
                 self._switch_port_8021x_status,
                 status_labels,
                 1,
@@ -863,7 +895,7 @@ class MSCollector(BaseDeviceCollector):
             neighbor_labels = create_port_labels(
                 device, port, org_id=org_id, org_name=org_name, type=protocol
             )
-            self.parent._set_metric(
+            self._set_port_metric(
                 self._switch_port_neighbor_present,
                 neighbor_labels,
                 1,
@@ -871,11 +903,172 @@ class MSCollector(BaseDeviceCollector):
                 ttl_seconds=ttl_seconds,
             )
 
+    def _set_port_metric(
+        self,
+        metric: Any,
+        labels: dict[str, str],
+        value: float,
+        metric_name: str,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Set a port-status series, recording it for the fingerprint cache."""
+        self.parent._set_metric(metric, labels, value, metric_name, ttl_seconds=ttl_seconds)
+        if self._port_emit_record is not None:
+            self._port_emit_record.append((metric_name, freeze_labels(labels)))
+
+    @staticmethod
+    def _port_fingerprint(device: dict[str, Any], port: dict[str, Any], org_id: str) -> int:
+        """Hash every input of the port-status families for one port.
+
+        Covers the device label inputs and each port field those families read
+        (status, speed/duplex, name, errors/warnings, STP states, 802.1X and
+        CDP/LLDP presence), so an equal fingerprint means identical series.
+        """
+        spanning = port.get("spanningTree") or {}
+        secure = port.get("securePort") or {}
+        return hash((
+            org_id,
+            device.get("serial", ""),
+            device.get("model", ""),
+            device.get("networkId", ""),
+            str(port.get("portId", "")),
+            "name" in port,
+            port.get("name"),
+            port.get("status"),
+            port.get("speed", ""),
+            port.get("duplex", ""),
+            tuple(port.get("errors") or ()),
+            tuple(port.get("warnings") or ()),
+            tuple(spanning.get("statuses") or ()),
+            bool(secure),
+            secure.get("active", False),
+            secure.get("authenticationStatus"),
+            bool(port.get("cdp")),
+            bool(port.get("lldp")),
+        ))
+
+    def _emit_port_status_families(
+        self,
+        device: dict[str, Any],
+        ports: list[dict[str, Any]],
+        org_id: str,
+        org_name: str,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Emit the port-status families for one switch, skipping unchanged ports.
+
+        Covers the link status, error/warning, STP/802.1X, port-info and
+        neighbor families. Most port attributes do not change between polls,
+        so a port whose content fingerprint matches the previous cycle skips
+        label construction, ``_set_metric`` and the F-070 stale-series removal;
+        its series' expiration timestamps are refreshed in one bulk call
+        instead. A port is re-emitted in full when its fingerprint changed, or
+        when any of its series is no longer tracked (expired or shed).
+
+        Parameters
+        ----------
+        device : dict[str, Any]
+            Device (or device-like) data used for label construction.
+        ports : list[dict[str, Any]]
+            Port status data for every port of the switch.
+        org_id : str
+            Organization ID.
+        org_name : str
+            Organization name.
+        ttl_seconds : float | None
+            Per-series TTL for the MS_PORT_STATUS group (#617).
+
+        """
+        serial = device.get("serial", "")
+        previous = self._port_emissions.get(serial, {})
+        current: dict[str, tuple[int, tuple[tuple[str, str], ...]]] = {}
+        unchanged: list[tuple[str, tuple[int, tuple[tuple[str, str], ...]]]] = []
+        to_emit: list[tuple[str, dict[str, Any], int]] = []
+        ports_by_id: dict[str, dict[str, Any]] = {}
+
+        for port in ports:
+            port_id = str(port.get("portId", ""))
+            fingerprint = self._port_fingerprint(device, port, org_id)
+            cached = previous.get(port_id)
+            if cached is not None and cached[0] == fingerprint:
+                unchanged.append((port_id, cached))
+                ports_by_id[port_id] = port
+            else:
+                to_emit.append((port_id, port, fingerprint))
+
+        if unchanged:
+            missing = self.parent._refresh_metrics(
+                [pair for _, (_, series) in unchanged for pair in series],
+                ttl_seconds=ttl_seconds,
+            )
+            for port_id, cached in unchanged:
+                # A parent without bulk refresh support re-emits everything.
+                if isinstance(missing, set) and missing.isdisjoint(cached[1]):
+                    current[port_id] = cached
+                else:
+                    to_emit.append((port_id, ports_by_id[port_id], cached[0]))
+
+        for port_id, port, fingerprint in to_emit:
+            current[port_id] = (
+                fingerprint,
+                self._emit_port_families(device, port, org_id, org_name, ttl_seconds),
+            )
+
+        self._port_emissions[serial] = current
+
+    def _emit_port_families(
+        self,
+        device: dict[str, Any],
+        port: dict[str, Any],
+        org_id: str,
+        org_name: str,
+        ttl_seconds: float | None,
+    ) -> tuple[tuple[str, str], ...]:
+        """Emit every port-status family for one port and return the series set."""
+        record: list[tuple[str, str]] = []
+        self._port_emit_record = record
+        try:
+            port_labels = create_port_labels(
+                device,
+                port,
+                org_id=org_id,
+                org_name=org_name,
+                link_speed=port.get("speed", ""),  # e.g., "1 Gbps", "100 Mbps"
+                duplex=port.get("duplex", ""),  # e.g., "full", "half"
+            )
+            is_connected = 1 if port.get("status") == "Connected" else 0
+            self._set_port_metric(
+                self._switch_port_status,
+                port_labels,
+                is_connected,
+                MSMetricName.MS_PORT_STATUS.value,
+                ttl_seconds=ttl_seconds,
+            )
+
+            # Active port errors/warnings (expire automatically once cleared)
+            self._emit_port_error_warning_metrics(
+                device, port, org_id, org_name, ttl_seconds=ttl_seconds
+            )
+            # STP state and 802.1X/secure-port auth status (same payload)
+            self._emit_port_stp_8021x_metrics(
+                device, port, org_id, org_name, ttl_seconds=ttl_seconds
+            )
+            # Port info join series (#534): port_name keyed on serial+port_id
+            self._emit_port_info(device, port, org_id, ttl_seconds=ttl_seconds)
+            # CDP/LLDP neighbor presence (#296), same payload
+            self._emit_port_neighbor_metrics(
+                device, port, org_id, org_name, ttl_seconds=ttl_seconds
+            )
+        finally:
+            self._port_emit_record = None
+        return tuple(record)
+
     @log_api_call("getOrganizationSwitchPortsStatusesBySwitch")
     @with_error_handling(
         operation="Collect MS switch port statuses (org)",
         continue_on_error=True,
     )
+    @measured_group(EndpointGroupName.MS_PORT_STATUS)
     async def collect_port_statuses_by_switch(
         self,
         org_id: str,
@@ -950,37 +1143,9 @@ class MSCollector(BaseDeviceCollector):
                 "orgName": org_name,
             }
 
-            for port in switch.get("ports", []) or []:
-                speed = port.get("speed", "")
-                duplex = port.get("duplex", "")
-                port_labels = create_port_labels(
-                    device_data,
-                    port,
-                    org_id=org_id,
-                    org_name=org_name,
-                    link_speed=speed,
-                    duplex=duplex,
-                )
-
-                is_connected = 1 if port.get("status") == "Connected" else 0
-                self.parent._set_metric(
-                    self._switch_port_status,
-                    port_labels,
-                    is_connected,
-                    MSMetricName.MS_PORT_STATUS.value,
-                    ttl_seconds=ttl,
-                )
-
-                self._emit_port_error_warning_metrics(
-                    device_data, port, org_id, org_name, ttl_seconds=ttl
-                )
-                self._emit_port_stp_8021x_metrics(
-                    device_data, port, org_id, org_name, ttl_seconds=ttl
-                )
-                self._emit_port_info(device_data, port, org_id, ttl_seconds=ttl)
-                self._emit_port_neighbor_metrics(
-                    device_data, port, org_id, org_name, ttl_seconds=ttl
-                )
+            self._emit_port_status_families(
+                device_data, switch.get("ports", []) or [], org_id, org_name, ttl_seconds=ttl
+            )
 
         self.parent._mark_group_ran(EndpointGroupName.MS_PORT_STATUS)
         return True
@@ -1033,42 +1198,13 @@ class MSCollector(BaseDeviceCollector):
                     port_statuses, expected_type=list, operation="getDeviceSwitchPortsStatuses"
                 )
 
-            for port in port_statuses:
-                # Create port labels with additional attributes
-                speed = port.get("speed", "")  # e.g., "1 Gbps", "100 Mbps"
-                duplex = port.get("duplex", "")  # e.g., "full", "half"
-                port_labels = create_port_labels(
-                    device, port, org_id=org_id, org_name=org_name, link_speed=speed, duplex=duplex
-                )
-
-                # Port status with speed and duplex
-                is_connected = 1 if port.get("status") == "Connected" else 0
-                self.parent._set_metric(
-                    self._switch_port_status,
-                    port_labels,
-                    is_connected,
-                    MSMetricName.MS_PORT_STATUS.value,
-                    ttl_seconds=status_ttl,
-                )
-
-                # Active port errors/warnings (expire automatically once cleared)
-                self._emit_port_error_warning_metrics(
-                    device, port, org_id, org_name, ttl_seconds=status_ttl
-                )
-
-                # STP state and 802.1X/secure-port auth status (same payload)
-                self._emit_port_stp_8021x_metrics(
-                    device, port, org_id, org_name, ttl_seconds=status_ttl
-                )
-
-                # Port info join series (#534): port_name keyed on serial+port_id
-                self._emit_port_info(device, port, org_id, ttl_seconds=status_ttl)
-
-                # CDP/LLDP neighbor presence (#296), same payload
-                self._emit_port_neighbor_metrics(
-                    device, port, org_id, org_name, ttl_seconds=status_ttl
-                )
+            # Status, errors/warnings, STP/802.1X, port info and neighbor
+            # families; unchanged ports only have their expiry refreshed.
+            self._emit_port_status_families(
+                device, port_statuses, org_id, org_name, ttl_seconds=status_ttl
+            )
 
+            for port in port_statuses:
                 # Traffic counters (rate in bytes per second)
                 if "trafficInKbps" in port:
                     traffic_counters = port["trafficInKbps"]
@@ -1390,6 +1526,7 @@ class MSCollector(BaseDeviceCollector):
         operation="Collect MS switch port usage/PoE (org)",
         continue_on_error=True,
     )
+    @measured_group(EndpointGroupName.MS_PORT_USAGE)
     async def collect_port_usage_by_switch(
         self,
         org_id: str,
@@ -1462,21 +1599,39 @@ class MSCollector(BaseDeviceCollector):
             return True
         network_ids = sorted(allowed_network_ids) if allowed_network_ids is not None else None
 
+        # Only ask for intervals completed since the stored cursor; the rings
+        # supply the rest of the trailing hour.
+        window = self._history.window(
+            org_id,
+            _PORT_USAGE_ENDPOINT,
+            timespan=_PORT_USAGE_TIMESPAN,
+            scope=",".join(network_ids or ()),
+            min_step=_PORT_USAGE_INTERVAL,
+        )
+
         with LogContext(org_id=org_id):
-            usage_response = await facade_for(self).call(
-                "getOrganizationSwitchPortsUsageHistoryByDeviceByInterval",
-                self.api.switch.getOrganizationSwitchPortsUsageHistoryByDeviceByInterval,
-                org_id,
-                networkIds=network_ids,
-                timespan=3600,
-                perPage=50,
-                total_pages="all",
-            )
-            usage_switches = validate_response_format(
-                usage_response,
-                expected_type=list,
-                operation="getOrganizationSwitchPortsUsageHistoryByDeviceByInterval",
-            )
+            usage_switches: list[dict[str, Any]] = []
+            if window.params is not None:
+                try:
+                    usage_response = await facade_for(self).call(
+                        _PORT_USAGE_ENDPOINT,
+                        self.api.switch.getOrganizationSwitchPortsUsageHistoryByDeviceByInterval,
+                        org_id,
+                        networkIds=network_ids,
+                        interval=_PORT_USAGE_INTERVAL,
+                        perPage=50,
+                        total_pages="all",
+                        **window.params,
+                    )
+                    usage_switches = validate_response_format(
+                        usage_response,
+                        expected_type=list,
+                        operation=_PORT_USAGE_ENDPOINT,
+                    )
+                except Exception:
+                    self._history.reset(org_id, _PORT_USAGE_ENDPOINT)
+                    raise
+            usage_switches = self._merge_port_usage_history(org_id, usage_switches, window)
 
             clients_response = await facade_for(self).call(
                 "getOrganizationSwitchPortsClientsOverviewByDevice",
@@ -1672,6 +1827,86 @@ class MSCollector(BaseDeviceCollector):
         self.parent._mark_group_ran(EndpointGroupName.MS_PORT_USAGE)
         return True
 
+    def _merge_port_usage_history(
+        self,
+        org_id: str,
+        switches: list[dict[str, Any]],
+        window: HistoryWindow,
+    ) -> list[dict[str, Any]]:
+        """Fold a usage-history response into the per-port rings.
+
+        Parameters
+        ----------
+        org_id : str
+            Organization ID.
+        switches : list[dict[str, Any]]
+            Switch rows from this poll (empty when the poll was skipped).
+        window : HistoryWindow
+            The window that was requested.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Switch rows in the response shape, each port carrying every
+            buffered interval of the trailing window. A response whose
+            intervals lack ``startTs``/``endTs`` cannot be merged; it is
+            returned unchanged and the next poll fetches the full window.
+
+        """
+        intervals_by_port: list[tuple[dict[str, Any], dict[str, Any], list[Any]]] = []
+        for switch in switches:
+            if not switch.get("serial"):
+                continue
+            for port in switch.get("ports", []) or []:
+                timed = []
+                for interval in port.get("intervals", []) or []:
+                    start = parse_timestamp(interval.get("startTs"))
+                    end = parse_timestamp(interval.get("endTs"))
+                    if start is None or end is None:
+                        self._history.reset(org_id, _PORT_USAGE_ENDPOINT)
+                        return switches
+                    timed.append((start, end, interval))
+                intervals_by_port.append((switch, port, timed))
+
+        # Age out what earlier polls buffered; this poll's intervals are inside
+        # the window the API just applied.
+        self._history.prune(
+            org_id, _PORT_USAGE_ENDPOINT, window.requested_at - _PORT_USAGE_TIMESPAN
+        )
+        newest_complete: float | None = None
+        for switch, port, timed in intervals_by_port:
+            key = (switch["serial"], str(port.get("portId", "")))
+            ring = self._history.ring(
+                org_id,
+                _PORT_USAGE_ENDPOINT,
+                key,
+                maxlen=_PORT_USAGE_TIMESPAN // _PORT_USAGE_INTERVAL + 2,
+            )
+            ring.meta = (
+                {k: v for k, v in switch.items() if k != "ports"},
+                {k: v for k, v in port.items() if k != "intervals"},
+            )
+            ring.seen_at = window.requested_at
+            for start, end, interval in timed:
+                ring.merge(start, interval)
+                # A still-open interval is merged but not passed by the cursor,
+                # so the next poll re-fetches its final value.
+                if end <= window.requested_at and (
+                    newest_complete is None or end > newest_complete
+                ):
+                    newest_complete = end
+        if newest_complete is not None:
+            self._history.advance(org_id, _PORT_USAGE_ENDPOINT, newest_complete)
+
+        merged: dict[str, dict[str, Any]] = {}
+        for (serial, _port_id), ring in self._history.rings(org_id, _PORT_USAGE_ENDPOINT).items():
+            switch_row, port_row = ring.meta
+            entry = merged.get(serial)
+            if entry is None:
+                entry = merged[serial] = {**switch_row, "ports": []}
+            entry["ports"].append({**port_row, "intervals": ring.values()})
+        return list(merged.values())
+
     def _should_collect_stp_priorities(self) -> bool:
         """Return whether enough time has elapsed to (re)collect STP priorities.
 
@@ -1864,7 +2099,7 @@ class MSCollector(BaseDeviceCollector):
         # Create standard device labels
         device_labels = create_device_labels(device, org_id=org_id, org_name=org_name)
         serial = device_labels.get("serial")
-        if serial and not self._should_collect_packet_stats(serial):
+        if serial and not self._should_collect_packet_stats(serial, org_id):
             logger.debug(
                 "Skipping packet statistics collection",
                 serial=serial,
@@ -1872,8 +2107,13 @@ class MSCollector(BaseDeviceCollector):
             )
             return
 
-        # #617: thread the MS_PACKET_STATS solved TTL onto every emission.
-        packet_ttl = self.parent._group_ttl_seconds(EndpointGroupName.MS_PACKET_STATS)
+        # #617: thread the MS_PACKET_STATS solved TTL onto every emission,
+        # stretched to a full rotation when the group is budgeted.
+        packet_ttl = self._packet_stats_cohort.scale_ttl(
+            org_id,
+            self.parent._group_ttl_seconds(EndpointGroupName.MS_PACKET_STATS),
+            cohort_budget(self.settings, EndpointGroupName.MS_PACKET_STATS),
+        )
 
         try:
             # Get packet statistics with 5-minute timespan
@@ -2023,7 +2263,7 @@ class MSCollector(BaseDeviceCollector):
                 port_count=len(packet_stats),
             )
             if serial:
-                self._mark_packet_stats_collected(serial)
+                self._mark_packet_stats_collected(serial, org_id)
 
         except Exception:
             logger.exception(
@@ -2037,6 +2277,7 @@ class MSCollector(BaseDeviceCollector):
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MS_PORT_OVERVIEW)
     async def collect_port_overview(self, org_id: str, org_name: str) -> None:
         """Collect switch port overview metrics for an organization.
 
@@ -2167,6 +2408,7 @@ class MSCollector(BaseDeviceCollector):
         operation="Collect MS org-wide PoE draw",
         continue_on_error=True,
     )
+    @measured_group(EndpointGroupName.MS_POWER_SUMMARY)
     async def collect_power_history(self, org_id: str, org_name: str) -> None:
         """Collect org-wide switch PoE power draw (#294).
 
@@ -2245,6 +2487,7 @@ class MSCollector(BaseDeviceCollector):
         operation="Collect MS DHCP security posture",
         continue_on_error=True,
     )
+    @measured_group(EndpointGroupName.MS_DHCP_SECURITY)
     async def collect_dhcp_security(self, org_id: str, org_name: str) -> None:
         """Collect rogue-DHCP (#292) and DAI coverage (#293) posture per switch network.
 
@@ -2405,6 +2648,7 @@ class MSCollector(BaseDeviceCollector):
         operation="Collect MS link aggregations",
         continue_on_error=True,
     )
+    @measured_group(EndpointGroupName.MS_LINK_AGGREGATIONS)
     async def collect_link_aggregations(self, org_id: str, org_name: str) -> None:
         """Collect link aggregation (LACP) groups + membership per switch network (#295).
 
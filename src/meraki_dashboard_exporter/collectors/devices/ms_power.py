@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from ...core.api_facade import facade_for
+from ...core.collector import measured_group
 from ...core.constants.metrics_constants import MSMetricName
 from ...core.domain_models import DevicePowerModuleStatus
 from ...core.error_handling import ErrorCategory, validate_response_format, with_error_handling
@@ -75,6 +76,7 @@ class MSPowerCollector(SubCollectorMixin):
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MS_POWER)
     async def collect_power_modules(
         self, org_id: str, org_name: str, device_lookup: dict[str, dict[str, Any]]
     ) -> None:
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any
 
 from ...core.api_facade import facade_for
 from ...core.async_utils import ManagedTaskGroup
+from ...core.collector import measured_group
 from ...core.constants.metrics_constants import MSMetricName
 from ...core.error_handling import ErrorCategory, validate_response_format, with_error_handling
 from ...core.logging import get_logger
@@ -189,6 +190,7 @@ class MSStackCollector(SubCollectorMixin):
 
         return True
 
+    @measured_group(EndpointGroupName.MS_STACKS)
     async def collect_for_org(
         self,
         org_id: str,
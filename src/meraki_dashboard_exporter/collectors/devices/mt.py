@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
@@ -32,6 +33,7 @@ from ...core.logging_decorators import log_api_call
 from ...core.logging_helpers import LogContext
 from ...core.metrics import create_labels
 from ...core.scheduler import EndpointGroupName
+from ...services.sensor_snapshot import SensorReadingsSnapshot
 from .base import BaseDeviceCollector
 
 logger = get_logger(__name__)
@@ -187,11 +189,14 @@ class MTCollector(BaseDeviceCollector):
                 else:
                     current_org_name = await self._get_org_name(organization_id)
 
-                await self._collect_org_sensors(organization_id, current_org_name, due=due)
-                succeeded += 1
-                await self._collect_org_gateway_connections(
-                    organization_id, current_org_name, due=due
-                )
+                with (
+                    self.parent._measure_group(group) if self.parent is not None else nullcontext()
+                ):
+                    await self._collect_org_sensors(organization_id, current_org_name, due=due)
+                    succeeded += 1
+                    await self._collect_org_gateway_connections(
+                        organization_id, current_org_name, due=due
+                    )
             except Exception as exc:
                 logger.exception(
                     "Failed to collect sensors for organization",
@@ -225,6 +230,7 @@ class MTCollector(BaseDeviceCollector):
         """
         if self.api is None:
             raise RuntimeError("API client not initialized")
+        self._track_inventory_bypass("getOrganizations")
         # Access the API - self.api should already be the DashboardAPI
         raw = await facade_for(self).call(
             "getOrganizations", self.api.organizations.getOrganizations
@@ -249,17 +255,17 @@ class MTCollector(BaseDeviceCollector):
 
         """
         try:
-            # Prefer the shared inventory cache to avoid a per-cycle getOrganization
-            # call on the FAST tier.
+            # The shared inventory directory owns org-name resolution (including
+            # orgs missing from its list), so there is no per-cycle
+            # getOrganization on the FAST tier.
             inventory = self.parent.inventory if self.parent is not None else None
             if inventory is not None:
-                for org in await inventory.get_organizations():
-                    if org.get("id") == org_id:
-                        return str(org.get("name", org_id))
+                return cast(str, await inventory.get_org_name(org_id))
 
             if self.api is None:
                 return org_id
-            # Fallback direct call: the facade owns pacing and retries.
+            # Standalone fallback: the facade owns pacing and retries.
+            self._track_inventory_bypass("getOrganization")
             org = await facade_for(self).call(
                 "getOrganization", self.api.organizations.getOrganization, org_id
             )
@@ -285,6 +291,7 @@ class MTCollector(BaseDeviceCollector):
         """
         if self.api is None:
             raise RuntimeError("API client not initialized")
+        self._track_inventory_bypass("getOrganizationDevices")
         raw = await facade_for(self).call(
             "getOrganizationDevices",
             self.api.organizations.getOrganizationDevices,
@@ -342,6 +349,39 @@ class MTCollector(BaseDeviceCollector):
             ),
         )
 
+    async def _get_sensor_readings(
+        self, org_id: str, inventory: Any | None
+    ) -> list[dict[str, Any]]:
+        """Read the org's latest sensor readings through the shared snapshot.
+
+        The inventory's :class:`SensorReadingsSnapshot` lets every MT consumer
+        in the same ``MT_SENSOR_READINGS`` cycle share one org-wide fetch.
+        Without an inventory (or a snapshot on it) the readings are fetched
+        directly.
+
+        Parameters
+        ----------
+        org_id : str
+            Organization ID.
+        inventory : Any | None
+            Shared inventory service, if injected on the parent.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            The readings; shared with other readers, so treat as read-only.
+
+        """
+        snapshot = getattr(inventory, "sensor_readings", None)
+        if not isinstance(snapshot, SensorReadingsSnapshot):
+            return cast(list[dict[str, Any]], await self._fetch_sensor_readings(org_id))
+        interval = (
+            self.parent._group_interval(EndpointGroupName.MT_SENSOR_READINGS)
+            if self.parent is not None
+            else 0.0
+        )
+        return await snapshot.get(org_id, self._fetch_sensor_readings, interval)
+
     async def _collect_org_sensors(
         self, org_id: str, org_name: str | None = None, *, due: bool = True
     ) -> None:
@@ -409,7 +449,7 @@ class MTCollector(BaseDeviceCollector):
             if sensor_serials:
                 # Use the shared API client (respects the global concurrency limit)
                 # instead of constructing a new AsyncMerakiClient per cycle (#249).
-                readings = await self._fetch_sensor_readings(org_id)
+                readings = await self._get_sensor_readings(org_id, inventory)
 
                 # Process readings (#617: thread the group's per-series TTL so a
                 # stretched-interval poll does not flap the emitted series).
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import time
+import zlib
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict
 
 from ...core.api_facade import facade_for
+from ...core.collector import measured_group
 from ...core.constants import MVMetricName
 from ...core.domain_models import (
     CameraAnalyticsZone,
@@ -27,6 +29,22 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+def _rotation_due(serial: str, last: float | None, interval: float, now: float) -> bool:
+    """Return whether a camera's slow-lane refresh is due under phase rotation.
+
+    Each camera gets a stable phase within the interval (CRC32 of its serial),
+    and is due once per interval when ``now`` crosses that phase. Refreshes of a
+    fleet are therefore spread evenly across the interval: each cycle only the
+    slice of cameras whose phase fell inside it is fetched, instead of every
+    camera at once. A camera never fetched before is due immediately; a
+    non-positive interval disables gating.
+    """
+    if interval <= 0 or last is None:
+        return True
+    offset = zlib.crc32(serial.encode()) / 2**32 * interval
+    return (now - offset) // interval > (last - offset) // interval
+
+
 class CameraSenseConfig(BaseModel):
     """Response of ``getDeviceCameraSense`` (#305).
 
@@ -112,8 +130,8 @@ class MVCollector(BaseDeviceCollector):
         """
         super().__init__(parent)
 
-        # Tracks the last time the mv_analytics group (analytics zones, recent
-        # person-count, quality/retention) was collected, keyed by serial, so
+        # Tracks the last time the mv_analytics group (recent person-count) was
+        # collected, keyed by serial, so
         # the group cadence can be self-enforced per-camera even though
         # collect() is dispatched every MEDIUM-tier (300s) cycle by
         # DeviceCollector's per-device fan-out (see F-027). The interval comes
@@ -125,10 +143,21 @@ class MVCollector(BaseDeviceCollector):
         self._last_analytics_collection: dict[str, float] = {}
 
         # Phase 4 (#305): analogous per-serial gate for the mv_sense_config
-        # group (floor 900s, 1 call/camera) - independent cadence bookkeeping
-        # from mv_analytics even though both currently share the same floor.
+        # group (1 call/camera), rotated like the mv_config lane below.
         self._last_sense_collection: dict[str, float] = {}
 
+        # Slow config lane (mv_config: analytics zones + quality/retention).
+        # Camera configuration changes rarely, so each camera is refreshed once
+        # per group interval at a stable per-serial phase (``_rotation_due``)
+        # rather than on the analytics cadence.
+        self._last_config_collection: dict[str, float] = {}
+        # Long-lived per-camera zone map (zone_id -> label) from the config lane.
+        self._camera_zones: dict[str, dict[str, str]] = {}
+        # Cameras whose last recent-analytics response was empty. Together with
+        # an empty cached zone map this lets the fast lane skip the call until
+        # the config lane sees a zone configured.
+        self._recent_empty: set[str] = set()
+
         # Common device label set shared by every MV gauge. Kept as a local
         # variable (not a module constant) so the metrics doc generator, which
         # resolves function-local label lists, picks up the full label set.
@@ -252,6 +281,26 @@ class MVCollector(BaseDeviceCollector):
         """Record that the mv_analytics group was just collected for this camera."""
         self._last_analytics_collection[serial] = time.time()
 
+    def _config_ttl_seconds(self) -> float | None:
+        """Solved per-series TTL for the mv_config group."""
+        ttl: float | None = self.parent._group_ttl_seconds(EndpointGroupName.MV_CONFIG)
+        return ttl
+
+    def _should_collect_config(self, serial: str) -> bool:
+        """Return whether the mv_config lane is due for this camera (rotated)."""
+        interval: float = self.parent._group_interval(EndpointGroupName.MV_CONFIG)
+        return _rotation_due(
+            serial, self._last_config_collection.get(serial), interval, time.time()
+        )
+
+    def _mark_config_collected(self, serial: str) -> None:
+        """Record that the mv_config lane was just collected for this camera."""
+        self._last_config_collection[serial] = time.time()
+
+    def _analytics_known_empty(self, serial: str) -> bool:
+        """Whether the camera has no zones and returned no recent analytics last time."""
+        return self._camera_zones.get(serial) == {} and serial in self._recent_empty
+
     def _sense_ttl_seconds(self) -> float | None:
         """Solved per-series TTL for the mv_sense_config group (#305)."""
         ttl: float | None = self.parent._group_ttl_seconds(EndpointGroupName.MV_SENSE_CONFIG)
@@ -260,17 +309,14 @@ class MVCollector(BaseDeviceCollector):
     def _should_collect_sense(self, serial: str) -> bool:
         """Return whether the mv_sense_config group is due for this camera.
 
-        Mirrors ``_should_collect_analytics`` (#305): a per-serial timestamp
-        gate reading the interval from the #617 scheduler
-        (``parent._group_interval(MV_SENSE_CONFIG)``, floor 900s), since
-        ``collect()`` is invoked every MEDIUM-tier (300s) cycle by
-        ``DeviceCollector``'s per-device fan-out.
+        A per-serial gate reading the interval from the #617 scheduler
+        (``parent._group_interval(MV_SENSE_CONFIG)``), since ``collect()`` is
+        invoked every MEDIUM-tier (300s) cycle by ``DeviceCollector``'s
+        per-device fan-out. Sense is configuration, so like the mv_config lane
+        the refresh is phase-rotated across the fleet (``_rotation_due``).
         """
         interval: float = self.parent._group_interval(EndpointGroupName.MV_SENSE_CONFIG)
-        if interval <= 0:
-            return True
-        last = self._last_sense_collection.get(serial, 0.0)
-        return (time.time() - last) >= interval
+        return _rotation_due(serial, self._last_sense_collection.get(serial), interval, time.time())
 
     def _mark_sense_collected(self, serial: str) -> None:
         """Record that the mv_sense_config group was just collected for this camera."""
@@ -294,25 +340,27 @@ class MVCollector(BaseDeviceCollector):
         Common device metrics (device_up, status_info, uptime) are handled
         by DeviceCollector._collect_common_metrics() before this is called.
 
-        All three analytics fetches - configured zones, recent per-zone
-        person-count, and quality/retention config - belong to the single
-        SLOW-class ``mv_analytics`` scheduler group (#617, floor 900s,
-        priority 4). ``collect()`` runs at the parent DeviceCollector's MEDIUM
-        (300s) per-device cadence, so a per-serial timestamp gate
-        (``_should_collect_analytics``) self-enforces the group cadence, and
-        the solved TTL (``_analytics_ttl_seconds``) is threaded onto every
-        emitted series so a series polled slower than its tier heartbeat does
-        not flap (#617 §1f). ``org_id`` is passed explicitly to each fetcher so
-        the client-side rate limiter is keyed to the org bucket (#549 / #270).
-        The three calls are independent (each ``@with_error_handling``
-        ``continue_on_error=True``) so a failure in one does not block the
-        others.
-
-        MV Sense enablement (#305, ``mv_sense_config`` group) is gated and
-        collected independently via its own per-serial timestamp gate
-        (``_should_collect_sense``) before the analytics block, so its cadence
-        can diverge from ``mv_analytics`` under adaptive budgeting even though
-        both currently share the same 900s floor.
+        Collection is split into two lanes:
+
+        - **Fast analytics lane** (``mv_analytics``): the recent per-zone
+          person count, gated per serial on the group interval
+          (``_should_collect_analytics``). A camera with no configured zones
+          whose last response was empty is skipped until the config lane
+          sees a zone.
+        - **Slow config lane**: analytics zones and quality/retention
+          (``mv_config``) and MV Sense (#305, ``mv_sense_config``). Each group
+          refreshes a camera once per its interval at a stable per-serial
+          phase (``_rotation_due``), so only a slice of the fleet is fetched
+          in any one cycle.
+
+        ``collect()`` runs at the parent DeviceCollector's MEDIUM (300s)
+        per-device cadence, so every gate is per-serial, and each group's
+        solved TTL is threaded onto its series so a series polled slower than
+        its tier heartbeat does not flap (#617 §1f). ``org_id`` is passed
+        explicitly to each fetcher so the client-side rate limiter is keyed to
+        the org bucket (#549 / #270). The fetchers are independent (each
+        ``@with_error_handling`` ``continue_on_error=True``) so a failure in
+        one does not block the others.
 
         Parameters
         ----------
@@ -336,6 +384,20 @@ class MVCollector(BaseDeviceCollector):
             if sense_ok is not None:
                 self.parent._mark_group_ran(EndpointGroupName.MV_SENSE_CONFIG)
 
+        if self._should_collect_config(serial):
+            # Mark the group ran on >=1 successful sub-fetch only (#629).
+            zone_map = await self._collect_analytics_zones(
+                device, org_id=org_id, org_name=org_name, serial=serial
+            )
+            quality_ok = await self._collect_quality_and_retention(
+                device, org_id=org_id, org_name=org_name, serial=serial
+            )
+            self._mark_config_collected(serial)
+            if zone_map is not None:
+                self._camera_zones[serial] = zone_map
+            if zone_map is not None or quality_ok is not None:
+                self.parent._mark_group_ran(EndpointGroupName.MV_CONFIG)
+
         if not self._should_collect_analytics(serial):
             logger.debug(
                 "Skipping MV analytics collection (mv_analytics cadence not yet elapsed)",
@@ -344,26 +406,24 @@ class MVCollector(BaseDeviceCollector):
             )
             return
 
-        # Each fetcher is @with_error_handling(continue_on_error=True): it returns
-        # None when swallowed and a non-None value on success. Track whether ANY
-        # of the three succeeded so the group is marked ran only on >=1 successful
-        # sub-fetch (#629). Total fan-out failure must leave the gate open so the
-        # next cycle retries rather than silently marking a failed cycle "ran".
-        zones_ok = await self._collect_analytics_zones(
-            device, org_id=org_id, org_name=org_name, serial=serial
-        )
-        recent_ok = await self._collect_analytics_recent(
-            device, org_id=org_id, org_name=org_name, serial=serial
-        )
-        quality_ok = await self._collect_quality_and_retention(
+        if self._analytics_known_empty(serial):
+            # Nothing to count: a successful-empty cycle, not a failure.
+            logger.debug("Skipping MV analytics for camera without zones", serial=serial)
+            self._mark_analytics_collected(serial)
+            self.parent._mark_group_ran(EndpointGroupName.MV_ANALYTICS)
+            return
+
+        # Returns None when swallowed; the group is marked ran only on success
+        # (#629) so a failed cycle leaves the gate open for the next retry.
+        zone_count = await self._collect_analytics_recent(
             device, org_id=org_id, org_name=org_name, serial=serial
         )
-
         self._mark_analytics_collected(serial)
-        # Feed the scheduler's diagnostics/last-ran bookkeeping. Gating itself is
-        # per-serial (above); this keeps the group's diagnostics live, but only
-        # when at least one sub-fetch succeeded (successful-empty still counts).
-        if zones_ok is not None or recent_ok is not None or quality_ok is not None:
+        if zone_count is not None:
+            if zone_count:
+                self._recent_empty.discard(serial)
+            else:
+                self._recent_empty.add(serial)
             self.parent._mark_group_ran(EndpointGroupName.MV_ANALYTICS)
 
     def _emit_zone_info(
@@ -397,7 +457,7 @@ class MVCollector(BaseDeviceCollector):
         """
         network_id = device.get("networkId", "")
         serial = device.get("serial", "")
-        ttl_seconds = self._analytics_ttl_seconds()
+        ttl_seconds = self._config_ttl_seconds()
         for zone_id, zone_name in zone_map.items():
             labels = create_labels(
                 org_id=org_id,
@@ -461,7 +521,7 @@ class MVCollector(BaseDeviceCollector):
             device_labels,
             len(zone_models),
             MVMetricName.MV_ANALYTICS_ZONES.value,
-            ttl_seconds=self._analytics_ttl_seconds(),
+            ttl_seconds=self._config_ttl_seconds(),
         )
 
         # zone.zoneId is the live wire field (#630); str() so it matches the
@@ -482,7 +542,7 @@ class MVCollector(BaseDeviceCollector):
         org_id: str,
         org_name: str,
         serial: str,
-    ) -> bool:
+    ) -> int:
         """Collect recent per-zone person-count analytics for a camera (#549).
 
         Replaces the DEPRECATED ``getDeviceCameraAnalyticsLive`` endpoint with
@@ -509,9 +569,10 @@ class MVCollector(BaseDeviceCollector):
 
         Returns
         -------
-        bool
-            ``True`` on a successful fetch (used by ``collect`` to decide whether
-            to mark the ``mv_analytics`` group ran, #629). On failure the
+        int
+            Number of zone records emitted on a successful fetch (used by
+            ``collect`` to mark the ``mv_analytics`` group ran, #629, and to
+            learn cameras with nothing to count). On failure the
             ``@with_error_handling(continue_on_error=True)`` wrapper returns
             ``None`` instead.
 
@@ -527,9 +588,11 @@ class MVCollector(BaseDeviceCollector):
         records = [CameraAnalyticsRecentZone.model_validate(record) for record in recent]
 
         ttl_seconds = self._analytics_ttl_seconds()
+        emitted = 0
         for record in records:
             if record.zoneId is None:
                 continue
+            emitted += 1
             person_count = record.averageCount if record.averageCount is not None else 0.0
             labels = create_device_labels(
                 device,
@@ -545,7 +608,7 @@ class MVCollector(BaseDeviceCollector):
                 ttl_seconds=ttl_seconds,
             )
 
-        return True
+        return emitted
 
     @log_api_call("getDeviceCameraQualityAndRetention")
     @with_error_handling(
@@ -573,7 +636,7 @@ class MVCollector(BaseDeviceCollector):
         -------
         bool
             ``True`` on a successful fetch (used by ``collect`` to decide whether
-            to mark the ``mv_analytics`` group ran, #629). On failure the
+            to mark the ``mv_config`` group ran, #629). On failure the
             ``@with_error_handling(continue_on_error=True)`` wrapper returns
             ``None`` instead.
 
@@ -591,7 +654,7 @@ class MVCollector(BaseDeviceCollector):
         qr_model = CameraQualityAndRetention.model_validate(quality_retention)
 
         device_labels = create_device_labels(device, org_id=org_id, org_name=org_name)
-        ttl_seconds = self._analytics_ttl_seconds()
+        ttl_seconds = self._config_ttl_seconds()
 
         self.parent._set_metric(
             self._mv_motion_based_retention_enabled,
@@ -708,6 +771,7 @@ class MVCollector(BaseDeviceCollector):
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MV_ONBOARDING)
     async def collect_onboarding_statuses(self, org_id: str, org_name: str) -> None:
         """Collect org-wide camera onboarding status (#306).
 
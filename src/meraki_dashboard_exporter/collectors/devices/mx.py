@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from ...core.api_facade import facade_for
+from ...core.cohort import CohortRotation, cohort_budget
+from ...core.collector import measured_group
 from ...core.constants import MXMetricName
 from ...core.domain_models import ApplianceDhcpSubnet
 from ...core.error_handling import ErrorCategory, validate_response_format, with_error_handling
@@ -19,6 +21,8 @@ from .mx_firewall import MXFirewallCollector
 from .mx_vpn import MXVpnCollector
 
 if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+
     from ..device import DeviceCollector
 
 logger = get_logger(__name__)
@@ -67,6 +71,10 @@ class MXCollector(BaseDeviceCollector):
         # fan-out within one MEDIUM-tier cycle needs per-serial state, not a single
         # group-global run gate).
         self._last_dhcp_subnets_collection: dict[str, float] = {}
+        # Rotating per-org slices of appliances for either group when it has a
+        # call budget (scheduler.group_cohort_budgets).
+        self._performance_cohort = CohortRotation(EndpointGroupName.MX_PERFORMANCE)
+        self._dhcp_subnets_cohort = CohortRotation(EndpointGroupName.MX_DHCP_SUBNETS)
 
         self._mx_uplink_info = self.parent._create_gauge(
             MXMetricName.MX_UPLINK_INFO,
@@ -139,6 +147,10 @@ class MXCollector(BaseDeviceCollector):
         """Delegate metric setting to the parent DeviceCollector."""
         return self.parent._set_metric(*args, **kwargs)
 
+    def _refresh_metrics(self, *args: Any, **kwargs: Any) -> Any:
+        """Delegate bulk series-expiry refresh to the parent DeviceCollector."""
+        return self.parent._refresh_metrics(*args, **kwargs)
+
     # -- scheduler gate delegation (#617) ----------------------------------
     # MXVpnCollector / MXFirewallCollector take *this* MXCollector as their
     # ``parent``, but the scheduler gate helpers live on the top-level
@@ -153,6 +165,10 @@ class MXCollector(BaseDeviceCollector):
         """Delegate the run-marker to the parent DeviceCollector."""
         self.parent._mark_group_ran(group)
 
+    def _measure_group(self, group: EndpointGroupName) -> AbstractContextManager[None]:
+        """Delegate the cost-model measuring context to the parent DeviceCollector."""
+        return cast("AbstractContextManager[None]", self.parent._measure_group(group))
+
     def _group_interval(self, group: EndpointGroupName) -> float:
         """Delegate the solved-interval lookup to the parent DeviceCollector."""
         return float(self.parent._group_interval(group))
@@ -162,24 +178,33 @@ class MXCollector(BaseDeviceCollector):
         ttl = self.parent._group_ttl_seconds(group)
         return None if ttl is None else float(ttl)
 
-    def _should_collect_performance(self, serial: str) -> bool:
+    def _should_collect_performance(self, serial: str, org_id: str = "") -> bool:
         """Return whether enough time has elapsed to (re)collect this MX's perf score.
 
         Per-serial throttle for the mx_performance endpoint group (#552/#617),
         reading the interval from the scheduler-solved group interval (floor
         900s) rather than a raw setting. A non-positive interval disables gating.
+        With a call budget, only the org's current rotating slice is due.
         """
         interval = self._group_interval(EndpointGroupName.MX_PERFORMANCE)
         if interval <= 0:
             return True
         last = self._last_performance_collection.get(serial, 0.0)
-        return (time.time() - last) >= interval
+        if (time.time() - last) < interval:
+            return False
+        return self._performance_cohort.admit(
+            org_id,
+            serial,
+            interval=interval,
+            budget=cohort_budget(self.settings, EndpointGroupName.MX_PERFORMANCE),
+        )
 
-    def _mark_performance_collected(self, serial: str) -> None:
+    def _mark_performance_collected(self, serial: str, org_id: str = "") -> None:
         """Record that the perf score was just collected for this serial."""
         self._last_performance_collection[serial] = time.time()
+        self._performance_cohort.mark_refreshed(org_id, serial)
 
-    def _should_collect_dhcp_subnets(self, serial: str) -> bool:
+    def _should_collect_dhcp_subnets(self, serial: str, org_id: str = "") -> bool:
         """Return whether enough time has elapsed to (re)collect this MX's DHCP subnets.
 
         Per-serial throttle for the mx_dhcp_subnets endpoint group (#286/#617),
@@ -189,11 +214,19 @@ class MXCollector(BaseDeviceCollector):
         if interval <= 0:
             return True
         last = self._last_dhcp_subnets_collection.get(serial, 0.0)
-        return (time.time() - last) >= interval
+        if (time.time() - last) < interval:
+            return False
+        return self._dhcp_subnets_cohort.admit(
+            org_id,
+            serial,
+            interval=interval,
+            budget=cohort_budget(self.settings, EndpointGroupName.MX_DHCP_SUBNETS),
+        )
 
-    def _mark_dhcp_subnets_collected(self, serial: str) -> None:
+    def _mark_dhcp_subnets_collected(self, serial: str, org_id: str = "") -> None:
         """Record that DHCP subnets were just collected for this serial."""
         self._last_dhcp_subnets_collection[serial] = time.time()
+        self._dhcp_subnets_cohort.mark_refreshed(org_id, serial)
 
     @property
     def inventory(self) -> Any:
@@ -280,12 +313,13 @@ class MXCollector(BaseDeviceCollector):
 
         """
         serial = device.get("serial", "")
+        org_id = device.get("orgId", "")
 
         # mx_performance gate (#552/#617): throttle the per-physical-MX perf call
         # to the mx_performance group's interval (floor 900s). Keyed per serial so
         # every appliance is collected once per interval within the MEDIUM-tier
         # fan-out rather than only the first one.
-        if not self._should_collect_performance(serial):
+        if not self._should_collect_performance(serial, org_id):
             return
 
         # Pass an explicit timespan so the score reflects a fixed, deterministic
@@ -312,7 +346,7 @@ class MXCollector(BaseDeviceCollector):
         # dict (e.g. {"errors": [...]}) still falls through to
         # validate_response_format and is handled/logged as a real failure.
         if resp is None:
-            self._mark_performance_collected(serial)
+            self._mark_performance_collected(serial, org_id)
             logger.debug(
                 "No performance score available for MX device",
                 serial=serial,
@@ -327,21 +361,25 @@ class MXCollector(BaseDeviceCollector):
 
         # Mark after a successful fetch (before emit) so a failed call retries on
         # the next cycle rather than being throttled out.
-        self._mark_performance_collected(serial)
+        self._mark_performance_collected(serial, org_id)
 
         perf = resp.get("perfScore")
         if perf is not None:
             labels = create_device_labels(
                 device,
-                org_id=device.get("orgId", ""),
-                org_name=device.get("orgName", device.get("orgId", "")),
+                org_id=org_id,
+                org_name=device.get("orgName", org_id),
             )
             self.parent._set_metric(
                 self._mx_performance_score,
                 labels,
                 float(perf),
                 MXMetricName.MX_PERFORMANCE_SCORE.value,
-                ttl_seconds=self._group_ttl_seconds(EndpointGroupName.MX_PERFORMANCE),
+                ttl_seconds=self._performance_cohort.scale_ttl(
+                    org_id,
+                    self._group_ttl_seconds(EndpointGroupName.MX_PERFORMANCE),
+                    cohort_budget(self.settings, EndpointGroupName.MX_PERFORMANCE),
+                ),
             )
 
     @log_api_call("getDeviceApplianceDhcpSubnets")
@@ -367,7 +405,8 @@ class MXCollector(BaseDeviceCollector):
 
         # mx_dhcp_subnets gate (#286/#617): throttle the per-physical-MX DHCP
         # subnets call to the mx_dhcp_subnets group's interval (floor 900s).
-        if not self._should_collect_dhcp_subnets(serial):
+        org_id = device.get("orgId", "")
+        if not self._should_collect_dhcp_subnets(serial, org_id):
             return
 
         resp = await facade_for(self).call(
@@ -384,16 +423,20 @@ class MXCollector(BaseDeviceCollector):
 
         # Mark after a successful fetch (before emit) so a failed call retries on
         # the next cycle rather than being throttled out.
-        self._mark_dhcp_subnets_collected(serial)
+        self._mark_dhcp_subnets_collected(serial, org_id)
 
         subnets = [ApplianceDhcpSubnet.model_validate(s) for s in resp]
-        ttl_seconds = self._group_ttl_seconds(EndpointGroupName.MX_DHCP_SUBNETS)
+        ttl_seconds = self._dhcp_subnets_cohort.scale_ttl(
+            org_id,
+            self._group_ttl_seconds(EndpointGroupName.MX_DHCP_SUBNETS),
+            cohort_budget(self.settings, EndpointGroupName.MX_DHCP_SUBNETS),
+        )
 
         for subnet in subnets:
             labels = create_device_labels(
                 device,
-                org_id=device.get("orgId", ""),
-                org_name=device.get("orgName", device.get("orgId", "")),
+                org_id=org_id,
+                org_name=device.get("orgName", org_id),
                 subnet=subnet.subnet or "",
                 vlan=str(subnet.vlanId) if subnet.vlanId is not None else "",
             )
@@ -418,6 +461,7 @@ class MXCollector(BaseDeviceCollector):
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MX_UPLINK_STATUS)
     async def collect_uplink_statuses(
         self, org_id: str, org_name: str, device_lookup: dict[str, dict[str, Any]]
     ) -> None:
@@ -534,6 +578,7 @@ class MXCollector(BaseDeviceCollector):
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MX_UPLINKS_OVERVIEW)
     async def collect_uplink_status_overview(self, org_id: str, org_name: str) -> None:
         """Collect the org-wide aggregate uplink-status overview counts (#330).
 
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any
 from meraki.exceptions import APIError
 
 from ...core.api_facade import facade_for
+from ...core.collector import measured_group
 from ...core.constants.metrics_constants import MXMetricName
 from ...core.domain_models import (
     ApplianceContentFiltering,
@@ -22,19 +23,27 @@ from ...core.domain_models import (
     ApplianceVlan,
 )
 from ...core.error_handling import ErrorCategory, validate_response_format, with_error_handling
+from ...core.history_cursor import format_timestamp
 from ...core.logging import get_logger
 from ...core.logging_decorators import log_api_call
+from ...core.metric_expiration import freeze_labels
 from ...core.metrics import LabelName
 from ...core.scheduler import EndpointGroupName
 from ..subcollector_mixin import SubCollectorMixin
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from meraki import DashboardAPI
 
     from ...core.config import Settings
 
 logger = get_logger(__name__)
 
+# Configuration changes are re-read from this many seconds before the last
+# check, so a change Dashboard records a little late is not missed.
+_CHANGE_LOOKBACK_SECONDS = 300.0
+
 
 class MXFirewallCollector(SubCollectorMixin):
     """Collector for MX firewall rules and security policy metrics.
@@ -49,6 +58,14 @@ class MXFirewallCollector(SubCollectorMixin):
     ``collect_for_network`` via
     ``_should_collect_firewall_rules``/``_mark_firewall_rules_collected``, keyed
     on the ``mx_firewall_config`` group's solved interval (see F-085).
+
+    Each config domain (firewall rules, security, NAT, VLANs) hashes its raw
+    per-network payload; a payload equal to the previous one skips parsing
+    and emission and only refreshes the series' expiry. When
+    ``collect_config_changes`` is reading the org's configuration-change log,
+    a network with no change since its last fetch is only re-fetched every
+    ``scheduler.config_change_resync_seconds``; a logged change makes it due
+    at once.
     """
 
     def __init__(self, parent: Any) -> None:
@@ -79,9 +96,17 @@ class MXFirewallCollector(SubCollectorMixin):
         self._last_security_config_collection: dict[str, float] = {}
         self._last_nat_config_collection: dict[str, float] = {}
         self._last_vlan_config_collection: dict[str, float] = {}
+        # Per (domain, network_id): (raw payload hash, series emitted for it).
+        self._config_emissions: dict[tuple[str, str], tuple[int, tuple[tuple[str, str], ...]]] = {}
+        # Collects (metric_name, frozen_labels) while a domain is being emitted.
+        self._emit_record: list[tuple[str, str]] | None = None
+        # Per org: epoch of the last successful configuration-change check, and
+        # the appliance networks collected for it.
+        self._config_changes_checked: dict[str, float] = {}
+        self._org_networks: dict[str, set[str]] = {}
         self._initialize_metrics()
 
-    def _should_collect_firewall_rules(self, network_id: str) -> bool:
+    def _should_collect_firewall_rules(self, network_id: str, org_id: str = "") -> bool:
         """Return whether enough time has elapsed to (re)collect firewall rules.
 
         Mirrors the ``_should_collect_port_usage``/``_mark_port_usage_collected``
@@ -91,52 +116,236 @@ class MXFirewallCollector(SubCollectorMixin):
         invoked every ``DeviceCollector`` cycle by
         ``_collect_mx_specific_metrics``.
         """
-        interval = float(self.parent._group_interval(EndpointGroupName.MX_FIREWALL_CONFIG))
-        if interval <= 0:
-            return True
-        last = self._last_firewall_collection.get(network_id, 0.0)
-        return (time.time() - last) >= interval
+        return self._config_due(
+            self._last_firewall_collection, network_id, EndpointGroupName.MX_FIREWALL_CONFIG, org_id
+        )
 
     def _mark_firewall_rules_collected(self, network_id: str) -> None:
         """Record that firewall rules were just collected for this network."""
         self._last_firewall_collection[network_id] = time.time()
 
-    def _should_collect_security_config(self, network_id: str) -> bool:
+    def _should_collect_security_config(self, network_id: str, org_id: str = "") -> bool:
         """Return whether the mx_security_config group is due for this network (#285)."""
-        interval = float(self.parent._group_interval(EndpointGroupName.MX_SECURITY_CONFIG))
-        if interval <= 0:
-            return True
-        last = self._last_security_config_collection.get(network_id, 0.0)
-        return (time.time() - last) >= interval
+        return self._config_due(
+            self._last_security_config_collection,
+            network_id,
+            EndpointGroupName.MX_SECURITY_CONFIG,
+            org_id,
+        )
 
     def _mark_security_config_collected(self, network_id: str) -> None:
         """Record that security config was just collected for this network."""
         self._last_security_config_collection[network_id] = time.time()
 
-    def _should_collect_nat_config(self, network_id: str) -> bool:
+    def _should_collect_nat_config(self, network_id: str, org_id: str = "") -> bool:
         """Return whether the mx_nat_config group is due for this network (#288)."""
-        interval = float(self.parent._group_interval(EndpointGroupName.MX_NAT_CONFIG))
-        if interval <= 0:
-            return True
-        last = self._last_nat_config_collection.get(network_id, 0.0)
-        return (time.time() - last) >= interval
+        return self._config_due(
+            self._last_nat_config_collection, network_id, EndpointGroupName.MX_NAT_CONFIG, org_id
+        )
 
     def _mark_nat_config_collected(self, network_id: str) -> None:
         """Record that NAT config was just collected for this network."""
         self._last_nat_config_collection[network_id] = time.time()
 
-    def _should_collect_vlan_config(self, network_id: str) -> bool:
+    def _should_collect_vlan_config(self, network_id: str, org_id: str = "") -> bool:
         """Return whether the mx_vlan_config group is due for this network (#289)."""
-        interval = float(self.parent._group_interval(EndpointGroupName.MX_VLAN_CONFIG))
-        if interval <= 0:
-            return True
-        last = self._last_vlan_config_collection.get(network_id, 0.0)
-        return (time.time() - last) >= interval
+        return self._config_due(
+            self._last_vlan_config_collection, network_id, EndpointGroupName.MX_VLAN_CONFIG, org_id
+        )
 
     def _mark_vlan_config_collected(self, network_id: str) -> None:
         """Record that VLAN/static-route config was just collected for this network."""
         self._last_vlan_config_collection[network_id] = time.time()
 
+    def _config_due(
+        self,
+        last_collection: dict[str, float],
+        network_id: str,
+        group: EndpointGroupName,
+        org_id: str,
+    ) -> bool:
+        """Return whether a config domain is due for this network.
+
+        The group's solved interval applies, stretched to the resync interval
+        while the org's configuration-change log is being read (a logged
+        change drops the network's timestamps, making it due at once).
+        """
+        interval = float(self.parent._group_interval(group))
+        last = last_collection.get(network_id)
+        if interval <= 0 or last is None:
+            return True
+        if self._change_detection_active(org_id):
+            interval = max(interval, self._resync_seconds())
+        return (time.time() - last) >= interval
+
+    def _resync_seconds(self) -> float:
+        """Return ``scheduler.config_change_resync_seconds`` (0 disables change detection)."""
+        scheduler = getattr(self.settings, "scheduler", None)
+        value = getattr(scheduler, "config_change_resync_seconds", 0)
+        return float(value) if isinstance(value, int | float) and value > 0 else 0.0
+
+    def _change_detection_active(self, org_id: str) -> bool:
+        """Return whether the org's change log was read within two check intervals."""
+        checked = self._config_changes_checked.get(org_id)
+        if checked is None or self._resync_seconds() <= 0:
+            return False
+        poll = float(self.parent._group_interval(EndpointGroupName.MX_FIREWALL_CONFIG))
+        return time.time() - checked <= 2 * max(poll, 1.0)
+
+    def _set_config_metric(
+        self,
+        metric: Any,
+        labels: dict[str, str],
+        value: float,
+        ttl_seconds: float | None,
+    ) -> None:
+        """Set a config-domain series, recording it for the payload-hash cache."""
+        self.parent._set_metric(metric, labels, value, ttl_seconds=ttl_seconds)
+        if self._emit_record is not None:
+            self._emit_record.append((getattr(metric, "_name", "unknown"), freeze_labels(labels)))
+
+    def _emit_unless_unchanged(
+        self,
+        domain: str,
+        network_id: str,
+        payload: Any,
+        ttl_seconds: float | None,
+        emit: Callable[[], None],
+    ) -> bool:
+        """Run ``emit`` unless the domain's raw payload is unchanged for this network.
+
+        An unchanged payload only refreshes the expiry of the series it
+        emitted last time, in one bulk call. The payload is re-emitted in full
+        when it changed or when any of those series is no longer tracked.
+
+        Parameters
+        ----------
+        domain : str
+            Config domain (``firewall``, ``security``, ``nat`` or ``vlan``).
+        network_id : str
+            Network the payload belongs to.
+        payload : Any
+            The validated raw API responses for the domain.
+        ttl_seconds : float | None
+            Per-series TTL of the domain's endpoint group.
+        emit : Callable[[], None]
+            Parses the payload and sets every series through
+            ``_set_config_metric``.
+
+        Returns
+        -------
+        bool
+            True when parsing and emission were skipped.
+
+        """
+        fingerprint = hash(repr(payload))
+        key = (domain, network_id)
+        cached = self._config_emissions.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            missing = self.parent._refresh_metrics(cached[1], ttl_seconds)
+            if isinstance(missing, set) and not missing:
+                return True
+        record: list[tuple[str, str]] = []
+        self._emit_record = record
+        try:
+            emit()
+        finally:
+            self._emit_record = None
+        self._config_emissions[key] = (fingerprint, tuple(record))
+        return False
+
+    @log_api_call("getOrganizationConfigurationChanges")
+    @with_error_handling(
+        operation="Collect MX configuration changes",
+        continue_on_error=True,
+        error_category=ErrorCategory.API_CLIENT_ERROR,
+    )
+    async def collect_config_changes(
+        self, org_id: str, networks: list[dict[str, Any]] | None = None
+    ) -> None:
+        """Read the org's configuration-change log and expire changed networks.
+
+        Runs at most once per ``mx_firewall_config`` interval per org and asks
+        only for changes since the previous check. Every appliance network
+        with a logged change has its config-domain timestamps dropped, so its
+        next ``collect_for_network`` fetches it again. A change logged against
+        a config template applies to the networks bound to it; an org-wide
+        change (such as a policy object), or one whose ``networkId`` the
+        inventory cannot place, applies to every network. While these checks
+        succeed, unchanged networks are only re-fetched every
+        ``scheduler.config_change_resync_seconds``; after two missed checks
+        the plain group intervals apply again.
+
+        Parameters
+        ----------
+        org_id : str
+            Organization ID.
+        networks : list[dict[str, Any]] | None
+            The org's unfiltered network inventory, used to resolve template
+            changes through ``configTemplateId``. Without it every change not
+            logged against a collected appliance network is org-wide.
+
+        """
+        if self._resync_seconds() <= 0:
+            return
+        poll = float(self.parent._group_interval(EndpointGroupName.MX_FIREWALL_CONFIG))
+        now = time.time()
+        checked = self._config_changes_checked.get(org_id)
+        if checked is not None and now - checked < poll:
+            return
+
+        window: dict[str, Any] = (
+            {"t0": format_timestamp(checked - _CHANGE_LOOKBACK_SECONDS)}
+            if checked is not None
+            else {"timespan": int(max(poll, 3600.0))}
+        )
+        changes = await facade_for(self).call(
+            "getOrganizationConfigurationChanges",
+            self.api.organizations.getOrganizationConfigurationChanges,
+            org_id,
+            total_pages="all",
+            **window,
+        )
+        changes = validate_response_format(
+            changes, expected_type=list, operation="getOrganizationConfigurationChanges"
+        )
+
+        known = self._org_networks.get(org_id, set())
+        inventory_ids: set[str] = set()
+        bound: dict[str, set[str]] = {}
+        for network in networks or []:
+            inventory_ids.add(network.get("id", ""))
+            template_id = network.get("configTemplateId")
+            if template_id:
+                bound.setdefault(template_id, set()).add(network.get("id", ""))
+
+        changed: set[str] = set()
+        for change in changes:
+            network_id = change.get("networkId") if isinstance(change, dict) else None
+            if network_id in known:
+                changed.add(network_id)
+            elif network_id in bound:
+                changed |= bound[network_id] & known
+            elif not network_id or network_id not in inventory_ids:
+                changed = set(known)
+                break
+        for network_id in changed:
+            for last_collection in (
+                self._last_firewall_collection,
+                self._last_security_config_collection,
+                self._last_nat_config_collection,
+                self._last_vlan_config_collection,
+            ):
+                last_collection.pop(network_id, None)
+        self._config_changes_checked[org_id] = now
+
+        logger.debug(
+            "Checked MX configuration changes",
+            org_id=org_id,
+            change_count=len(changes),
+            changed_networks=len(changed),
+        )
+
     def _initialize_metrics(self) -> None:
         """Initialize firewall-related Prometheus gauge metrics."""
         self._firewall_rules_total = self.parent._create_gauge(
@@ -268,8 +477,9 @@ class MXFirewallCollector(SubCollectorMixin):
             Human-readable network name.
 
         """
-        if self._should_collect_firewall_rules(network_id):
-            base_labels = {
+        self._org_networks.setdefault(org_id, set()).add(network_id)
+        if self._should_collect_firewall_rules(network_id, org_id):
+            base_labels: dict[str, str] = {
                 LabelName.ORG_ID: org_id,
                 LabelName.NETWORK_ID: network_id,
             }
@@ -288,28 +498,6 @@ class MXFirewallCollector(SubCollectorMixin):
                 expected_type=dict,
                 operation="getNetworkApplianceFirewallL3FirewallRules",
             )
-            l3_rules = ApplianceFirewallRules.model_validate(l3_data).rules
-
-            # The last rule is always the built-in default rule; exclude it from the count
-            user_l3_rules = [r for r in l3_rules if (r.comment or "") != "Default rule"]
-
-            self.parent._set_metric(
-                self._firewall_rules_total,
-                {**base_labels, LabelName.RULE_TYPE: "L3"},
-                float(len(user_l3_rules)),
-                ttl_seconds=ttl_seconds,
-            )
-
-            # Default policy: determined from the last rule's policy field
-            if l3_rules:
-                default_rule = l3_rules[-1]
-                default_policy = default_rule.policy or "deny"
-                self.parent._set_metric(
-                    self._firewall_default_policy,
-                    base_labels,
-                    1.0 if default_policy == "allow" else 0.0,
-                    ttl_seconds=ttl_seconds,
-                )
 
             # L7 rules (same error-shape normalization as L3)
             self._track_api_call("getNetworkApplianceFirewallL7FirewallRules")
@@ -323,23 +511,47 @@ class MXFirewallCollector(SubCollectorMixin):
                 expected_type=dict,
                 operation="getNetworkApplianceFirewallL7FirewallRules",
             )
-            l7_rules = ApplianceFirewallRules.model_validate(l7_data).rules
 
-            self.parent._set_metric(
-                self._firewall_rules_total,
-                {**base_labels, LabelName.RULE_TYPE: "L7"},
-                float(len(l7_rules)),
-                ttl_seconds=ttl_seconds,
-            )
+            def emit() -> None:
+                l3_rules = ApplianceFirewallRules.model_validate(l3_data).rules
+                # The last rule is always the built-in default rule; exclude it
+                # from the count.
+                user_l3_rules = [r for r in l3_rules if (r.comment or "") != "Default rule"]
+                self._set_config_metric(
+                    self._firewall_rules_total,
+                    {**base_labels, LabelName.RULE_TYPE: "L3"},
+                    float(len(user_l3_rules)),
+                    ttl_seconds,
+                )
 
+                # Default policy: determined from the last rule's policy field
+                if l3_rules:
+                    default_policy = l3_rules[-1].policy or "deny"
+                    self._set_config_metric(
+                        self._firewall_default_policy,
+                        base_labels,
+                        1.0 if default_policy == "allow" else 0.0,
+                        ttl_seconds,
+                    )
+
+                l7_rules = ApplianceFirewallRules.model_validate(l7_data).rules
+                self._set_config_metric(
+                    self._firewall_rules_total,
+                    {**base_labels, LabelName.RULE_TYPE: "L7"},
+                    float(len(l7_rules)),
+                    ttl_seconds,
+                )
+
+            unchanged = self._emit_unless_unchanged(
+                "firewall", network_id, (l3_data, l7_data), ttl_seconds, emit
+            )
             self._mark_firewall_rules_collected(network_id)
 
             logger.debug(
                 "Collected firewall rules",
                 org_id=org_id,
                 network_id=network_id,
-                l3_user_rules=len(user_l3_rules),
-                l7_rules=len(l7_rules),
+                unchanged=unchanged,
             )
         else:
             logger.debug(
@@ -379,7 +591,7 @@ class MXFirewallCollector(SubCollectorMixin):
             Network ID for the appliance network.
 
         """
-        if not self._should_collect_security_config(network_id):
+        if not self._should_collect_security_config(network_id, org_id):
             logger.debug(
                 "Skipping security config collection (mx_security_config cadence not yet elapsed)",
                 org_id=org_id,
@@ -387,7 +599,7 @@ class MXFirewallCollector(SubCollectorMixin):
             )
             return
 
-        base_labels = {
+        base_labels: dict[str, str] = {
             LabelName.ORG_ID: org_id,
             LabelName.NETWORK_ID: network_id,
         }
@@ -404,27 +616,9 @@ class MXFirewallCollector(SubCollectorMixin):
             expected_type=dict,
             operation="getNetworkApplianceContentFiltering",
         )
-        content_filtering = ApplianceContentFiltering.model_validate(cf_data)
-        self.parent._set_metric(
-            self._content_filtering_blocked_categories,
-            base_labels,
-            float(len(content_filtering.blockedUrlCategories)),
-            ttl_seconds=ttl_seconds,
-        )
-        self.parent._set_metric(
-            self._content_filtering_blocked_url_patterns,
-            base_labels,
-            float(len(content_filtering.blockedUrlPatterns)),
-            ttl_seconds=ttl_seconds,
-        )
-        self.parent._set_metric(
-            self._content_filtering_allowed_url_patterns,
-            base_labels,
-            float(len(content_filtering.allowedUrlPatterns)),
-            ttl_seconds=ttl_seconds,
-        )
 
         # Malware protection -- 400/404 without an Advanced Security license.
+        malware_data: dict[str, Any] | None = None
         try:
             self._track_api_call("getNetworkApplianceSecurityMalware")
             malware_response = await facade_for(self).call(
@@ -437,25 +631,6 @@ class MXFirewallCollector(SubCollectorMixin):
                 expected_type=dict,
                 operation="getNetworkApplianceSecurityMalware",
             )
-            malware = ApplianceSecurityMalwareSettings.model_validate(malware_data)
-            self.parent._set_metric(
-                self._malware_protection_enabled,
-                base_labels,
-                1.0 if malware.mode == "enabled" else 0.0,
-                ttl_seconds=ttl_seconds,
-            )
-            self.parent._set_metric(
-                self._malware_allowed_urls,
-                base_labels,
-                float(len(malware.allowedUrls)),
-                ttl_seconds=ttl_seconds,
-            )
-            self.parent._set_metric(
-                self._malware_allowed_files,
-                base_labels,
-                float(len(malware.allowedFiles)),
-                ttl_seconds=ttl_seconds,
-            )
         except APIError as e:
             if e.status in {400, 404}:
                 logger.debug(
@@ -468,6 +643,7 @@ class MXFirewallCollector(SubCollectorMixin):
                 raise
 
         # IDS/IPS (intrusion) -- 400/404 without an Advanced Security license.
+        intrusion_data: dict[str, Any] | None = None
         try:
             self._track_api_call("getNetworkApplianceSecurityIntrusion")
             intrusion_response = await facade_for(self).call(
@@ -480,21 +656,6 @@ class MXFirewallCollector(SubCollectorMixin):
                 expected_type=dict,
                 operation="getNetworkApplianceSecurityIntrusion",
             )
-            intrusion = ApplianceSecurityIntrusionSettings.model_validate(intrusion_data)
-            if intrusion.mode:
-                self.parent._set_metric(
-                    self._ids_mode,
-                    {**base_labels, LabelName.MODE: intrusion.mode},
-                    1.0,
-                    ttl_seconds=ttl_seconds,
-                )
-            if intrusion.idsRulesets:
-                self.parent._set_metric(
-                    self._ids_ruleset,
-                    {**base_labels, LabelName.RULESET: intrusion.idsRulesets},
-                    1.0,
-                    ttl_seconds=ttl_seconds,
-                )
         except APIError as e:
             if e.status in {400, 404}:
                 logger.debug(
@@ -506,6 +667,68 @@ class MXFirewallCollector(SubCollectorMixin):
             else:
                 raise
 
+        def emit() -> None:
+            content_filtering = ApplianceContentFiltering.model_validate(cf_data)
+            self._set_config_metric(
+                self._content_filtering_blocked_categories,
+                base_labels,
+                float(len(content_filtering.blockedUrlCategories)),
+                ttl_seconds,
+            )
+            self._set_config_metric(
+                self._content_filtering_blocked_url_patterns,
+                base_labels,
+                float(len(content_filtering.blockedUrlPatterns)),
+                ttl_seconds,
+            )
+            self._set_config_metric(
+                self._content_filtering_allowed_url_patterns,
+                base_labels,
+                float(len(content_filtering.allowedUrlPatterns)),
+                ttl_seconds,
+            )
+
+            if malware_data is not None:
+                malware = ApplianceSecurityMalwareSettings.model_validate(malware_data)
+                self._set_config_metric(
+                    self._malware_protection_enabled,
+                    base_labels,
+                    1.0 if malware.mode == "enabled" else 0.0,
+                    ttl_seconds,
+                )
+                self._set_config_metric(
+                    self._malware_allowed_urls,
+                    base_labels,
+                    float(len(malware.allowedUrls)),
+                    ttl_seconds,
+                )
+                self._set_config_metric(
+                    self._malware_allowed_files,
+                    base_labels,
+                    float(len(malware.allowedFiles)),
+                    ttl_seconds,
+                )
+
+            if intrusion_data is not None:
+                intrusion = ApplianceSecurityIntrusionSettings.model_validate(intrusion_data)
+                if intrusion.mode:
+                    self._set_config_metric(
+                        self._ids_mode,
+                        {**base_labels, LabelName.MODE: intrusion.mode},
+                        1.0,
+                        ttl_seconds,
+                    )
+                if intrusion.idsRulesets:
+                    self._set_config_metric(
+                        self._ids_ruleset,
+                        {**base_labels, LabelName.RULESET: intrusion.idsRulesets},
+                        1.0,
+                        ttl_seconds,
+                    )
+
+        self._emit_unless_unchanged(
+            "security", network_id, (cf_data, malware_data, intrusion_data), ttl_seconds, emit
+        )
         self._mark_security_config_collected(network_id)
 
     @log_api_call("getNetworkApplianceFirewallPortForwardingRules")
@@ -528,7 +751,7 @@ class MXFirewallCollector(SubCollectorMixin):
             Network ID for the appliance network.
 
         """
-        if not self._should_collect_nat_config(network_id):
+        if not self._should_collect_nat_config(network_id, org_id):
             logger.debug(
                 "Skipping NAT config collection (mx_nat_config cadence not yet elapsed)",
                 org_id=org_id,
@@ -536,7 +759,7 @@ class MXFirewallCollector(SubCollectorMixin):
             )
             return
 
-        base_labels = {
+        base_labels: dict[str, str] = {
             LabelName.ORG_ID: org_id,
             LabelName.NETWORK_ID: network_id,
         }
@@ -552,13 +775,6 @@ class MXFirewallCollector(SubCollectorMixin):
             expected_type=dict,
             operation="getNetworkApplianceFirewallPortForwardingRules",
         )
-        port_forwarding = AppliancePortForwardingRules.model_validate(pf_data)
-        self.parent._set_metric(
-            self._port_forwarding_rules,
-            base_labels,
-            float(len(port_forwarding.rules)),
-            ttl_seconds=ttl_seconds,
-        )
 
         self._track_api_call("getNetworkApplianceFirewallOneToOneNatRules")
         one_to_one_response = await facade_for(self).call(
@@ -571,13 +787,6 @@ class MXFirewallCollector(SubCollectorMixin):
             expected_type=dict,
             operation="getNetworkApplianceFirewallOneToOneNatRules",
         )
-        one_to_one = ApplianceOneToOneNatRules.model_validate(one_to_one_data)
-        self.parent._set_metric(
-            self._nat_rules,
-            {**base_labels, LabelName.NAT_TYPE: "1:1"},
-            float(len(one_to_one.rules)),
-            ttl_seconds=ttl_seconds,
-        )
 
         self._track_api_call("getNetworkApplianceFirewallOneToManyNatRules")
         one_to_many_response = await facade_for(self).call(
@@ -590,14 +799,33 @@ class MXFirewallCollector(SubCollectorMixin):
             expected_type=dict,
             operation="getNetworkApplianceFirewallOneToManyNatRules",
         )
-        one_to_many = ApplianceOneToManyNatRules.model_validate(one_to_many_data)
-        self.parent._set_metric(
-            self._nat_rules,
-            {**base_labels, LabelName.NAT_TYPE: "1:many"},
-            float(len(one_to_many.rules)),
-            ttl_seconds=ttl_seconds,
-        )
 
+        def emit() -> None:
+            port_forwarding = AppliancePortForwardingRules.model_validate(pf_data)
+            self._set_config_metric(
+                self._port_forwarding_rules,
+                base_labels,
+                float(len(port_forwarding.rules)),
+                ttl_seconds,
+            )
+            one_to_one = ApplianceOneToOneNatRules.model_validate(one_to_one_data)
+            self._set_config_metric(
+                self._nat_rules,
+                {**base_labels, LabelName.NAT_TYPE: "1:1"},
+                float(len(one_to_one.rules)),
+                ttl_seconds,
+            )
+            one_to_many = ApplianceOneToManyNatRules.model_validate(one_to_many_data)
+            self._set_config_metric(
+                self._nat_rules,
+                {**base_labels, LabelName.NAT_TYPE: "1:many"},
+                float(len(one_to_many.rules)),
+                ttl_seconds,
+            )
+
+        self._emit_unless_unchanged(
+            "nat", network_id, (pf_data, one_to_one_data, one_to_many_data), ttl_seconds, emit
+        )
         self._mark_nat_config_collected(network_id)
 
     @log_api_call("getNetworkApplianceVlans")
@@ -623,7 +851,7 @@ class MXFirewallCollector(SubCollectorMixin):
             Network ID for the appliance network.
 
         """
-        if not self._should_collect_vlan_config(network_id):
+        if not self._should_collect_vlan_config(network_id, org_id):
             logger.debug(
                 "Skipping VLAN config collection (mx_vlan_config cadence not yet elapsed)",
                 org_id=org_id,
@@ -631,12 +859,13 @@ class MXFirewallCollector(SubCollectorMixin):
             )
             return
 
-        base_labels = {
+        base_labels: dict[str, str] = {
             LabelName.ORG_ID: org_id,
             LabelName.NETWORK_ID: network_id,
         }
         ttl_seconds = self.parent._group_ttl_seconds(EndpointGroupName.MX_VLAN_CONFIG)
 
+        vlans_data: list[Any] | None = None
         try:
             vlans_response = await facade_for(self).call(
                 "getNetworkApplianceVlans",
@@ -648,13 +877,6 @@ class MXFirewallCollector(SubCollectorMixin):
                 expected_type=list,
                 operation="getNetworkApplianceVlans",
             )
-            vlans = [ApplianceVlan.model_validate(v) for v in vlans_data]
-            self.parent._set_metric(
-                self._vlans_total,
-                base_labels,
-                float(len(vlans)),
-                ttl_seconds=ttl_seconds,
-            )
         except APIError as e:
             if e.status in {400, 404}:
                 logger.debug(
@@ -677,20 +899,33 @@ class MXFirewallCollector(SubCollectorMixin):
             expected_type=list,
             operation="getNetworkApplianceStaticRoutes",
         )
-        routes = [ApplianceStaticRoute.model_validate(r) for r in routes_data]
-        self.parent._set_metric(
-            self._static_routes_total,
-            base_labels,
-            float(len(routes)),
-            ttl_seconds=ttl_seconds,
-        )
-        self.parent._set_metric(
-            self._static_routes_enabled,
-            base_labels,
-            float(sum(1 for r in routes if r.enabled)),
-            ttl_seconds=ttl_seconds,
-        )
 
+        def emit() -> None:
+            if vlans_data is not None:
+                vlans = [ApplianceVlan.model_validate(v) for v in vlans_data]
+                self._set_config_metric(
+                    self._vlans_total,
+                    base_labels,
+                    float(len(vlans)),
+                    ttl_seconds,
+                )
+            routes = [ApplianceStaticRoute.model_validate(r) for r in routes_data]
+            self._set_config_metric(
+                self._static_routes_total,
+                base_labels,
+                float(len(routes)),
+                ttl_seconds,
+            )
+            self._set_config_metric(
+                self._static_routes_enabled,
+                base_labels,
+                float(sum(1 for r in routes if r.enabled)),
+                ttl_seconds,
+            )
+
+        self._emit_unless_unchanged(
+            "vlan", network_id, (vlans_data, routes_data), ttl_seconds, emit
+        )
         self._mark_vlan_config_collected(network_id)
 
     @log_api_call("getOrganizationApplianceSecurityEvents")
@@ -699,6 +934,7 @@ class MXFirewallCollector(SubCollectorMixin):
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MX_SECURITY_EVENTS)
     async def collect_org_security_events(self, org_id: str, org_name: str) -> None:
         """Collect aggregated MX security event counts for an organization.
 
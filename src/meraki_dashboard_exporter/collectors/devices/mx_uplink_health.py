@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from ...core.api_facade import facade_for
+from ...core.collector import measured_group
 from ...core.constants.metrics_constants import MXMetricName
 from ...core.domain_models import DeviceUplinkLossLatency, UplinkLossLatencyTimeSeriesPoint
 from ...core.error_handling import ErrorCategory, validate_response_format, with_error_handling
@@ -80,6 +81,7 @@ class MXUplinkHealthCollector(SubCollectorMixin):
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MX_UPLINK_HEALTH)
     async def collect_uplink_loss_latency(
         self, org_id: str, org_name: str, device_lookup: dict[str, dict[str, Any]]
     ) -> None:
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any
 
 from ...core.api_facade import facade_for
 from ...core.async_utils import ManagedTaskGroup
+from ...core.collector import measured_group
 from ...core.constants.device_constants import ProductType
 from ...core.constants.metrics_constants import MXMetricName
 from ...core.domain_models import ApplianceVpnSiteToSite, ApplianceVpnStats
@@ -232,6 +233,7 @@ class MXVpnCollector(SubCollectorMixin):
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.MX_VPN_CONFIG)
     async def collect_site_to_site_topology(self, org_id: str, org_name: str) -> None:
         """Collect site-to-site VPN topology config drift for every appliance network (#287).
 
@@ -340,7 +340,8 @@ class InsightCollector(MetricCollector):
         # (Re)fetch the monitored-application inventory when the applications
         # group is due, or when the cache is cold (needed to fan out health).
         if apps_due or org_id not in self._app_cache:
-            raw_apps = await self._fetch_applications(org_id)
+            with self._measure_group(EndpointGroupName.INSIGHT_APPLICATIONS):
+                raw_apps = await self._fetch_applications(org_id)
             if raw_apps is None:
                 logger.debug(
                     "Insight applications unavailable for organization; skipping",
@@ -354,7 +355,8 @@ class InsightCollector(MetricCollector):
 
         selected = self._app_cache.get(org_id, [])
         if health_due and selected:
-            await self._collect_application_health(org_id, org_name, selected)
+            with self._measure_group(EndpointGroupName.INSIGHT_APP_HEALTH):
+                await self._collect_application_health(org_id, org_name, selected)
 
     def _select_applications(
         self, applications: list[InsightApplication], org_id: str
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import math
 import time
 from typing import TYPE_CHECKING, Any
 
@@ -11,6 +12,7 @@ from opentelemetry import trace
 from prometheus_client import Counter, Gauge
 
 from ..core.async_utils import get_task_admission_metrics
+from ..core.concurrency_limiter import sdk_executor_workers
 from ..core.constants.metrics_constants import CollectorMetricName
 from ..core.error_handling import StartupConfigurationError, TaskExpiredBeforeStartError
 from ..core.logging import get_logger
@@ -18,7 +20,11 @@ from ..core.metrics import LabelName
 from ..core.org_health import OrgHealthTracker
 from ..core.otel_tracing import trace_method
 from ..core.rate_limiter import OrgRateLimiter
-from ..core.registry import get_registered_collectors
+from ..core.registry import (
+    collector_short_name,
+    get_registered_collectors,
+    import_collector_modules,
+)
 from ..core.scheduler import EndpointScheduler
 from ..services.inventory import OrganizationInventory
 
@@ -40,10 +46,12 @@ def calculate_collector_admission_limit(settings: Any) -> int:
 
     Each admitted collector may fan out to ``api.concurrency_limit`` SDK
     calls. Capping the outer admission count prevents those task groups from
-    collectively queuing more work than the dedicated executor can run.
+    collectively queuing more work than the dedicated executor can run. With
+    the adaptive concurrency limiter the executor is sized to its ceiling and
+    the limiter decides how much of it is used.
     """
     configured = int(settings.collectors.max_concurrent_collectors)
-    executor_workers = int(settings.api.executor_workers)
+    executor_workers = sdk_executor_workers(settings)
     fanout = int(settings.api.concurrency_limit)
     executor_capacity = max(1, executor_workers // fanout)
     return min(configured, executor_capacity)
@@ -69,7 +77,7 @@ _ORG_HEALTH_TRACKER_COLLECTORS = frozenset({
 
 
 class CollectorManager:
-    """Manages and coordinates metric collectors on per-collector, group-clocked loops.
+    """Manages and coordinates metric collectors run by the central dispatcher.
 
     Parameters
     ----------
@@ -102,11 +110,11 @@ class CollectorManager:
         # after collectors are instantiated (see _register_endpoint_groups).
         self.scheduler = EndpointScheduler(settings, self.rate_limiter)
 
-        # Flat list of all instantiated top-level collectors. Each runs its own
-        # endpoint-group-clocked loop (#631); there is no tier grouping.
+        # Flat list of all instantiated top-level collectors. Each is dispatched
+        # when its earliest endpoint group is due (#631); there is no tier grouping.
         self.collectors: list[MetricCollector] = []
 
-        # Bound concurrent collector runs across all the per-collector loops.
+        # Bound concurrent collector runs across every dispatch path.
         admission_limit = calculate_collector_admission_limit(self.settings)
         configured_limit = int(self.settings.collectors.max_concurrent_collectors)
         if admission_limit < configured_limit:
@@ -114,7 +122,7 @@ class CollectorManager:
                 "Collector concurrency reduced to fit SDK executor capacity",
                 configured_limit=configured_limit,
                 effective_limit=admission_limit,
-                executor_workers=self.settings.api.executor_workers,
+                executor_workers=sdk_executor_workers(self.settings),
                 per_collector_fanout=self.settings.api.concurrency_limit,
             )
         self._collector_semaphore = asyncio.Semaphore(admission_limit)
@@ -240,41 +248,36 @@ class CollectorManager:
 
     def _initialize_collectors(self) -> None:
         """Initialize all enabled collectors."""
-        # Import all collectors to trigger registration
-        # This ensures the @register_collector decorators are executed
-        from . import (  # noqa: F401
-            alerts,
-            clients,
-            config,
-            device,
-            insight,
-            mt_alerts,
-            mt_sensor,
-            network_health,
-            organization,
-        )
+        # Get active collector names for filtering
+        active_collector_names = self.settings.collectors.active_collectors
+
+        # Import only the enabled collectors' modules so their
+        # @register_collector decorators run; disabled ones are never loaded.
+        not_imported = import_collector_modules(active_collector_names)
 
         # Get all registered collectors (flat list, no tiers)
         registered_collectors = get_registered_collectors()
+        registered_names = {collector_class.__name__ for collector_class in registered_collectors}
+        inactive_names = [
+            name
+            for name in [*registered_names, *not_imported]
+            if collector_short_name(name) not in active_collector_names
+        ]
 
-        # Get active collector names for filtering
-        active_collector_names = self.settings.collectors.active_collectors
+        for collector_name in sorted(set(inactive_names)):
+            logger.info(
+                "Skipping collector (not in active list)",
+                collector=collector_name,
+            )
+            # Track skipped collectors
+            self.skipped_collectors.append({
+                "name": collector_name,
+                "reason": "not in active_collectors list",
+            })
 
         for collector_class in registered_collectors:
             collector_name = collector_class.__name__
-            collector_short_name = collector_name.replace("Collector", "").lower()
-
-            # Check if collector is in active list
-            if collector_short_name not in active_collector_names:
-                logger.info(
-                    "Skipping collector (not in active list)",
-                    collector=collector_name,
-                )
-                # Track skipped collectors
-                self.skipped_collectors.append({
-                    "name": collector_name,
-                    "reason": "not in active_collectors list",
-                })
+            if collector_short_name(collector_name) not in active_collector_names:
                 continue
 
             try:
@@ -400,13 +403,11 @@ class CollectorManager:
         # Get all known collector names (short form)
         all_known_collectors = set()
         for collector in self.collectors:
-            collector_short_name = collector.__class__.__name__.replace("Collector", "").lower()
-            all_known_collectors.add(collector_short_name)
+            all_known_collectors.add(collector_short_name(collector.__class__.__name__))
 
         # Also add skipped collectors to known list
         for skipped in self.skipped_collectors:
-            collector_short_name = skipped["name"].replace("Collector", "").lower()
-            all_known_collectors.add(collector_short_name)
+            all_known_collectors.add(collector_short_name(skipped["name"]))
 
         # Check for unknown collector names in configuration
         configured_collectors = self.settings.collectors.active_collectors
@@ -485,15 +486,22 @@ class CollectorManager:
 
     @property
     def is_ready(self) -> bool:
-        """Whether every readiness-gating collector has succeeded at least once.
+        """Whether enough readiness-gating collectors have succeeded at least once.
 
+        "Enough" is ``collectors.readiness_quorum`` of them (all, by default),
         AND at least one Meraki API request has returned HTTP 200 (#509
         hardening). A collector cycle that produced no success withholds
         readiness (F-105).
         """
         gating = self._readiness_collectors()
-        all_succeeded = all(c.__class__.__name__ in self._collector_succeeded for c in gating)
-        return bool(gating) and all_succeeded and self._has_api_success()
+        succeeded = sum(c.__class__.__name__ in self._collector_succeeded for c in gating)
+        quorum_met = succeeded >= math.ceil(self._readiness_quorum() * len(gating))
+        return bool(gating) and quorum_met and self._has_api_success()
+
+    def _readiness_quorum(self) -> float:
+        """Configured readiness quorum, tolerating settings doubles without it."""
+        quorum = getattr(self.settings.collectors, "readiness_quorum", 1.0)
+        return float(quorum) if isinstance(quorum, int | float) else 1.0
 
     def _has_api_success(self) -> bool:
         """Whether at least one Meraki API request returned HTTP 200 (#509)."""
@@ -506,20 +514,50 @@ class CollectorManager:
         Returns
         -------
         dict[str, Any]
-            Dictionary with "ready" bool, "api_success" bool, and "collectors"
+            Dictionary with "ready" bool, "api_success" bool, "quorum" (the
+            configured fraction of gating collectors required), "collectors"
             mapping each readiness-gating collector name to whether it has
-            succeeded at least once.
+            succeeded at least once, and "orgs" mapping each known organization
+            to whether its inventory is warm and which readiness-gating
+            endpoint groups are currently serving fresh data.
 
         """
+        gating = self._readiness_collectors()
         return {
             "ready": self.is_ready,
             "api_success": self._has_api_success(),
+            "quorum": self._readiness_quorum(),
             "collectors": {
                 collector.__class__.__name__: (
                     collector.__class__.__name__ in self._collector_succeeded
                 )
-                for collector in self._readiness_collectors()
+                for collector in gating
             },
+            "orgs": self._org_readiness(gating),
+        }
+
+    def _org_readiness(self, gating: list[MetricCollector]) -> dict[str, dict[str, Any]]:
+        """Per-org inventory warmth and gating-group freshness for ``/ready``."""
+        warmed = getattr(self.inventory, "warmed_organizations", None)
+        warm_orgs = set(warmed()) if callable(warmed) else set()
+        org_ids = set(warm_orgs)
+        if isinstance(self.settings.meraki.org_id, str):
+            org_ids.add(self.settings.meraki.org_id)
+        groups = sorted(
+            {
+                group.name
+                for collector in gating
+                for group in collector.get_endpoint_groups()
+                if group.priority <= 3 and group.gated
+            },
+            key=str,
+        )
+        return {
+            org_id: {
+                "inventory_warm": org_id in warm_orgs,
+                "groups": {str(group): self.scheduler.is_fresh(group) for group in groups},
+            }
+            for org_id in sorted(org_ids)
         }
 
     def get_last_success_time(self) -> float | None:
@@ -568,12 +606,15 @@ class CollectorManager:
         return sorted(self.collectors, key=sort_key)
 
     async def collect_initial(self) -> None:
-        """Run one initial collection of every collector, sequentially.
-
-        Ordered by best group priority (up-ness first) then name, to bound
-        startup API load while landing the freshest signals earliest. Every gate
-        is open on a cold start (never-attempted groups are due), so this
-        refetches everything once.
+        """Run one initial collection of every collector.
+
+        Started in best-group-priority order (up-ness first) then name, so the
+        freshest signals land earliest, with at most
+        ``collectors.cold_start_concurrency`` running at once to bound startup
+        API load. Readiness is tracked per collector as each one finishes, so
+        one slow collector no longer holds back the rest. Every gate is open on
+        a cold start (never-attempted groups are due), so this refetches
+        everything once.
         """
         # Warm the cache before the first collection cycle so collectors get cache hits
         try:
@@ -593,22 +634,36 @@ class CollectorManager:
         if self.settings.network_filter.is_active:
             await self._validate_network_filter()
 
-        # Collect one collector at a time (priority order) to bound startup load.
-        for collector in self._ordered_collectors():
-            try:
-                await self.run_collector_once(collector, force=True)
+        concurrency = getattr(self.settings.collectors, "cold_start_concurrency", 1)
+        if not isinstance(concurrency, int) or concurrency <= 1:
+            # Collect one collector at a time (priority order) to bound startup load.
+            for collector in self._ordered_collectors():
+                await self._collect_initial_one(collector)
                 # Small delay between collectors to avoid connection pool exhaustion
                 await asyncio.sleep(1)
-            except Exception:
-                logger.exception(
-                    "Failed to collect during initial collection",
-                    collector=collector.__class__.__name__,
-                )
-                # Continue with the next collector even if this one fails
+        else:
+            # The semaphore admits waiters FIFO, so collectors start in priority order.
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def bounded(collector: MetricCollector) -> None:
+                async with semaphore:
+                    await self._collect_initial_one(collector)
+
+            await asyncio.gather(*(bounded(c) for c in self._ordered_collectors()))
 
         # Publish the per-collector cadence gauges now that a schedule exists.
         self._emit_cadence_gauges()
 
+    async def _collect_initial_one(self, collector: MetricCollector) -> None:
+        """Run one collector's initial collection; failures are logged, not raised."""
+        try:
+            await self.run_collector_once(collector, force=True)
+        except Exception:
+            logger.exception(
+                "Failed to collect during initial collection",
+                collector=collector.__class__.__name__,
+            )
+
     async def validate_profile_selection(self) -> None:
         """Resolve the startup plan and reject an ambiguous over-budget profile.
 
@@ -759,7 +814,7 @@ class CollectorManager:
         """Run a single collector once with timeout, concurrency bound, and health tracking.
 
         Bounded by the global ``max_concurrent_collectors`` semaphore so the many
-        per-collector loops never overwhelm the API together. When ``force`` is
+        dispatcher, webhooks and manual triggers never overwhelm the API together. When ``force`` is
         True the collector fetches every group regardless of its gate (manual
         trigger). Tracks active collections, errors, cadence-utilization, and
         health; records first-success for readiness.
@@ -346,11 +346,14 @@ class MTSensorAlertsCollector(MetricCollector):
 
         async def _process_network(network: dict[str, Any]) -> None:
             if alerts_due:
-                await self._collect_network_alerts(network)
+                with self._measure_group(EndpointGroupName.MT_SENSOR_ALERTS):
+                    await self._collect_network_alerts(network)
             if profiles_due:
-                await self._collect_network_alert_profiles(network)
+                with self._measure_group(EndpointGroupName.MT_ALERT_PROFILES):
+                    await self._collect_network_alert_profiles(network)
             if relationships_due:
-                await self._collect_network_relationships(network)
+                with self._measure_group(EndpointGroupName.MT_RELATIONSHIPS):
+                    await self._collect_network_relationships(network)
 
         await process_in_batches_with_errors(
             sensor_networks,
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import functools
-from collections.abc import Awaitable, Callable
+from collections import Counter
+from collections.abc import Awaitable, Callable, Mapping
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from ..core.async_utils import ManagedTaskGroup
@@ -26,6 +27,12 @@ from ..core.registry import register_collector
 from ..core.scheduler import EndpointGroup, EndpointGroupName, pages
 from .network_health_collectors.air_marshal import AirMarshalCollector
 from .network_health_collectors.bluetooth import BluetoothCollector
+from .network_health_collectors.capabilities import (
+    REASON_KNOWN_UNAVAILABLE,
+    REASON_NO_APS,
+    REASON_NOT_CAPABLE,
+    NetworkCapabilityCache,
+)
 from .network_health_collectors.connection_stats import ConnectionStatsCollector
 from .network_health_collectors.data_rates import DataRatesCollector
 from .network_health_collectors.latency_stats import LatencyStatsCollector
@@ -60,6 +67,15 @@ _BUNDLE_GROUPS: tuple[EndpointGroupName, ...] = (
     EndpointGroupName.NH_MESH,
 )
 
+# API calls one bundle group issues per network (for skipped-call accounting);
+# groups not listed issue one.
+_BUNDLE_CALLS_PER_NETWORK: dict[EndpointGroupName, float] = {
+    EndpointGroupName.NH_LATENCY_STATS: 2.0,
+}
+
+# A mesh repeater needs a gateway AP, so a network needs two APs to have one.
+_MESH_MIN_APS = 2
+
 
 @register_collector
 class NetworkHealthCollector(MetricCollector):
@@ -171,6 +187,10 @@ class NetworkHealthCollector(MetricCollector):
         self.air_marshal_collector = AirMarshalCollector(self)
         self.mesh_collector = MeshCollector(self)
 
+        # Known-unavailable (network, group) pairs re-probed on a slow cadence,
+        # plus the skipped-call counter for every capability-filtered call.
+        self.network_capabilities = NetworkCapabilityCache()
+
     def _initialize_metrics(self) -> None:
         """Initialize network health metrics."""
         # RF channel utilization metrics per AP
@@ -479,9 +499,10 @@ class NetworkHealthCollector(MetricCollector):
             # endpoints return every wireless device/network in the org in one
             # paginated pass each, so per-network fan-out here would be wasteful.
             if self._should_run_group(EndpointGroupName.NH_CHANNEL_UTILIZATION):
-                channel_util_ok = await self.rf_health_collector.collect_org(
-                    org_id, org_name or org_id, wireless_networks
-                )
+                with self._measure_group(EndpointGroupName.NH_CHANNEL_UTILIZATION):
+                    channel_util_ok = await self.rf_health_collector.collect_org(
+                        org_id, org_name or org_id, wireless_networks
+                    )
                 # Mark ran only if the org-wide fetch achieved >=1 successful
                 # fetch this cycle (#629). Total failure leaves the gate open so
                 # the next cycle retries instead of waiting out the interval.
@@ -493,9 +514,33 @@ class NetworkHealthCollector(MetricCollector):
             # fan-out only for the groups that are due, then mark each ran.
             due_groups = frozenset(g for g in _BUNDLE_GROUPS if self._should_run_group(g))
             if due_groups:
+                self.network_capabilities.prune()
+                # Capability pre-filter: a wireless network with no APs in the
+                # inventory has nothing for any bundle group to report.
+                ap_counts = await self._wireless_ap_counts(org_id)
+                bundle_networks = wireless_networks
+                if ap_counts is not None:
+                    bundle_networks = [n for n in wireless_networks if ap_counts.get(n["id"])]
+                    skipped = len(wireless_networks) - len(bundle_networks)
+                    if skipped:
+                        for group in due_groups:
+                            self.network_capabilities.record_skipped(
+                                group,
+                                REASON_NO_APS,
+                                skipped * _BUNDLE_CALLS_PER_NETWORK.get(group, 1.0),
+                            )
+                if not bundle_networks:
+                    # Nothing to fetch for any network: the due groups are done.
+                    for group in due_groups:
+                        self._mark_group_ran(group)
+                    return
                 results = await process_in_batches_with_errors(
-                    wireless_networks,
-                    functools.partial(self._collect_network_health_bundle, due_groups=due_groups),
+                    bundle_networks,
+                    functools.partial(
+                        self._collect_network_health_bundle,
+                        due_groups=due_groups,
+                        ap_counts=ap_counts,
+                    ),
                     batch_size=self.settings.api.network_batch_size,
                     delay_between_batches=self.settings.api.batch_delay,
                     spread_over_seconds=self._get_smoothing_window(),
@@ -571,8 +616,76 @@ class NetworkHealthCollector(MetricCollector):
                 org_id, org_name, source=SOURCE_NETWORK_HEALTH, category=category
             )
 
+    async def _wireless_ap_counts(self, org_id: str) -> dict[str, int] | None:
+        """Count wireless devices per network from the inventory cache.
+
+        Parameters
+        ----------
+        org_id : str
+            Organization ID.
+
+        Returns
+        -------
+        dict[str, int] | None
+            AP count per network ID, or None when the device inventory is
+            unavailable or empty (capability pre-filtering then fails open).
+
+        """
+        if self.inventory is None:
+            return None
+        try:
+            devices = await self.inventory.get_devices(org_id)
+        except Exception:
+            logger.debug("Device inventory unavailable for capability filtering", org_id=org_id)
+            return None
+        if not isinstance(devices, list) or not devices:
+            return None
+        return dict(
+            Counter(
+                device["networkId"]
+                for device in devices
+                if device.get("productType") == ProductType.WIRELESS and device.get("networkId")
+            )
+        )
+
+    async def _skip_reason(
+        self, network: dict[str, Any], group: EndpointGroupName, ap_count: int | None
+    ) -> str | None:
+        """Return why ``group`` can be skipped for ``network``, or None to fetch it.
+
+        Parameters
+        ----------
+        network : dict[str, Any]
+            Network data.
+        group : EndpointGroupName
+            Due bundle group.
+        ap_count : int | None
+            APs in the network per inventory; None when unknown.
+
+        Returns
+        -------
+        str | None
+            ``not_capable`` when the network lacks the feature,
+            ``known_unavailable`` when the pair recently returned 400 or
+            nothing, else None.
+
+        """
+        if group is EndpointGroupName.NH_MESH and ap_count is not None and ap_count < _MESH_MIN_APS:
+            return REASON_NOT_CAPABLE
+        if self.network_capabilities.is_known_unavailable(network["id"], group):
+            return REASON_KNOWN_UNAVAILABLE
+        if (
+            group is EndpointGroupName.NH_BLUETOOTH
+            and not await self.bluetooth_collector.scanning_enabled(network)
+        ):
+            return REASON_NOT_CAPABLE
+        return None
+
     async def _collect_network_health_bundle(
-        self, network: dict[str, Any], due_groups: frozenset[EndpointGroupName]
+        self,
+        network: dict[str, Any],
+        due_groups: frozenset[EndpointGroupName],
+        ap_counts: Mapping[str, int] | None = None,
     ) -> frozenset[EndpointGroupName]:
         """Collect the per-network health sub-metrics for a single network.
 
@@ -593,12 +706,16 @@ class NetworkHealthCollector(MetricCollector):
             Network data (already wireless-filtered by the coordinator).
         due_groups : frozenset[EndpointGroupName]
             The per-network groups that are due this cycle.
+        ap_counts : Mapping[str, int] | None
+            AP count per network from inventory, for capability pre-filtering;
+            None when unknown.
 
         Returns
         -------
         frozenset[EndpointGroupName]
             The subset of ``due_groups`` whose fetch succeeded for this network
-            (a successful fetch returning empty still counts as success).
+            (a successful fetch returning empty still counts as success, and
+            so does a group skipped by capability filtering).
 
         """
         # (group, per-network collect coroutine factory) in bundle order.
@@ -614,25 +731,36 @@ class NetworkHealthCollector(MetricCollector):
             (EndpointGroupName.NH_MESH, self._collect_network_mesh),
         )
 
+        ap_count = ap_counts.get(network["id"]) if ap_counts is not None else None
         succeeded: set[EndpointGroupName] = set()
         for group, collect in group_calls:
             if group not in due_groups:
                 continue
-            try:
-                await collect(network)
-            except Exception as exc:
-                # Per-network per-group failure: isolate it so sibling groups
-                # (and other networks) still run, mirror the fan-out's #621
-                # error accounting, and record no success for this group here.
-                self._track_error(categorize_error(exc))
-                logger.debug(
-                    "Network-health group fetch failed for network",
-                    group=group.value,
-                    network_id=network.get("id"),
-                    network_name=network.get("name"),
-                )
-            else:
-                succeeded.add(group)
+            # Charge this group's calls (capability probe included) to its own
+            # measured execution, not to whichever gate was admitted last.
+            with self._measure_group(group):
+                reason = await self._skip_reason(network, group, ap_count)
+                if reason is not None:
+                    self.network_capabilities.record_skipped(
+                        group, reason, _BUNDLE_CALLS_PER_NETWORK.get(group, 1.0)
+                    )
+                    succeeded.add(group)
+                    continue
+                try:
+                    await collect(network)
+                except Exception as exc:
+                    # Per-network per-group failure: isolate it so sibling groups
+                    # (and other networks) still run, mirror the fan-out's #621
+                    # error accounting, and record no success for this group here.
+                    self._track_error(categorize_error(exc))
+                    logger.debug(
+                        "Network-health group fetch failed for network",
+                        group=group.value,
+                        network_id=network.get("id"),
+                        network_name=network.get("name"),
+                    )
+                else:
+                    succeeded.add(group)
         return frozenset(succeeded)
 
     async def _fetch_networks_for_health(self, org_id: str) -> list[dict[str, Any]]:
@@ -3,6 +3,7 @@
 from .air_marshal import AirMarshalCollector
 from .base import BaseNetworkHealthCollector
 from .bluetooth import BluetoothCollector
+from .capabilities import NetworkCapabilityCache
 from .connection_stats import ConnectionStatsCollector
 from .data_rates import DataRatesCollector
 from .latency_stats import LatencyStatsCollector
@@ -18,6 +19,7 @@ __all__ = [
     "DataRatesCollector",
     "LatencyStatsCollector",
     "MeshCollector",
+    "NetworkCapabilityCache",
     "RFHealthCollector",
     "SSIDPerformanceCollector",
 ]
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 from ...core.logging import get_logger
 from ..subcollector_mixin import SubCollectorMixin
+from .capabilities import NetworkCapabilityCache
 
 if TYPE_CHECKING:
     from ...core.config import Settings
@@ -29,3 +30,15 @@ class BaseNetworkHealthCollector(SubCollectorMixin):
         self.parent = parent
         self.api = parent.api
         self.settings: Settings = parent.settings
+
+    def _record_unavailable(self, network_id: str, group: str) -> None:
+        """Record a 400 or empty result in the parent's capability cache."""
+        cache = getattr(self.parent, "network_capabilities", None)
+        if isinstance(cache, NetworkCapabilityCache):
+            cache.record_unavailable(network_id, group)
+
+    def _record_available(self, network_id: str, group: str) -> None:
+        """Clear a known-unavailable entry after the group returned data."""
+        cache = getattr(self.parent, "network_capabilities", None)
+        if isinstance(cache, NetworkCapabilityCache):
+            cache.record_available(network_id, group)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, Any, cast
 
 from ...core.api_facade import facade_for
@@ -12,6 +13,7 @@ from ...core.logging_decorators import log_api_call
 from ...core.logging_helpers import LogContext
 from ...core.scheduler import EndpointGroupName
 from .base import BaseNetworkHealthCollector
+from .capabilities import REPROBE_SECONDS, is_unavailable_error
 
 if TYPE_CHECKING:
     pass
@@ -22,6 +24,92 @@ logger = get_logger(__name__)
 class BluetoothCollector(BaseNetworkHealthCollector):
     """Collector for Bluetooth clients detected by MR devices in a network."""
 
+    def __init__(self, parent: Any) -> None:
+        """Initialize the Bluetooth collector.
+
+        Parameters
+        ----------
+        parent : Any
+            Parent NetworkHealthCollector instance.
+
+        """
+        super().__init__(parent)
+        # network_id -> (recheck_at, scanning enabled), refreshed every
+        # REPROBE_SECONDS so networks with scanning off skip the client call.
+        self._scanning_enabled: dict[str, tuple[float, bool]] = {}
+
+    @log_api_call("getNetworkWirelessBluetoothSettings")
+    async def _fetch_bluetooth_settings(
+        self, network_id: str, org_id: str | None = None
+    ) -> dict[str, Any]:
+        """Fetch the wireless Bluetooth settings for a network.
+
+        Parameters
+        ----------
+        network_id : str
+            Network ID.
+        org_id : str | None
+            Organization ID for rate-limit keying (consumed by @log_api_call).
+
+        Returns
+        -------
+        dict[str, Any]
+            The network's Bluetooth settings.
+
+        """
+        _ = org_id  # Consumed by the @log_api_call decorator for rate-limit keying.
+        response = await facade_for(self).call(
+            "getNetworkWirelessBluetoothSettings",
+            self.api.wireless.getNetworkWirelessBluetoothSettings,
+            network_id,
+        )
+        return cast(
+            dict[str, Any],
+            validate_response_format(
+                response,
+                expected_type=dict,
+                operation="getNetworkWirelessBluetoothSettings",
+            ),
+        )
+
+    async def scanning_enabled(self, network: dict[str, Any]) -> bool:
+        """Return whether the network's APs scan for Bluetooth clients.
+
+        Checked once per ``REPROBE_SECONDS`` per network. Fails open: when the
+        settings cannot be read, the network is treated as scanning.
+
+        Parameters
+        ----------
+        network : dict[str, Any]
+            Network data.
+
+        Returns
+        -------
+        bool
+            False only when the settings report ``scanningEnabled: false``.
+
+        """
+        network_id = network["id"]
+        now = time.time()
+        cached = self._scanning_enabled.get(network_id)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+
+        try:
+            bt_settings = await self._fetch_bluetooth_settings(
+                network_id, org_id=network.get("orgId", "")
+            )
+            enabled = bt_settings.get("scanningEnabled") is not False
+        except Exception as e:
+            logger.debug(
+                "Bluetooth settings not available; assuming scanning is enabled",
+                network_id=network_id,
+                error=str(e),
+            )
+            enabled = True
+        self._scanning_enabled[network_id] = (now + REPROBE_SECONDS, enabled)
+        return enabled
+
     @log_api_call("getNetworkBluetoothClients")
     async def _fetch_bluetooth_clients(
         self, network_id: str, org_id: str | None = None
@@ -100,6 +188,8 @@ class BluetoothCollector(BaseNetworkHealthCollector):
             )
 
         except Exception as e:
+            if is_unavailable_error(e):
+                self._record_unavailable(network_id, EndpointGroupName.NH_BLUETOOTH)
             # Log at debug level if it's just not available (400/404 errors)
             # or if the API exhausted retries on a rate limit.
             #
@@ -0,0 +1,129 @@
+"""Capability pre-filtering and negative-result caching for network health.
+
+The per-network bundle issues one call per due group for every wireless
+network, but several groups have nothing to report on most networks: mesh
+needs a repeater (so at least two APs), Bluetooth client counts need scanning
+enabled, and a wireless network with no APs in inventory has no wireless data
+at all. Those calls come back 400/404 or empty every cycle.
+
+``NetworkCapabilityCache`` remembers the (network, group) pairs that came
+back 400 or empty and skips them until a slow re-probe. 404s are left to the
+API facade's negative-result cache, which already answers repeats of a
+per-network read locally. Every call the coordinator skips, whether by
+pre-filter or by this cache, is counted in
+``meraki_exporter_network_health_skipped_calls_total``.
+"""
+
+from __future__ import annotations
+
+import time
+import zlib
+from dataclasses import dataclass
+
+from prometheus_client import REGISTRY, Counter
+
+from ...core.constants.metrics_constants import CollectorMetricName
+from ...core.error_handling import ErrorCategory, categorize_error
+from ...core.metrics import LabelName
+
+#: Seconds a (network, group) pair stays known-unavailable before one re-probe.
+REPROBE_SECONDS = 6 * 3600
+
+# Up to this fraction is added to each entry's re-probe delay, keyed on the
+# pair, so pairs recorded in the same cycle do not all re-probe together.
+_REPROBE_JITTER = 0.1
+
+#: Skip reasons (bounded ``reason`` label values).
+REASON_NO_APS = "no_aps"
+REASON_NOT_CAPABLE = "not_capable"
+REASON_KNOWN_UNAVAILABLE = "known_unavailable"
+
+
+@dataclass(frozen=True)
+class NetworkCapabilityMetrics:
+    """Counters for network-health calls skipped by capability filtering."""
+
+    skipped_calls: Counter
+
+
+_capability_metrics: NetworkCapabilityMetrics | None = None
+
+
+def get_capability_metrics() -> NetworkCapabilityMetrics:
+    """Return capability metrics, recreating them after an isolated test registry reset."""
+    global _capability_metrics
+    metric_name = CollectorMetricName.NETWORK_HEALTH_SKIPPED_CALLS_TOTAL.value
+    if _capability_metrics is None or metric_name not in REGISTRY._names_to_collectors:
+        _capability_metrics = NetworkCapabilityMetrics(
+            skipped_calls=Counter(
+                metric_name,
+                "Per-network health API calls skipped by group and reason (no_aps = no "
+                "APs in inventory, not_capable = feature absent, known_unavailable = "
+                "returned 400 or empty recently)",
+                labelnames=[LabelName.GROUP.value, LabelName.REASON.value],
+            ),
+        )
+    return _capability_metrics
+
+
+def is_unavailable_error(exc: BaseException) -> bool:
+    """Return whether ``exc`` is the 400 a network without the feature returns.
+
+    Categorized by :func:`categorize_error`, so the HTTP status decides rather
+    than the message text. 404s are not recorded here: the API facade's
+    negative-result cache already suppresses them.
+    """
+    return isinstance(exc, Exception) and (categorize_error(exc) is ErrorCategory.API_CLIENT_ERROR)
+
+
+class NetworkCapabilityCache:
+    """Known-unavailable (network, group) pairs with a slow re-probe.
+
+    Parameters
+    ----------
+    reprobe_seconds : float
+        Base delay before a known-unavailable pair is called again.
+
+    """
+
+    def __init__(self, reprobe_seconds: float = REPROBE_SECONDS) -> None:
+        """Initialize an empty cache."""
+        self.reprobe_seconds = reprobe_seconds
+        self._unavailable: dict[tuple[str, str], float] = {}
+        self._metrics = get_capability_metrics()
+
+    def is_known_unavailable(self, network_id: str, group: str, now: float | None = None) -> bool:
+        """Return whether the pair is still inside its re-probe delay."""
+        key = (network_id, str(group))
+        expires_at = self._unavailable.get(key)
+        if expires_at is None:
+            return False
+        if (time.time() if now is None else now) >= expires_at:
+            del self._unavailable[key]
+            return False
+        return True
+
+    def record_unavailable(self, network_id: str, group: str, now: float | None = None) -> None:
+        """Remember that the pair returned 400 or nothing."""
+        key = (network_id, str(group))
+        jitter = (zlib.crc32(f"{network_id}:{group}".encode()) % 1000) / 1000 * _REPROBE_JITTER
+        now = time.time() if now is None else now
+        self._unavailable[key] = now + self.reprobe_seconds * (1 + jitter)
+
+    def record_available(self, network_id: str, group: str) -> None:
+        """Forget the pair after it returned data."""
+        self._unavailable.pop((network_id, str(group)), None)
+
+    def record_skipped(self, group: str, reason: str, calls: float = 1.0) -> None:
+        """Count ``calls`` API calls skipped for ``group``."""
+        self._metrics.skipped_calls.labels(group=str(group), reason=reason).inc(calls)
+
+    def prune(self, now: float | None = None) -> None:
+        """Drop entries whose re-probe delay has passed."""
+        now = time.time() if now is None else now
+        for key in [key for key, expires_at in self._unavailable.items() if expires_at <= now]:
+            del self._unavailable[key]
+
+    def __len__(self) -> int:
+        """Return the number of known-unavailable pairs."""
+        return len(self._unavailable)
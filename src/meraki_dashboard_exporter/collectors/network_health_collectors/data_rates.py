@@ -12,6 +12,7 @@ from ...core.logging_decorators import log_api_call
 from ...core.logging_helpers import LogContext
 from ...core.scheduler import EndpointGroupName
 from .base import BaseNetworkHealthCollector
+from .capabilities import is_unavailable_error
 
 if TYPE_CHECKING:
     pass
@@ -132,6 +133,8 @@ class DataRatesCollector(BaseNetworkHealthCollector):
                 )
 
         except Exception as e:
+            if is_unavailable_error(e):
+                self._record_unavailable(network_id, EndpointGroupName.NH_DATA_RATES)
             # Log at debug level if it's just not available (400/404 errors)
             # or if the API exhausted retries on a rate limit.
             error_str = str(e)
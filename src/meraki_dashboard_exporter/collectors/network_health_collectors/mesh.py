@@ -36,6 +36,7 @@ from ...core.logging_helpers import LogContext
 from ...core.metrics import LabelName
 from ...core.scheduler import EndpointGroupName
 from .base import BaseNetworkHealthCollector
+from .capabilities import is_unavailable_error
 
 if TYPE_CHECKING:
     pass
@@ -136,6 +137,8 @@ class MeshCollector(BaseNetworkHealthCollector):
             with LogContext(network_id=network_id, network_name=network_name, org_id=org_id):
                 entries = await self._fetch_mesh_statuses(network_id)
         except Exception as e:
+            if is_unavailable_error(e):
+                self._record_unavailable(network_id, EndpointGroupName.NH_MESH)
             # Log at debug level if it's just not available (400/404 - the
             # network has no repeaters, by far the common case) or the API
             # exhausted retries on a rate limit. Deliberately do NOT emit any
@@ -162,7 +165,10 @@ class MeshCollector(BaseNetworkHealthCollector):
             return
 
         if not entries:
+            # No repeaters: re-probe on the slow capability cadence, not hourly.
+            self._record_unavailable(network_id, EndpointGroupName.NH_MESH)
             return
+        self._record_available(network_id, EndpointGroupName.NH_MESH)
 
         ttl_seconds = self.parent._group_ttl_seconds(EndpointGroupName.NH_MESH)
         base_labels = create_network_labels(network, org_id=org_id, org_name=org_name)
@@ -13,6 +13,7 @@ from ...core.logging_helpers import LogContext
 from ...core.metrics import LabelName
 from ...core.scheduler import EndpointGroupName
 from .base import BaseNetworkHealthCollector
+from .capabilities import is_unavailable_error
 
 if TYPE_CHECKING:
     pass
@@ -122,6 +123,8 @@ class SSIDPerformanceCollector(BaseNetworkHealthCollector):
                 )
 
         except Exception as e:
+            if is_unavailable_error(e):
+                self._record_unavailable(network_id, EndpointGroupName.NH_FAILED_CONNECTIONS)
             error_str = str(e)
             if (
                 "400" in error_str
@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Any, ClassVar, cast
 from ..core.api_facade import facade_for
 from ..core.api_helpers import create_api_helper
 from ..core.async_utils import ManagedTaskGroup
-from ..core.collector import MetricCollector
+from ..core.collector import MetricCollector, measured_group
 from ..core.constants import DeviceMetricName, NetworkMetricName, OrgMetricName
 from ..core.constants.metrics_constants import CollectorMetricName
 from ..core.error_handling import (
@@ -527,11 +527,14 @@ class OrganizationCollector(MetricCollector):
         # currently in OrgHealthTracker backoff are skipped HERE, before the
         # worker coroutine is even constructed (not inside the worker), so an
         # all-orgs-in-backoff cycle can be distinguished from a genuine
-        # success by the frozen coordinator failure rule below (#509).
+        # success by the frozen coordinator failure rule below (#509). With
+        # several orgs, every org starts at once and their sub-collections take
+        # turns on the weighted fair queue instead of orgs running in list order.
+        fair = self._start_fair_queue(len(organizations), self.settings.api.concurrency_limit)
         skipped_backoff = 0
         async with ManagedTaskGroup(
             name="org_collector_orgs",
-            max_concurrency=self.settings.api.concurrency_limit,
+            max_concurrency=len(organizations) if fair else self.settings.api.concurrency_limit,
         ) as group:
             for org in organizations:
                 org_id = org["id"]
@@ -762,7 +765,11 @@ class OrganizationCollector(MetricCollector):
         ) -> None:
             nonlocal succeeded
             try:
-                result = await coro
+                async with self._org_slot(org_id):
+                    result = await coro
+            except asyncio.CancelledError:
+                coro.close()  # Cancelled while queued for a fair-queue slot.
+                raise
             except CollectorError as exc:
                 if exc.category == ErrorCategory.API_NOT_AVAILABLE:
                     return
@@ -1006,6 +1013,7 @@ class OrganizationCollector(MetricCollector):
         continue_on_error=False,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.ORG_DEVICE_MODEL_OVERVIEW)
     async def _collect_device_counts_by_model(self, org_id: str, org_name: str) -> None:
         """Collect device counts by specific model.
 
@@ -1116,6 +1124,7 @@ class OrganizationCollector(MetricCollector):
         continue_on_error=False,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.ORG_AVAILABILITIES)
     async def _collect_device_availability_metrics(self, org_id: str, org_name: str) -> None:
         """Collect device availability metrics.
 
@@ -1214,6 +1223,7 @@ class OrganizationCollector(MetricCollector):
         continue_on_error=False,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.ORG_PACKET_CAPTURES)
     async def _collect_packet_capture_metrics(self, org_id: str, org_name: str) -> None:
         """Collect packet capture metrics.
 
@@ -1352,6 +1362,7 @@ class OrganizationCollector(MetricCollector):
         continue_on_error=False,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.ORG_APP_USAGE)
     async def _collect_application_usage_metrics(self, org_id: str, org_name: str) -> None:
         """Collect application usage metrics by category.
 
@@ -1463,6 +1474,7 @@ class OrganizationCollector(MetricCollector):
             ),
         )
 
+    @measured_group(EndpointGroupName.ORG_CONFIG_TEMPLATES)
     async def _collect_config_templates(self, org_id: str, org_name: str) -> None:
         """Collect config-template count and template-binding metrics (#297).
 
@@ -1542,6 +1554,7 @@ class OrganizationCollector(MetricCollector):
             ),
         )
 
+    @measured_group(EndpointGroupName.ORG_ADAPTIVE_POLICY)
     async def _collect_adaptive_policy(self, org_id: str, org_name: str) -> None:
         """Collect adaptive-policy overview counts (#298).
 
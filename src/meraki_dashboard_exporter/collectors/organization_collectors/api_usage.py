@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any, cast
 from pydantic import BaseModel, ConfigDict
 
 from ...core.api_facade import facade_for
+from ...core.collector import measured_group
 from ...core.error_handling import ErrorCategory, categorize_error, validate_response_format
 from ...core.label_helpers import create_org_labels
 from ...core.logging import get_logger
@@ -209,6 +210,7 @@ class APIUsageCollector(BaseOrganizationCollector):
             series=len(by_operation),
         )
 
+    @measured_group(EndpointGroupName.ORG_API_USAGE)
     async def collect(self, org_id: str, org_name: str) -> bool | ErrorCategory:
         """Collect API usage metrics.
 
@@ -6,6 +6,7 @@ import time
 from typing import TYPE_CHECKING, Any, cast
 
 from ...core.api_facade import facade_for
+from ...core.collector import measured_group
 from ...core.error_handling import ErrorCategory, categorize_error, validate_response_format
 from ...core.label_helpers import create_org_labels
 from ...core.logging import get_logger
@@ -72,6 +73,7 @@ class ClientOverviewCollector(BaseOrganizationCollector):
             ),
         )
 
+    @measured_group(EndpointGroupName.ORG_CLIENT_OVERVIEW)
     async def collect(self, org_id: str, org_name: str) -> bool | ErrorCategory:
         """Collect client overview metrics.
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, cast
 
 from ...core.api_facade import facade_for
+from ...core.collector import measured_group
 from ...core.error_handling import ErrorCategory, validate_response_format, with_error_handling
 from ...core.label_helpers import create_org_labels
 from ...core.logging import get_logger
@@ -79,6 +80,7 @@ class DeviceAvailabilityHistoryCollector(BaseOrganizationCollector):
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.ORG_AVAILABILITY_HISTORY)
     async def collect(self, org_id: str, org_name: str) -> bool:
         """Collect device availability change history metrics.
 
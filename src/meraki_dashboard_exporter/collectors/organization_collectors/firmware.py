@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, cast
 
 from ...core.api_facade import facade_for
+from ...core.collector import measured_group
 from ...core.error_handling import ErrorCategory, validate_response_format, with_error_handling
 from ...core.label_helpers import create_device_labels, create_org_labels
 from ...core.logging import get_logger
@@ -93,6 +94,7 @@ class FirmwareCollector(BaseOrganizationCollector):
         error_category=ErrorCategory.API_CLIENT_ERROR,
         return_error_category=True,
     )
+    @measured_group(EndpointGroupName.ORG_FIRMWARE)
     async def collect(self, org_id: str, org_name: str) -> bool | ErrorCategory:
         """Collect firmware upgrade metrics.
 
@@ -295,6 +297,7 @@ class FirmwareCollector(BaseOrganizationCollector):
         error_category=ErrorCategory.API_CLIENT_ERROR,
         return_error_category=True,
     )
+    @measured_group(EndpointGroupName.ORG_FIRMWARE_COMPLIANCE)
     async def collect_compliance(self, org_id: str, org_name: str) -> bool | ErrorCategory:
         """Collect firmware compliance metrics (#611).
 
@@ -6,6 +6,7 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, cast
 
 from ...core.api_facade import facade_for
+from ...core.collector import measured_group
 from ...core.constants.api_constants import LicenseState
 from ...core.error_handling import ErrorCategory, validate_response_format, with_error_handling
 from ...core.label_helpers import create_org_labels
@@ -117,6 +118,7 @@ class LicenseCollector(BaseOrganizationCollector):
         error_category=ErrorCategory.API_CLIENT_ERROR,
         return_error_category=True,
     )
+    @measured_group(EndpointGroupName.ORG_LICENSES)
     async def collect(self, org_id: str, org_name: str) -> bool | ErrorCategory:
         """Collect license metrics.
 
@@ -25,6 +25,7 @@ from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import urlparse
 
 from ...core.api_facade import facade_for
+from ...core.collector import measured_group
 from ...core.error_handling import ErrorCategory, validate_response_format, with_error_handling
 from ...core.label_helpers import create_org_labels
 from ...core.logging import get_logger
@@ -90,6 +91,7 @@ class WebhookLogsCollector(BaseOrganizationCollector):
         continue_on_error=True,
         error_category=ErrorCategory.API_CLIENT_ERROR,
     )
+    @measured_group(EndpointGroupName.ORG_WEBHOOK_LOGS)
     async def collect(self, org_id: str, org_name: str) -> bool:
         """Collect webhook delivery-log metrics.
 
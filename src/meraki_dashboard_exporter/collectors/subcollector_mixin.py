@@ -68,6 +68,18 @@ class SubCollectorMixin:
         if hasattr(self.parent, "_track_api_call"):
             self.parent._track_api_call(method_name)
 
+    def _track_inventory_bypass(self, endpoint: str) -> None:
+        """Count a direct directory call on the parent, attributed to this sub-collector.
+
+        Parameters
+        ----------
+        endpoint : str
+            The directory API operation called directly.
+
+        """
+        if hasattr(self.parent, "_track_inventory_bypass"):
+            self.parent._track_inventory_bypass(endpoint, collector=self.__class__.__name__)
+
     def _track_error(self, category: ErrorCategory) -> None:
         """Track a classified sub-collector failure on the owning collector."""
         if hasattr(self.parent, "_track_error"):
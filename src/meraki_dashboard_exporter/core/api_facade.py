@@ -4,13 +4,18 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import math
+import time
+from collections import deque
 from collections.abc import Callable
 from typing import Any
 
 import structlog
 from prometheus_client import Counter
 
+from .concurrency_limiter import AdaptiveConcurrencyLimiter
 from .constants.metrics_constants import CollectorMetricName
+from .cost_model import record_api_calls
 from .error_handling import (
     RetryableAPIError,
     _apply_jitter,
@@ -19,6 +24,7 @@ from .error_handling import (
     validate_response_format,
 )
 from .metrics import LabelName
+from .negative_cache import negative_results
 
 
 class FacadeRateLimitExhaustedError(RetryableAPIError):
@@ -27,16 +33,153 @@ class FacadeRateLimitExhaustedError(RetryableAPIError):
     facade_retry_exhausted = True
 
 
+# Operation prefixes of reads scoped to one network or device, the only reads
+# the negative-result cache keys on.
+_SINGLE_ENTITY_OPERATIONS = ("getNetwork", "getDevice")
+
+# Keyword arguments naming the entity of such a read, and those that only shape
+# its time window or paging. Any other keyword (``clientId``, ``deviceSerial``,
+# ``clients``, ``productTypes``, ...) narrows the call below its network or
+# device, so one answer cannot stand for the entity and the call is not cached.
+_ENTITY_KWARGS = frozenset({"networkId", "network_id", "serial"})
+_WINDOW_KWARGS = frozenset({
+    "autoResolution",
+    "endingBefore",
+    "interval",
+    "perPage",
+    "resolution",
+    "startingAfter",
+    "t0",
+    "t1",
+    "timespan",
+    "total_pages",
+})
+
+# Latency samples kept per hedgeable operation, and the fewest needed before
+# its p95 replaces ``hedge_min_delay_seconds`` as the hedge trigger.
+_HEDGE_LATENCY_WINDOW = 200
+_HEDGE_MIN_SAMPLES = 20
+# Hedge budget counters are halved past this many calls so the budget follows
+# recent traffic rather than the whole process lifetime.
+_HEDGE_BUDGET_WINDOW = 10_000
+
+
+class _HedgeTracker:
+    """Process-wide hedging state shared by every facade instance."""
+
+    def __init__(self) -> None:
+        self._latencies: dict[str, deque[float]] = {}
+        self._calls = 0.0
+        self._hedges = 0.0
+
+    def delay_for(self, operation: str, settings: Any | None) -> float | None:
+        """Seconds to wait before hedging ``operation``; ``None`` when not hedgeable."""
+        api = getattr(settings, "api", None)
+        if getattr(api, "hedge_enabled", False) is not True:
+            return None
+        operations = getattr(api, "hedge_operations", ())
+        if not operation.startswith("get") or operation not in operations:
+            return None
+        self._calls += 1
+        if self._calls > _HEDGE_BUDGET_WINDOW:
+            self._calls /= 2
+            self._hedges /= 2
+        floor = _numeric_setting(settings, "hedge_min_delay_seconds", 1.0)
+        samples = self._latencies.get(operation)
+        if samples is None or len(samples) < _HEDGE_MIN_SAMPLES:
+            return floor
+        ordered = sorted(samples)
+        p95 = ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+        return max(floor, p95)
+
+    def observe(self, operation: str, seconds: float) -> None:
+        """Record one completed attempt's latency."""
+        self._latencies.setdefault(operation, deque(maxlen=_HEDGE_LATENCY_WINDOW)).append(seconds)
+
+    def available(self, settings: Any | None) -> bool:
+        """Whether the budget cap allows one more hedge."""
+        fraction = _numeric_setting(settings, "hedge_budget_fraction", 0.05)
+        return self._hedges < fraction * self._calls
+
+    def try_spend(self, settings: Any | None) -> bool:
+        """Take one hedge from the budget if the cap allows it."""
+        if not self.available(settings):
+            return False
+        self._hedges += 1
+        return True
+
+
+_hedges = _HedgeTracker()
+
+
+class _AbandonedError(Exception):
+    """An attempt given up on before an executor thread picked it up."""
+
+
+class _Attempt:
+    """One SDK call on the executor, holding a concurrency slot until its thread returns.
+
+    ``asyncio.wait`` never cancels the executor future, so the slot is
+    released from its done-callback exactly when the SDK thread finishes, even
+    after the caller timed out: an SDK thread already in HTTP cannot be
+    interrupted. An attempt abandoned while still queued skips the request.
+    """
+
+    __slots__ = ("_call", "abandoned", "future", "started")
+
+    def __init__(self, call: Callable[[], Any]) -> None:
+        """Wrap ``call``; :meth:`submit` starts it."""
+        self._call = call
+        self.abandoned = False
+        self.started = time.monotonic()
+        self.future: asyncio.Future[Any]
+
+    @classmethod
+    def submit(
+        cls, call: Callable[[], Any], concurrency: AdaptiveConcurrencyLimiter | None
+    ) -> _Attempt:
+        """Start ``call`` on the executor under a slot already taken from ``concurrency``."""
+        attempt = cls(call)
+        try:
+            attempt.future = asyncio.get_running_loop().run_in_executor(None, attempt)
+        except BaseException:
+            if concurrency is not None:
+                concurrency.release()
+            raise
+        attempt.future.add_done_callback(functools.partial(_finish_attempt, concurrency))
+        return attempt
+
+    def __call__(self) -> Any:
+        """Run the SDK call on an executor thread unless abandoned first."""
+        if self.abandoned:
+            raise _AbandonedError
+        return self._call()
+
+
+def _finish_attempt(
+    concurrency: AdaptiveConcurrencyLimiter | None, future: asyncio.Future[Any]
+) -> None:
+    """Release an attempt's slot and mark an unawaited outcome as retrieved."""
+    if concurrency is not None:
+        concurrency.release()
+    if not future.cancelled():
+        future.exception()
+
+
 class MerakiApiFacade:
     """Stable async facade seam for synchronous Meraki SDK operations.
 
     It is intentionally the only component that crosses from async exporter code
     to the synchronous Dashboard SDK.  One logical call may make multiple SDK
     attempts when Dashboard returns 429; every attempt is paced and metered.
+    Single-entity reads that recently failed with a benign 404 for the same
+    network or device are answered from the process-wide negative-result cache
+    without a request.
     """
 
     _attempts_total: Counter | None = None
     _requests_total: Counter | None = None
+    _hedged_total: Counter | None = None
 
     def __init__(
         self,
@@ -58,6 +201,14 @@ class MerakiApiFacade:
                 "Total outbound Meraki SDK request attempts by operation and outcome.",
                 labelnames=[LabelName.OPERATION.value, LabelName.STATUS.value],
             )
+        if cls._hedged_total is None:
+            cls._hedged_total = Counter(
+                CollectorMetricName.API_HEDGED_REQUESTS_TOTAL.value,
+                "Hedge decisions for slow idempotent SDK calls by operation and result "
+                "(won = the hedge finished first, lost = the original did, "
+                "skipped_budget = the hedge cap was reached).",
+                labelnames=[LabelName.OPERATION.value, LabelName.RESULT.value],
+            )
         if cls._requests_total is None:
             cls._requests_total = Counter(
                 CollectorMetricName.API_REQUESTS_TOTAL.value,
@@ -89,6 +240,12 @@ class MerakiApiFacade:
         max_retries = int(_numeric_setting(self._settings, "max_retries", 3.0))
         retry_after_cap = _numeric_setting(self._settings, "retry_after_max_seconds", 60.0)
         org_id = _resolve_org_id(args, kwargs)
+        entity = _resolve_entity(operation, args, kwargs) if self._negative_cache_on() else None
+        if entity is not None and (cached := negative_results.suppressed(operation, entity)):
+            raise cached
+        concurrency = getattr(self._rate_limiter, "concurrency_limiter", None)
+        if not isinstance(concurrency, AdaptiveConcurrencyLimiter):
+            concurrency = None
         attempt = 0
 
         async with asyncio.timeout(deadline):
@@ -96,15 +253,30 @@ class MerakiApiFacade:
                 if self._rate_limiter is not None:
                     await self._rate_limiter.acquire(org_id, operation)
                 try:
-                    response = await asyncio.get_running_loop().run_in_executor(
-                        None, functools.partial(fn, *args, **kwargs)
+                    response, elapsed = await self._execute(
+                        operation, functools.partial(fn, *args, **kwargs), org_id, concurrency
                     )
                     result = _validate_generic_response(response, operation)
                 except Exception as exc:
                     status = _status_from_exception(exc)
                     self._record_attempt(operation, status)
+                    record_api_calls(1.0)
                     if not _is_rate_limit_error(exc):
+                        if entity is not None:
+                            negative_results.record_failure(
+                                operation,
+                                entity,
+                                exc,
+                                base_seconds=_numeric_setting(
+                                    self._settings, "negative_cache_base_seconds", 900.0
+                                ),
+                                max_seconds=_numeric_setting(
+                                    self._settings, "negative_cache_max_seconds", 21600.0
+                                ),
+                            )
                         raise
+                    if concurrency is not None:
+                        concurrency.record_throttle()
                     if attempt >= max_retries:
                         raise FacadeRateLimitExhaustedError(
                             f"{operation} exhausted facade attempts"
@@ -125,8 +297,114 @@ class MerakiApiFacade:
                 # bounded HTTP-success status used by the established readiness
                 # consumer, while failures retain their concrete status.
                 self._record_attempt(operation, "200")
+                if entity is not None:
+                    negative_results.record_success(operation, entity)
+                # The SDK follows pagination inside one call; charge the pages
+                # it fetched to the running endpoint group's measured cost.
+                pages = _pages_fetched(result, kwargs)
+                record_api_calls(pages)
+                if concurrency is not None:
+                    # Per-page latency, so paginated bulk fetches don't read as
+                    # a latency spike.
+                    concurrency.record_rtt(elapsed / pages)
                 return result
 
+    async def _execute(
+        self,
+        operation: str,
+        call: Callable[[], Any],
+        org_id: str | None,
+        concurrency: AdaptiveConcurrencyLimiter | None,
+    ) -> tuple[Any, float]:
+        """Run one SDK attempt on the executor, hedging it when configured.
+
+        A hedgeable GET that has not completed by its operation's observed p95
+        gets a second attempt with its own rate-limit token and concurrency
+        slot; the first success wins and the other is abandoned (an SDK thread
+        already in HTTP cannot be interrupted, so its result is discarded).
+
+        Returns the winning result and its latency in seconds, measured from
+        the moment its concurrency slot was granted.
+        """
+        hedge_after = _hedges.delay_for(operation, self._settings)
+        if concurrency is not None:
+            await concurrency.acquire()
+        primary = _Attempt.submit(call, concurrency)
+        attempts = [primary]
+        try:
+            if hedge_after is not None:
+                done, _ = await asyncio.wait({primary.future}, timeout=hedge_after)
+                if not done and (
+                    hedge := await self._hedge(operation, call, org_id, concurrency, primary)
+                ):
+                    attempts.append(hedge)
+
+            errors: list[BaseException] = []
+            pending = {attempt.future for attempt in attempts}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in attempts:
+                    if attempt.future not in done:
+                        continue
+                    error = attempt.future.exception()
+                    if error is None:
+                        finished = time.monotonic()
+                        if hedge_after is not None:
+                            _hedges.observe(operation, finished - primary.started)
+                        if len(attempts) > 1:
+                            self._record_hedge(
+                                operation, "won" if attempt is not primary else "lost"
+                            )
+                        return attempt.future.result(), finished - attempt.started
+                    errors.append(error)
+            raise errors[0]
+        finally:
+            for attempt in attempts:
+                attempt.abandoned = True
+
+    async def _hedge(
+        self,
+        operation: str,
+        call: Callable[[], Any],
+        org_id: str | None,
+        concurrency: AdaptiveConcurrencyLimiter | None,
+        primary: _Attempt,
+    ) -> _Attempt | None:
+        """Start a hedge for a slow primary attempt, or return None when none is sent.
+
+        The hedge waits for its own rate-limit token and concurrency slot, so
+        the limiter sees every request in flight. The budget is spent only
+        once both are held and the primary is still running.
+        """
+        if not _hedges.available(self._settings):
+            self._record_hedge(operation, "skipped_budget")
+            return None
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(org_id, operation)
+        if primary.future.done():
+            return None
+        if concurrency is not None:
+            await concurrency.acquire()
+        if primary.future.done() or not _hedges.try_spend(self._settings):
+            if concurrency is not None:
+                concurrency.release()
+            if not primary.future.done():
+                self._record_hedge(operation, "skipped_budget")
+            return None
+        # The hedge is an extra request: charge it to the group cost.
+        record_api_calls(1.0)
+        return _Attempt.submit(call, concurrency)
+
+    def _negative_cache_on(self) -> bool:
+        """Whether benign 404 answers may be served from the negative cache."""
+        api = getattr(self._settings, "api", None)
+        return getattr(api, "negative_cache_enabled", False) is True
+
+    def _record_hedge(self, operation: str, result: str) -> None:
+        hedged_total = type(self)._hedged_total
+        assert hedged_total is not None
+        hedged_total.labels(operation=operation, result=result).inc()
+
     def _record_attempt(self, operation: str, status: str) -> None:
         """Record both the new detailed attempt metric and legacy counter."""
         attempts_total = type(self)._attempts_total
@@ -168,6 +446,24 @@ def _resolve_org_id(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str | None
     return None
 
 
+def _resolve_entity(operation: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str | None:
+    """Network ID or serial a single-entity read is scoped to, for the negative cache.
+
+    Org-level reads, batched calls and calls narrowed by any argument beyond
+    the entity and its time window (a client, an AP, a list of clients) do not
+    answer for the entity as a whole and are never cached.
+    """
+    if not operation.startswith(_SINGLE_ENTITY_OPERATIONS) or len(args) > 1:
+        return None
+    entity = args[0] if args else None
+    for key, value in kwargs.items():
+        if key in _ENTITY_KWARGS and entity is None:
+            entity = value
+        elif key not in _WINDOW_KWARGS:
+            return None
+    return entity if isinstance(entity, str) and entity else None
+
+
 def _numeric_setting(settings: Any | None, name: str, default: float) -> float:
     """Read a numeric API setting while tolerating lightweight test doubles."""
     value = getattr(getattr(settings, "api", None), name, default)
@@ -185,6 +481,21 @@ def _validate_generic_response(response: Any, operation: str) -> Any:
     return response
 
 
+def _pages_fetched(result: Any, kwargs: dict[str, Any]) -> float:
+    """Number of HTTP pages an SDK call fetched (1 unless it auto-paginated)."""
+    total_pages = kwargs.get("total_pages")
+    per_page = kwargs.get("perPage")
+    if total_pages in {None, 1} or not isinstance(per_page, int) or per_page <= 0:
+        return 1.0
+    items = result.get("items") if isinstance(result, dict) else result
+    if not isinstance(items, list):
+        return 1.0
+    fetched = max(1, math.ceil(len(items) / per_page))
+    if isinstance(total_pages, int) and total_pages > 0:
+        fetched = min(fetched, total_pages)
+    return float(fetched)
+
+
 def _status_from_exception(exc: Exception) -> str:
     """Return the bounded status label value for an SDK failure."""
     status = getattr(exc, "status", None)
@@ -80,6 +80,7 @@ class APIHelper:
                 "Using configured organization", org_id=self.collector.settings.meraki.org_id
             )
             self.collector._track_api_call("getOrganization")
+            self.collector._track_inventory_bypass("getOrganization")
             org = await facade_for(self).call(
                 "getOrganization",
                 self.api.organizations.getOrganization,
@@ -92,6 +93,7 @@ class APIHelper:
             # Fetch all organizations
             logger.debug("Fetching all organizations directly (no inventory cache)")
             self.collector._track_api_call("getOrganizations")
+            self.collector._track_inventory_bypass("getOrganizations")
             orgs = await facade_for(self).call(
                 "getOrganizations", self.api.organizations.getOrganizations, total_pages="all"
             )
@@ -170,6 +172,7 @@ class APIHelper:
         """
         logger.debug("Fetching networks directly (no inventory cache)", org_id=org_id)
         self.collector._track_api_call("getOrganizationNetworks")
+        self.collector._track_inventory_bypass("getOrganizationNetworks")
         networks = await facade_for(self).call(
             "getOrganizationNetworks",
             self.api.organizations.getOrganizationNetworks,
@@ -288,6 +291,7 @@ class APIHelper:
             product_types=product_types,
         )
         self.collector._track_api_call("getOrganizationDevices")
+        self.collector._track_inventory_bypass("getOrganizationDevices")
         raw_devices = await facade_for(self).call(
             "getOrganizationDevices",
             self.api.organizations.getOrganizationDevices,
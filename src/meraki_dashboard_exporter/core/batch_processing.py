@@ -1,7 +1,9 @@
 """Batch processing utilities for collectors.
 
 This module provides utilities for processing items in batches with
-error handling and logging.
+error handling and logging. Items run either in barrier-separated batches or,
+in streaming mode, through a fixed number of in-flight slots that are refilled
+as soon as any item completes.
 """
 
 from __future__ import annotations
@@ -9,7 +11,7 @@ from __future__ import annotations
 import asyncio
 import time
 from collections.abc import Callable, Coroutine
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from .logging import get_logger
 
@@ -19,6 +21,85 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+def _report_item_failure[T](
+    item: T,
+    error: BaseException,
+    item_description: str,
+    error_context_func: Callable[[T], dict[str, Any]] | None,
+    on_error: Callable[[Exception], None] | None,
+) -> None:
+    """Log a swallowed per-item failure and forward it to the caller's error sink."""
+    context = {"error": str(error), "error_type": type(error).__name__}
+    if error_context_func:
+        context.update(error_context_func(item))
+
+    logger.error(f"Failed to process {item_description}", **context)
+
+    # Surface the swallowed per-item failure to the caller's error sink (#621).
+    # Guarded so a misbehaving sink never breaks batch processing or loses
+    # partial results.
+    if on_error is not None and isinstance(error, Exception):
+        try:
+            on_error(error)
+        except Exception:
+            logger.exception("on_error sink raised while reporting batch item failure")
+
+
+async def _process_streaming[T, R](
+    items: list[T],
+    process_func: Callable[[T], Coroutine[Any, Any, R]],
+    slots: int,
+    token_interval: float,
+    item_description: str,
+    error_context_func: Callable[[T], dict[str, Any]] | None,
+    on_error: Callable[[Exception], None] | None,
+) -> list[tuple[T, R | Exception]]:
+    """Run items through ``slots`` workers, pacing starts with a token clock.
+
+    Each worker takes the next item as soon as its previous one finishes, so a
+    single slow item only occupies its own slot. Starts draw from a pacing
+    token bucket holding ``slots`` tokens and refilling one every
+    ``token_interval`` seconds: the first ``slots`` items start immediately and
+    item ``i`` after that no earlier than ``(i - slots + 1) * token_interval``
+    seconds in — the same average start rate as the batched mode without its
+    barriers.
+    """
+    outcomes: list[tuple[bool, R | Exception | None]] = [(False, None)] * len(items)
+    next_index = 0
+    start_time = time.monotonic()
+
+    async def worker() -> None:
+        nonlocal next_index
+        while next_index < len(items):
+            index = next_index
+            next_index += 1
+            if token_interval > 0 and index >= slots:
+                not_before = start_time + (index - slots + 1) * token_interval
+                sleep_seconds = not_before - time.monotonic()
+                if sleep_seconds > 0:
+                    await asyncio.sleep(sleep_seconds)
+
+            item = items[index]
+            try:
+                outcomes[index] = (True, await process_func(item))
+            except Exception as exc:
+                _report_item_failure(item, exc, item_description, error_context_func, on_error)
+                outcomes[index] = (True, exc)
+            except asyncio.CancelledError, KeyboardInterrupt, SystemExit:
+                raise
+            except BaseException as exc:
+                # Logged and dropped from the results, as in the batched mode.
+                _report_item_failure(item, exc, item_description, error_context_func, on_error)
+
+    await asyncio.gather(*(worker() for _ in range(min(slots, len(items)))))
+
+    return [
+        (item, cast("R | Exception", result))
+        for item, (kept, result) in zip(items, outcomes, strict=True)
+        if kept
+    ]
+
+
 async def process_in_batches_with_errors[T, R](
     items: list[T],
     process_func: Callable[[T], Coroutine[Any, Any, R]],
@@ -31,6 +112,7 @@ async def process_in_batches_with_errors[T, R](
     item_description: str = "item",
     error_context_func: Callable[[T], dict[str, Any]] | None = None,
     on_error: Callable[[Exception], None] | None = None,
+    streaming: bool = False,
 ) -> list[tuple[T, R | Exception]]:
     """Process items in batches with error handling and logging.
 
@@ -61,6 +143,12 @@ async def process_in_batches_with_errors[T, R](
         Callers typically bind this to their collector's ``_track_error`` so
         per-item batch failures surface in ``meraki_exporter_collector_errors_total``.
         Control flow is unchanged — partial results are still returned.
+    streaming : bool
+        Use a sliding window instead of batch barriers: ``batch_size`` items are
+        in flight at once and a slot is refilled as soon as any item completes,
+        so one slow item no longer stalls the rest of its batch. Starts are
+        spread by a pacing token (``batch_size`` tokens per batch spacing)
+        rather than inter-batch sleeps. Results keep the input order.
 
     Returns
     -------
@@ -88,6 +176,22 @@ async def process_in_batches_with_errors[T, R](
     if max_batch_delay is not None:
         spacing = min(spacing, max_batch_delay)
 
+    if streaming:
+        logger.debug(
+            f"Streaming {item_description}s through sliding window",
+            total=total_items,
+            slots=batch_size,
+        )
+        return await _process_streaming(
+            items,
+            process_func,
+            slots=max(1, batch_size),
+            token_interval=spacing / max(1, batch_size),
+            item_description=item_description,
+            error_context_func=error_context_func,
+            on_error=on_error,
+        )
+
     for i in range(0, total_items, batch_size):
         batch = items[i : i + batch_size]
         batch_end = min(i + batch_size, total_items)
@@ -109,21 +213,7 @@ async def process_in_batches_with_errors[T, R](
         # Process results
         for item, result in zip(batch, batch_results, strict=False):
             if isinstance(result, BaseException):
-                # Extract context for error logging
-                context = {"error": str(result), "error_type": type(result).__name__}
-                if error_context_func:
-                    context.update(error_context_func(item))
-
-                logger.error(f"Failed to process {item_description}", **context)
-
-                # Surface the swallowed per-item failure to the caller's error
-                # sink (#621). Guarded so a misbehaving sink never breaks batch
-                # processing or loses partial results.
-                if on_error is not None and isinstance(result, Exception):
-                    try:
-                        on_error(result)
-                    except Exception:
-                        logger.exception("on_error sink raised while reporting batch item failure")
+                _report_item_failure(item, result, item_description, error_context_func, on_error)
 
             # Only append if it's the expected type or Exception
             if not isinstance(result, BaseException) or isinstance(result, Exception):
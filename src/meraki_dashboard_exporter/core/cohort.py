@@ -0,0 +1,290 @@
+"""Budgeted rotating cohorts for per-entity fan-out endpoints.
+
+Some endpoints have no org-wide form and cost one call per device or client
+(``getDeviceSwitchPortsStatusesPackets``, ``getDeviceAppliancePerformance``,
+``getNetworkWirelessSignalQualityHistory``, ...), so their cost per interval
+grows with the fleet. ``CohortRotation`` bounds that cost: given a call budget
+per group interval, each interval refreshes only the ``budget`` entities whose
+data is oldest (ties broken by a stable per-entity hash). The fleet is walked
+in stable rotating slices, every entity is refreshed within
+``ceil(n / budget)`` intervals, and the cost per interval stays at the budget
+however large the fleet grows. Without a budget every entity is due each
+interval, exactly as before.
+
+Two entry points share the bookkeeping:
+
+* ``select`` picks the slice from the full entity list, for call sites that
+  run once per group interval and already hold the list.
+* ``admit`` answers for one entity at a time, for per-device fan-outs that
+  reach the collector device by device. The slice is fixed at the start of
+  each interval window from the entities seen in the previous windows.
+
+Data age is exported as a per-group maximum, refreshed whenever the group
+rotates, and per device (``meraki_exporter_cohort_data_age_seconds``) only
+while the group has a budget, so unbudgeted groups add no per-device series.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from prometheus_client import REGISTRY, Gauge
+
+from .constants.metrics_constants import CollectorMetricName
+from .metrics import LabelName
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_NEVER = float("-inf")
+
+# Windows an entity may go unseen before ``admit`` forgets it (one missed
+# window is tolerated so a late cycle does not reset the rotation).
+_FORGET_AFTER_WINDOWS = 2
+
+
+@dataclass(frozen=True)
+class CohortMetrics:
+    """Gauges for cohort data age."""
+
+    data_age: Gauge
+    max_data_age: Gauge
+
+
+_cohort_metrics: CohortMetrics | None = None
+
+
+def get_cohort_metrics() -> CohortMetrics:
+    """Return cohort metrics, recreating them after an isolated test registry reset."""
+    global _cohort_metrics
+    metric_name = CollectorMetricName.COHORT_DATA_AGE_SECONDS.value
+    if _cohort_metrics is None or metric_name not in REGISTRY._names_to_collectors:
+        _cohort_metrics = CohortMetrics(
+            data_age=Gauge(
+                metric_name,
+                "Seconds since a device's data was last refreshed by a budgeted, "
+                "rotating endpoint group (as of the group's last rotation)",
+                labelnames=[LabelName.GROUP.value, LabelName.SERIAL.value],
+            ),
+            max_data_age=Gauge(
+                CollectorMetricName.COHORT_MAX_DATA_AGE_SECONDS.value,
+                "Oldest data age in seconds across the entities of a rotating endpoint group",
+                labelnames=[LabelName.GROUP.value],
+            ),
+        )
+    return _cohort_metrics
+
+
+def stable_key(entity: str) -> tuple[int, str]:
+    """Return the rotation order key for ``entity`` (stable across restarts)."""
+    return zlib.crc32(entity.encode()), entity
+
+
+def cohort_budget(settings: Any, group: str) -> int:
+    """Return the configured per-interval call budget for ``group``.
+
+    Read from ``scheduler.group_cohort_budgets``; 0 (no entry) means the group
+    is not budgeted and refreshes every entity each interval.
+    """
+    budgets = getattr(getattr(settings, "scheduler", None), "group_cohort_budgets", None)
+    if not isinstance(budgets, dict):
+        return 0
+    value = budgets.get(str(group))
+    return value if isinstance(value, int) and value > 0 else 0
+
+
+@dataclass
+class _Scope:
+    """Rotation state for one scope (an org or a network)."""
+
+    refreshed: dict[str, float] = field(default_factory=dict)
+    seen: dict[str, int] = field(default_factory=dict)
+    window: int | None = None
+    cohort: set[str] = field(default_factory=set)
+    size: int = 0
+    budget: int = 0
+
+
+class CohortRotation:
+    """Stable rotating slices of the entities one endpoint group fans out over.
+
+    Parameters
+    ----------
+    group : str
+        Endpoint group name, used as the metric label.
+    export_entity_age : bool
+        Export the per-entity age gauge (entities must be device serials) while
+        the scope has a budget; without one every entity is refreshed each
+        interval and only the group maximum is exported. High-cardinality
+        entities such as clients only ever feed the group maximum.
+
+    """
+
+    def __init__(self, group: str, *, export_entity_age: bool = True) -> None:
+        """Initialize an empty rotation."""
+        self.group = str(group)
+        self.export_entity_age = export_entity_age
+        self._scopes: dict[str, _Scope] = {}
+        self._max_age: dict[str, float] = {}
+        self._metrics = get_cohort_metrics()
+
+    def select(
+        self, scope: str, entities: Iterable[str], budget: int, now: float | None = None
+    ) -> list[str]:
+        """Return this run's slice of ``entities``, in the caller's order.
+
+        Parameters
+        ----------
+        scope : str
+            Rotation scope; the budget applies per scope.
+        entities : Iterable[str]
+            Every entity currently in the scope. Entities missing from it are
+            forgotten.
+        budget : int
+            Entities to return; non-positive returns them all.
+        now : float | None
+            Current epoch seconds (defaults to ``time.time()``).
+
+        Returns
+        -------
+        list[str]
+            The ``budget`` entities with the oldest data.
+
+        """
+        now = time.time() if now is None else now
+        state = self._scopes.setdefault(scope, _Scope())
+        self._set_budget(state, budget)
+        ids = list(dict.fromkeys(entity for entity in entities if entity))
+        self._forget(state, set(state.refreshed) - set(ids))
+        state.size = len(ids)
+        self._publish(scope, state, now)
+        if budget <= 0 or len(ids) <= budget:
+            return ids
+        chosen = set(self._oldest(state, ids, budget))
+        return [entity for entity in ids if entity in chosen]
+
+    def admit(
+        self,
+        scope: str,
+        entity: str,
+        *,
+        interval: float,
+        budget: int,
+        now: float | None = None,
+    ) -> bool:
+        """Return whether ``entity`` belongs to the current window's slice.
+
+        Parameters
+        ----------
+        scope : str
+            Rotation scope; the budget applies per scope.
+        entity : str
+            Entity asking to be refreshed.
+        interval : float
+            Group interval in seconds; one slice is refreshed per interval.
+        budget : int
+            Entities per slice; non-positive admits every entity.
+        now : float | None
+            Current epoch seconds (defaults to ``time.time()``).
+
+        Returns
+        -------
+        bool
+            True when the entity is in the slice and has not been refreshed
+            in this window yet.
+
+        """
+        if interval <= 0 or not entity:
+            return True
+        now = time.time() if now is None else now
+        window = int(now // interval)
+        state = self._scopes.setdefault(scope, _Scope())
+        self._set_budget(state, budget)
+        if state.window != window:
+            self._rotate(scope, state, window, budget, now)
+        state.seen[entity] = window
+        if budget <= 0:
+            return True
+        if entity in state.cohort:
+            return state.refreshed.get(entity, _NEVER) < window * interval
+        if len(state.cohort) < budget:
+            # Spare capacity: new entities (and a cold start) fill the slice.
+            state.cohort.add(entity)
+            state.size = max(state.size, len(state.cohort))
+            return True
+        return False
+
+    def mark_refreshed(self, scope: str, entity: str, now: float | None = None) -> None:
+        """Record a successful refresh of ``entity``."""
+        if not entity:
+            return
+        now = time.time() if now is None else now
+        state = self._scopes.setdefault(scope, _Scope())
+        state.refreshed[entity] = now
+        if self._exports_entity_age(state):
+            self._metrics.data_age.labels(group=self.group, serial=entity).set(0.0)
+
+    def scale_ttl(self, scope: str, ttl_seconds: float | None, budget: int) -> float | None:
+        """Stretch a series TTL to cover a full rotation of the scope.
+
+        A budgeted entity is refreshed only every ``ceil(n / budget)``
+        intervals, so its series must outlive that many intervals.
+        """
+        if ttl_seconds is None or budget <= 0:
+            return ttl_seconds
+        state = self._scopes.get(scope)
+        size = state.size if state is not None else 0
+        return ttl_seconds * max(1, math.ceil(size / budget))
+
+    def _rotate(self, scope: str, state: _Scope, window: int, budget: int, now: float) -> None:
+        live = {e for e, seen in state.seen.items() if window - seen <= _FORGET_AFTER_WINDOWS}
+        self._forget(state, (set(state.seen) | set(state.refreshed)) - live)
+        state.window = window
+        state.size = len(live)
+        state.cohort = set(self._oldest(state, live, budget)) if budget > 0 else set()
+        self._publish(scope, state, now)
+
+    def _exports_entity_age(self, state: _Scope) -> bool:
+        return self.export_entity_age and state.budget > 0
+
+    def _set_budget(self, state: _Scope, budget: int) -> None:
+        budget = max(0, budget)
+        if self._exports_entity_age(state) and budget == 0:
+            # Unbudgeted scopes only feed the group maximum.
+            self._remove_entity_age(state.refreshed)
+        state.budget = budget
+
+    def _remove_entity_age(self, entities: Iterable[str]) -> None:
+        for entity in entities:
+            try:
+                self._metrics.data_age.remove(self.group, entity)
+            except KeyError:
+                pass
+
+    @staticmethod
+    def _oldest(state: _Scope, entities: Iterable[str], budget: int) -> list[str]:
+        return heapq.nsmallest(
+            budget,
+            entities,
+            key=lambda entity: (state.refreshed.get(entity, _NEVER), stable_key(entity)),
+        )
+
+    def _forget(self, state: _Scope, entities: set[str]) -> None:
+        for entity in entities:
+            state.seen.pop(entity, None)
+            state.cohort.discard(entity)
+            if state.refreshed.pop(entity, None) is not None and self._exports_entity_age(state):
+                self._remove_entity_age((entity,))
+
+    def _publish(self, scope: str, state: _Scope, now: float) -> None:
+        ages = {entity: max(0.0, now - ts) for entity, ts in state.refreshed.items()}
+        if self._exports_entity_age(state):
+            for entity, age in ages.items():
+                self._metrics.data_age.labels(group=self.group, serial=entity).set(age)
+        self._max_age[scope] = max(ages.values(), default=0.0)
+        self._metrics.max_data_age.labels(group=self.group).set(max(self._max_age.values()))
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 import time
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, ClassVar, Protocol
+from collections.abc import Callable, Coroutine, Iterable
+from contextlib import AbstractAsyncContextManager, AbstractContextManager, nullcontext
+from typing import TYPE_CHECKING, Any, ClassVar, ParamSpec, Protocol, TypeVar, cast
 
 from opentelemetry import trace
 from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, Info
@@ -14,6 +17,7 @@ from ..core.cardinality import CardinalityConfig, normalize_metric_name
 from ..core.constants.metrics_constants import CollectorMetricName
 from ..core.error_handling import ErrorCategory
 from ..core.exemplars import add_exemplar
+from ..core.fair_queue import WeightedFairQueue
 from ..core.logging import get_logger
 from ..core.metrics import LabelName
 
@@ -28,6 +32,47 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+def measured_group(
+    group: EndpointGroupName,
+) -> Callable[[Callable[P, Coroutine[Any, Any, T]]], Callable[P, Coroutine[Any, Any, T]]]:
+    """Decorator charging a gated fetch method's API calls to ``group``.
+
+    For methods that fetch exactly one endpoint group: the call runs inside the
+    coordinator's ``_measure_group(group)`` (the instance's own, or its
+    ``parent``'s for sub-collectors). Without one the method runs unmeasured.
+
+    Parameters
+    ----------
+    group : EndpointGroupName
+        The endpoint group the decorated method fetches.
+
+    Returns
+    -------
+    Callable
+        Decorator for an async collector method.
+
+    """
+
+    def decorator(func: Callable[P, Coroutine[Any, Any, T]]) -> Callable[P, Coroutine[Any, Any, T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            owner = args[0] if args else None
+            measure = getattr(owner, "_measure_group", None) or getattr(
+                getattr(owner, "parent", None), "_measure_group", None
+            )
+            if measure is None:
+                return await func(*args, **kwargs)
+            with measure(group):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
 
 class MetricCollector(ABC):
     """Abstract base class for metric collectors.
@@ -52,11 +97,16 @@ class MetricCollector(ABC):
     # gate opens regardless of its schedule (#631); the manager toggles it.
     _force_run: bool = False
 
+    # Weighted fair queue sharing this cycle's per-org work items across orgs;
+    # None (pass-through) unless the coordinator collects more than one org.
+    _fair_queue: WeightedFairQueue | None = None
+
     # Class-level performance metrics shared by all collectors
     _collector_duration: Histogram | None = None
     _collector_errors: Counter | None = None
     _collector_last_success: Gauge | None = None
     _collector_api_calls: Counter | None = None
+    _collector_inventory_bypass: Counter | None = None
     _collector_smoothing_window: Gauge | None = None
     _collector_start_offset: Gauge | None = None
 
@@ -481,6 +531,30 @@ class MetricCollector(ABC):
         else:
             logger.warning("Collector API calls metric not initialized", endpoint=endpoint)
 
+    def _track_inventory_bypass(self, endpoint: str, collector: str | None = None) -> None:
+        """Count an org/network/device directory call that skipped the inventory.
+
+        Every collector is meant to read organizations, networks and devices
+        through the shared :class:`OrganizationInventory`; the remaining direct
+        fallbacks call this so any bypass stays visible per collector.
+
+        Parameters
+        ----------
+        endpoint : str
+            The directory API operation called directly.
+        collector : str | None
+            Reporting collector name; defaults to this collector's class name
+            (sub-collectors pass their own).
+
+        """
+        name = collector or self.__class__.__name__
+        logger.debug("Inventory bypassed for directory call", collector=name, endpoint=endpoint)
+        if MetricCollector._collector_inventory_bypass is not None:
+            MetricCollector._collector_inventory_bypass.labels(
+                collector=name,
+                endpoint=endpoint,
+            ).inc()
+
     def _track_error(self, category: ErrorCategory) -> None:
         """Track an error for monitoring.
 
@@ -574,9 +648,39 @@ class MetricCollector(ABC):
         is_shed = getattr(self.scheduler, "is_shed", None)
         if is_shed is not None and is_shed(group) is True:
             return False
-        if getattr(self, "_force_run", False):
-            return True
-        return self.scheduler.should_run(group)
+        if not getattr(self, "_force_run", False) and not self.scheduler.should_run(group):
+            return False
+        # Open a measured execution (online cost model); the calls made inside
+        # the group's ``_measure_group`` block are charged to it and
+        # ``mark_ran`` closes it.
+        cost_model = getattr(self.scheduler, "cost_model", None)
+        if cost_model is not None:
+            cost_model.begin(group)
+        return True
+
+    def _measure_group(self, group: EndpointGroupName) -> AbstractContextManager[None]:
+        """Charge the API calls made inside the block to ``group``'s cost model.
+
+        Wrap each gated group's fetch in this (or decorate a single-group fetch
+        method with :func:`measured_group`) so a collector that admits several
+        groups attributes every call to the group that made it. A no-op without
+        a scheduler.
+
+        Parameters
+        ----------
+        group : EndpointGroupName
+            The endpoint group whose fetch runs inside the block.
+
+        Returns
+        -------
+        AbstractContextManager[None]
+            The measuring context.
+
+        """
+        cost_model = getattr(self.scheduler, "cost_model", None)
+        if cost_model is None:
+            return nullcontext()
+        return cast("AbstractContextManager[None]", cost_model.measure(group))
 
     def _mark_group_ran(self, group: EndpointGroupName) -> None:
         """Record a successful fetch of a group (no-op without a scheduler).
@@ -707,6 +811,48 @@ class MetricCollector(ABC):
         """Compute a stable offset within the fan-out smoothing window for a key."""
         return self._offset_within(key, self._get_smoothing_window())
 
+    def _start_fair_queue(self, org_count: int, capacity: int) -> bool:
+        """Share this cycle's per-org work across orgs by weight.
+
+        With more than one org, work items from every org are admitted through
+        ``capacity`` shared slots in weighted fair order
+        (``api.org_weights``) instead of org-list order. A single org keeps
+        the pass-through path.
+
+        Returns
+        -------
+        bool
+            True when fair queuing is active for this cycle.
+
+        """
+        if org_count > 1:
+            self._fair_queue = WeightedFairQueue(
+                self.__class__.__name__, capacity, self.settings.api.org_weights
+            )
+        else:
+            self._fair_queue = None
+        return self._fair_queue is not None
+
+    def _org_slot(self, org_id: str) -> AbstractAsyncContextManager[None]:
+        """Hold a fair-queue slot for one of ``org_id``'s work items (no-op when off)."""
+        if self._fair_queue is None:
+            return nullcontext()
+        return self._fair_queue.slot(org_id)
+
+    def _fair_item[T, R](
+        self, org_id: str, func: Callable[[T], Coroutine[Any, Any, R]]
+    ) -> Callable[[T], Coroutine[Any, Any, R]]:
+        """Wrap a per-item coroutine function so each item takes a fair-queue slot."""
+        queue = self._fair_queue
+        if queue is None:
+            return func
+
+        async def run(item: T) -> R:
+            async with queue.slot(org_id):
+                return await func(item)
+
+        return run
+
     def _record_smoothing_metrics(self) -> None:
         """Record smoothing window and base offset metrics for this collector."""
         if self._collector_smoothing_window is None and self._collector_start_offset is None:
@@ -884,6 +1030,40 @@ class MetricCollector(ABC):
                 value=value,
             )
 
+    def _refresh_metrics(
+        self,
+        series: Iterable[tuple[str, str]],
+        ttl_seconds: float | None = None,
+    ) -> set[tuple[str, str]]:
+        """Keep unchanged series alive by refreshing their expiration timestamps.
+
+        The bulk counterpart of ``_set_metric`` for series whose value and
+        labels are known not to have changed since they were last set: the
+        Gauge is not touched and no label dicts are built.
+
+        Parameters
+        ----------
+        series : Iterable[tuple[str, str]]
+            ``(metric_name, frozen_labels)`` pairs, labels frozen with
+            ``metric_expiration.freeze_labels``.
+        ttl_seconds : float | None
+            Per-series TTL, as for ``_set_metric``.
+
+        Returns
+        -------
+        set[tuple[str, str]]
+            Pairs no longer tracked (expired or shed); the caller must re-emit
+            them with ``_set_metric``. Disabled families are never tracked and
+            are not reported.
+
+        """
+        if not self.expiration_manager:
+            return set()
+        missing = self.expiration_manager.refresh_series(
+            self.__class__.__name__, series, ttl_seconds
+        )
+        return {pair for pair in missing if not self._is_metric_disabled(pair[0])}
+
     # Fallback buckets if no configured buckets are supplied (mirrors the
     # MonitoringSettings.histogram_buckets default).
     _DEFAULT_DURATION_BUCKETS: tuple[float, ...] = (
@@ -950,6 +1130,14 @@ class MetricCollector(ABC):
             )
             cls._collector_api_calls = api_calls_metric
 
+            cls._collector_inventory_bypass = Counter(
+                CollectorMetricName.COLLECTOR_INVENTORY_BYPASS_TOTAL.value,
+                "Org/network/device directory calls made directly instead of through "
+                "the shared inventory",
+                labelnames=[LabelName.COLLECTOR.value, LabelName.ENDPOINT.value],
+                registry=REGISTRY,
+            )
+
             cls._collector_smoothing_window = Gauge(
                 CollectorMetricName.COLLECTION_SMOOTHING_WINDOW_SECONDS.value,
                 "Configured smoothing window for collector runs",
@@ -0,0 +1,218 @@
+"""Latency-gradient concurrency limit for in-flight Meraki SDK calls.
+
+A fixed executor size is wrong in both directions: when Dashboard latency
+rises, a large pool just queues more requests server-side; when latency is
+low, a small pool caps throughput far below the request budget. This limiter
+sets the number of SDK calls allowed in flight from observed round-trip times
+(a gradient / Vegas style controller):
+
+* ``short_rtt`` tracks recent per-page latency, ``long_rtt`` a slow baseline.
+* Each successful call moves the limit towards
+  ``limit × clamp(long_rtt / short_rtt, 0.5, 1) + sqrt(limit)``: steady latency
+  grows the limit by a queue allowance, rising latency shrinks it in
+  proportion.
+* A 429 from the facade cuts the limit multiplicatively.
+
+The limit stays within ``[min_limit, max_limit]``; the SDK executor is sized
+to ``max_limit`` so the limiter, not the thread pool, is the binding bound.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+from collections import deque
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+from typing import Any
+
+from prometheus_client import REGISTRY, Gauge
+
+from .constants.metrics_constants import CollectorMetricName
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# EWMA weights for the short (recent) and long (baseline) RTT trackers.
+_SHORT_RTT_ALPHA = 0.3
+_LONG_RTT_ALPHA = 0.02
+# Lower bound on the gradient: a latency spike at most halves the target.
+_MIN_GRADIENT = 0.5
+# Weight of each new target in the smoothed limit.
+_LIMIT_SMOOTHING = 0.2
+# Multiplicative decrease applied on a 429.
+_THROTTLE_BACKOFF = 0.75
+
+
+@dataclass(frozen=True)
+class ConcurrencyLimiterMetrics:
+    """Adaptive SDK concurrency gauges."""
+
+    limit: Gauge
+    inflight: Gauge
+
+
+_concurrency_metrics: ConcurrencyLimiterMetrics | None = None
+
+
+def get_concurrency_limiter_metrics() -> ConcurrencyLimiterMetrics:
+    """Return limiter gauges, recreating them after an isolated test registry reset."""
+    global _concurrency_metrics
+    metric_name = CollectorMetricName.SDK_CONCURRENCY_LIMIT.value
+    if _concurrency_metrics is None or metric_name not in REGISTRY._names_to_collectors:
+        _concurrency_metrics = ConcurrencyLimiterMetrics(
+            limit=Gauge(
+                CollectorMetricName.SDK_CONCURRENCY_LIMIT.value,
+                "Current adaptive limit on in-flight Meraki SDK calls",
+            ),
+            inflight=Gauge(
+                CollectorMetricName.SDK_INFLIGHT.value,
+                "Meraki SDK calls currently in flight under the adaptive limit",
+            ),
+        )
+    return _concurrency_metrics
+
+
+def sdk_executor_workers(settings: Any) -> int:
+    """Thread-pool size for the SDK executor.
+
+    ``api.executor_workers``, raised to ``api.adaptive_concurrency_max`` when
+    the adaptive limiter is enabled so the limiter can grow past the static
+    pool size. Tolerates settings doubles without the adaptive fields.
+    """
+    api = settings.api
+    workers = int(getattr(api, "executor_workers", 10))
+    if getattr(api, "adaptive_concurrency_enabled", False) is True:
+        workers = max(workers, int(api.adaptive_concurrency_max))
+    return workers
+
+
+class AdaptiveConcurrencyLimiter:
+    """Bound in-flight SDK calls by a limit adapted to latency and 429s.
+
+    Parameters
+    ----------
+    initial_limit : int
+        Starting limit.
+    min_limit : int
+        Floor the limit never drops below.
+    max_limit : int
+        Ceiling the limit never exceeds (the executor size).
+
+    """
+
+    def __init__(self, initial_limit: int, min_limit: int, max_limit: int) -> None:
+        """Initialize the limiter with no RTT history."""
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self._inflight = 0
+        self._short_rtt: float | None = None
+        self._long_rtt: float | None = None
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._metrics = get_concurrency_limiter_metrics()
+        self._export()
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> AdaptiveConcurrencyLimiter | None:
+        """Build the limiter from ``api.adaptive_concurrency_*``, or None when disabled."""
+        api = settings.api
+        if getattr(api, "adaptive_concurrency_enabled", False) is not True:
+            return None
+        return cls(
+            initial_limit=int(api.executor_workers),
+            min_limit=int(api.adaptive_concurrency_min),
+            max_limit=int(api.adaptive_concurrency_max),
+        )
+
+    @property
+    def limit(self) -> int:
+        """Current whole-number limit on in-flight calls."""
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def inflight(self) -> int:
+        """SDK calls currently holding a slot."""
+        return self._inflight
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncGenerator[None]:
+        """Hold one in-flight slot, waiting while the limit is reached."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self) -> None:
+        """Take one in-flight slot, waiting while the limit is reached.
+
+        Every successful ``acquire`` must be paired with one :meth:`release`;
+        use :meth:`slot` when the slot ends with a block.
+        """
+        if self._inflight >= self.limit or self._waiters:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._waiters.append(future)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # Granted just before the cancellation: pass it on.
+                    self._inflight -= 1
+                    self._wake()
+                else:
+                    with contextlib.suppress(ValueError):
+                        self._waiters.remove(future)
+                raise
+        else:
+            self._inflight += 1
+        self._export()
+
+    def release(self) -> None:
+        """Return a slot taken by :meth:`acquire` and admit the next waiter."""
+        self._inflight -= 1
+        self._wake()
+        self._export()
+
+    def record_rtt(self, seconds: float) -> None:
+        """Fold one successful call's per-page latency into the limit."""
+        if seconds <= 0:
+            return
+        if self._short_rtt is None or self._long_rtt is None:
+            self._short_rtt = self._long_rtt = seconds
+        else:
+            self._short_rtt += _SHORT_RTT_ALPHA * (seconds - self._short_rtt)
+            self._long_rtt += _LONG_RTT_ALPHA * (seconds - self._long_rtt)
+        gradient = max(_MIN_GRADIENT, min(1.0, self._long_rtt / self._short_rtt))
+        target = self._limit * gradient + math.sqrt(self._limit)
+        self._set_limit(self._limit + _LIMIT_SMOOTHING * (target - self._limit))
+
+    def record_throttle(self) -> None:
+        """Cut the limit after Dashboard returned 429."""
+        before = self.limit
+        self._set_limit(self._limit * _THROTTLE_BACKOFF)
+        if self.limit < before:
+            logger.info(
+                "Adaptive SDK concurrency limit reduced after rate limiting",
+                previous_limit=before,
+                limit=self.limit,
+            )
+
+    def _set_limit(self, value: float) -> None:
+        self._limit = min(float(self.max_limit), max(float(self.min_limit), value))
+        self._wake()
+        self._export()
+
+    def _wake(self) -> None:
+        """Grant slots to queued callers while the limit allows."""
+        while self._waiters and self._inflight < self.limit:
+            future = self._waiters.popleft()
+            if future.done():
+                continue
+            self._inflight += 1
+            future.set_result(None)
+
+    def _export(self) -> None:
+        self._metrics.limit.set(self.limit)
+        self._metrics.inflight.set(self._inflight)
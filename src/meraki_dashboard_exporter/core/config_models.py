@@ -115,7 +115,7 @@ class APISettings(BaseModel):
             "pressure), which is distinct from the client-side AIMD rate limiter that "
             "caps request RATE: the limiter paces how fast requests leave, this caps how "
             "many are outstanding at once. Both are needed. Not to be confused with "
-            "collectors.max_concurrent_collectors, which bounds how many collector loops "
+            "collectors.max_concurrent_collectors, which bounds how many collectors "
             "run at once globally (#636)."
         ),
     )
@@ -274,7 +274,8 @@ class APISettings(BaseModel):
         le=5000,
         description=(
             "Maximum wireless clients queried for signal quality per network per cycle "
-            "(0 disables the cap). Bounds the sequential per-client API fan-out."
+            "(0 disables the cap). Bounds the sequential per-client API fan-out; larger "
+            "networks are walked in rotating slices, oldest data first."
         ),
     )
     retry_after_max_seconds: int = Field(
@@ -299,6 +300,28 @@ class APISettings(BaseModel):
             "concurrency limit."
         ),
     )
+    adaptive_concurrency_enabled: bool = Field(
+        True,
+        description=(
+            "Adapt the number of in-flight SDK calls to observed Dashboard latency and "
+            "429 feedback (latency-gradient limiter) instead of relying on the fixed "
+            "executor size alone. The limit starts at executor_workers and moves within "
+            "[adaptive_concurrency_min, adaptive_concurrency_max]; the SDK executor is "
+            "sized to adaptive_concurrency_max when enabled."
+        ),
+    )
+    adaptive_concurrency_min: int = Field(
+        2,
+        ge=1,
+        le=50,
+        description="Lowest adaptive limit on in-flight SDK calls.",
+    )
+    adaptive_concurrency_max: int = Field(
+        20,
+        ge=1,
+        le=100,
+        description="Highest adaptive limit on in-flight SDK calls (and the SDK executor size).",
+    )
     per_fetch_deadline_seconds: int = Field(
         120,
         ge=1,
@@ -307,10 +330,103 @@ class APISettings(BaseModel):
             "Wall-clock deadline (seconds) for a single logical fetch, including all "
             "paginated page requests made under total_pages='all'. Sits between the SDK "
             "per-request timeout (see 'timeout') and the per-collector timeout so a slow "
-            "bulk fetch fails fast instead of consuming the whole collector budget."
+            "bulk fetch fails fast instead of consuming the whole collector budget. The "
+            "deadline covers the whole call, including waits for the rate limiter and an "
+            "SDK concurrency slot; a timed-out call keeps its slot until its SDK thread "
+            "returns."
+        ),
+    )
+    hedge_enabled: bool = Field(
+        False,
+        description=(
+            "Hedge slow idempotent GETs listed in hedge_operations: when an attempt has "
+            "not completed by that operation's observed p95 latency, issue a second "
+            "attempt and take whichever finishes first. Hedges are paced by the rate "
+            "limiter and capped at hedge_budget_fraction of hedgeable calls."
+        ),
+    )
+    hedge_operations: Annotated[list[str], NoDecode] = Field(
+        default_factory=lambda: [
+            "getOrganizationDevicesAvailabilities",
+            "getOrganizationSwitchPortsStatusesBySwitch",
+        ],
+        description="SDK operations eligible for hedging (CSV or JSON array of get* names).",
+    )
+    hedge_budget_fraction: float = Field(
+        0.05,
+        ge=0.0,
+        le=0.5,
+        description="Most hedges allowed, as a fraction of calls to hedgeable operations.",
+    )
+    hedge_min_delay_seconds: float = Field(
+        1.0,
+        ge=0.1,
+        le=60.0,
+        description=(
+            "Shortest wait before hedging, and the wait used until an operation has "
+            "enough latency samples for a p95."
+        ),
+    )
+    negative_cache_enabled: bool = Field(
+        True,
+        description=(
+            "Remember per-network and per-device GETs that returned a benign 404 (no data "
+            "for that network or device) and answer repeats locally until a re-probe is due, "
+            "instead of spending a rate-limit token on them every cycle. Entries are "
+            "dropped when the entity's inventory record changes."
+        ),
+    )
+    negative_cache_base_seconds: float = Field(
+        900.0,
+        ge=60.0,
+        le=86400.0,
+        description="Re-probe delay after the first benign failure; doubles per failed re-probe.",
+    )
+    negative_cache_max_seconds: float = Field(
+        21600.0,
+        ge=60.0,
+        le=604800.0,
+        description="Longest re-probe delay for a cached benign failure.",
+    )
+    org_weights: dict[str, float] = Field(
+        default_factory=dict,
+        description=(
+            "Per-organization fair-share weights for multi-org collector fan-out, e.g. "
+            '{"123456": 4} for a higher SLA tier. Orgs not listed weigh 1. When more '
+            "than one org is collected, device and organization work items from every "
+            "org share the collector's slots in proportion to these weights instead of "
+            "being processed in org-list order. Env: JSON object."
         ),
     )
 
+    @field_validator("hedge_operations", mode="before")
+    @classmethod
+    def _split_hedge_operations(cls, v: object) -> list[str]:
+        """Accept a list, a comma-separated string, or a JSON array from env vars."""
+        return _split_collector_csv_list(v)
+
+    @field_validator("org_weights", mode="before")
+    @classmethod
+    def _parse_org_weights(cls, v: object) -> object:
+        """Accept a JSON-object string as well as a native dict."""
+        if isinstance(v, str):
+            stripped = v.strip()
+            if not stripped:
+                return {}
+            import json
+
+            return json.loads(stripped)
+        return v
+
+    @field_validator("org_weights", mode="after")
+    @classmethod
+    def _validate_org_weights(cls, v: dict[str, float]) -> dict[str, float]:
+        """Reject non-positive weights."""
+        for org_id, weight in v.items():
+            if weight <= 0:
+                raise ValueError(f"org_weights[{org_id!r}] must be positive, got {weight}")
+        return v
+
 
 class MonitoringSettings(BaseModel):
     """Monitoring and observability settings."""
@@ -500,8 +616,49 @@ class SchedulerSettings(BaseModel):
             "Pinned groups are excluded from solver stretching. Env: JSON object."
         ),
     )
+    group_cohort_budgets: dict[str, int] = Field(
+        default_factory=dict,
+        description=(
+            'Per-group call budgets for per-device fan-out groups, e.g. {"ms_packet_stats": 100}. '
+            "Each interval a budgeted group refreshes at most this many entities per org, "
+            "oldest data first, so the fleet is walked in stable rotating slices. Supported: "
+            "ms_packet_stats, mx_performance, mx_dhcp_subnets, mr_signal_quality. "
+            "Env: JSON object."
+        ),
+    )
+    config_change_resync_seconds: int = Field(
+        21600,
+        ge=0,
+        le=604800,
+        description=(
+            "MX firewall, security, NAT and VLAN config is re-fetched per network only "
+            "when the org's configuration-change log shows a change for it, or after "
+            "this many seconds as a safety resync. 0 disables change detection and "
+            "uses the plain group intervals."
+        ),
+    )
+    cost_model_enabled: bool = Field(
+        True,
+        description=(
+            "Solve with measured API calls per group execution (pages and retries "
+            "counted by the API facade) once enough executions were observed; "
+            "groups without enough data use the static cost estimate."
+        ),
+    )
+    cost_model_alpha: float = Field(
+        0.3,
+        gt=0.0,
+        le=1.0,
+        description="EWMA smoothing factor for measured group cost (higher reacts faster).",
+    )
+    cost_model_min_samples: int = Field(
+        3,
+        ge=1,
+        le=100,
+        description="Successful executions needed before a group's measured cost is used.",
+    )
 
-    @field_validator("group_interval_overrides", mode="before")
+    @field_validator("group_interval_overrides", "group_cohort_budgets", mode="before")
     @classmethod
     def _parse_overrides(cls, v: object) -> object:
         """Accept a JSON-object string as well as a native dict.
@@ -858,6 +1015,28 @@ class WebhookSettings(BaseModel):
         le=1000000,
         description="Maximum processed-webhook replay protection entries",
     )
+    refresh_on_events: bool = Field(
+        True,
+        description=(
+            "Invalidate the affected org's inventory cache and re-poll the affected "
+            "endpoint groups when a device-down, uplink or settings-change webhook arrives"
+        ),
+    )
+    refresh_debounce_seconds: float = Field(
+        2.0,
+        ge=0.0,
+        le=60.0,
+        description="Seconds to coalesce webhook events before an event-driven re-poll",
+    )
+    refresh_min_interval_seconds: int = Field(
+        60,
+        ge=5,
+        le=3600,
+        description=(
+            "Minimum seconds between event-driven re-polls of the same collector; "
+            "events inside the window are folded into the next re-poll"
+        ),
+    )
 
 
 class CollectorSettings(BaseModel):
@@ -906,7 +1085,7 @@ class CollectorSettings(BaseModel):
         ge=1,
         le=50,
         description=(
-            "Max number of collectors whose group-clocked loops may be executing a run "
+            "Max number of collectors the central dispatcher may be running "
             "concurrently, GLOBALLY (single shared semaphore; replaces the old per-tier "
             "concurrency knobs). This bounds how many collectors run at once; it is "
             "distinct from api.concurrency_limit, which bounds the fan-out breadth INSIDE "
@@ -914,6 +1093,26 @@ class CollectorSettings(BaseModel):
             "run, each fanning out up to api.concurrency_limit sub-requests (#636)."
         ),
     )
+    cold_start_concurrency: int = Field(
+        4,
+        ge=1,
+        le=20,
+        description=(
+            "Collectors (and per-organization inventory warm-ups) run at once during the "
+            "initial cold-start collection, in priority order. 1 restores the one-at-a-time "
+            "start with a 1s gap between collectors."
+        ),
+    )
+    readiness_quorum: float = Field(
+        1.0,
+        gt=0.0,
+        le=1.0,
+        description=(
+            "Fraction of readiness-gating collectors that must have succeeded at least once "
+            "before /ready returns 200. 1.0 waits for all of them; lower values let a pod "
+            "serve once most data is fresh instead of waiting on the slowest collector."
+        ),
+    )
     collect_ap_signal_quality: bool = Field(
         True,
         description=(
@@ -1007,6 +1206,50 @@ class ClientSettings(BaseModel):
         le=512,
         description="Maximum number of reverse-DNS lookups in flight at once.",
     )
+    dns_resolver_backend: Literal["system", "async"] = Field(
+        "system",
+        description=(
+            "Reverse-DNS backend. 'system' calls gethostbyaddr on a dedicated thread pool "
+            "(honours nsswitch/hosts files). 'async' sends PTR queries over UDP (TCP on "
+            "truncation) directly from the event loop, pipelining many queries per socket "
+            "with per-query retries; suited to very large client populations."
+        ),
+    )
+    # NoDecode: the raw CSV env string reaches the list-preserving validator below.
+    dns_nameservers: Annotated[list[str], NoDecode] = Field(
+        default_factory=list,
+        description=(
+            "Nameservers for the async backend as host, host:port or [v6]:port (CSV or "
+            "JSON array); empty reads the nameserver entries of /etc/resolv.conf."
+        ),
+    )
+    dns_query_attempts: int = Field(
+        2,
+        ge=1,
+        le=5,
+        description=(
+            "Attempts per lookup for the async backend; dns_timeout is split evenly "
+            "across attempts and each retry moves to the next nameserver."
+        ),
+    )
+    dns_negative_cache_ttl: int = Field(
+        3600,
+        ge=60,
+        le=86400,
+        description=(
+            "Cache TTL in seconds for lookups the async backend got an authoritative "
+            "negative answer for (NXDOMAIN or no PTR record)."
+        ),
+    )
+    dns_transient_failure_ttl: int = Field(
+        60,
+        ge=5,
+        le=3600,
+        description=(
+            "Cache TTL in seconds for async-backend lookups that failed transiently "
+            "(every nameserver timed out or returned SERVFAIL)."
+        ),
+    )
     dns_timeout: float = Field(
         5.0,
         ge=0.5,
@@ -1030,6 +1273,42 @@ class ClientSettings(BaseModel):
             "client churn (#543)."
         ),
     )
+    dns_refresh_ahead_fraction: float = Field(
+        0.8,
+        ge=0.5,
+        le=1.0,
+        description=(
+            "Fraction of an entry's TTL after which a cache hit schedules a background "
+            "re-resolution, so entries are renewed before they expire instead of inline "
+            "on the collection path. 1.0 disables refresh-ahead."
+        ),
+    )
+    dns_refresh_ahead_concurrency: int = Field(
+        4,
+        ge=1,
+        le=64,
+        description=(
+            "Maximum background refresh-ahead lookups in flight; kept small so "
+            "refreshes never compete with foreground resolution."
+        ),
+    )
+    dns_cache_file: str | None = Field(
+        None,
+        description=(
+            "Optional path where the reverse-DNS cache is persisted (JSON, written "
+            "atomically) and reloaded on startup with each entry's remaining TTL, "
+            "avoiding a full re-resolution after a restart."
+        ),
+    )
+    dns_cache_persist_interval: int = Field(
+        300,
+        ge=30,
+        le=86400,
+        description=(
+            "Minimum seconds between periodic writes of dns_cache_file; the cache is "
+            "also written at shutdown."
+        ),
+    )
     cache_ttl: int = Field(
         3600,
         ge=300,
@@ -1052,6 +1331,16 @@ class ClientSettings(BaseModel):
             "with a warning and counted in meraki_exporter_clients_over_cap."
         ),
     )
+    store_eviction_policy: Literal["lru", "fair_share", "refuse"] = Field(
+        "lru",
+        description=(
+            "How the client store admits a new client once it holds max_clients_total "
+            "clients: 'lru' evicts the least recently seen client across all networks; "
+            "'fair_share' evicts from the network furthest over its equal share of the cap "
+            "(its least recently seen client first); 'refuse' keeps the pre-existing "
+            "behaviour of skipping new clients until stale networks are cleaned up."
+        ),
+    )
     signal_quality_enabled: bool = Field(
         False,
         description=(
@@ -1061,6 +1350,12 @@ class ClientSettings(BaseModel):
         ),
     )
 
+    @field_validator("dns_nameservers", mode="before")
+    @classmethod
+    def _split_nameservers_csv(cls, v: object) -> list[str]:
+        """Accept a list, a comma-separated string, or a JSON array from env vars."""
+        return _split_collector_csv_list(v)
+
 
 class MerakiSettings(BaseModel):
     """Meraki API configuration."""
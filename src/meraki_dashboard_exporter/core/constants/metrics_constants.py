@@ -574,6 +574,8 @@ class CollectorMetricName(StrEnum):
     # API client metrics
     API_REQUESTS_TOTAL = "meraki_exporter_api_requests_total"
     EXPORTER_API_REQUEST_ATTEMPTS_TOTAL = "meraki_exporter_api_request_attempts_total"
+    API_HEDGED_REQUESTS_TOTAL = "meraki_exporter_api_hedged_requests_total"
+    API_NEGATIVE_CACHE_SUPPRESSED_TOTAL = "meraki_exporter_api_negative_cache_suppressed_total"
     API_RETRY_ATTEMPTS_TOTAL = "meraki_exporter_api_retry_total"
     API_RATE_LIMITER_WAIT_SECONDS = "meraki_exporter_api_rate_limiter_wait_seconds"
     API_RATE_LIMITER_THROTTLED_TOTAL = "meraki_exporter_api_rate_limiter_throttled_total"
@@ -622,8 +624,20 @@ class CollectorMetricName(StrEnum):
     CLIENT_DNS_QUEUE_DEPTH = "meraki_exporter_client_dns_queue_depth"
     CLIENT_DNS_QUEUE_WAIT_SECONDS = "meraki_exporter_client_dns_queue_wait_seconds"
     CLIENT_DNS_LOOKUPS_TIMEOUT_TOTAL = "meraki_exporter_client_dns_lookups_timeout_total"
+    # Background refresh-ahead re-resolutions of near-expiry cache entries, the
+    # subset that failed (the stale entry is kept until it expires), and their
+    # cumulative lookup time (kept out of CLIENT_DNS_RESOLUTION_SECONDS_TOTAL).
+    CLIENT_DNS_REFRESH_AHEAD_TOTAL = "meraki_exporter_client_dns_refresh_ahead_total"
+    CLIENT_DNS_REFRESH_AHEAD_FAILED_TOTAL = "meraki_exporter_client_dns_refresh_ahead_failed_total"
+    CLIENT_DNS_REFRESH_AHEAD_SECONDS_TOTAL = (
+        "meraki_exporter_client_dns_refresh_ahead_seconds_total"
+    )
     CLIENT_STORE_TOTAL = "meraki_exporter_client_store_total"
     CLIENT_STORE_NETWORKS = "meraki_exporter_client_store_networks"
+    # Client-store admission under clients.max_clients_total: evictions by reason
+    # (lru / fair_share / stale_network) and new clients refused while full.
+    CLIENT_STORE_EVICTIONS_TOTAL = "meraki_exporter_client_store_evictions_total"
+    CLIENT_STORE_REJECTED_TOTAL = "meraki_exporter_client_store_rejected_total"
 
     # Collection utilization metrics
     EXPORTER_COLLECTION_UTILIZATION_RATIO = "meraki_exporter_collection_utilization_ratio"
@@ -643,6 +657,8 @@ class CollectorMetricName(StrEnum):
     COLLECTOR_ERRORS_TOTAL = "meraki_exporter_collector_errors_total"
     COLLECTOR_SUCCESS_TIMESTAMP_SECONDS = "meraki_exporter_collector_success_timestamp_seconds"
     COLLECTOR_API_CALLS_TOTAL = "meraki_exporter_collector_api_calls_total"
+    # Org/network/device directory calls that bypassed the shared inventory.
+    COLLECTOR_INVENTORY_BYPASS_TOTAL = "meraki_exporter_collector_inventory_bypass_total"
     COLLECTOR_FAILURE_STREAK = "meraki_exporter_collector_failure_streak"
 
     # Bounded task admission and queue visibility (#710).
@@ -669,6 +685,32 @@ class CollectorMetricName(StrEnum):
     SCHEDULER_GROUP_FAILURES_TOTAL = "meraki_exporter_scheduler_group_failures_total"
     SCHEDULER_GROUP_SKIPS_TOTAL = "meraki_exporter_scheduler_group_skips_total"
     SCHEDULER_GROUP_SHED = "meraki_exporter_scheduler_group_shed"
+    SCHEDULER_ESTIMATED_COST_CALLS = "meraki_exporter_scheduler_estimated_cost_calls"
+    SCHEDULER_MEASURED_COST_CALLS = "meraki_exporter_scheduler_measured_cost_calls"
+    SCHEDULER_MEASURED_COST_UPPER_CALLS = "meraki_exporter_scheduler_measured_cost_upper_calls"
+    SCHEDULER_MEASURED_DEMAND_RPS = "meraki_exporter_scheduler_measured_demand_rps"
+    SCHEDULER_GROUP_EXECUTION_SECONDS = "meraki_exporter_scheduler_group_execution_seconds"
+    DISPATCHER_LATENESS_SECONDS = "meraki_exporter_dispatcher_lateness_seconds"
+    DISPATCHER_WAKEUPS_TOTAL = "meraki_exporter_dispatcher_wakeups_total"
+
+    # Weighted fair queuing of per-org work items
+    FAIR_QUEUE_DEPTH = "meraki_exporter_fair_queue_depth"
+    FAIR_QUEUE_WAIT_SECONDS = "meraki_exporter_fair_queue_wait_seconds"
+
+    # Adaptive (latency-gradient) limit on in-flight SDK calls
+    SDK_CONCURRENCY_LIMIT = "meraki_exporter_sdk_concurrency_limit"
+    SDK_INFLIGHT = "meraki_exporter_sdk_inflight"
+
+    # Cursor-based incremental fetches of interval-history endpoints
+    HISTORY_FETCHES_TOTAL = "meraki_exporter_history_fetches_total"
+
+    # Budgeted rotating cohorts for per-entity fan-out groups
+    COHORT_DATA_AGE_SECONDS = "meraki_exporter_cohort_data_age_seconds"
+    COHORT_MAX_DATA_AGE_SECONDS = "meraki_exporter_cohort_max_data_age_seconds"
+
+    # Network-health calls skipped by capability pre-filtering / negative cache
+    NETWORK_HEALTH_SKIPPED_CALLS_TOTAL = "meraki_exporter_network_health_skipped_calls_total"
+
     COLLECTION_PROFILE_INFO = "meraki_exporter_collection_profile_info"
 
     # OTel data-log emitter self-observability (#622). Counters labelled by
@@ -714,3 +756,8 @@ class WebhookMetricName(StrEnum):
     # Fast-path device state transitions driven by inbound webhooks (#614).
     # direction=down|up, result=applied|unknown_serial. Bounded ≤4 series.
     WEBHOOK_DEVICE_STATE_TRANSITIONS_TOTAL = "meraki_webhook_device_state_transitions_total"
+
+    # Event-driven inventory invalidation and re-polls. Labels are bounded by
+    # the alert-type routing table (type = cache kind; group/result static).
+    WEBHOOK_INVENTORY_INVALIDATIONS_TOTAL = "meraki_webhook_inventory_invalidations_total"
+    WEBHOOK_REPOLLS_TOTAL = "meraki_webhook_repolls_total"
@@ -0,0 +1,186 @@
+"""Online, measured API cost per endpoint-group execution.
+
+``EndpointGroup.cost_fn`` predicts the calls one execution makes from the org
+shape (``pages(n, per_page)`` arithmetic). Real executions also pay for 404-heavy
+networks, 429 retries and pages the estimate did not foresee, so the solver's
+demand can be consistently off. :class:`GroupCostModel` measures instead: an
+execution opens when the group's gate admits it, every SDK attempt made by
+:class:`~.api_facade.MerakiApiFacade` inside the group's
+:meth:`~GroupCostModel.measure` block is charged to it through a context
+variable, and the execution closes on the group's successful ``mark_ran``. Each
+closed execution folds into an exponentially weighted mean and variance of calls
+and wall time.
+
+The binding is scoped to the fetch, not set by the gate, so a collector that
+admits several groups up front charges each call to the group that made it. The
+context variable follows asyncio task creation, so per-network fan-out tasks
+spawned inside the block are charged to it. Failed executions never close and
+are discarded when the group is next admitted.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from .scheduler import EndpointGroupName
+
+# (model, group) of the execution the current task is working for.
+_current_execution: ContextVar[tuple[GroupCostModel, EndpointGroupName] | None] = ContextVar(
+    "endpoint_group_execution", default=None
+)
+
+# Two-sided ~95% normal quantile for the reported confidence bounds.
+_CONFIDENCE_Z = 1.96
+
+
+@dataclass(slots=True)
+class CostEstimate:
+    """EWMA summary of one group's measured executions."""
+
+    samples: int
+    mean_calls: float
+    variance_calls: float
+    mean_seconds: float
+    effective_window: float
+
+    @property
+    def stddev_calls(self) -> float:
+        """Standard deviation of calls per execution."""
+        return math.sqrt(max(0.0, self.variance_calls))
+
+    def bounds(self) -> tuple[float, float]:
+        """~95% confidence bounds of the mean calls per execution.
+
+        The sample count is capped at the EWMA's effective window, since older
+        executions have decayed out of the mean.
+        """
+        n = max(1.0, min(float(self.samples), self.effective_window))
+        half_width = _CONFIDENCE_Z * self.stddev_calls / math.sqrt(n)
+        return max(0.0, self.mean_calls - half_width), self.mean_calls + half_width
+
+
+class GroupCostModel:
+    """Per-group EWMA of API calls and wall time per successful execution.
+
+    Parameters
+    ----------
+    alpha : float
+        EWMA smoothing factor in (0, 1]; higher follows changes faster.
+    min_samples : int
+        Closed executions required before :meth:`measured_cost` trusts the
+        mean over the static ``cost_fn`` estimate.
+
+    """
+
+    def __init__(self, alpha: float = 0.3, min_samples: int = 3) -> None:
+        """Initialize an empty model."""
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+        self.alpha = alpha
+        self.min_samples = max(1, min_samples)
+        self._open: dict[EndpointGroupName, list[float]] = {}
+        self._estimates: dict[EndpointGroupName, CostEstimate] = {}
+
+    def begin(self, group: EndpointGroupName, now: float | None = None) -> None:
+        """Open an execution of ``group`` (called when its gate admits it).
+
+        A still-open previous execution (one that failed) is discarded.
+        """
+        self._open[group] = [time.monotonic() if now is None else now, 0.0]
+
+    @contextmanager
+    def measure(self, group: EndpointGroupName) -> Generator[None]:
+        """Charge the SDK calls made inside the block to ``group``.
+
+        Calls count only while an execution of ``group`` is open, so a block
+        whose gate did not admit the group charges nothing. Repeated blocks (one
+        per org, say) add to the same execution; tasks created inside the block
+        inherit the binding.
+        """
+        token = _current_execution.set((self, group))
+        try:
+            yield
+        finally:
+            _current_execution.reset(token)
+
+    def record_calls(self, group: EndpointGroupName, calls: float) -> None:
+        """Charge ``calls`` API requests to the open execution of ``group``."""
+        execution = self._open.get(group)
+        if execution is not None:
+            execution[1] += calls
+
+    def complete(self, group: EndpointGroupName, now: float | None = None) -> CostEstimate | None:
+        """Close the open execution of ``group`` and fold it into the EWMA.
+
+        Returns
+        -------
+        CostEstimate | None
+            The updated estimate, or ``None`` when no execution was open.
+
+        """
+        execution = self._open.pop(group, None)
+        if execution is None:
+            return None
+        started, calls = execution
+        seconds = max(0.0, (time.monotonic() if now is None else now) - started)
+        current = self._estimates.get(group)
+        if current is None:
+            current = CostEstimate(
+                samples=1,
+                mean_calls=calls,
+                variance_calls=0.0,
+                mean_seconds=seconds,
+                effective_window=(2.0 - self.alpha) / self.alpha,
+            )
+        else:
+            # Incremental EWMA mean/variance (Finch, "Incremental calculation of
+            # weighted mean and variance", 2009).
+            diff = calls - current.mean_calls
+            increment = self.alpha * diff
+            current.mean_calls += increment
+            current.variance_calls = (1.0 - self.alpha) * (
+                current.variance_calls + diff * increment
+            )
+            current.mean_seconds += self.alpha * (seconds - current.mean_seconds)
+            current.samples += 1
+        self._estimates[group] = current
+        return current
+
+    def estimate(self, group: EndpointGroupName) -> CostEstimate | None:
+        """Return the current estimate for ``group`` (any sample count)."""
+        return self._estimates.get(group)
+
+    def measured_cost(self, group: EndpointGroupName) -> float | None:
+        """Mean calls per execution once ``min_samples`` executions closed."""
+        current = self._estimates.get(group)
+        if current is None or current.samples < self.min_samples:
+            return None
+        return current.mean_calls
+
+    def measured_costs(self) -> dict[EndpointGroupName, float]:
+        """Trusted measured costs for every group that has enough samples."""
+        return {
+            group: estimate.mean_calls
+            for group, estimate in self._estimates.items()
+            if estimate.samples >= self.min_samples
+        }
+
+
+def record_api_calls(calls: float = 1.0) -> None:
+    """Charge ``calls`` requests to the execution the current task works for.
+
+    No-op outside a :meth:`GroupCostModel.measure` block (startup warming,
+    discovery, tests).
+    """
+    current = _current_execution.get()
+    if current is not None:
+        model, group = current
+        model.record_calls(group, calls)
@@ -0,0 +1,220 @@
+"""Central earliest-deadline-first dispatcher for collector runs.
+
+One task replaces the per-collector polling loops. It keeps a min-heap of
+``(due_at, priority, seq, collector)`` work items, where ``due_at`` is the
+collector's earliest-due endpoint group (``EndpointScheduler.seconds_until_due``)
+and ``priority`` its most important declared group. The dispatcher sleeps
+exactly until the head of the heap is due, then starts the due collectors in
+``(priority, due_at)`` order, up to the admission limit. A finished run puts
+its collector back at its next due time and wakes the dispatcher, so there are
+no per-collector idle wakeups and no 1s sleep granularity.
+
+The dispatch unit is the collector: endpoint-group fetches live inside the
+collectors, whose gates (``_should_run_group``) admit exactly the groups that
+are due when the collector runs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol
+
+from prometheus_client import REGISTRY, Counter, Histogram
+
+from .constants.metrics_constants import CollectorMetricName
+from .logging import get_logger
+from .metrics import LabelName
+
+if TYPE_CHECKING:
+    from .scheduler import EndpointScheduler
+
+logger = get_logger(__name__)
+
+# Minimum spacing between two runs of the same collector. A group whose gate
+# the collector never consults (e.g. no devices of that type) stays "due now";
+# this keeps such a collector from being re-dispatched in a tight loop.
+_MIN_REDISPATCH_SECONDS = 1.0
+
+# Priority given to collectors that declare no gated endpoint groups.
+_UNGATED_PRIORITY = 5
+
+
+class DispatchRunner(Protocol):
+    """Structural view of ``CollectorManager`` (core never imports ``collectors``)."""
+
+    scheduler: EndpointScheduler
+
+    async def run_collector_once(self, collector: Any, *, force: bool = False) -> None:
+        """Run one collector once, honouring its group gates."""
+        ...
+
+
+@dataclass(frozen=True)
+class DispatcherMetrics:
+    """Dispatcher metrics, shared by every dispatcher instance."""
+
+    lateness_seconds: Histogram
+    wakeups: Counter
+
+
+_dispatcher_metrics: DispatcherMetrics | None = None
+
+
+def get_dispatcher_metrics() -> DispatcherMetrics:
+    """Return dispatcher metrics, recreating them after an isolated test registry reset."""
+    global _dispatcher_metrics
+    metric_name = CollectorMetricName.DISPATCHER_WAKEUPS_TOTAL.value
+    if _dispatcher_metrics is None or metric_name not in REGISTRY._names_to_collectors:
+        _dispatcher_metrics = DispatcherMetrics(
+            lateness_seconds=Histogram(
+                CollectorMetricName.DISPATCHER_LATENESS_SECONDS.value,
+                "Seconds between a collector becoming due and the dispatcher starting it "
+                "(scheduling jitter plus waits for an admission slot)",
+                labelnames=[LabelName.COLLECTOR.value],
+                buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60, 300),
+            ),
+            wakeups=Counter(
+                CollectorMetricName.DISPATCHER_WAKEUPS_TOTAL.value,
+                "Dispatcher wakeups, by result (dispatched = at least one collector "
+                "started; idle = nothing was due or no admission slot was free)",
+                labelnames=[LabelName.RESULT.value],
+            ),
+        )
+    return _dispatcher_metrics
+
+
+class CollectionDispatcher:
+    """Run collectors when their earliest endpoint group is due, most urgent first.
+
+    Parameters
+    ----------
+    runner : DispatchRunner
+        The collector manager: runs collectors and owns the scheduler.
+    max_concurrency : int
+        Maximum collectors running at once (the manager's admission limit).
+    resolve_cap_seconds : float
+        Longest a collector waits between dispatches, so re-solves, AIMD moves
+        and re-enabled groups are picked up within one resolve period.
+
+    """
+
+    def __init__(
+        self,
+        runner: DispatchRunner,
+        *,
+        max_concurrency: int,
+        resolve_cap_seconds: float,
+    ) -> None:
+        """Initialize an empty dispatcher."""
+        self._runner = runner
+        self.max_concurrency = max(1, max_concurrency)
+        self.resolve_cap_seconds = float(resolve_cap_seconds)
+        self._collectors: dict[str, Any] = {}
+        self._priorities: dict[str, int] = {}
+        self._heap: list[tuple[float, int, int, str]] = []
+        # Due time of the heap entry that is current per collector; older
+        # entries (superseded by reschedule()) are skipped when popped.
+        self._due: dict[str, float] = {}
+        self._seq = itertools.count()
+        self._running: dict[str, asyncio.Task[None]] = {}
+        self._wake = asyncio.Event()
+        self._metrics = get_dispatcher_metrics()
+
+    def add(self, collector: Any, delay_seconds: float = 0.0) -> None:
+        """Register a collector, first due ``delay_seconds`` from now."""
+        name = collector.__class__.__name__
+        self._collectors[name] = collector
+        priorities = [g.priority for g in collector.get_endpoint_groups() if g.gated]
+        self._priorities[name] = min(priorities, default=_UNGATED_PRIORITY)
+        self._push(name, time.monotonic() + max(0.0, delay_seconds))
+
+    def _push(self, name: str, due_at: float) -> None:
+        self._due[name] = due_at
+        heapq.heappush(self._heap, (due_at, self._priorities[name], next(self._seq), name))
+        self._wake.set()
+
+    def _next_due_at(self, collector: Any, now: float) -> float:
+        """When the collector's earliest enabled group is due, capped at one resolve period."""
+        groups = [g.name for g in collector.get_endpoint_groups()]
+        due_in = self._runner.scheduler.seconds_until_due(groups, now)
+        wait = self.resolve_cap_seconds if due_in is None else min(due_in, self.resolve_cap_seconds)
+        return now + max(_MIN_REDISPATCH_SECONDS, wait)
+
+    def reschedule(self) -> None:
+        """Pull idle collectors forward when a scheduler re-solve made them due sooner."""
+        now = time.monotonic()
+        for name, collector in self._collectors.items():
+            if name in self._running:
+                continue
+            due_at = self._next_due_at(collector, now)
+            if due_at < self._due.get(name, math.inf):
+                self._push(name, due_at)
+
+    async def run(self, shutdown: asyncio.Event) -> None:
+        """Dispatch until ``shutdown`` is set or the task is cancelled."""
+        watcher = asyncio.create_task(self._wake_on(shutdown))
+        try:
+            while not shutdown.is_set():
+                self._wake.clear()
+                started = self._dispatch_due(time.monotonic())
+                self._metrics.wakeups.labels(result="dispatched" if started else "idle").inc()
+                timeout = self._seconds_until_next(time.monotonic())
+                try:
+                    async with asyncio.timeout(timeout):
+                        await self._wake.wait()
+                except TimeoutError:
+                    pass
+        finally:
+            running = [watcher, *self._running.values()]
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
+    async def _wake_on(self, shutdown: asyncio.Event) -> None:
+        await shutdown.wait()
+        self._wake.set()
+
+    def _seconds_until_next(self, now: float) -> float | None:
+        """Sleep until the heap head is due; ``None`` while every slot is busy."""
+        if len(self._running) >= self.max_concurrency or not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - now)
+
+    def _dispatch_due(self, now: float) -> int:
+        """Start due collectors in (priority, due) order while slots are free."""
+        ready: list[tuple[float, int, int, str]] = []
+        while self._heap and self._heap[0][0] <= now:
+            item = heapq.heappop(self._heap)
+            if self._due.get(item[3]) == item[0] and item[3] not in self._running:
+                ready.append(item)
+        ready.sort(key=lambda item: (item[1], item[0], item[2]))
+        started = 0
+        for item in ready:
+            if len(self._running) >= self.max_concurrency:
+                heapq.heappush(self._heap, item)
+                continue
+            due_at, _priority, _seq, name = item
+            self._metrics.lateness_seconds.labels(collector=name).observe(max(0.0, now - due_at))
+            task = asyncio.create_task(self._run_one(name), name=f"dispatch_{name}")
+            self._running[name] = task
+            started += 1
+        return started
+
+    async def _run_one(self, name: str) -> None:
+        collector = self._collectors[name]
+        try:
+            await self._runner.run_collector_once(collector)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # run_collector_once already swallows per-collector failures at its
+            # own boundary; anything reaching here is unexpected. Keep going.
+            logger.exception("Error during collector run", collector=name)
+        finally:
+            self._running.pop(name, None)
+        self._push(name, self._next_due_at(collector, time.monotonic()))
@@ -0,0 +1,163 @@
+"""Weighted fair queuing of per-organization work items.
+
+Collector coordinators fan work out across organizations. Admitting whole
+orgs in iteration order lets one very large org hold the executor for minutes
+while small orgs wait behind it. ``WeightedFairQueue`` instead admits
+individual work items (a sub-collection, a per-device fetch) through a fixed
+number of slots, using start-time fair queuing: every item gets a virtual
+start tag ``max(V, last_finish[org])`` and advances its org's finish tag by
+``cost / weight``. Waiting items are admitted lowest tag first, so executor
+time is shared across orgs in proportion to their weights regardless of how
+many items each org queued or where it sat in the list.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncGenerator, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from prometheus_client import REGISTRY, Gauge, Histogram
+
+from .constants.metrics_constants import CollectorMetricName
+from .metrics import LabelName
+
+
+@dataclass(frozen=True)
+class FairQueueMetrics:
+    """Per-org fair-queue metrics, shared by every queue instance."""
+
+    depth: Gauge
+    wait_seconds: Histogram
+
+
+_fair_queue_metrics: FairQueueMetrics | None = None
+
+
+def get_fair_queue_metrics() -> FairQueueMetrics:
+    """Return fair-queue metrics, recreating them after an isolated test registry reset."""
+    global _fair_queue_metrics
+    metric_name = CollectorMetricName.FAIR_QUEUE_DEPTH.value
+    if _fair_queue_metrics is None or metric_name not in REGISTRY._names_to_collectors:
+        labelnames = [LabelName.COLLECTOR.value, LabelName.ORG_ID.value]
+        _fair_queue_metrics = FairQueueMetrics(
+            depth=Gauge(
+                CollectorMetricName.FAIR_QUEUE_DEPTH.value,
+                "Per-organization work items waiting for a fair-queue slot",
+                labelnames=labelnames,
+            ),
+            wait_seconds=Histogram(
+                CollectorMetricName.FAIR_QUEUE_WAIT_SECONDS.value,
+                "Seconds a per-organization work item waited for a fair-queue slot",
+                labelnames=labelnames,
+                buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 120, 300),
+            ),
+        )
+    return _fair_queue_metrics
+
+
+class WeightedFairQueue:
+    """Admit per-org work items through shared slots in weighted fair order.
+
+    Parameters
+    ----------
+    name : str
+        Owner name used as the ``collector`` metric label.
+    capacity : int
+        Work items allowed to run at once across all organizations.
+    weights : Mapping[str, float] | None
+        Per-org weights (e.g. by SLA tier); unlisted orgs weigh 1.0. An org
+        with weight 2 gets twice the slot time of a weight-1 org when both
+        have work queued.
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        capacity: int,
+        weights: Mapping[str, float] | None = None,
+    ) -> None:
+        """Initialize an idle queue."""
+        self.name = name
+        self.capacity = max(1, capacity)
+        self._weights = dict(weights or {})
+        self._active = 0
+        self._virtual_time = 0.0
+        self._finish: dict[str, float] = {}
+        self._waiters: list[tuple[float, int, str, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+        self._depth: dict[str, int] = {}
+        self._metrics = get_fair_queue_metrics()
+
+    def weight(self, org_id: str) -> float:
+        """Return the org's configured weight (1.0 when unlisted)."""
+        return max(1e-6, float(self._weights.get(org_id, 1.0)))
+
+    def queue_depth(self, org_id: str) -> int:
+        """Return how many of the org's work items are waiting for a slot."""
+        return self._depth.get(org_id, 0)
+
+    @asynccontextmanager
+    async def slot(self, org_id: str, cost: float = 1.0) -> AsyncGenerator[None]:
+        """Hold one slot for a unit of ``org_id``'s work.
+
+        Parameters
+        ----------
+        org_id : str
+            Organization the work item belongs to.
+        cost : float
+            Relative size of the work item; larger items advance the org's
+            virtual clock further.
+
+        """
+        enqueued_at = time.monotonic()
+        start_tag = max(self._virtual_time, self._finish.get(org_id, 0.0))
+        self._finish[org_id] = start_tag + cost / self.weight(org_id)
+
+        if self._active < self.capacity and not self._waiters:
+            self._active += 1
+            self._virtual_time = start_tag
+        else:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (start_tag, next(self._seq), org_id, future))
+            self._set_depth(org_id, 1)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # The slot was handed over just before the cancellation.
+                    self._release()
+                else:
+                    future.cancel()
+                    self._set_depth(org_id, -1)
+                raise
+
+        self._metrics.wait_seconds.labels(collector=self.name, org_id=org_id).observe(
+            time.monotonic() - enqueued_at
+        )
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        """Hand the freed slot to the lowest-tagged live waiter, or free it."""
+        while self._waiters:
+            start_tag, _seq, org_id, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._set_depth(org_id, -1)
+            self._virtual_time = start_tag
+            future.set_result(None)
+            return
+        self._active -= 1
+
+    def _set_depth(self, org_id: str, delta: int) -> None:
+        depth = self._depth.get(org_id, 0) + delta
+        self._depth[org_id] = depth
+        self._metrics.depth.labels(collector=self.name, org_id=org_id).set(depth)
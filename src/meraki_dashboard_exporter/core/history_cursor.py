@@ -0,0 +1,252 @@
+"""Time cursors for incremental fetches of interval-history endpoints.
+
+Several org-wide history endpoints are polled with a fixed trailing window
+(``timespan=3600`` for switch port usage, ``timespan=86400`` for MR power
+mode) every cycle, so each poll re-downloads intervals that were already seen
+and pagination grows with the window. ``HistoryCursorStore`` remembers, per
+``(org, endpoint)``, the end of the newest complete interval seen, so the next
+poll asks only for ``t0=<cursor>`` onwards. Fetched samples are merged into a
+small per-series ``IntervalRing`` keyed by sample start time, and the
+collector derives the current value from the ring exactly as it would from a
+full-window response.
+
+The cursor resets to a full-window fetch when there is none yet (restart),
+when the gap since the cursor reaches the window, when the request scope
+(e.g. the resolved network filter) changes, or when the owner reports a
+failed or non-mergeable response.
+"""
+
+from __future__ import annotations
+
+import bisect
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from prometheus_client import REGISTRY, Counter
+
+from .constants.metrics_constants import CollectorMetricName
+from .metrics import LabelName
+
+
+@dataclass(frozen=True)
+class HistoryCursorMetrics:
+    """Counters for incremental history fetches."""
+
+    fetches: Counter
+
+
+_history_metrics: HistoryCursorMetrics | None = None
+
+
+def get_history_cursor_metrics() -> HistoryCursorMetrics:
+    """Return history-cursor metrics, recreating them after an isolated test registry reset."""
+    global _history_metrics
+    metric_name = CollectorMetricName.HISTORY_FETCHES_TOTAL.value
+    if _history_metrics is None or metric_name not in REGISTRY._names_to_collectors:
+        _history_metrics = HistoryCursorMetrics(
+            fetches=Counter(
+                metric_name,
+                "Interval-history polls by endpoint and result (full = whole window, "
+                "incremental = from the stored cursor, reused = nothing new, served "
+                "from the ring buffers)",
+                labelnames=[LabelName.ENDPOINT.value, LabelName.RESULT.value],
+            ),
+        )
+    return _history_metrics
+
+
+def parse_timestamp(value: Any) -> float | None:
+    """Parse an ISO-8601 API timestamp into epoch seconds, or None."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed.timestamp()
+
+
+def format_timestamp(epoch_seconds: float) -> str:
+    """Format epoch seconds as the ISO-8601 UTC string the API expects for ``t0``."""
+    return datetime.fromtimestamp(epoch_seconds, tz=UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class IntervalRing:
+    """Bounded, time-ordered samples for one series.
+
+    Samples are keyed by start time; merging a sample with a start time that
+    is already held replaces it, so a re-reported (partial) interval updates in
+    place. ``meta`` holds whatever the owner needs to label the series (the
+    latest row the series was seen in).
+
+    Parameters
+    ----------
+    maxlen : int
+        Samples kept; the oldest are dropped first.
+
+    """
+
+    __slots__ = ("_starts", "_values", "maxlen", "meta", "seen_at")
+
+    def __init__(self, maxlen: int) -> None:
+        """Initialize an empty ring."""
+        self.maxlen = max(1, maxlen)
+        self._starts: list[float] = []
+        self._values: list[Any] = []
+        self.meta: Any = None
+        self.seen_at = 0.0
+
+    def merge(self, start_ts: float, value: Any) -> None:
+        """Insert or replace the sample starting at ``start_ts``."""
+        index = bisect.bisect_left(self._starts, start_ts)
+        if index < len(self._starts) and self._starts[index] == start_ts:
+            self._values[index] = value
+            return
+        self._starts.insert(index, start_ts)
+        self._values.insert(index, value)
+        if len(self._starts) > self.maxlen:
+            del self._starts[0]
+            del self._values[0]
+
+    def prune(self, oldest_ts: float) -> None:
+        """Drop samples starting before ``oldest_ts``."""
+        index = bisect.bisect_left(self._starts, oldest_ts)
+        if index:
+            del self._starts[:index]
+            del self._values[:index]
+
+    def values(self) -> list[Any]:
+        """Return the held values, oldest first."""
+        return list(self._values)
+
+    def __len__(self) -> int:
+        """Return the number of held samples."""
+        return len(self._starts)
+
+
+@dataclass
+class _EndpointHistory:
+    """Cursor and ring buffers for one (org, endpoint)."""
+
+    scope: str
+    cursor: float | None = None
+    rings: dict[Any, IntervalRing] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class HistoryWindow:
+    """What to request for one poll.
+
+    ``params`` are the SDK keyword arguments selecting the window, or None
+    when no new complete interval can exist yet and the rings are reused.
+    """
+
+    params: dict[str, Any] | None
+    incremental: bool
+    requested_at: float
+
+
+class HistoryCursorStore:
+    """Per-(org, endpoint) time cursors and per-series ring buffers."""
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._histories: dict[tuple[str, str], _EndpointHistory] = {}
+        self._metrics = get_history_cursor_metrics()
+
+    def window(
+        self,
+        org_id: str,
+        endpoint: str,
+        *,
+        timespan: float,
+        scope: str = "",
+        min_step: float = 0.0,
+        now: float | None = None,
+    ) -> HistoryWindow:
+        """Decide the window for the next poll of ``endpoint``.
+
+        Parameters
+        ----------
+        org_id : str
+            Organization ID.
+        endpoint : str
+            SDK operation name.
+        timespan : float
+            Full trailing window in seconds the derived values cover.
+        scope : str
+            Fingerprint of any other request parameters; a change resets.
+        min_step : float
+            Interval resolution; when less than this has elapsed since the
+            cursor, nothing new can be complete and the poll is skipped.
+        now : float | None
+            Current epoch seconds (defaults to ``time.time()``).
+
+        Returns
+        -------
+        HistoryWindow
+            ``{"timespan": ...}`` for a full fetch, ``{"t0": ...}`` for an
+            incremental one, or no params when the rings are reused as-is.
+
+        """
+        now = time.time() if now is None else now
+        history = self._histories.get((org_id, endpoint))
+        if (
+            history is None
+            or history.scope != scope
+            or history.cursor is None
+            or history.cursor > now
+            or now - history.cursor >= timespan
+        ):
+            self._histories[(org_id, endpoint)] = _EndpointHistory(scope=scope)
+            self._record(endpoint, "full")
+            return HistoryWindow({"timespan": int(timespan)}, incremental=False, requested_at=now)
+        if now - history.cursor < min_step:
+            self._record(endpoint, "reused")
+            return HistoryWindow(None, incremental=True, requested_at=now)
+        self._record(endpoint, "incremental")
+        return HistoryWindow(
+            {"t0": format_timestamp(history.cursor)}, incremental=True, requested_at=now
+        )
+
+    def advance(self, org_id: str, endpoint: str, end_ts: float) -> None:
+        """Move the cursor forward to ``end_ts`` (never backwards)."""
+        history = self._histories.get((org_id, endpoint))
+        if history is None:
+            return
+        if history.cursor is None or end_ts > history.cursor:
+            history.cursor = end_ts
+
+    def reset(self, org_id: str, endpoint: str) -> None:
+        """Forget the cursor and rings so the next poll fetches the full window."""
+        self._histories.pop((org_id, endpoint), None)
+
+    def ring(self, org_id: str, endpoint: str, key: Any, maxlen: int) -> IntervalRing:
+        """Return the ring for one series, creating it on first use."""
+        history = self._histories.setdefault((org_id, endpoint), _EndpointHistory(scope=""))
+        ring = history.rings.get(key)
+        if ring is None:
+            ring = history.rings[key] = IntervalRing(maxlen)
+        return ring
+
+    def rings(self, org_id: str, endpoint: str) -> dict[Any, IntervalRing]:
+        """Return every series ring held for ``(org_id, endpoint)``."""
+        history = self._histories.get((org_id, endpoint))
+        return history.rings if history is not None else {}
+
+    def prune(self, org_id: str, endpoint: str, oldest_ts: float) -> None:
+        """Age out samples and series not seen since ``oldest_ts``."""
+        history = self._histories.get((org_id, endpoint))
+        if history is None:
+            return
+        for key, ring in list(history.rings.items()):
+            ring.prune(oldest_ts)
+            if ring.seen_at < oldest_ts:
+                del history.rings[key]
+
+    def _record(self, endpoint: str, result: str) -> None:
+        self._metrics.fetches.labels(endpoint=endpoint, result=result).inc()
@@ -10,7 +10,7 @@ from __future__ import annotations
 import asyncio
 import time
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING, Any, NamedTuple
 
 import structlog
@@ -26,6 +26,11 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 
 
+def freeze_labels(labels: dict[str, str]) -> str:
+    """Return the order-independent string key the manager tracks a series under."""
+    return "|".join(f"{k}={v}" for k, v in sorted(labels.items()))
+
+
 class _TrackedSeries(NamedTuple):
     """Per-series tracking record stored in ``_metric_timestamps``.
 
@@ -213,6 +218,47 @@ class MetricExpirationManager:
             # Series already removed, or labels no longer match the gauge — nothing to do.
             pass
 
+    def refresh_series(
+        self,
+        collector_name: str,
+        series: Iterable[tuple[str, str]],
+        ttl_seconds: float | None = None,
+    ) -> set[tuple[str, str]]:
+        """Refresh the timestamps of already-tracked series in bulk.
+
+        For emitters that know a series' value and labels are unchanged since
+        the last ``track_metric_update`` and only need to keep it alive, without
+        rebuilding label dicts or touching the Gauge.
+
+        Parameters
+        ----------
+        collector_name : str
+            Name of the collector that owns the series.
+        series : Iterable[tuple[str, str]]
+            ``(metric_name, frozen_labels)`` pairs, labels frozen with
+            ``freeze_labels``.
+        ttl_seconds : float | None
+            Per-series TTL to record, as for ``track_metric_update``.
+
+        Returns
+        -------
+        set[tuple[str, str]]
+            Pairs that are not tracked (expired, shed, or never tracked). Their
+            Prometheus series may be gone, so the caller must re-emit them.
+
+        """
+        current_time = time.time()
+        entry = _TrackedSeries(current_time, collector_name, ttl_seconds)
+        timestamps = self._metric_timestamps
+        missing: set[tuple[str, str]] = set()
+        for metric_name, frozen_labels in series:
+            key = (collector_name, metric_name, frozen_labels)
+            if key in timestamps:
+                timestamps[key] = entry
+            else:
+                missing.add((metric_name, frozen_labels))
+        return missing
+
     def _freeze_labels(self, labels: dict[str, str]) -> str:
         """Convert label dict to frozen string representation.
 
@@ -227,7 +273,7 @@ class MetricExpirationManager:
             Frozen string representation for use as dict key.
 
         """
-        return "|".join(f"{k}={v}" for k, v in sorted(labels.items()))
+        return freeze_labels(labels)
 
     def _fallback_ttl(self, collector_name: str) -> float:
         """Fallback TTL for a series with no explicit ttl_seconds.
@@ -103,6 +103,7 @@ class LabelName(StrEnum):
     OPERATION = "operation"  # Meraki SDK operation ID
     PROFILE = "profile"  # Active collection profile (#701)
     PHASE = "phase"  # Bounded task lifecycle phase (#710)
+    REASON = "reason"  # Bounded outcome reason (e.g. client-store eviction reason)
 
     # API client labels (Phase 2.1)
     ENDPOINT = "endpoint"  # API endpoint name
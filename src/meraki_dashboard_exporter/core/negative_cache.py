@@ -0,0 +1,262 @@
+"""Negative-result cache for benign "no data for this entity" API failures.
+
+Many per-network and per-device endpoints legitimately answer 404 for
+entities that simply do not have the feature: mesh statuses on a network with
+no repeaters, appliance endpoints on a network without an MX, and so on.
+Without a cache every cycle pays a rate-limit token and a round trip for each
+of them, forever.
+
+``NegativeResultCache`` remembers (operation, entity) pairs whose last call
+failed with a benign category from :func:`categorize_error` and lets
+:class:`MerakiApiFacade` answer the next calls locally until a re-probe is
+due. Only reads of a whole network or device are cached: org-level and
+batched reads answer for many entities, and a read narrowed to one client or
+AP answers for less than its network, so one entity's key cannot stand for
+either. The re-probe delay doubles after every failed re-probe, up to a cap,
+and any success forgets the pair. Entries are also dropped when the inventory
+record of their entity changes (a device moves network, a network gains a
+product type), since that is exactly when the answer may have changed.
+Suppressed calls are counted per operation in
+``meraki_exporter_api_negative_cache_suppressed_total``.
+"""
+
+from __future__ import annotations
+
+import time
+import zlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from meraki.exceptions import APIError
+from prometheus_client import REGISTRY, Counter
+
+from .constants.metrics_constants import CollectorMetricName
+from .error_handling import ErrorCategory, categorize_error
+from .metrics import LabelName
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+#: Error categories treated as a stable "no data for this entity" answer. A 400
+#: rejects the request itself (its parameters), not the entity, so it is not one.
+BENIGN_CATEGORIES: frozenset[ErrorCategory] = frozenset({ErrorCategory.API_NOT_AVAILABLE})
+
+# Up to this fraction is added to each entry's re-probe delay, keyed on the
+# pair, so pairs recorded in the same cycle do not all re-probe together.
+_REPROBE_JITTER = 0.1
+
+
+@dataclass(frozen=True)
+class NegativeCacheMetrics:
+    """Counters for calls answered by the negative-result cache."""
+
+    suppressed_calls: Counter
+
+
+_negative_cache_metrics: NegativeCacheMetrics | None = None
+
+
+def get_negative_cache_metrics() -> NegativeCacheMetrics:
+    """Return negative-cache metrics, recreating them after an isolated test registry reset."""
+    global _negative_cache_metrics
+    metric_name = CollectorMetricName.API_NEGATIVE_CACHE_SUPPRESSED_TOTAL.value
+    if _negative_cache_metrics is None or metric_name not in REGISTRY._names_to_collectors:
+        _negative_cache_metrics = NegativeCacheMetrics(
+            suppressed_calls=Counter(
+                metric_name,
+                "SDK calls answered locally because the same operation recently "
+                "returned a benign 404 for the same entity",
+                labelnames=[LabelName.OPERATION.value],
+            ),
+        )
+    return _negative_cache_metrics
+
+
+class NegativeCachedError(APIError):  # type: ignore[misc]
+    """Replayed benign failure for a call the negative cache suppressed.
+
+    An ``APIError`` carrying the original HTTP ``status`` and ``reason``, so
+    callers that catch ``APIError`` or branch on the status (or on the 404
+    text) handle a suppressed call exactly like the real one.
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        entity: str,
+        status: int | None,
+        reason: str | None,
+        category: ErrorCategory,
+    ) -> None:
+        """Describe the suppressed call without an HTTP response."""
+        self.response = None
+        self.tag = "negative_cache"
+        self.operation = operation
+        self.entity = entity
+        self.status = status
+        self.reason = reason
+        self.category = category
+        self.message = "suppressed by the negative-result cache"
+        Exception.__init__(
+            self,
+            f"{operation} for {entity} - "
+            f"{status if status is not None else category.value} {reason}, {self.message}",
+        )
+
+
+@dataclass
+class _Entry:
+    """One known benign failure and its re-probe schedule."""
+
+    status: int | None
+    reason: str | None
+    category: ErrorCategory
+    failures: int
+    retry_at: float
+
+
+class NegativeResultCache:
+    """Known benign failures keyed by (operation, entity), with exponential re-probe."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._entries: dict[tuple[str, str], _Entry] = {}
+        self._by_entity: dict[str, set[str]] = {}
+        self._fingerprints: dict[tuple[str, str], dict[str, int]] = {}
+
+    def suppressed(
+        self, operation: str, entity: str, now: float | None = None
+    ) -> NegativeCachedError | None:
+        """Return the error to replay for the call, or ``None`` when it must run.
+
+        A pair whose re-probe is due is let through (its failure count is kept
+        so a repeated failure backs off further).
+        """
+        entry = self._entries.get((operation, entity))
+        if entry is None or (time.time() if now is None else now) >= entry.retry_at:
+            return None
+        get_negative_cache_metrics().suppressed_calls.labels(operation=operation).inc()
+        return NegativeCachedError(operation, entity, entry.status, entry.reason, entry.category)
+
+    def record_failure(
+        self,
+        operation: str,
+        entity: str,
+        exc: BaseException,
+        *,
+        base_seconds: float,
+        max_seconds: float,
+        now: float | None = None,
+    ) -> bool:
+        """Remember a benign failure; return whether ``exc`` was cached.
+
+        Parameters
+        ----------
+        operation : str
+            SDK operation name.
+        entity : str
+            Network ID or serial the call was made for.
+        exc : BaseException
+            The failure. Only :data:`BENIGN_CATEGORIES` are cached.
+        base_seconds : float
+            Re-probe delay after the first failure.
+        max_seconds : float
+            Cap on the doubled re-probe delay.
+        now : float | None
+            Current epoch seconds (defaults to ``time.time()``).
+
+        Returns
+        -------
+        bool
+            True when the pair is now suppressed.
+
+        """
+        if not isinstance(exc, Exception):
+            return False
+        category = categorize_error(exc)
+        if category not in BENIGN_CATEGORIES:
+            return False
+        key = (operation, entity)
+        previous = self._entries.get(key)
+        failures = previous.failures + 1 if previous is not None else 1
+        delay = min(max_seconds, base_seconds * 2 ** (failures - 1))
+        jitter = (zlib.crc32(f"{operation}:{entity}".encode()) % 1000) / 1000 * _REPROBE_JITTER
+        status = getattr(exc, "status", None)
+        reason = getattr(exc, "reason", None)
+        self._entries[key] = _Entry(
+            status=status if isinstance(status, int) else None,
+            reason=reason if isinstance(reason, str) else None,
+            category=category,
+            failures=failures,
+            retry_at=(time.time() if now is None else now) + delay * (1 + jitter),
+        )
+        self._by_entity.setdefault(entity, set()).add(operation)
+        return True
+
+    def record_success(self, operation: str, entity: str) -> None:
+        """Forget the pair after it returned data."""
+        if self._entries.pop((operation, entity), None) is None:
+            return
+        operations = self._by_entity.get(entity)
+        if operations is not None:
+            operations.discard(operation)
+            if not operations:
+                del self._by_entity[entity]
+
+    def invalidate_entities(self, entities: Iterable[str]) -> int:
+        """Drop every cached failure for ``entities``; return how many were dropped."""
+        dropped = 0
+        for entity in entities:
+            for operation in self._by_entity.pop(entity, ()):
+                if self._entries.pop((operation, entity), None) is not None:
+                    dropped += 1
+        return dropped
+
+    def observe_inventory(
+        self, kind: str, org_id: str, records: Iterable[dict[str, Any]], id_key: str
+    ) -> int:
+        """Invalidate entities whose inventory record changed since the last refresh.
+
+        Parameters
+        ----------
+        kind : str
+            Inventory kind (``networks`` or ``devices``); tracked separately.
+        org_id : str
+            Organization the records belong to.
+        records : Iterable[dict[str, Any]]
+            The freshly fetched inventory records.
+        id_key : str
+            Record field holding the entity ID (``id`` or ``serial``).
+
+        Returns
+        -------
+        int
+            Number of cached failures dropped.
+
+        """
+        current: dict[str, int] = {}
+        for record in records:
+            entity = record.get(id_key)
+            if isinstance(entity, str) and entity:
+                current[entity] = zlib.crc32(repr(sorted(record.items())).encode())
+        previous = self._fingerprints.get((kind, org_id))
+        self._fingerprints[(kind, org_id)] = current
+        if previous is None or not self._entries:
+            return 0
+        changed = {e for e, fp in current.items() if previous.get(e) != fp}
+        changed |= set(previous) - set(current)
+        return self.invalidate_entities(changed)
+
+    def reset(self) -> None:
+        """Forget every entry and inventory fingerprint."""
+        self._entries.clear()
+        self._by_entity.clear()
+        self._fingerprints.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached failures."""
+        return len(self._entries)
+
+
+#: Process-wide cache shared by every facade instance and the inventory.
+negative_results = NegativeResultCache()
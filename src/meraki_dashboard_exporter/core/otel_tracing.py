@@ -3,42 +3,96 @@
 from __future__ import annotations
 
 import functools
+import importlib
 import inspect
 import os
 from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
 
-import grpc
 from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
-from opentelemetry.instrumentation.logging import LoggingInstrumentor
-from opentelemetry.instrumentation.requests import RequestsInstrumentor
-from opentelemetry.instrumentation.threading import ThreadingInstrumentor
-from opentelemetry.propagate import set_global_textmap
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.sdk.trace.sampling import (
-    ALWAYS_OFF,
-    ALWAYS_ON,
-    ParentBased,
-    TraceIdRatioBased,
-)
-from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 
 from ..__version__ import get_version
 from .logging import get_logger
 
 if TYPE_CHECKING:
+    # Bound at runtime on first use by ``_load_otel_sdk`` (see ``_LAZY_IMPORTS``).
+    import grpc
     from fastapi import FastAPI
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+    from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+    from opentelemetry.instrumentation.logging import LoggingInstrumentor
+    from opentelemetry.instrumentation.requests import RequestsInstrumentor
+    from opentelemetry.instrumentation.threading import ThreadingInstrumentor
+    from opentelemetry.propagate import set_global_textmap
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import (
+        ALWAYS_OFF,
+        ALWAYS_ON,
+        ParentBased,
+        TraceIdRatioBased,
+    )
+    from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 
     from .config import Settings
 
 logger = get_logger(__name__)
 
+# The OpenTelemetry SDK, the gRPC OTLP exporter and the library instrumentors
+# are only needed once tracing (or an OTLP signal) is enabled, and importing
+# them costs far more than the rest of this module. They are resolved on first
+# use: ``name -> (module, attribute)``, with an empty attribute for a module.
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "grpc": ("grpc", ""),
+    "OTLPSpanExporter": (
+        "opentelemetry.exporter.otlp.proto.grpc.trace_exporter",
+        "OTLPSpanExporter",
+    ),
+    "FastAPIInstrumentor": ("opentelemetry.instrumentation.fastapi", "FastAPIInstrumentor"),
+    "HTTPXClientInstrumentor": ("opentelemetry.instrumentation.httpx", "HTTPXClientInstrumentor"),
+    "LoggingInstrumentor": ("opentelemetry.instrumentation.logging", "LoggingInstrumentor"),
+    "RequestsInstrumentor": ("opentelemetry.instrumentation.requests", "RequestsInstrumentor"),
+    "ThreadingInstrumentor": ("opentelemetry.instrumentation.threading", "ThreadingInstrumentor"),
+    "set_global_textmap": ("opentelemetry.propagate", "set_global_textmap"),
+    "Resource": ("opentelemetry.sdk.resources", "Resource"),
+    "TracerProvider": ("opentelemetry.sdk.trace", "TracerProvider"),
+    "BatchSpanProcessor": ("opentelemetry.sdk.trace.export", "BatchSpanProcessor"),
+    "ALWAYS_OFF": ("opentelemetry.sdk.trace.sampling", "ALWAYS_OFF"),
+    "ALWAYS_ON": ("opentelemetry.sdk.trace.sampling", "ALWAYS_ON"),
+    "ParentBased": ("opentelemetry.sdk.trace.sampling", "ParentBased"),
+    "TraceIdRatioBased": ("opentelemetry.sdk.trace.sampling", "TraceIdRatioBased"),
+    "TraceContextTextMapPropagator": (
+        "opentelemetry.trace.propagation.tracecontext",
+        "TraceContextTextMapPropagator",
+    ),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily-loaded OpenTelemetry name on first attribute access."""
+    target = _LAZY_IMPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = target
+    value: Any = importlib.import_module(module_name)
+    if attribute:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def _load_otel_sdk() -> None:
+    """Bind every lazily-loaded name into module globals before use.
+
+    Names already bound (including test patches) are left untouched.
+    """
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
+
 
 def build_otel_resource(settings: Settings) -> Resource:
     """Build the shared OpenTelemetry ``Resource`` for traces and data logs.
@@ -59,6 +113,7 @@ def build_otel_resource(settings: Settings) -> Resource:
         OpenTelemetry resource describing this exporter instance.
 
     """
+    _load_otel_sdk()
     return Resource.create({
         "service.name": settings.otel.service_name,
         "service.version": get_version(),
@@ -131,6 +186,7 @@ def build_otlp_credentials(
         )
         raise
 
+    _load_otel_sdk()
     return grpc.ssl_channel_credentials(
         root_certificates=root_certificates,
         private_key=private_key,
@@ -169,6 +225,7 @@ class TracingConfig:
             return
 
         try:
+            _load_otel_sdk()
             # Create resource with service information (shared with the data-log
             # emitter via build_otel_resource so traces and logs match exactly).
             resource = build_otel_resource(self.settings)
@@ -235,6 +292,7 @@ class TracingConfig:
             OpenTelemetry sampler instance.
 
         """
+        _load_otel_sdk()
         # Get sampling rate from settings (guarded so a bad value can't abort setup)
         sampling_rate = self._get_sampling_rate()
 
@@ -292,6 +350,7 @@ class TracingConfig:
 
     def _instrument_libraries(self) -> None:
         """Instrument all relevant libraries for tracing."""
+        _load_otel_sdk()
         # Instrument requests (used by Meraki SDK)
         RequestsInstrumentor().instrument(
             tracer_provider=self._tracer_provider,
@@ -367,6 +426,7 @@ class TracingConfig:
             return
 
         try:
+            _load_otel_sdk()
             FastAPIInstrumentor().instrument_app(
                 app,
                 tracer_provider=self._tracer_provider,
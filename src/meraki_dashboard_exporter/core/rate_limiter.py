@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 
 from prometheus_client import Counter, Gauge, Histogram
 
+from .concurrency_limiter import AdaptiveConcurrencyLimiter
 from .constants.metrics_constants import CollectorMetricName
 from .logging import get_logger
 from .metrics import LabelName
@@ -78,6 +79,10 @@ class OrgRateLimiter:
         self._tokens: dict[str, float] = {}
         self._last_refill: dict[str, float] = {}
 
+        # Adaptive limit on in-flight SDK calls; the facade holds one of its
+        # slots per attempt and feeds it latency and 429s. None when disabled.
+        self.concurrency_limiter = AdaptiveConcurrencyLimiter.from_settings(settings)
+
         self._init_metrics()
 
         logger.info(
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import importlib
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from ..core.logging import get_logger
@@ -16,6 +18,24 @@ logger = get_logger(__name__)
 # clocked loop; there is no per-tier grouping any more.
 _COLLECTOR_REGISTRY: list[type[MetricCollector]] = []
 
+# Static manifest of the top-level collectors: class name -> module within the
+# ``collectors`` package. Lets the manager import only the collectors that are
+# enabled, instead of every collector module (and their SDK/helper imports), on
+# startup. A new top-level collector must be listed here as well as decorated.
+COLLECTOR_MANIFEST: dict[str, str] = {
+    "AlertsCollector": "alerts",
+    "ClientsCollector": "clients",
+    "ConfigCollector": "config",
+    "DeviceCollector": "device",
+    "InsightCollector": "insight",
+    "MTSensorAlertsCollector": "mt_alerts",
+    "MTSensorCollector": "mt_sensor",
+    "NetworkHealthCollector": "network_health",
+    "OrganizationCollector": "organization",
+}
+
+_COLLECTORS_PACKAGE = "meraki_dashboard_exporter.collectors"
+
 
 def register_collector[T](cls: T) -> T:
     """Decorator to automatically register a collector with the CollectorManager.
@@ -70,3 +90,33 @@ def clear_registry() -> None:
     """
     _COLLECTOR_REGISTRY.clear()
     logger.debug("Cleared collector registry")
+
+
+def collector_short_name(class_name: str) -> str:
+    """Return the configuration name of a collector class (``DeviceCollector`` -> ``device``)."""
+    return class_name.replace("Collector", "").lower()
+
+
+def import_collector_modules(active: Iterable[str] | None = None) -> list[str]:
+    """Import the modules of manifest collectors so their decorators register them.
+
+    Parameters
+    ----------
+    active : Iterable[str] | None
+        Short collector names (as in ``collectors.active_collectors``) to
+        import. ``None`` imports every collector in the manifest.
+
+    Returns
+    -------
+    list[str]
+        Class names of the manifest collectors that were NOT imported.
+
+    """
+    wanted = None if active is None else set(active)
+    skipped: list[str] = []
+    for class_name, module in COLLECTOR_MANIFEST.items():
+        if wanted is not None and collector_short_name(class_name) not in wanted:
+            skipped.append(class_name)
+            continue
+        importlib.import_module(f"{_COLLECTORS_PACKAGE}.{module}")
+    return skipped
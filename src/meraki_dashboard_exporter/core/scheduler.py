@@ -8,8 +8,8 @@ floor) to fit estimated steady-state demand inside ``budget × target_utilizatio
 
 Frozen seam per #617/#631 — names/signatures are compiled against by sibling
 modules (collector.py gate helpers, manager.py wiring, inventory OrgShape
-computation, rate-limiter AIMD feedback, the per-collector group-clocked loops
-in app.py which read ``seconds_until_due``).
+computation, rate-limiter AIMD feedback, the collection dispatcher in
+dispatcher.py which reads ``seconds_until_due``).
 
 Settings are read dynamically (``settings.scheduler.*``, ``settings.api.*``,
 ``settings.monitoring.*``) rather than importing ``config_models`` — this avoids
@@ -27,11 +27,12 @@ from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple
 from prometheus_client import REGISTRY, Counter, Gauge
 
 from .constants.metrics_constants import CollectorMetricName
+from .cost_model import GroupCostModel
 from .logging import get_logger
 from .metrics import LabelName
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable
+    from collections.abc import Callable, Iterable, Mapping
 
     from .config import Settings
     from .rate_limiter import OrgRateLimiter
@@ -52,6 +53,9 @@ _DEFAULTS: dict[str, Any] = {
     "aimd_recovery_rps_per_minute": 0.1,
     "aimd_resolve_hysteresis": 0.2,
     "group_interval_overrides": {},
+    "cost_model_enabled": True,
+    "cost_model_alpha": 0.3,
+    "cost_model_min_samples": 3,
 }
 
 # Fraction of the solved interval that must elapse before a group re-runs.
@@ -95,6 +99,7 @@ class EndpointGroupName(StrEnum):
     MX_SECURITY_EVENTS = "mx_security_events"
     MX_FIREWALL_CONFIG = "mx_firewall_config"
     MV_ANALYTICS = "mv_analytics"
+    MV_CONFIG = "mv_config"
     MG_UPLINK_STATUS = "mg_uplink_status"
     # MEDIUM — NetworkHealthCollector
     NH_CHANNEL_UTILIZATION = "nh_channel_utilization"
@@ -230,6 +235,7 @@ class SolvedInterval(NamedTuple):
     cost_per_cycle: float
     demand_rps: float  # cost_per_cycle / interval_seconds
     pinned: bool
+    measured: bool = False  # cost_per_cycle came from the online cost model
 
 
 def solve_intervals(
@@ -240,6 +246,7 @@ def solve_intervals(
     overrides: dict[str, int],
     max_stretch_factor: float,
     max_interval_seconds: float,
+    measured_costs: Mapping[EndpointGroupName, float] | None = None,
 ) -> dict[EndpointGroupName, SolvedInterval]:
     """Pure, deterministic interval solver (no I/O, no clock).
 
@@ -251,8 +258,9 @@ def solve_intervals(
     2. Apply ``overrides`` (operator pins): set exactly; a pin below the group's
        floor is honoured with a WARNING log. Pinned groups are excluded from
        stretching.
-    3. ``demand = Σ cost_fn(shape) / interval`` over ALL groups (including
-       ``gated=False`` overhead groups).
+    3. ``demand = Σ cost / interval`` over ALL groups (including
+       ``gated=False`` overhead groups), where ``cost`` is the group's entry in
+       ``measured_costs`` when present and ``cost_fn(shape)`` otherwise.
     4. While ``demand > budget_rps × target_utilization``: stretch the
        unpinned, gated group chosen by sort key
        ``(-priority, stretch_factor, name)`` — lowest-priority class first,
@@ -269,6 +277,7 @@ def solve_intervals(
     base: dict[EndpointGroupName, float] = {}
     pinned: dict[EndpointGroupName, bool] = {}
     costs: dict[EndpointGroupName, float] = {}
+    measured = measured_costs or {}
 
     # Step 1: every group starts at its volatility floor.
     for g in group_list:
@@ -277,7 +286,12 @@ def solve_intervals(
         intervals[g.name] = b
         pinned[g.name] = False
         enabled = g.enabled_fn is None or g.enabled_fn(shape)
-        costs[g.name] = float(g.cost_fn(shape)) if enabled else 0.0
+        if not enabled:
+            costs[g.name] = 0.0
+        elif g.name in measured:
+            costs[g.name] = float(measured[g.name])
+        else:
+            costs[g.name] = float(g.cost_fn(shape))
 
     # Step 2: operator overrides / pins.
     for g in group_list:
@@ -334,11 +348,12 @@ def solve_intervals(
             cost_per_cycle=costs[g.name],
             demand_rps=costs[g.name] / interval,
             pinned=pinned[g.name],
+            measured=g.name in measured and costs[g.name] > 0.0,
         )
     return result
 
 
-class EndpointScheduler:
+class EndpointScheduler:  # noqa: PLR0904 - the single gate/solver seam collectors share
     """Runtime scheduler: solved intervals + per-group run gates + gauges.
 
     Constructed once by ``CollectorManager`` and injected into every
@@ -360,6 +375,11 @@ class EndpointScheduler:
     _group_skips: ClassVar[Counter | None] = None
     _group_shed_gauge: ClassVar[Gauge | None] = None
     _profile_info: ClassVar[Gauge | None] = None
+    _static_cost_gauge: ClassVar[Gauge | None] = None
+    _measured_cost_gauge: ClassVar[Gauge | None] = None
+    _measured_cost_upper_gauge: ClassVar[Gauge | None] = None
+    _measured_demand_gauge: ClassVar[Gauge | None] = None
+    _execution_seconds_gauge: ClassVar[Gauge | None] = None
 
     def __init__(self, settings: Settings, rate_limiter: OrgRateLimiter) -> None:
         """Initialize the scheduler.
@@ -388,12 +408,21 @@ class EndpointScheduler:
         self._failed_attempt: dict[EndpointGroupName, float] = {}
         self._last_success_timestamp: dict[EndpointGroupName, float] = {}
         self._shed_groups: set[EndpointGroupName] = set()
+        # Groups an external event (a webhook) asked to refresh ahead of their
+        # interval; consumed by the next should_run() that admits the group.
+        self._expedited: set[EndpointGroupName] = set()
         self._profile_threshold_demand_rps: float = 0.0
         self._last_shape: OrgShape | None = None
         self._last_resolve_ts: float | None = None
         self._budget_used_at_last_solve: float | None = None
         self._total_demand_rps: float = 0.0
         self._over_budget: bool = False
+        # Measured calls/wall time per execution (#617 follow-up). Fed by the
+        # facade while an admitted execution is open; read by resolve().
+        self.cost_model = GroupCostModel(
+            alpha=float(self._sched("cost_model_alpha")),
+            min_samples=int(self._sched("cost_model_min_samples")),
+        )
         self._init_metrics()
 
     # -- settings access (dynamic; no config_models import) -----------------
@@ -495,6 +524,9 @@ class EndpointScheduler:
         effective_budget = self._effective_budget_rps()
         solve_budget = math.inf if mode == "fixed" else effective_budget
 
+        measured_costs = (
+            self.cost_model.measured_costs() if bool(self._sched("cost_model_enabled")) else {}
+        )
         standard = solve_intervals(
             self._groups_for_profile("standard"),
             shape,
@@ -503,6 +535,7 @@ class EndpointScheduler:
             self._collect_overrides(),
             float(self._sched("max_stretch_factor")),
             float(self._sched("max_interval_seconds")),
+            measured_costs,
         )
         self._profile_threshold_demand_rps = sum(item.demand_rps for item in standard.values())
         profile = self.active_profile()
@@ -514,6 +547,7 @@ class EndpointScheduler:
             self._collect_overrides(),
             float(self._sched("max_stretch_factor")),
             float(self._sched("max_interval_seconds")),
+            measured_costs,
         )
 
         total_demand = sum(s.demand_rps for s in solved.values())
@@ -551,6 +585,7 @@ class EndpointScheduler:
             mode=mode,
             profile=profile,
             groups=len(solved),
+            measured_cost_groups=sum(1 for item in solved.values() if item.measured),
             total_demand_rps=round(total_demand, 3),
             budget_rps=round(configured_budget, 3),
             effective_budget_rps=round(effective_budget, 3),
@@ -626,7 +661,12 @@ class EndpointScheduler:
         last_ran = self._last_ran.get(group)
         last_attempt = self._last_attempt.get(group)
         # Base due-ness: interval since last success (never-ran ⇒ always due).
-        if last_ran is not None and (now - last_ran) < self.interval_for(group) * _GATE_TOLERANCE:
+        # An expedited group skips only this check; failure spacing still holds.
+        if (
+            group not in self._expedited
+            and last_ran is not None
+            and (now - last_ran) < self.interval_for(group) * _GATE_TOLERANCE
+        ):
             return False
         # If the last attempt failed, space retries so failures don't hot-loop.
         if self._last_attempt_failed(last_ran, last_attempt):
@@ -638,6 +678,7 @@ class EndpointScheduler:
             if skips is not None:
                 skips.labels(group=str(group)).inc()
             return False
+        self._expedited.discard(group)
         self._last_attempt[group] = now
         self._attempts[group] = self._attempts.get(group, 0) + 1
         attempts = type(self)._group_attempts
@@ -659,7 +700,10 @@ class EndpointScheduler:
             return now
         last_ran = self._last_ran.get(group)
         last_attempt = self._last_attempt.get(group)
-        base = now if last_ran is None else last_ran + self.interval_for(group) * _GATE_TOLERANCE
+        if last_ran is None or group in self._expedited:
+            base = now
+        else:
+            base = last_ran + self.interval_for(group) * _GATE_TOLERANCE
         if self._last_attempt_failed(last_ran, last_attempt):
             assert last_attempt is not None
             base = max(base, last_attempt + self._failure_retry_seconds())
@@ -671,8 +715,8 @@ class EndpointScheduler:
         """Seconds until the earliest gated, enabled group in ``groups`` is due.
 
         Skips disabled (#623) and ungated groups. Returns ``None`` when none of
-        the given groups is schedulable (the collector's loop then just sleeps a
-        resolve period and re-checks). Clamped at 0 for already-due groups.
+        the given groups is schedulable (the dispatcher then re-checks the
+        collector after a resolve period). Clamped at 0 for already-due groups.
         """
         if now is None:
             now = time.monotonic()
@@ -695,15 +739,59 @@ class EndpointScheduler:
             return None
         return max(0.0, best - now)
 
+    def expedite(self, group: EndpointGroupName) -> bool:
+        """Make a gated group due now, ahead of its solved interval.
+
+        Used for event-driven refreshes (a webhook reporting a change the next
+        scheduled poll would otherwise pick up late). The flag is consumed by
+        the next ``should_run`` that admits the group, so one expedite buys
+        exactly one early fetch. Failure-retry spacing, profile and shedding
+        still apply.
+
+        Returns
+        -------
+        bool
+            False when the group is unregistered or ungated (already always due).
+
+        """
+        declared = self._groups.get(group)
+        if declared is None or not declared.gated:
+            return False
+        self._expedited.add(group)
+        return True
+
+    def is_expedited(self, group: EndpointGroupName) -> bool:
+        """Whether an expedite for the group is still waiting to be consumed."""
+        return group in self._expedited
+
     def mark_ran(self, group: EndpointGroupName, now: float | None = None) -> None:
         """Record a successful fetch (call only after success; failures retry)."""
         self._last_ran[group] = time.monotonic() if now is None else now
+        self._record_measured_cost(group)
         timestamp = time.time()
         self._last_success_timestamp[group] = timestamp
         success_gauge = type(self)._group_success_gauge
         if success_gauge is not None:
             success_gauge.labels(group=str(group)).set(timestamp)
 
+    def _record_measured_cost(self, group: EndpointGroupName) -> None:
+        """Close the group's open execution and publish its measured cost."""
+        estimate = self.cost_model.complete(group)
+        if estimate is None:
+            return
+        cls = type(self)
+        label = str(group)
+        if cls._measured_cost_gauge is not None:
+            cls._measured_cost_gauge.labels(group=label).set(estimate.mean_calls)
+        if cls._measured_cost_upper_gauge is not None:
+            cls._measured_cost_upper_gauge.labels(group=label).set(estimate.bounds()[1])
+        if cls._execution_seconds_gauge is not None:
+            cls._execution_seconds_gauge.labels(group=label).set(estimate.mean_seconds)
+        if cls._measured_demand_gauge is not None:
+            interval = self.interval_for(group) if group in self._groups else 0.0
+            if interval > 0:
+                cls._measured_demand_gauge.labels(group=label).set(estimate.mean_calls / interval)
+
     def mark_failed(self, group: EndpointGroupName) -> None:
         """Record a group failure where the owning collector can attribute one."""
         attempt = self._last_attempt.get(group)
@@ -742,6 +830,17 @@ class EndpointScheduler:
         multiplier = float(getattr(monitoring, "metric_ttl_multiplier", 2.0))
         return self.interval_for(group) * multiplier
 
+    def is_fresh(self, group: EndpointGroupName, now: float | None = None) -> bool:
+        """Whether the group last succeeded within its metric TTL."""
+        last_ran = self._last_ran.get(group)
+        if last_ran is None:
+            return False
+        if now is None:
+            now = time.monotonic()
+        monitoring = getattr(self._settings, "monitoring", None)
+        multiplier = float(getattr(monitoring, "metric_ttl_multiplier", 2.0))
+        return now - last_ran <= self.interval_for(group) * multiplier
+
     def fastest_effective_interval_seconds(self) -> float:
         """Fastest current group interval across all registered groups.
 
@@ -895,6 +994,35 @@ class EndpointScheduler:
             "Active collection profile (exactly one profile label has value 1).",
             labelnames=[LabelName.PROFILE.value],
         )
+        cls._static_cost_gauge = Gauge(
+            CollectorMetricName.SCHEDULER_ESTIMATED_COST_CALLS.value,
+            "Static cost_fn estimate of API calls per endpoint-group execution for "
+            "the last-resolved org shape (refreshed on each solver resolve)",
+            labelnames=[LabelName.GROUP.value],
+        )
+        cls._measured_cost_gauge = Gauge(
+            CollectorMetricName.SCHEDULER_MEASURED_COST_CALLS.value,
+            "Measured API calls (pages and retries) per successful endpoint-group "
+            "execution, exponentially weighted",
+            labelnames=[LabelName.GROUP.value],
+        )
+        cls._measured_cost_upper_gauge = Gauge(
+            CollectorMetricName.SCHEDULER_MEASURED_COST_UPPER_CALLS.value,
+            "Upper ~95% confidence bound of the measured API calls per execution",
+            labelnames=[LabelName.GROUP.value],
+        )
+        cls._measured_demand_gauge = Gauge(
+            CollectorMetricName.SCHEDULER_MEASURED_DEMAND_RPS.value,
+            "Measured API demand per endpoint group in requests/second (measured "
+            "calls per execution / solved interval); compare with "
+            "meraki_exporter_scheduler_estimated_demand_rps",
+            labelnames=[LabelName.GROUP.value],
+        )
+        cls._execution_seconds_gauge = Gauge(
+            CollectorMetricName.SCHEDULER_GROUP_EXECUTION_SECONDS.value,
+            "Wall time per successful endpoint-group execution in seconds, exponentially weighted",
+            labelnames=[LabelName.GROUP.value],
+        )
         cls._metrics_initialized = True
 
     def _emit_gauges(
@@ -919,6 +1047,17 @@ class EndpointScheduler:
         for name, solved in self._solved.items():
             if cls._demand_gauge is not None:
                 cls._demand_gauge.labels(group=str(name)).set(solved.demand_rps)
+            if cls._static_cost_gauge is not None and self._last_shape is not None:
+                group = self._groups[name]
+                enabled = group.enabled_fn is None or group.enabled_fn(self._last_shape)
+                cls._static_cost_gauge.labels(group=str(name)).set(
+                    float(group.cost_fn(self._last_shape)) if enabled else 0.0
+                )
+            measured = self.cost_model.estimate(name)
+            if cls._measured_demand_gauge is not None and measured is not None:
+                cls._measured_demand_gauge.labels(group=str(name)).set(
+                    measured.mean_calls / solved.interval_seconds
+                )
             if cls._interval_gauge is not None:
                 cls._interval_gauge.labels(group=str(name)).set(solved.interval_seconds)
             if cls._stretch_gauge is not None:
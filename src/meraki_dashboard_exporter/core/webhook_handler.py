@@ -36,6 +36,17 @@ class DeviceStateApplier(Protocol):
         ...
 
 
+class WebhookEventRefresher(Protocol):
+    """Seam for event-driven cache invalidation and re-polls.
+
+    Implemented by ``core/webhook_refresh.py::WebhookRefreshCoordinator``.
+    """
+
+    def notify(self, org_id: str | None, alert_type: str) -> bool:
+        """Queue the refresh for an accepted alert; False when not routed."""
+        ...
+
+
 # ALERT-TYPE → device-state direction (#614). Keyed on the *bound* alert type
 # (all members are in KNOWN_ALERT_TYPES, so bounding preserves them). Only
 # whole-device availability transitions belong here — per-port / uplink /
@@ -209,6 +220,7 @@ class WebhookHandler:
         self,
         settings: Settings,
         device_state_applier: DeviceStateApplier | None = None,
+        event_refresher: WebhookEventRefresher | None = None,
     ) -> None:
         """Initialize webhook handler with metrics.
 
@@ -222,10 +234,15 @@ class WebhookHandler:
             a poll-known serial flips ``meraki_device_up`` ahead of the next
             poll. ``None`` (default) = feature off; webhooks degrade to today's
             count-only behaviour.
+        event_refresher : WebhookEventRefresher | None
+            Optional refresher that invalidates the affected org's inventory
+            entries and re-polls the affected endpoint groups for device-down,
+            uplink and settings-change alerts. ``None`` disables it.
 
         """
         self.settings = settings
         self._device_state_applier = device_state_applier
+        self._event_refresher = event_refresher
         # Guards the one-time "applier not configured" debug log (avoids per-event
         # spam when the device collector is disabled).
         self._applier_none_logged = False
@@ -532,6 +549,13 @@ class WebhookHandler:
                     )
                     self._applier_none_logged = True
 
+            # Event-driven freshness: drop the org's stale inventory entries and
+            # re-poll just the affected groups (debounced and rate-limited by the
+            # refresher). Raw organization_id is fine here: it only keys cache
+            # entries, never a metric label.
+            if self._event_refresher is not None:
+                self._event_refresher.notify(payload.organization_id, alert_type)
+
             # Track successful processing
             self.events_processed.labels(
                 org_id=org_id,
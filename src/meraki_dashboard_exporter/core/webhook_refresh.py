@@ -0,0 +1,279 @@
+"""Event-driven inventory invalidation and re-polls for inbound webhooks.
+
+Polling alone bounds freshness by the inventory TTLs (``TTL_AVAILABILITY`` /
+``TTL_MEDIUM``) and by each endpoint group's solved interval. A webhook that
+reports a device going down, an uplink changing state or a settings change says
+exactly which org's data just went stale, so :class:`WebhookRefreshCoordinator`
+drops only that org's affected inventory entries and expedites only the
+endpoint groups that read them. The owning collector is then run once; its
+other groups stay behind their gates and every other org is served from cache.
+
+Re-polls are debounced (a burst of alerts becomes one run) and rate-limited per
+collector (``webhooks.refresh_min_interval_seconds``): events inside the window
+are folded into the next re-poll, so a webhook storm cannot become an API storm.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Protocol
+
+from prometheus_client import Counter
+
+from .constants.metrics_constants import WebhookMetricName
+from .logging import get_logger
+from .metrics import LabelName
+from .scheduler import EndpointGroupName
+
+if TYPE_CHECKING:
+    from .config import Settings
+    from .scheduler import EndpointGroup, EndpointScheduler
+
+logger = get_logger(__name__)
+
+# Org-scoped invalidations remembered per pending re-poll. On the insecure
+# (no shared secret) path org IDs are caller-controlled, so the set is capped;
+# overflow still re-polls, it just leaves those orgs to their TTLs.
+_MAX_PENDING_ORGS = 64
+
+
+@dataclass(frozen=True, slots=True)
+class RefreshRoute:
+    """What one alert type makes stale: inventory cache kinds and endpoint groups."""
+
+    invalidate: frozenset[str]
+    groups: tuple[EndpointGroupName, ...]
+
+
+_AVAILABILITY_ROUTE = RefreshRoute(
+    invalidate=frozenset({"availability"}),
+    groups=(EndpointGroupName.DEVICE_AVAILABILITY, EndpointGroupName.ORG_AVAILABILITIES),
+)
+_UPLINK_ROUTE = RefreshRoute(
+    invalidate=frozenset({"availability"}),
+    groups=(EndpointGroupName.MX_UPLINK_STATUS, EndpointGroupName.MG_UPLINK_STATUS),
+)
+_SETTINGS_ROUTE = RefreshRoute(
+    invalidate=frozenset({"networks", "devices"}),
+    groups=(EndpointGroupName.CONFIG_ORG,),
+)
+
+# Keyed on the *bound* alert type (see ``webhook_handler.bound_alert_type``);
+# every key is in KNOWN_ALERT_TYPES. Alert types not listed here only count.
+REFRESH_ROUTES: dict[str, RefreshRoute] = {
+    "device_down": _AVAILABILITY_ROUTE,
+    "gateway_down": _AVAILABILITY_ROUTE,
+    "uplink_status_change": _UPLINK_ROUTE,
+    "cellular_up": _UPLINK_ROUTE,
+    "cellular_down": _UPLINK_ROUTE,
+    "settings_changed": _SETTINGS_ROUTE,
+    "settings changed": _SETTINGS_ROUTE,
+    "config_changed": _SETTINGS_ROUTE,
+}
+
+
+class RefreshableCollector(Protocol):
+    """The slice of a collector the coordinator needs."""
+
+    def get_endpoint_groups(self) -> tuple[EndpointGroup, ...]:
+        """Return the endpoint groups the collector owns."""
+        ...
+
+
+class RefreshInventory(Protocol):
+    """The slice of ``OrganizationInventory`` the coordinator needs."""
+
+    async def invalidate_kind(self, kind: str, org_id: str) -> bool:
+        """Drop one kind of cached data for one org."""
+        ...
+
+
+class CollectorRunner(Protocol):
+    """Structural view of ``CollectorManager`` (core never imports ``collectors``)."""
+
+    collectors: list[Any]
+    scheduler: EndpointScheduler
+    inventory: RefreshInventory
+
+    def is_collector_running(self, collector_name: str) -> bool:
+        """Whether the named collector is mid-run."""
+        ...
+
+    async def run_collector_once(self, collector: Any, *, force: bool = False) -> None:
+        """Run one collector once, honouring its group gates."""
+        ...
+
+
+@dataclass(slots=True)
+class _PendingRefresh:
+    """Work accumulated for one collector until its re-poll fires."""
+
+    collector: Any
+    groups: set[EndpointGroupName] = field(default_factory=set)
+    invalidations: set[tuple[str, str]] = field(default_factory=set)
+
+
+class WebhookRefreshCoordinator:
+    """Turn accepted webhook alerts into targeted invalidations and re-polls.
+
+    Parameters
+    ----------
+    settings : Settings
+        Application settings (``webhooks.refresh_*`` read on every event).
+    runner : CollectorRunner
+        The collector manager: owns the collectors, scheduler and inventory.
+    background_tasks : set[asyncio.Task[Any]] | None
+        Task set the re-poll tasks are registered in, so the application's
+        shutdown cancels them with its other background work.
+
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        runner: CollectorRunner,
+        background_tasks: set[asyncio.Task[Any]] | None = None,
+    ) -> None:
+        """Initialize the coordinator and its metrics."""
+        self.settings = settings
+        self._runner = runner
+        self._tasks: set[asyncio.Task[Any]] = (
+            background_tasks if background_tasks is not None else set()
+        )
+        self._owners: dict[EndpointGroupName, Any] | None = None
+        self._pending: dict[str, _PendingRefresh] = {}
+        # Loop time of the last re-poll per collector (rate-limit window start).
+        self._last_repoll: dict[str, float] = {}
+        self._initialize_metrics()
+
+    def _initialize_metrics(self) -> None:
+        """Initialize Prometheus metrics for event-driven refreshes."""
+        self.invalidations = Counter(
+            WebhookMetricName.WEBHOOK_INVENTORY_INVALIDATIONS_TOTAL.value,
+            "Inventory cache entries dropped because a webhook reported them stale, "
+            "by cache kind (availability/devices/networks)",
+            [LabelName.TYPE.value],
+        )
+        self.repolls = Counter(
+            WebhookMetricName.WEBHOOK_REPOLLS_TOTAL.value,
+            "Webhook-driven endpoint-group re-polls, by group and result (scheduled = "
+            "new re-poll queued; coalesced = folded into a queued one; triggered = "
+            "collector run; pending = collector ran but the gate held, its loop picks the "
+            "group up; deferred = collector already running, its loop picks the group "
+            "up; skipped = group not schedulable)",
+            [LabelName.GROUP.value, LabelName.RESULT.value],
+        )
+
+    def _owner_of(self, group: EndpointGroupName) -> Any | None:
+        """Return the active collector that owns ``group`` (lazily indexed)."""
+        if self._owners is None:
+            self._owners = {}
+            for collector in self._runner.collectors:
+                for declared in collector.get_endpoint_groups():
+                    self._owners.setdefault(declared.name, collector)
+        return self._owners.get(group)
+
+    def notify(self, org_id: str | None, alert_type: str) -> bool:
+        """Queue the refresh for one accepted alert.
+
+        Parameters
+        ----------
+        org_id : str | None
+            ``organizationId`` from the payload; ``None`` re-polls without an
+            org-scoped invalidation.
+        alert_type : str
+            Bound alert type.
+
+        Returns
+        -------
+        bool
+            True when the alert type is routed and a re-poll was queued or joined.
+
+        """
+        route = REFRESH_ROUTES.get(alert_type)
+        if route is None or not self.settings.webhooks.refresh_on_events:
+            return False
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.debug("No running event loop; skipping webhook-driven refresh")
+            return False
+
+        queued = False
+        for group in route.groups:
+            collector = self._owner_of(group)
+            if collector is None:
+                continue
+            name = collector.__class__.__name__
+            pending = self._pending.get(name)
+            if pending is None:
+                pending = _PendingRefresh(collector=collector)
+                self._pending[name] = pending
+                task = loop.create_task(self._flush_after(name, self._delay_for(name, loop)))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            result = "coalesced" if group in pending.groups else "scheduled"
+            self.repolls.labels(group=str(group), result=result).inc()
+            pending.groups.add(group)
+            if org_id:
+                orgs = {org for _kind, org in pending.invalidations}
+                if org_id in orgs or len(orgs) < _MAX_PENDING_ORGS:
+                    pending.invalidations.update((kind, org_id) for kind in route.invalidate)
+            queued = True
+        return queued
+
+    def _delay_for(self, name: str, loop: asyncio.AbstractEventLoop) -> float:
+        """Debounce, stretched to the end of the collector's rate-limit window."""
+        webhooks = self.settings.webhooks
+        delay = float(webhooks.refresh_debounce_seconds)
+        last = self._last_repoll.get(name)
+        if last is not None:
+            window_end = last + float(webhooks.refresh_min_interval_seconds)
+            delay = max(delay, window_end - loop.time())
+        return delay
+
+    async def _flush_after(self, name: str, delay: float) -> None:
+        """Wait out the debounce/rate-limit window, then run the re-poll."""
+        await asyncio.sleep(delay)
+        pending = self._pending.pop(name, None)
+        if pending is None:
+            return
+        self._last_repoll[name] = asyncio.get_running_loop().time()
+        try:
+            await self._invalidate(pending.invalidations)
+            scheduler = self._runner.scheduler
+            groups = sorted(pending.groups)
+            expedited = [group for group in groups if scheduler.expedite(group)]
+            for group in set(groups) - set(expedited):
+                self.repolls.labels(group=str(group), result="skipped").inc()
+            if not expedited:
+                return
+            if self._runner.is_collector_running(name):
+                results = dict.fromkeys(expedited, "deferred")
+            else:
+                await self._runner.run_collector_once(pending.collector)
+                # A run that did not consume the expedite (failure-retry spacing
+                # or shedding held the gate) leaves it for the collector's loop.
+                results = {
+                    group: "pending" if scheduler.is_expedited(group) else "triggered"
+                    for group in expedited
+                }
+            for group, result in results.items():
+                self.repolls.labels(group=str(group), result=result).inc()
+            logger.info(
+                "Webhook-driven re-poll",
+                collector=name,
+                results={str(group): result for group, result in results.items()},
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Webhook-driven re-poll failed", collector=name)
+
+    async def _invalidate(self, invalidations: Iterable[tuple[str, str]]) -> None:
+        inventory = self._runner.inventory
+        for kind, org_id in sorted(invalidations):
+            if await inventory.invalidate_kind(kind, org_id):
+                self.invalidations.labels(type=kind).inc()
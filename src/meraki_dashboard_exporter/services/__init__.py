@@ -5,9 +5,11 @@ from __future__ import annotations
 from .client_store import ClientStore
 from .dns_resolver import DNSResolver
 from .inventory import OrganizationInventory
+from .sensor_snapshot import SensorReadingsSnapshot
 
 __all__ = [
     "ClientStore",
     "DNSResolver",
     "OrganizationInventory",
+    "SensorReadingsSnapshot",
 ]
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import heapq
 import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any
 
@@ -14,9 +16,23 @@ from ..core.domain_models import ClientData
 
 logger = structlog.get_logger(__name__)
 
+#: Reasons a client leaves the store; label values of
+#: ``meraki_exporter_client_store_evictions_total``.
+EVICTION_REASONS: tuple[str, ...] = ("lru", "fair_share", "stale_network")
+
 
 class ClientStore:
-    """In-memory store for client data with TTL support."""
+    """In-memory store for client data with TTL support.
+
+    The store is bounded by ``clients.max_clients_total``. Every client carries a
+    last-seen position in a recency order that spans all networks (and one per
+    network), refreshed whenever a ``getNetworkClients`` poll reports it. When
+    the store is full, ``clients.store_eviction_policy`` decides how a new client
+    is admitted: ``lru`` evicts the least recently seen client anywhere,
+    ``fair_share`` evicts from the network furthest over its equal share of the
+    cap, and ``refuse`` skips the new client. Clients reported by the poll being
+    applied are never evicted to admit another client from the same poll.
+    """
 
     def __init__(self, settings: Settings):
         """Initialize client store.
@@ -31,9 +47,19 @@ class ClientStore:
         self.cache_ttl = settings.clients.cache_ttl
         self.max_clients_per_network = settings.clients.max_clients_per_network
         self.max_clients_total = settings.clients.max_clients_total
+        self.eviction_policy = settings.clients.store_eviction_policy
+
+        # Store clients by network ID, each network in last-seen order (oldest first)
+        self._clients: dict[str, OrderedDict[str, ClientData]] = {}
+
+        # Last-seen order across all networks (oldest first); its length is the
+        # store-wide client count, so the cap check is O(1).
+        self._recency: OrderedDict[tuple[str, str], None] = OrderedDict()
 
-        # Store clients by network ID
-        self._clients: dict[str, dict[str, ClientData]] = {}
+        # Cumulative eviction/refusal counters, promoted to Prometheus counters
+        # by ClientsCollector._update_cache_metrics.
+        self._evictions: dict[str, int] = dict.fromkeys(EVICTION_REASONS, 0)
+        self._rejected_new = 0
 
         # Track last update time per network
         self._last_update: dict[str, float] = {}
@@ -75,12 +101,17 @@ class ClientStore:
 
         # Initialize network store if needed
         if network_id not in self._clients:
-            self._clients[network_id] = {}
+            self._clients[network_id] = OrderedDict()
 
         network_clients = self._clients[network_id]
         updated_count = 0
         new_count = 0
         skipped_new_count = 0
+        evicted_count = 0
+        # Clients reported by this poll: never evicted to admit a sibling.
+        seen_this_update: set[str] = set()
+        # Lazily-built max-heap of (-client_count, network_id) for fair_share.
+        fair_heap: list[tuple[int, str]] | None = None
 
         # Limit number of clients per network
         clients_to_process = clients[: self.max_clients_per_network]
@@ -93,11 +124,6 @@ class ClientStore:
                 limit=self.max_clients_per_network,
             )
 
-        # Global cap (#533): computed once up-front so it is stable across the
-        # whole call even though new clients are added to the store as we go.
-        global_total = sum(len(clients_in_network) for clients_in_network in self._clients.values())
-        global_capacity = max(self.max_clients_total - global_total, 0)
-
         # Process each client
         for client in clients_to_process:
             client_id = client.id
@@ -141,12 +167,17 @@ class ClientStore:
                 existing.wirelessCapabilities = client.wirelessCapabilities
                 updated_count += 1
             else:
-                # Global cap reached: skip creating new clients, but existing
-                # clients (handled in the branch above) always continue to be
-                # updated.
-                if new_count >= global_capacity:
-                    skipped_new_count += 1
-                    continue
+                # Global cap (#533) reached: make room per the eviction policy,
+                # or skip the new client. Existing clients (handled in the
+                # branch above) always continue to be updated.
+                if len(self._recency) >= self.max_clients_total:
+                    if self.eviction_policy == "fair_share" and fair_heap is None:
+                        fair_heap = [(-len(c), nid) for nid, c in self._clients.items() if c]
+                        heapq.heapify(fair_heap)
+                    if not self._make_room(network_id, seen_this_update, fair_heap):
+                        skipped_new_count += 1
+                        continue
+                    evicted_count += 1
 
                 # Add new client
                 network_clients[client_id] = ClientData(
@@ -186,12 +217,24 @@ class ClientStore:
                 )
                 new_count += 1
 
+            self._touch(network_id, client_id)
+            seen_this_update.add(client_id)
+
         if skipped_new_count > 0:
+            self._rejected_new += skipped_new_count
             logger.warning(
                 "Global client store cap reached; not adding new clients",
                 network_id=network_id,
                 skipped=skipped_new_count,
                 global_cap=self.max_clients_total,
+                eviction_policy=self.eviction_policy,
+            )
+        if evicted_count > 0:
+            logger.debug(
+                "Evicted least recently seen clients to admit new clients",
+                network_id=network_id,
+                evicted=evicted_count,
+                eviction_policy=self.eviction_policy,
             )
 
         # Update timestamp
@@ -209,6 +252,86 @@ class ClientStore:
             total_clients=len(network_clients),
         )
 
+    def _touch(self, network_id: str, client_id: str) -> None:
+        """Mark a client as just seen in both the global and per-network order."""
+        key = (network_id, client_id)
+        if key in self._recency:
+            self._recency.move_to_end(key)
+        else:
+            self._recency[key] = None
+        self._clients[network_id].move_to_end(client_id)
+
+    def _evict_client(self, network_id: str, client_id: str, reason: str) -> None:
+        """Remove one client from every index and count the eviction."""
+        self._clients[network_id].pop(client_id, None)
+        self._recency.pop((network_id, client_id), None)
+        self._evictions[reason] += 1
+
+    def _make_room(
+        self,
+        network_id: str,
+        protected: set[str],
+        fair_heap: list[tuple[int, str]] | None,
+    ) -> bool:
+        """Evict one client per the configured policy so a new one can be admitted.
+
+        Parameters
+        ----------
+        network_id : str
+            Network the new client belongs to.
+        protected : set[str]
+            Client IDs of ``network_id`` already applied from the current poll;
+            they are never evicted.
+        fair_heap : list[tuple[int, str]] | None
+            ``fair_share`` only: max-heap of ``(-client_count, network_id)``,
+            kept current lazily across calls within one ``update_clients``.
+
+        Returns
+        -------
+        bool
+            True when a client was evicted, False when the new client must be
+            skipped (``refuse`` policy, or only protected clients remain).
+
+        """
+        if self.eviction_policy == "lru":
+            if not self._recency:
+                return False
+            victim_network, victim_client = next(iter(self._recency))
+            # Every entry behind a protected one was also touched by this poll.
+            if victim_network == network_id and victim_client in protected:
+                return False
+            self._evict_client(victim_network, victim_client, "lru")
+            return True
+
+        if self.eviction_policy == "fair_share" and fair_heap is not None:
+            fair_share = self.max_clients_total / max(len(self._clients), 1)
+            own_clients = self._clients[network_id]
+            if len(own_clients) >= fair_share:
+                # At or over its share: the network can only recycle its own
+                # least recently seen clients.
+                own_victim: str | None = next(iter(own_clients), None)
+                if own_victim is None or own_victim in protected:
+                    return False
+                self._evict_client(network_id, own_victim, "fair_share")
+                return True
+            while fair_heap:
+                negative_count, victim_network = heapq.heappop(fair_heap)
+                victim_clients = self._clients.get(victim_network)
+                if (
+                    victim_network == network_id
+                    or not victim_clients
+                    or len(victim_clients) != -negative_count
+                ):
+                    continue  # stale heap entry; the live count is re-pushed below
+                victim_client = next(iter(victim_clients))
+                self._evict_client(victim_network, victim_client, "fair_share")
+                if victim_clients:
+                    heapq.heappush(fair_heap, (-len(victim_clients), victim_network))
+                return True
+            return False
+
+        return False
+
     def get_client(self, network_id: str, client_id: str) -> ClientData | None:
         """Get a specific client.
 
@@ -345,7 +468,7 @@ class ClientStore:
             Store statistics.
 
         """
-        total_clients = sum(len(clients) for clients in self._clients.values())
+        total_clients = len(self._recency)
         online_clients = sum(
             1
             for clients in self._clients.values()
@@ -358,6 +481,10 @@ class ClientStore:
             "total_clients": total_clients,
             "online_clients": online_clients,
             "offline_clients": total_clients - online_clients,
+            "capacity": self.max_clients_total,
+            "eviction_policy": self.eviction_policy,
+            "evictions": self._evictions.copy(),
+            "rejected_new_clients": self._rejected_new,
             "networks": {
                 network_id: {
                     "name": self._network_names.get(network_id, "Unknown"),
@@ -372,8 +499,9 @@ class ClientStore:
         }
 
     def clear(self) -> None:
-        """Clear all stored data."""
+        """Clear all stored data (eviction counters are cumulative and kept)."""
         self._clients.clear()
+        self._recency.clear()
         self._last_update.clear()
         self._network_names.clear()
         self._network_orgs.clear()
@@ -382,7 +510,8 @@ class ClientStore:
     def _evict_network(self, network_id: str) -> str | None:
         """Remove every record associated with one network as one operation."""
         network_name = self._network_names.get(network_id)
-        self._clients.pop(network_id, None)
+        for client_id in self._clients.pop(network_id, {}):
+            del self._recency[network_id, client_id]
         self._last_update.pop(network_id, None)
         self._network_names.pop(network_id, None)
         self._network_orgs.pop(network_id, None)
@@ -402,6 +531,7 @@ class ClientStore:
         ]
 
         for network_id in stale_networks:
+            self._evictions["stale_network"] += len(self._clients[network_id])
             network_name = self._evict_network(network_id)
             logger.info(
                 "Removed stale network data",
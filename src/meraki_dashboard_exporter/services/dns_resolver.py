@@ -3,20 +3,28 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import ipaddress
+import json
 import socket
 import time
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import cast
+from pathlib import Path
+from typing import Any, cast
 
 import structlog
 
 from ..core.async_utils import AsyncRetry, with_timeout
 from ..core.config import Settings
+from .ptr_resolver import AsyncPTRResolver, parse_nameserver, parse_resolv_conf
 
 logger = structlog.get_logger(__name__)
 
+# Bumped whenever the on-disk layout of ``clients.dns_cache_file`` changes;
+# files with another version are ignored rather than misread.
+CACHE_FILE_VERSION = 1
+
 
 @dataclass
 class CacheEntry:
@@ -26,6 +34,7 @@ class CacheEntry:
     timestamp: float
     client_id: str | None = None
     description: str | None = None
+    ttl: float | None = None  # per-entry override of the resolver cache_ttl
 
 
 class DNSResolver:
@@ -54,6 +63,9 @@ class DNSResolver:
         # (excludes cache hits); promoted to a Prometheus counter by the
         # collector for average-latency queries (#319).
         self._total_resolution_time: float = 0.0
+        # Background refresh-ahead lookups are timed separately so they do not
+        # inflate the foreground average latency.
+        self._refresh_resolution_time: float = 0.0
 
         # Dedicated, bounded thread pool for blocking reverse-DNS lookups (F-075).
         # `socket.gethostbyaddr` cannot be interrupted, so when `with_timeout`
@@ -69,6 +81,40 @@ class DNSResolver:
             thread_name_prefix="dns-resolver",
         )
 
+        # Optional event-loop PTR backend: no threads, many queries per socket.
+        self.negative_cache_ttl = settings.clients.dns_negative_cache_ttl
+        self.transient_failure_ttl = settings.clients.dns_transient_failure_ttl
+        self._ptr_resolver: AsyncPTRResolver | None = None
+        if settings.clients.dns_resolver_backend == "async":
+            nameservers = [
+                parse_nameserver(spec) for spec in settings.clients.dns_nameservers
+            ] or parse_resolv_conf()
+            self._ptr_resolver = AsyncPTRResolver(
+                nameservers,
+                timeout=self.timeout,
+                attempts=settings.clients.dns_query_attempts,
+                max_inflight=self.max_concurrent_lookups,
+            )
+            logger.info(
+                "Using async PTR resolver backend",
+                nameservers=[f"{host}:{port}" for host, port in nameservers],
+            )
+
+        # Refresh-ahead: cache hits past this fraction of their TTL queue a
+        # background re-resolution, drained after each foreground batch.
+        self.refresh_ahead_fraction = settings.clients.dns_refresh_ahead_fraction
+        self.refresh_ahead_concurrency = settings.clients.dns_refresh_ahead_concurrency
+        self._refresh_pending: dict[str, None] = {}
+        self._refresh_task: asyncio.Task[None] | None = None
+
+        # Optional persistence across restarts; timestamps are wall-clock, so a
+        # reloaded entry keeps exactly the TTL it had left.
+        self.cache_file = (
+            Path(settings.clients.dns_cache_file) if settings.clients.dns_cache_file else None
+        )
+        self.persist_interval = settings.clients.dns_cache_persist_interval
+        self._last_persist = time.monotonic()
+
         # Statistics tracking
         self._stats = {
             "total_lookups": 0,
@@ -79,14 +125,26 @@ class DNSResolver:
             "queue_wait_count": 0,
             "queue_peak_depth": 0,
             "lookup_timeouts": 0,
+            "refresh_ahead_lookups": 0,
+            "refresh_ahead_failures": 0,
         }
         self._closed = False
 
+        if self.cache_file is not None:
+            self.load_cache_file()
+
     def close(self) -> None:
-        """Cancel queued reverse-DNS work and join active resolver threads."""
+        """Cancel queued reverse-DNS work, persist the cache, and join resolver threads."""
         if self._closed:
             return
         self._closed = True
+        self._refresh_pending.clear()
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+        if self.cache_file is not None:
+            self.save_cache_file()
+        if self._ptr_resolver is not None:
+            self._ptr_resolver.close()
         self._executor.shutdown(wait=True, cancel_futures=True)
 
     def track_client(self, client_id: str, ip: str | None, description: str | None) -> bool:
@@ -127,13 +185,15 @@ class DNSResolver:
             return True
         return False
 
-    def _is_cache_valid(self, entry: CacheEntry) -> bool:
+    def _is_cache_valid(self, entry: CacheEntry, now: float | None = None) -> bool:
         """Check if a cache entry is still valid.
 
         Parameters
         ----------
         entry : CacheEntry
             Cache entry to check.
+        now : float | None
+            Wall-clock time to evaluate against; defaults to ``time.time()``.
 
         Returns
         -------
@@ -141,8 +201,18 @@ class DNSResolver:
             True if entry is still valid, False otherwise.
 
         """
-        age = time.time() - entry.timestamp
-        return age < self.cache_ttl
+        age = (time.time() if now is None else now) - entry.timestamp
+        return age < self._entry_ttl(entry)
+
+    def _entry_ttl(self, entry: CacheEntry) -> float:
+        """Return the effective TTL of a cache entry."""
+        return entry.ttl if entry.ttl is not None else self.cache_ttl
+
+    def _needs_refresh(self, entry: CacheEntry, now: float) -> bool:
+        """Whether a still-valid entry is close enough to expiry to refresh ahead."""
+        if self.refresh_ahead_fraction >= 1.0:
+            return False
+        return now - entry.timestamp >= self._entry_ttl(entry) * self.refresh_ahead_fraction
 
     async def resolve_hostname(self, ip: str | None, client_id: str | None = None) -> str | None:
         """Resolve hostname from IP address.
@@ -176,6 +246,8 @@ class DNSResolver:
                     age=int(time.time() - entry.timestamp),
                 )
                 self._stats["cache_hits"] += 1
+                if self._needs_refresh(entry, time.time()):
+                    self._refresh_pending[ip] = None
                 return entry.hostname
             else:
                 logger.debug("Cache entry expired", ip=ip, age=int(time.time() - entry.timestamp))
@@ -194,18 +266,11 @@ class DNSResolver:
 
         # Perform reverse DNS lookup with retry, timing the actual resolution
         # (cache hits above are excluded) for the resolution-seconds counter (#319).
-        lookup_start = time.perf_counter()
-        hostname = await self._retry.execute(
-            lambda: self._perform_lookup(ip),
-            operation=f"DNS lookup for {ip}",
-        )
-        self._total_resolution_time += time.perf_counter() - lookup_start
+        hostname, entry_ttl = await self._lookup(ip)
 
         # Track success/failure
         if hostname:
             self._stats["successful_lookups"] += 1
-            # Extract short hostname (remove domain)
-            hostname = hostname.split(".")[0]
         else:
             self._stats["failed_lookups"] += 1
 
@@ -216,11 +281,205 @@ class DNSResolver:
                 hostname=hostname,
                 timestamp=time.time(),
                 client_id=client_id,
+                ttl=entry_ttl,
             ),
         )
 
         return hostname
 
+    async def _lookup(
+        self, ip: str, *, background: bool = False
+    ) -> tuple[str | None, float | None]:
+        """Resolve ``ip`` through the configured backend, bypassing the cache.
+
+        Parameters
+        ----------
+        ip : str
+            Valid IP address to resolve.
+        background : bool
+            A refresh-ahead lookup: its time is added to the refresh-ahead
+            total instead of the foreground resolution time.
+
+        Returns
+        -------
+        tuple[str | None, float | None]
+            Short hostname (domain removed) or None, and the per-entry TTL
+            override to cache it with (None means ``dns_cache_ttl``).
+
+        """
+        lookup_start = time.perf_counter()
+        entry_ttl: float | None = None
+        if self._ptr_resolver is not None:
+            hostname, entry_ttl = await self._async_ptr_lookup(ip)
+        else:
+            hostname = await self._retry.execute(
+                lambda: self._perform_lookup(ip),
+                operation=f"DNS lookup for {ip}",
+            )
+        elapsed = time.perf_counter() - lookup_start
+        if background:
+            self._refresh_resolution_time += elapsed
+        else:
+            self._total_resolution_time += elapsed
+        # Extract short hostname (remove domain)
+        return (hostname.split(".")[0] if hostname else None), entry_ttl
+
+    def _start_refresh_ahead(self) -> None:
+        """Drain queued refresh-ahead IPs in the background, if not already running."""
+        if self._closed or not self._refresh_pending:
+            return
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.create_task(self._run_refresh_ahead())
+
+    async def _run_refresh_ahead(self) -> None:
+        """Re-resolve near-expiry entries with a small, fixed worker pool.
+
+        Workers pop from the pending set rather than gathering one coroutine per
+        IP, so a TTL boundary across a large client population stays bounded
+        (#709). A failed refresh leaves the existing entry untouched; it then
+        expires normally and is retried on the foreground path. Refreshing a
+        negative entry that is still unresolvable renews it and is not a
+        failure.
+        """
+
+        async def worker() -> None:
+            while self._refresh_pending and not self._closed:
+                ip = next(iter(self._refresh_pending))
+                del self._refresh_pending[ip]
+                entry = self._cache.get(ip)
+                if entry is None:
+                    continue
+                self._stats["refresh_ahead_lookups"] += 1
+                try:
+                    hostname, entry_ttl = await self._lookup(ip, background=True)
+                except Exception as e:
+                    logger.debug("DNS refresh-ahead failed", ip=ip, error=str(e))
+                    self._stats["refresh_ahead_failures"] += 1
+                    continue
+                if hostname is None and entry.hostname is not None:
+                    self._stats["refresh_ahead_failures"] += 1
+                    continue
+                self._cache_put(
+                    ip,
+                    CacheEntry(
+                        hostname=hostname,
+                        timestamp=time.time(),
+                        client_id=entry.client_id,
+                        description=entry.description,
+                        ttl=entry_ttl,
+                    ),
+                )
+
+        workers = min(self.refresh_ahead_concurrency, len(self._refresh_pending))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+    def load_cache_file(self) -> int:
+        """Load still-valid entries from ``clients.dns_cache_file``.
+
+        Returns
+        -------
+        int
+            Number of entries restored. Missing, unreadable, or foreign-version
+            files restore nothing.
+
+        """
+        if self.cache_file is None:
+            return 0
+        try:
+            payload = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Ignoring unreadable DNS cache file", path=str(self.cache_file), error=str(e)
+            )
+            return 0
+        if not isinstance(payload, dict) or payload.get("version") != CACHE_FILE_VERSION:
+            logger.warning(
+                "Ignoring DNS cache file with unknown version", path=str(self.cache_file)
+            )
+            return 0
+
+        now = time.time()
+        restored: list[tuple[str, CacheEntry]] = []
+        for ip, record in (payload.get("entries") or {}).items():
+            try:
+                hostname, timestamp, ttl = record
+                entry = CacheEntry(
+                    hostname=str(hostname) if hostname else None,
+                    timestamp=float(timestamp),
+                    ttl=float(ttl) if ttl is not None else None,
+                )
+            except TypeError, ValueError:
+                continue
+            if self._is_cache_valid(entry, now):
+                restored.append((ip, entry))
+        # Keep the freshest entries when the file holds more than the cap allows.
+        restored.sort(key=lambda item: item[1].timestamp)
+        for ip, entry in restored[-self.max_cache_entries :]:
+            self._cache[ip] = entry
+        logger.info(
+            "Restored DNS cache from disk",
+            path=str(self.cache_file),
+            entries=min(len(restored), self.max_cache_entries),
+        )
+        return min(len(restored), self.max_cache_entries)
+
+    def _cache_snapshot(self) -> dict[str, Any]:
+        """Serializable view of the valid cache entries."""
+        now = time.time()
+        return {
+            "version": CACHE_FILE_VERSION,
+            "entries": {
+                ip: [entry.hostname, entry.timestamp, entry.ttl]
+                for ip, entry in self._cache.items()
+                if self._is_cache_valid(entry, now)
+            },
+        }
+
+    def _write_cache_file(self, snapshot: dict[str, Any]) -> bool:
+        """Atomically replace the cache file with ``snapshot``."""
+        assert self.cache_file is not None
+        tmp_path = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        try:
+            tmp_path.write_text(json.dumps(snapshot, separators=(",", ":")), encoding="utf-8")
+            tmp_path.replace(self.cache_file)
+        except OSError as e:
+            logger.warning("Failed to persist DNS cache", path=str(self.cache_file), error=str(e))
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+            return False
+        return True
+
+    def save_cache_file(self) -> bool:
+        """Synchronously persist the cache (used at shutdown).
+
+        Returns
+        -------
+        bool
+            True when the file was written.
+
+        """
+        if self.cache_file is None:
+            return False
+        self._last_persist = time.monotonic()
+        return self._write_cache_file(self._cache_snapshot())
+
+    async def _maybe_persist_cache(self) -> None:
+        """Persist the cache once per ``dns_cache_persist_interval``, off the event loop."""
+        if self.cache_file is None or self._closed:
+            return
+        if time.monotonic() - self._last_persist < self.persist_interval:
+            return
+        self._last_persist = time.monotonic()
+        # The snapshot is taken on the loop; only serialization and I/O move
+        # to the DNS executor.
+        snapshot = self._cache_snapshot()
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._write_cache_file, snapshot
+        )
+
     def _cache_put(self, ip: str, entry: CacheEntry) -> None:
         """Insert a cache entry and enforce the size bound (#543).
 
@@ -245,7 +504,7 @@ class DNSResolver:
         evicted until it fits.
         """
         now = time.time()
-        expired = [ip for ip, e in self._cache.items() if now - e.timestamp >= self.cache_ttl]
+        expired = [ip for ip, e in self._cache.items() if not self._is_cache_valid(e, now)]
         for ip in expired:
             del self._cache[ip]
 
@@ -310,6 +569,38 @@ class DNSResolver:
             logger.debug("DNS lookup failed", ip=ip, error=str(e))
             return None
 
+    async def _async_ptr_lookup(self, ip: str) -> tuple[str | None, float | None]:
+        """Resolve through the event-loop PTR backend.
+
+        Parameters
+        ----------
+        ip : str
+            IP address to resolve.
+
+        Returns
+        -------
+        tuple[str | None, float | None]
+            Full hostname (or None) and the cache TTL override for the entry:
+            authoritative negative answers use ``dns_negative_cache_ttl``, and
+            timeouts and server failures the shorter ``dns_transient_failure_ttl``
+            so a resolver outage is retried soon after it recovers.
+
+        """
+        assert self._ptr_resolver is not None
+        try:
+            answer = await self._ptr_resolver.resolve(ip)
+        except Exception as e:
+            logger.debug("Async PTR lookup failed", ip=ip, error=str(e))
+            return None, self.transient_failure_ttl
+        if answer.status == "timeout":
+            self._stats["lookup_timeouts"] += 1
+        if answer.hostname is None:
+            if answer.negative:
+                return None, self.negative_cache_ttl
+            return None, self.transient_failure_ttl
+        logger.debug("Resolved hostname", ip=ip, hostname=answer.hostname)
+        return answer.hostname, None
+
     async def _system_dns_lookup(self, ip: str) -> str | None:
         """Perform DNS lookup using system resolver.
 
@@ -450,8 +741,14 @@ class DNSResolver:
             failed=failed,
             cached=cached,
             cache_size=len(self._cache),
+            refresh_ahead_queued=len(self._refresh_pending),
         )
 
+        # Refreshes start only once the foreground batch is done, so they never
+        # compete with it for lookup slots.
+        self._start_refresh_ahead()
+        await self._maybe_persist_cache()
+
         return resolved
 
     def clear_cache(self) -> None:
@@ -459,6 +756,7 @@ class DNSResolver:
         old_size = len(self._cache)
         self._cache.clear()
         self._client_tracking.clear()
+        self._refresh_pending.clear()
         # Reset statistics
         self._stats = {
             "total_lookups": 0,
@@ -469,8 +767,11 @@ class DNSResolver:
             "queue_wait_count": 0,
             "queue_peak_depth": 0,
             "lookup_timeouts": 0,
+            "refresh_ahead_lookups": 0,
+            "refresh_ahead_failures": 0,
         }
         self._total_resolution_time = 0.0
+        self._refresh_resolution_time = 0.0
         logger.info("DNS cache cleared", entries_cleared=old_size)
 
     @property
@@ -494,7 +795,7 @@ class DNSResolver:
 
         current_time = time.time()
         for entry in self._cache.values():
-            if current_time - entry.timestamp < self.cache_ttl:
+            if self._is_cache_valid(entry, current_time):
                 valid += 1
             else:
                 expired += 1
@@ -521,6 +822,10 @@ class DNSResolver:
             "queue_wait_count": self._stats["queue_wait_count"],
             "queue_peak_depth": self._stats["queue_peak_depth"],
             "lookup_timeouts": self._stats["lookup_timeouts"],
+            "refresh_ahead_lookups": self._stats["refresh_ahead_lookups"],
+            "refresh_ahead_failures": self._stats["refresh_ahead_failures"],
+            "refresh_ahead_resolution_time": self._refresh_resolution_time,
+            "refresh_ahead_pending": len(self._refresh_pending),
         }
 
     def get_lookup_stats(self) -> dict[str, float]:
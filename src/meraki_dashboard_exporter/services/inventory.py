@@ -8,6 +8,7 @@ TTL-based cache invalidation with different TTLs per update tier.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import random
 import time
 from collections.abc import Callable
@@ -21,10 +22,14 @@ from ..api.client import AsyncMerakiClient
 from ..core.api_facade import facade_for
 from ..core.constants.metrics_constants import CollectorMetricName, NetworkMetricName
 from ..core.error_handling import validate_response_format
+from ..core.negative_cache import negative_results
 from ..core.network_filter import NetworkFilter
 from ..core.scheduler import OrgShape
+from .sensor_snapshot import SensorReadingsSnapshot
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
     from meraki import DashboardAPI
 
     from ..core.config import Settings
@@ -33,6 +38,9 @@ T = TypeVar("T")
 
 logger = structlog.get_logger(__name__)
 
+# Cache kinds that can be dropped individually per org (see invalidate_kind).
+INVALIDATION_KINDS: frozenset[str] = frozenset({"availability", "devices", "networks"})
+
 
 class OrganizationInventory:
     """Shared inventory cache for organizations, networks, and devices.
@@ -51,9 +59,14 @@ class OrganizationInventory:
     >>> networks = await inventory.get_networks(org_id)
     >>> devices = await inventory.get_devices(org_id)
 
+    Organization lookups (O(1) by ID, served from the same cache):
+    >>> org = await inventory.get_organization(org_id)
+    >>> name = await inventory.get_org_name(org_id)
+
     Manual cache invalidation:
     >>> await inventory.invalidate(org_id)  # Invalidate specific org
     >>> await inventory.invalidate()  # Invalidate all
+    >>> await inventory.invalidate_kind("availability", org_id)  # One cache kind
 
     """
 
@@ -116,8 +129,24 @@ class OrganizationInventory:
         self._license_timestamps: dict[str, float] = {}
         self._license_list_timestamps: dict[str, float] = {}
 
-        # Lock for thread-safe cache updates
+        # Directory indexes keyed by (kind, scope). Each remembers the cached
+        # list it was built from and is rebuilt when that list is replaced.
+        # Only the organization directory is indexed today.
+        self._indexes: dict[
+            tuple[str, str], tuple[list[dict[str, Any]], dict[str, dict[str, Any]]]
+        ] = {}
+        # Organizations resolved individually because they are not in the
+        # getOrganizations list (e.g. a single configured org): id -> (ts, org).
+        self._extra_orgs: dict[str, tuple[float, dict[str, Any]]] = {}
+        # Latest MT sensor readings, shared by every MT consumer for one cycle.
+        self.sensor_readings = SensorReadingsSnapshot()
+        # Organizations whose networks and devices were warmed at startup.
+        self._warmed_orgs: set[str] = set()
+
+        # Lock for thread-safe cache updates. Per-org fetches take that org's
+        # lock instead, so a slow organization does not serialize the others.
         self._lock = asyncio.Lock()
+        self._org_locks: dict[str, asyncio.Lock] = {}
 
         # Metrics
         self._cache_hits = 0
@@ -427,7 +456,7 @@ class OrganizationInventory:
         self._cache_misses += 1
         logger.debug("Cache miss for networks, fetching from API", org_id=org_id)
 
-        async with self._lock:
+        async with self._org_lock(org_id):
             # Double-check after acquiring lock
             cache_timestamp = self._network_timestamps.get(org_id, 0.0)
             if (
@@ -454,6 +483,7 @@ class OrganizationInventory:
             self._network_timestamps[org_id] = current_time
             self._cache_size.labels(org_id=org_id, cache_type="networks").set(len(networks))
             self._emit_filter_metrics(org_id, networks)
+            negative_results.observe_inventory("networks", org_id, networks, "id")
 
             logger.info(
                 "Updated network cache",
@@ -550,7 +580,7 @@ class OrganizationInventory:
             self._cache_misses += 1
             logger.debug("Cache miss for devices, fetching from API", org_id=org_id)
 
-            async with self._lock:
+            async with self._org_lock(org_id):
                 # Double-check after acquiring lock
                 cache_timestamp = self._device_timestamps.get(org_id, 0.0)
                 if (
@@ -576,6 +606,7 @@ class OrganizationInventory:
                     self._devices[org_id] = devices
                     self._device_timestamps[org_id] = current_time
                     self._cache_size.labels(org_id=org_id, cache_type="devices").set(len(devices))
+                    negative_results.observe_inventory("devices", org_id, devices, "serial")
 
                     logger.info(
                         "Updated device cache",
@@ -659,7 +690,7 @@ class OrganizationInventory:
         self._cache_misses += 1
         logger.debug("Cache miss for device availabilities, fetching from API", org_id=org_id)
 
-        async with self._lock:
+        async with self._org_lock(org_id):
             # Double-check after acquiring lock
             cache_timestamp = self._availability_timestamps.get(org_id, 0.0)
             if (
@@ -730,6 +761,81 @@ class OrganizationInventory:
 
         return [a for a in availabilities if _net_id(a) in allowed_ids]
 
+    def _index(
+        self, kind: str, scope: str, records: list[dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        """Return a ``record["id"] -> record`` map for a cached list, building it once."""
+        cached = self._indexes.get((kind, scope))
+        if cached is not None and cached[0] is records:
+            return cached[1]
+        index = {str(record["id"]): record for record in records if record.get("id")}
+        self._indexes[(kind, scope)] = (records, index)
+        return index
+
+    async def get_organization(self, org_id: str) -> dict[str, Any] | None:
+        """Look up one organization in the shared directory.
+
+        Served from the cached organization list; an org missing from it is
+        fetched once with ``getOrganization`` and cached for the inventory TTL,
+        so no collector needs its own per-cycle organization call.
+
+        Parameters
+        ----------
+        org_id : str
+            Organization ID.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            The organization, or None when it cannot be resolved.
+
+        """
+        organizations = await self.get_organizations()
+        org = self._index("organizations", "global", organizations).get(org_id)
+        if org is not None:
+            return org
+
+        extra = self._extra_orgs.get(org_id)
+        if extra is not None and not self._is_expired(extra[0], self._ttl):
+            self._cache_hits += 1
+            return extra[1]
+
+        self._cache_misses += 1
+        try:
+            result = await self._make_api_call(
+                "getOrganization", self.api.organizations.getOrganization, org_id
+            )
+            org = cast(
+                dict[str, Any],
+                validate_response_format(result, expected_type=dict, operation="getOrganization"),
+            )
+        except Exception:
+            logger.debug("Organization not resolvable for directory lookup", org_id=org_id)
+            return None
+        self._extra_orgs[org_id] = (time.time(), org)
+        return org
+
+    async def get_org_name(self, org_id: str) -> str:
+        """Return an organization's name, or the ID when it cannot be resolved.
+
+        Parameters
+        ----------
+        org_id : str
+            Organization ID.
+
+        Returns
+        -------
+        str
+            Organization name (falls back to ``org_id``).
+
+        """
+        try:
+            org = await self.get_organization(org_id)
+        except Exception:
+            logger.debug("Failed to resolve organization name", org_id=org_id)
+            return org_id
+        return str(org.get("name") or org_id) if org else org_id
+
     async def invalidate(self, org_id: str | None = None) -> None:
         """Invalidate cache for an organization or all organizations.
 
@@ -740,7 +846,7 @@ class OrganizationInventory:
             If None, invalidate all cached data.
 
         """
-        async with self._lock:
+        async with self._invalidation_locks(org_id):
             if org_id is None:
                 # Invalidate all
                 self._organizations = None
@@ -755,6 +861,9 @@ class OrganizationInventory:
                 self._availability_timestamps.clear()
                 self._license_timestamps.clear()
                 self._license_list_timestamps.clear()
+                self._indexes.clear()
+                self._extra_orgs.clear()
+                self.sensor_readings.invalidate()
                 logger.info("Invalidated all inventory cache")
             else:
                 # Invalidate specific org
@@ -778,8 +887,52 @@ class OrganizationInventory:
                     del self._license_timestamps[org_id]
                 if org_id in self._license_list_timestamps:
                     del self._license_list_timestamps[org_id]
+                self._extra_orgs.pop(org_id, None)
+                self.sensor_readings.invalidate(org_id)
                 logger.info("Invalidated inventory cache for organization", org_id=org_id)
 
+    async def invalidate_kind(self, kind: str, org_id: str) -> bool:
+        """Invalidate one kind of cached data for one organization.
+
+        Narrower than :meth:`invalidate`: an event that only moves device
+        availability (e.g. a ``device_down`` webhook) should not also throw
+        away the org's networks, devices and licenses.
+
+        Parameters
+        ----------
+        kind : str
+            One of :data:`INVALIDATION_KINDS` (``availability``, ``devices``,
+            ``networks``).
+        org_id : str
+            Organization whose entry is dropped.
+
+        Returns
+        -------
+        bool
+            True when a cached entry was dropped, False when none was cached.
+
+        Raises
+        ------
+        ValueError
+            If ``kind`` is not an invalidation kind.
+
+        """
+        if kind not in INVALIDATION_KINDS:
+            raise ValueError(f"Unknown inventory invalidation kind: {kind}")
+        async with self._org_lock(org_id):
+            if kind == "availability":
+                self._availability_timestamps.pop(org_id, None)
+                dropped = self._device_availabilities.pop(org_id, None) is not None
+            elif kind == "devices":
+                self._device_timestamps.pop(org_id, None)
+                dropped = self._devices.pop(org_id, None) is not None
+            else:
+                self._network_timestamps.pop(org_id, None)
+                dropped = self._networks.pop(org_id, None) is not None
+        if dropped:
+            logger.debug("Invalidated inventory cache entry", kind=kind, org_id=org_id)
+        return dropped
+
     def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics for monitoring.
 
@@ -803,6 +956,7 @@ class OrganizationInventory:
             "cached_availabilities": len(self._device_availabilities),
             "cached_licenses": len(self._licenses_overview),
             "cached_license_lists": len(self._licenses),
+            "cached_sensor_readings": len(self.sensor_readings),
         }
 
     @staticmethod
@@ -838,7 +992,9 @@ class OrganizationInventory:
 
         Called before starting collectors so the first collection cycle
         gets cache hits instead of misses. Fetches organizations, networks,
-        and devices for each target organization.
+        and devices for each target organization. Organizations are warmed
+        concurrently, at most ``collectors.cold_start_concurrency`` at a time,
+        so one slow organization does not hold up the rest.
 
         Parameters
         ----------
@@ -854,22 +1010,61 @@ class OrganizationInventory:
                 logger.exception("Failed to fetch organizations during cache warming")
             return
 
-        target_orgs = [o for o in orgs if org_ids is None or o.get("id") in org_ids]
+        target_ids = [
+            org_id
+            for org in orgs
+            if (org_id := org.get("id", "")) and (org_ids is None or org_id in org_ids)
+        ]
+        concurrency = getattr(
+            getattr(self.settings, "collectors", None), "cold_start_concurrency", 1
+        )
+        semaphore = asyncio.Semaphore(concurrency if isinstance(concurrency, int) else 1)
 
-        for org in target_orgs:
-            org_id = org.get("id", "")
-            if not org_id:
-                continue
-            try:
-                await self.get_networks(org_id)
-                await self.get_devices(org_id)
-                logger.info("Warmed cache for organization", org_id=org_id)
-            except Exception as exc:
-                if not self._log_startup_auth_error(exc):
-                    logger.exception(
-                        "Failed to warm cache for organization",
-                        org_id=org_id,
-                    )
+        async def warm_org(org_id: str) -> None:
+            async with semaphore:
+                try:
+                    await self.get_networks(org_id)
+                    await self.get_devices(org_id)
+                except Exception as exc:
+                    if not self._log_startup_auth_error(exc):
+                        logger.exception(
+                            "Failed to warm cache for organization",
+                            org_id=org_id,
+                        )
+                    return
+            self._warmed_orgs.add(org_id)
+            logger.info("Warmed cache for organization", org_id=org_id)
+
+        await asyncio.gather(*(warm_org(org_id) for org_id in target_ids))
+
+    def _org_lock(self, org_id: str) -> asyncio.Lock:
+        """Return the lock guarding one organization's cache entries."""
+        lock = self._org_locks.get(org_id)
+        if lock is None:
+            lock = self._org_locks[org_id] = asyncio.Lock()
+        return lock
+
+    @contextlib.asynccontextmanager
+    async def _invalidation_locks(self, org_id: str | None) -> AsyncGenerator[None]:
+        """Hold every lock a fetch could store under while ``org_id`` is invalidated.
+
+        Per-org fetches hold only their org's lock, so invalidating everything
+        also waits out each in-flight fetch. Otherwise a fetch that started
+        before the clear would store its result with a fresh timestamp after
+        it, silently undoing the invalidation.
+        """
+        async with contextlib.AsyncExitStack() as stack:
+            if org_id is None:
+                await stack.enter_async_context(self._lock)
+                for key in sorted(self._org_locks):
+                    await stack.enter_async_context(self._org_locks[key])
+            else:
+                await stack.enter_async_context(self._org_lock(org_id))
+            yield
+
+    def warmed_organizations(self) -> frozenset[str]:
+        """Return the organization IDs whose inventory finished warming."""
+        return frozenset(self._warmed_orgs)
 
     async def get_networks_with_device_types(
         self,
@@ -986,7 +1181,7 @@ class OrganizationInventory:
         self._cache_misses += 1
         logger.debug("Cache miss for licenses overview, fetching from API", org_id=org_id)
 
-        async with self._lock:
+        async with self._org_lock(org_id):
             # Double-check after acquiring lock
             cache_timestamp = self._license_timestamps.get(org_id, 0.0)
             if (
@@ -1078,7 +1273,7 @@ class OrganizationInventory:
         self._cache_misses += 1
         logger.debug("Cache miss for licenses, fetching from API", org_id=org_id)
 
-        async with self._lock:
+        async with self._org_lock(org_id):
             # Double-check after acquiring lock
             cache_timestamp = self._license_list_timestamps.get(org_id, 0.0)
             if (
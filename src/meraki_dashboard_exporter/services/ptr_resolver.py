@@ -0,0 +1,376 @@
+"""Event-loop native reverse-DNS (PTR) resolver.
+
+``socket.gethostbyaddr`` blocks a thread per lookup and cannot be cancelled, so
+the system backend of :class:`~.dns_resolver.DNSResolver` is capped at
+``dns_max_concurrent_lookups`` threads and a hung lookup pins its thread until
+the OS gives up. This module speaks the DNS wire protocol directly on the event
+loop instead: one UDP socket per nameserver carries many queries at once
+(matched back by query ID and question), each query is retried across
+nameservers with a per-attempt timeout, and truncated answers are re-asked over
+TCP. Only what a PTR lookup needs is implemented (RFC 1035 header, question,
+answer section and name compression).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import secrets
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+RESOLV_CONF_PATH = Path("/etc/resolv.conf")
+DNS_PORT = 53
+
+_TYPE_PTR = 12
+_CLASS_IN = 1
+_FLAG_QR = 0x8000
+_FLAG_TC = 0x0200
+_FLAG_RD = 0x0100
+_RCODE_NOERROR = 0
+_RCODE_NXDOMAIN = 3
+_HEADER = struct.Struct("!HHHHHH")
+_MAX_POINTER_HOPS = 32
+
+
+class DNSMessageError(ValueError):
+    """A DNS response could not be decoded."""
+
+
+@dataclass(frozen=True, slots=True)
+class PTRAnswer:
+    """Outcome of one reverse lookup.
+
+    ``status`` is one of ``ok``, ``nxdomain``, ``nodata`` (authoritative
+    negative answers), ``servfail`` (every nameserver refused or failed) or
+    ``timeout`` (no nameserver answered within the attempt budget).
+    """
+
+    hostname: str | None
+    status: str
+
+    @property
+    def negative(self) -> bool:
+        """True for authoritative "no such name" answers."""
+        return self.status in {"nxdomain", "nodata"}
+
+
+@dataclass(frozen=True, slots=True)
+class _Response:
+    """Decoded fields of a PTR response."""
+
+    query_id: int
+    qname: str
+    rcode: int
+    truncated: bool
+    hostname: str | None
+
+
+def parse_nameserver(spec: str) -> tuple[str, int]:
+    """Split ``host``, ``host:port`` or ``[v6host]:port`` into ``(host, port)``.
+
+    Parameters
+    ----------
+    spec : str
+        Nameserver address, optionally with a port.
+
+    Returns
+    -------
+    tuple[str, int]
+        Host and port (``53`` when omitted).
+
+    """
+    spec = spec.strip()
+    if spec.startswith("["):
+        host, _, rest = spec[1:].partition("]")
+        return host, int(rest[1:]) if rest.startswith(":") else DNS_PORT
+    if spec.count(":") == 1:
+        host, _, port = spec.partition(":")
+        return host, int(port)
+    return spec, DNS_PORT
+
+
+def parse_resolv_conf(path: Path = RESOLV_CONF_PATH) -> list[tuple[str, int]]:
+    """Read the ``nameserver`` entries of a resolv.conf file.
+
+    Parameters
+    ----------
+    path : Path
+        resolv.conf location.
+
+    Returns
+    -------
+    list[tuple[str, int]]
+        Nameservers in file order. Falls back to ``127.0.0.1`` (the resolver
+        library default) when the file is missing or lists none.
+
+    """
+    servers: list[tuple[str, int]] = []
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        lines = []
+    for line in lines:
+        fields = line.split()
+        if len(fields) >= 2 and fields[0] == "nameserver":
+            servers.append((fields[1], DNS_PORT))
+    return servers or [("127.0.0.1", DNS_PORT)]
+
+
+def build_ptr_query(query_id: int, qname: str) -> bytes:
+    """Encode a recursive PTR query for ``qname``."""
+    question = bytearray()
+    for label in qname.rstrip(".").split("."):
+        encoded = label.encode("ascii")
+        question.append(len(encoded))
+        question += encoded
+    question += b"\x00"
+    question += struct.pack("!HH", _TYPE_PTR, _CLASS_IN)
+    return _HEADER.pack(query_id, _FLAG_RD, 1, 0, 0, 0) + bytes(question)
+
+
+def _read_name(data: bytes, offset: int) -> tuple[str, int]:
+    """Decode a possibly-compressed domain name; return it and the next offset."""
+    labels: list[str] = []
+    end: int | None = None
+    hops = 0
+    while True:
+        if offset >= len(data):
+            raise DNSMessageError("name runs past end of message")
+        length = data[offset]
+        if length & 0xC0 == 0xC0:
+            if offset + 1 >= len(data):
+                raise DNSMessageError("truncated compression pointer")
+            hops += 1
+            if hops > _MAX_POINTER_HOPS:
+                raise DNSMessageError("compression pointer loop")
+            if end is None:
+                end = offset + 2
+            offset = ((length & 0x3F) << 8) | data[offset + 1]
+            continue
+        offset += 1
+        if length == 0:
+            break
+        label = data[offset : offset + length]
+        if len(label) != length:
+            raise DNSMessageError("label runs past end of message")
+        labels.append(label.decode("ascii", errors="replace"))
+        offset += length
+    return ".".join(labels), end if end is not None else offset
+
+
+def parse_ptr_response(data: bytes) -> _Response:
+    """Decode the header, question and first PTR answer of a response."""
+    if len(data) < _HEADER.size:
+        raise DNSMessageError("message shorter than a DNS header")
+    query_id, flags, qdcount, ancount, _nscount, _arcount = _HEADER.unpack_from(data)
+    if not flags & _FLAG_QR:
+        raise DNSMessageError("message is not a response")
+    offset = _HEADER.size
+    qname = ""
+    for index in range(qdcount):
+        name, offset = _read_name(data, offset)
+        if index == 0:
+            qname = name
+        offset += 4
+    hostname: str | None = None
+    for _ in range(ancount):
+        _name, offset = _read_name(data, offset)
+        if offset + 10 > len(data):
+            raise DNSMessageError("answer record runs past end of message")
+        rtype, _rclass, _ttl, rdlength = struct.unpack_from("!HHIH", data, offset)
+        offset += 10
+        if rtype == _TYPE_PTR and hostname is None:
+            hostname, _ = _read_name(data, offset)
+        offset += rdlength
+    return _Response(
+        query_id=query_id,
+        qname=qname.lower(),
+        rcode=flags & 0x000F,
+        truncated=bool(flags & _FLAG_TC),
+        hostname=hostname or None,
+    )
+
+
+class _UDPChannel(asyncio.DatagramProtocol):
+    """One connected UDP socket to a nameserver carrying many queries at once."""
+
+    def __init__(self) -> None:
+        self.transport: asyncio.DatagramTransport | None = None
+        self.pending: dict[int, tuple[str, asyncio.Future[_Response]]] = {}
+        self.closed = False
+
+    @property
+    def usable(self) -> bool:
+        """Whether queries can be sent: connected, and not closed or closing."""
+        return not self.closed and self.transport is not None and not self.transport.is_closing()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def datagram_received(self, data: bytes, addr: tuple[str | int, ...]) -> None:
+        try:
+            response = parse_ptr_response(data)
+        except DNSMessageError as exc:
+            logger.debug("Discarding undecodable DNS response", error=str(exc))
+            return
+        entry = self.pending.get(response.query_id)
+        # Only accept an answer to the question actually asked under this ID.
+        if entry is None or entry[0] != response.qname:
+            return
+        future = entry[1]
+        if not future.done():
+            future.set_result(response)
+
+    def error_received(self, exc: Exception) -> None:
+        # ICMP errors (port unreachable, ...) surface as per-query timeouts.
+        logger.debug("DNS socket error", error=str(exc))
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self.closed = True
+        for _qname, future in self.pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("DNS socket closed"))
+
+    def allocate_id(self) -> int:
+        """Pick a random query ID not currently in flight on this socket."""
+        while True:
+            query_id = secrets.randbelow(0x10000)
+            if query_id not in self.pending:
+                return query_id
+
+
+class AsyncPTRResolver:
+    """Pipelined, retrying PTR resolver running entirely on the event loop.
+
+    Parameters
+    ----------
+    nameservers : list[tuple[str, int]]
+        ``(host, port)`` pairs queried in rotation.
+    timeout : float
+        Overall budget for one lookup in seconds, split evenly across attempts.
+    attempts : int
+        Attempts per lookup; each retry moves to the next nameserver.
+    max_inflight : int
+        Maximum lookups in flight at once across all sockets.
+
+    """
+
+    def __init__(
+        self,
+        nameservers: list[tuple[str, int]],
+        timeout: float,
+        attempts: int,
+        max_inflight: int,
+    ) -> None:
+        """Initialize the resolver; sockets are opened lazily on first use."""
+        if not nameservers:
+            raise ValueError("AsyncPTRResolver needs at least one nameserver")
+        self.nameservers = list(nameservers)
+        self.attempts = max(1, attempts)
+        self.attempt_timeout = timeout / self.attempts
+        self._semaphore = asyncio.Semaphore(max_inflight)
+        self._channels: dict[tuple[str, int], _UDPChannel] = {}
+        self._channel_locks: dict[tuple[str, int], asyncio.Lock] = {}
+        self._rotation = 0
+
+    async def resolve(self, ip: str) -> PTRAnswer:
+        """Reverse-resolve one IP address.
+
+        Parameters
+        ----------
+        ip : str
+            IPv4 or IPv6 address (must be valid).
+
+        Returns
+        -------
+        PTRAnswer
+            Fully-qualified hostname or the negative/failed outcome.
+
+        """
+        qname = ipaddress.ip_address(ip).reverse_pointer.lower()
+        start = self._rotation
+        self._rotation = (self._rotation + 1) % len(self.nameservers)
+        status = "timeout"
+        async with self._semaphore:
+            for attempt in range(self.attempts):
+                server = self.nameservers[(start + attempt) % len(self.nameservers)]
+                try:
+                    response = await self._query_udp(server, qname)
+                    if response.truncated:
+                        response = await self._query_tcp(server, qname)
+                except TimeoutError:
+                    status = "timeout"
+                    continue
+                except (OSError, DNSMessageError, asyncio.IncompleteReadError) as exc:
+                    logger.debug("PTR query failed", ip=ip, server=server[0], error=str(exc))
+                    status = "servfail"
+                    continue
+                if response.rcode == _RCODE_NXDOMAIN:
+                    return PTRAnswer(hostname=None, status="nxdomain")
+                if response.rcode == _RCODE_NOERROR:
+                    if response.hostname:
+                        return PTRAnswer(hostname=response.hostname, status="ok")
+                    return PTRAnswer(hostname=None, status="nodata")
+                status = "servfail"
+        return PTRAnswer(hostname=None, status=status)
+
+    async def _channel(self, server: tuple[str, int]) -> _UDPChannel:
+        """Return the open UDP channel to ``server``, (re)connecting when needed."""
+        channel = self._channels.get(server)
+        if channel is not None and channel.usable:
+            return channel
+        lock = self._channel_locks.setdefault(server, asyncio.Lock())
+        async with lock:
+            channel = self._channels.get(server)
+            if channel is None or not channel.usable:
+                loop = asyncio.get_running_loop()
+                _transport, channel = await loop.create_datagram_endpoint(
+                    _UDPChannel, remote_addr=server
+                )
+                self._channels[server] = channel
+        return channel
+
+    async def _query_udp(self, server: tuple[str, int], qname: str) -> _Response:
+        channel = await self._channel(server)
+        query_id = channel.allocate_id()
+        future: asyncio.Future[_Response] = asyncio.get_running_loop().create_future()
+        channel.pending[query_id] = (qname, future)
+        try:
+            transport = channel.transport
+            if transport is None or transport.is_closing():
+                # Fails this attempt over to the next one, which reopens the socket.
+                raise ConnectionError("DNS socket is not open")
+            transport.sendto(build_ptr_query(query_id, qname))
+            async with asyncio.timeout(self.attempt_timeout):
+                return await future
+        finally:
+            channel.pending.pop(query_id, None)
+
+    async def _query_tcp(self, server: tuple[str, int], qname: str) -> _Response:
+        query_id = secrets.randbelow(0x10000)
+        query = build_ptr_query(query_id, qname)
+        async with asyncio.timeout(self.attempt_timeout):
+            reader, writer = await asyncio.open_connection(*server)
+            try:
+                writer.write(struct.pack("!H", len(query)) + query)
+                await writer.drain()
+                (length,) = struct.unpack("!H", await reader.readexactly(2))
+                response = parse_ptr_response(await reader.readexactly(length))
+            finally:
+                writer.close()
+        if response.query_id != query_id or response.qname != qname:
+            raise DNSMessageError("TCP response does not match the query")
+        return response
+
+    def close(self) -> None:
+        """Close every UDP socket; in-flight lookups fail over to their timeout."""
+        for channel in self._channels.values():
+            if channel.transport is not None:
+                channel.transport.close()
+        self._channels.clear()
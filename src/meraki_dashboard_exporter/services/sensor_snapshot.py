@@ -0,0 +1,99 @@
+"""Shared per-organization snapshot of the latest MT sensor readings.
+
+``getOrganizationSensorReadingsLatest`` is org-wide and paginated, so every
+MT consumer that fetched it on its own would pay the full page count again
+for the same data. ``SensorReadingsSnapshot`` keeps one snapshot per org with
+a cycle-scoped lifetime: readers within the same ``MT_SENSOR_READINGS`` cycle
+share it, and concurrent readers of a missing or stale snapshot share a
+single in-flight fetch. A failed fetch is never cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+#: Fraction of the group interval a snapshot stays fresh. Below one so the
+#: next due cycle always refetches instead of re-reading last cycle's data.
+CYCLE_LIFETIME_FRACTION = 0.5
+
+
+class SensorReadingsSnapshot:
+    """Cycle-scoped, single-flight cache of org-wide sensor readings."""
+
+    def __init__(self) -> None:
+        """Initialize an empty snapshot store."""
+        self._readings: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+        self._inflight: dict[str, asyncio.Future[list[dict[str, Any]]]] = {}
+
+    async def get(
+        self,
+        org_id: str,
+        fetch: Callable[[str], Awaitable[list[dict[str, Any]]]],
+        interval_seconds: float,
+    ) -> list[dict[str, Any]]:
+        """Return the org's readings, fetching at most once per cycle.
+
+        Parameters
+        ----------
+        org_id : str
+            Organization ID.
+        fetch : Callable[[str], Awaitable[list[dict[str, Any]]]]
+            Fetcher issuing ``getOrganizationSensorReadingsLatest`` for the org.
+            Only called when no fresh snapshot or in-flight fetch exists.
+        interval_seconds : float
+            Current ``MT_SENSOR_READINGS`` interval; the snapshot is fresh for
+            ``CYCLE_LIFETIME_FRACTION`` of it.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            The readings. Shared between readers — do not mutate.
+
+        """
+        cached = self._readings.get(org_id)
+        if cached is not None and time.monotonic() - cached[0] < (
+            interval_seconds * CYCLE_LIFETIME_FRACTION
+        ):
+            return cached[1]
+
+        pending = self._inflight.get(org_id)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[list[dict[str, Any]]] = asyncio.get_running_loop().create_future()
+        self._inflight[org_id] = future
+        try:
+            readings = await fetch(org_id)
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                # Waiters re-raise it; do not warn about an unretrieved exception.
+                future.exception()
+            raise
+        else:
+            self._readings[org_id] = (time.monotonic(), readings)
+            future.set_result(readings)
+            logger.debug("Fetched sensor readings snapshot", org_id=org_id, readings=len(readings))
+            return readings
+        finally:
+            self._inflight.pop(org_id, None)
+
+    def invalidate(self, org_id: str | None = None) -> None:
+        """Drop the snapshot for one organization, or for all of them."""
+        if org_id is None:
+            self._readings.clear()
+        else:
+            self._readings.pop(org_id, None)
+
+    def __len__(self) -> int:
+        """Return the number of organizations with a snapshot."""
+        return len(self._readings)
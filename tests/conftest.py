@@ -55,6 +55,16 @@ def reset_client_auth_state():
     AsyncMerakiClient.reset_auth_state()
 
 
+@pytest.fixture(autouse=True)
+def reset_negative_results():
+    """Clear the process-wide negative-result cache around every test."""
+    from meraki_dashboard_exporter.core.negative_cache import negative_results
+
+    negative_results.reset()
+    yield
+    negative_results.reset()
+
+
 @pytest.fixture
 def force_debug_log_capture():
     """Force structlog to emit DEBUG events so ``capture_logs()`` can record them.
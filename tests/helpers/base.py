@@ -69,6 +69,10 @@ class BaseCollectorTest:
         monkeypatch.setattr(
             "meraki_dashboard_exporter.core.collector.MetricCollector._collector_api_calls", None
         )
+        monkeypatch.setattr(
+            "meraki_dashboard_exporter.core.collector.MetricCollector._collector_inventory_bypass",
+            None,
+        )
         return registry
 
     @pytest.fixture
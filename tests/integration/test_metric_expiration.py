@@ -13,7 +13,10 @@ from unittest.mock import MagicMock, patch
 import pytest
 from prometheus_client import Gauge
 
-from meraki_dashboard_exporter.core.metric_expiration import MetricExpirationManager
+from meraki_dashboard_exporter.core.metric_expiration import (
+    MetricExpirationManager,
+    freeze_labels,
+)
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -108,6 +111,26 @@ class TestMetricTracking:
         assert stats["by_collector"][_COLLECTOR] == 2
         assert stats["ttl_multiplier"] == 2.0
 
+    def test_refresh_series_updates_tracked_and_reports_missing(
+        self, expiration_manager: MetricExpirationManager
+    ) -> None:
+        """Bulk refresh bumps tracked entries in place and returns untracked pairs."""
+        with patch("meraki_dashboard_exporter.core.metric_expiration.time.time") as mock_time:
+            mock_time.return_value = 1000.0
+            _track(expiration_manager)
+            mock_time.return_value = 1500.0
+            tracked = (_METRIC, freeze_labels(_LABELS))
+            gone = (_METRIC, freeze_labels({**_LABELS, "serial": "GONE"}))
+
+            missing = expiration_manager.refresh_series(
+                _COLLECTOR, [tracked, gone], ttl_seconds=900.0
+            )
+
+        assert missing == {gone}
+        entry = expiration_manager._metric_timestamps[(_COLLECTOR, *tracked)]
+        assert (entry.ts, entry.ttl_seconds) == (1500.0, 900.0)
+        assert len(expiration_manager._metric_timestamps) == 1
+
 
 # ---------------------------------------------------------------------------
 # Tests: expiry after TTL
@@ -203,6 +203,52 @@ class TestOrganizationInventoryBasics:
         assert first[0] is not second[0]
 
 
+class TestOrganizationInventoryDirectory:
+    """Directory lookups shared by every collector."""
+
+    async def test_org_name_from_cached_list(self, mock_api, mock_settings, inventory_service):
+        """Org names resolve from the cached list without per-lookup calls."""
+        mock_api.organizations.getOrganizations.return_value = [
+            {"id": "1", "name": "One"},
+            {"id": "2", "name": "Two"},
+        ]
+
+        assert await inventory_service.get_org_name("2") == "Two"
+        assert await inventory_service.get_org_name("1") == "One"
+
+        mock_api.organizations.getOrganizations.assert_called_once()
+        mock_api.organizations.getOrganization.assert_not_called()
+
+    async def test_org_missing_from_list_fetched_once(
+        self, mock_api, mock_settings, inventory_service
+    ):
+        """An org absent from the list is fetched once, then served from cache."""
+        mock_api.organizations.getOrganizations.return_value = [{"id": "1", "name": "One"}]
+        mock_api.organizations.getOrganization.return_value = {"id": "9", "name": "Nine"}
+
+        assert await inventory_service.get_org_name("9") == "Nine"
+        assert await inventory_service.get_org_name("9") == "Nine"
+
+        mock_api.organizations.getOrganization.assert_called_once_with("9")
+
+    async def test_org_name_falls_back_to_id(self, mock_api, mock_settings, inventory_service):
+        """An unresolvable org yields its ID rather than raising."""
+        mock_api.organizations.getOrganizations.return_value = []
+        mock_api.organizations.getOrganization.side_effect = RuntimeError("boom")
+
+        assert await inventory_service.get_org_name("404") == "404"
+
+    async def test_lookup_index_follows_refresh(self, mock_api, mock_settings, inventory_service):
+        """After invalidation the index is rebuilt from the refreshed list."""
+        mock_api.organizations.getOrganizations.return_value = [{"id": "1", "name": "Old"}]
+        assert await inventory_service.get_org_name("1") == "Old"
+
+        mock_api.organizations.getOrganizations.return_value = [{"id": "1", "name": "New"}]
+        await inventory_service.invalidate()
+
+        assert await inventory_service.get_org_name("1") == "New"
+
+
 class TestOrganizationInventoryCacheInvalidation:
     """Test cache invalidation functionality."""
 
@@ -233,6 +279,28 @@ class TestOrganizationInventoryCacheInvalidation:
         assert mock_api.organizations.getOrganizationNetworks.call_count == 2
         assert mock_api.organizations.getOrganizationDevices.call_count == 2
 
+    async def test_invalidate_kind_drops_only_that_kind(self, mock_api, inventory_service):
+        """invalidate_kind refetches one cache kind for one org; others stay cached."""
+        mock_api.organizations.getOrganizationNetworks.return_value = NetworkFactory.create_many(
+            2, org_id="org_1"
+        )
+        mock_api.organizations.getOrganizationDevices.return_value = DeviceFactory.create_many(2)
+        for org_id in ("org_1", "org_2"):
+            await inventory_service.get_networks(org_id)
+            await inventory_service.get_devices(org_id)
+
+        assert await inventory_service.invalidate_kind("devices", "org_1") is True
+        assert await inventory_service.invalidate_kind("devices", "org_1") is False
+
+        for org_id in ("org_1", "org_2"):
+            await inventory_service.get_networks(org_id)
+            await inventory_service.get_devices(org_id)
+        assert mock_api.organizations.getOrganizationNetworks.call_count == 2
+        assert mock_api.organizations.getOrganizationDevices.call_count == 3
+
+        with pytest.raises(ValueError, match="invalidation kind"):
+            await inventory_service.invalidate_kind("licenses", "org_1")
+
     async def test_invalidate_all_orgs(self, mock_api, mock_settings, inventory_service):
         """Test invalidating cache for all organizations."""
         mock_settings.meraki.org_id = None
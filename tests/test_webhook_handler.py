@@ -633,3 +633,19 @@ class TestWebhookDeviceStateFastPath:
                 )
                 is None
             )
+
+
+class TestWebhookEventRefresh:
+    """Accepted alerts are handed to the event refresher; rejected ones are not."""
+
+    def test_accepted_alert_notifies_refresher(self, settings_with_secret: Settings) -> None:
+        """The raw org ID and bound alert type reach the refresher once."""
+        refresher = MagicMock()
+        handler = WebhookHandler(settings_with_secret, event_refresher=refresher)
+        payload = _device_down_payload()
+
+        assert handler.process_webhook(payload) is not None
+        # A replay of the same alert is rejected before reaching the refresher.
+        assert handler.process_webhook(payload) is None
+
+        refresher.notify.assert_called_once_with(payload["organizationId"], "device_down")
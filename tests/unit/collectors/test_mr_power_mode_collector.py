@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -9,6 +10,7 @@ from prometheus_client import Gauge
 
 from meraki_dashboard_exporter.collectors.devices.mr.performance import MRPerformanceCollector
 from meraki_dashboard_exporter.core.constants.metrics_constants import MRMetricName
+from meraki_dashboard_exporter.core.history_cursor import format_timestamp
 from meraki_dashboard_exporter.core.scheduler import EndpointGroupName
 
 
@@ -188,3 +190,35 @@ class TestMRPowerModeCollection:
         assert pm_calls
         for c in pm_calls:
             assert c.kwargs["ttl_seconds"] == 900.0
+
+    async def test_incremental_poll_keeps_the_buffered_newest_mode(
+        self, collector: MRPerformanceCollector, mock_api: MagicMock, mock_parent: MagicMock
+    ) -> None:
+        """After a full-day poll, the next asks for t0 onwards and keeps earlier modes."""
+        now = time.time()
+        history = MagicMock(
+            side_effect=[
+                [
+                    {
+                        "serial": "Q1",
+                        "model": "MR46",
+                        "network": {"id": "net1"},
+                        "events": [{"ts": format_timestamp(now - 3600), "powerMode": "low"}],
+                    }
+                ],
+                [{"serial": "Q1", "model": "MR46", "network": {"id": "net1"}, "events": []}],
+            ]
+        )
+        mock_api.wireless.getOrganizationWirelessDevicesPowerModeHistory = history
+
+        await collector.collect_power_mode("org1", "Org", {})
+        await collector.collect_power_mode("org1", "Org", {})
+
+        assert history.call_args_list[0].kwargs == {"total_pages": "all", "timespan": 86400}
+        assert set(history.call_args_list[1].kwargs) == {"total_pages", "t0"}
+        modes = [
+            c.args[1]["mode"]
+            for c in mock_parent._set_metric.call_args_list
+            if c.args[0] is collector._mr_power_mode
+        ]
+        assert modes == ["low", "low"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
@@ -9,6 +10,7 @@ import pytest
 from prometheus_client import REGISTRY, Gauge
 
 from meraki_dashboard_exporter.collectors.devices.ms import MSCollector
+from meraki_dashboard_exporter.core.history_cursor import format_timestamp
 
 if TYPE_CHECKING:
     pass
@@ -1438,6 +1440,63 @@ class TestMSCollector:
         result = await ms_collector.collect_port_usage_by_switch("org1", "Org One", devices)
         assert result is False
 
+    async def test_collect_port_usage_by_switch_fetches_incrementally_from_cursor(
+        self,
+        ms_collector: MSCollector,
+        mock_api: MagicMock,
+    ) -> None:
+        """The second poll asks only for t0 onwards and sums over the buffered window."""
+        now = time.time()
+
+        def interval(start_offset: int, total_kb: int) -> dict[str, object]:
+            return {
+                "startTs": format_timestamp(now - start_offset),
+                "endTs": format_timestamp(now - start_offset + 300),
+                "data": {"usage": {"total": total_kb, "upstream": 0, "downstream": total_kb}},
+            }
+
+        def response(*intervals: dict[str, object]) -> list[dict[str, object]]:
+            return [
+                {
+                    "serial": "Q2XX-0004",
+                    "model": "MS120-8",
+                    "network": {"id": "net1", "name": "Net One"},
+                    "ports": [{"portId": "1", "intervals": list(intervals)}],
+                }
+            ]
+
+        usage_history = MagicMock(
+            side_effect=[
+                response(interval(900, 100), interval(600, 200)),
+                response(interval(300, 50)),
+            ]
+        )
+        mock_api.switch.getOrganizationSwitchPortsUsageHistoryByDeviceByInterval = usage_history
+        mock_api.switch.getOrganizationSwitchPortsClientsOverviewByDevice = MagicMock(
+            return_value=[]
+        )
+        devices = [{"serial": "Q2XX-0004", "networkId": "net1", "model": "MS120-8"}]
+
+        await ms_collector.collect_port_usage_by_switch("org1", "Org One", devices)
+        await ms_collector.collect_port_usage_by_switch("org1", "Org One", devices)
+
+        first, second = (c.kwargs for c in usage_history.call_args_list)
+        assert first["timespan"] == 3600
+        assert "t0" not in first
+        assert second["t0"] == format_timestamp(now - 300)
+        assert "timespan" not in second
+        assert first["interval"] == second["interval"] == 300
+        labels = {
+            "org_id": "org1",
+            "network_id": "net1",
+            "serial": "Q2XX-0004",
+            "model": "MS120-8",
+            "device_type": "MS",
+            "port_id": "1",
+            "direction": "total",
+        }
+        assert REGISTRY.get_sample_value("meraki_ms_port_usage_bytes", labels) == 350 * 1000
+
     async def test_collect_emits_ms_port_info_per_device_path(
         self,
         ms_collector: MSCollector,
@@ -2119,3 +2178,91 @@ class TestMSCollector:
             )
             == 1.0
         )
+
+    async def test_unchanged_ports_refresh_expiry_instead_of_re_emitting(
+        self,
+        ms_collector: MSCollector,
+        mock_api: MagicMock,
+        mock_parent: MagicMock,
+    ) -> None:
+        """Ports identical to the last cycle skip _set_metric; only changed ports re-emit."""
+        ports = [
+            {
+                "portId": "1",
+                "name": "Uplink",
+                "status": "Connected",
+                "speed": "10 Gbps",
+                "duplex": "full",
+                "spanningTree": {"statuses": ["forwarding"]},
+                "lldp": {"systemName": "core"},
+            },
+            {"portId": "2", "name": "Port 2", "status": "Disconnected"},
+        ]
+        mock_api.switch.getOrganizationSwitchPortsStatusesBySwitch = MagicMock(
+            return_value=[{"serial": "Q2XX-0001", "model": "MS250-48", "ports": ports}]
+        )
+        mock_parent._refresh_metrics = MagicMock(return_value=set())
+        devices = [{"serial": "Q2XX-0001", "networkId": "net1"}]
+
+        await ms_collector.collect_port_statuses_by_switch("org1", "Org", devices)
+        first_emits = mock_parent._set_metric.call_count
+        mock_parent._refresh_metrics.assert_not_called()
+
+        mock_parent._set_metric.reset_mock()
+        await ms_collector.collect_port_statuses_by_switch("org1", "Org", devices)
+
+        mock_parent._set_metric.assert_not_called()
+        mock_parent._refresh_metrics.assert_called_once()
+        refreshed = mock_parent._refresh_metrics.call_args.args[0]
+        assert len(refreshed) == first_emits
+        assert {name for name, _ in refreshed} >= {
+            "meraki_ms_port_status",
+            "meraki_ms_port_stp_state",
+            "meraki_ms_port_info",
+            "meraki_ms_port_neighbor_present",
+        }
+
+        ports[1]["status"] = "Connected"
+        await ms_collector.collect_port_statuses_by_switch("org1", "Org", devices)
+
+        emitted_ports = {c.args[1]["port_id"] for c in mock_parent._set_metric.call_args_list}
+        assert emitted_ports == {"2"}
+        status_labels = {
+            "org_id": "org1",
+            "network_id": "net1",
+            "serial": "Q2XX-0001",
+            "model": "MS250-48",
+            "device_type": "MS",
+            "port_id": "2",
+            "link_speed": "",
+            "duplex": "",
+        }
+        assert REGISTRY.get_sample_value("meraki_ms_port_status", status_labels) == 1.0
+
+    async def test_unchanged_port_with_untracked_series_is_re_emitted(
+        self,
+        ms_collector: MSCollector,
+        mock_api: MagicMock,
+        mock_parent: MagicMock,
+    ) -> None:
+        """A series that expired or was shed since the last cycle forces a full re-emit."""
+        device = {"serial": "Q2XX-0002", "model": "MS120-8", "networkId": "net1", "orgId": "org1"}
+        mock_api.switch.getDeviceSwitchPortsStatuses = MagicMock(
+            return_value=[
+                {"portId": "1", "status": "Connected", "cdp": {"deviceId": "x"}},
+                {"portId": "2", "status": "Connected"},
+            ]
+        )
+        await ms_collector.collect(device)
+
+        recorded = ms_collector._port_emissions["Q2XX-0002"]["1"][1]
+        mock_parent._refresh_metrics = MagicMock(return_value={recorded[0]})
+        mock_parent._set_metric.reset_mock()
+        await ms_collector.collect(device)
+
+        port_status_calls = [
+            c.args[1]["port_id"]
+            for c in mock_parent._set_metric.call_args_list
+            if c.args[3] == "meraki_ms_port_status"
+        ]
+        assert port_status_calls == ["1"]
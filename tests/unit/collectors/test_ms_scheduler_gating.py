@@ -202,6 +202,25 @@ class TestMSPacketStatsGate(_MSGatingBase):
         assert ms._should_collect_packet_stats("fresh") is False
         assert ms._should_collect_packet_stats("stale") is True
 
+    async def test_packet_stats_budget_admits_a_rotating_slice(
+        self, mock_api, settings, isolated_registry, inventory
+    ) -> None:
+        """With a cohort budget only that many due switches per org are admitted."""
+        settings.scheduler.group_cohort_budgets = {EndpointGroupName.MS_PACKET_STATS.value: 2}
+        sched = _FakeScheduler(interval_map={EndpointGroupName.MS_PACKET_STATS: 600.0})
+        dc = self._device_collector(mock_api, settings, isolated_registry, inventory, sched)
+        ms = dc.ms_collector
+        serials = [f"Q2SW-{i}" for i in range(5)]
+
+        admitted = [s for s in serials if ms._should_collect_packet_stats(s, "O1")]
+        for serial in admitted:
+            ms._mark_packet_stats_collected(serial, "O1")
+
+        assert len(admitted) == 2
+        assert not any(
+            ms._should_collect_packet_stats(s, "O1") for s in serials if s not in admitted
+        )
+
     async def test_packet_stats_threads_ttl(
         self, mock_api, settings, isolated_registry, inventory
     ) -> None:
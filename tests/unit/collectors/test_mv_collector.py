@@ -559,7 +559,7 @@ class TestMVCollector:
         mock_parent: MagicMock,
         device: dict,
     ) -> None:
-        """Once the group interval has elapsed, the next cycle re-fetches all three."""
+        """Once the group interval has elapsed, the next cycle re-fetches both lanes."""
         self._set_all_responses(mock_api)
 
         with patch(
@@ -567,7 +567,7 @@ class TestMVCollector:
             return_value=1_000.0,
         ):
             await mv_collector.collect(device)
-        assert mock_api.camera.getDeviceCameraAnalyticsZones.call_count == 1
+        assert mock_api.camera.getDeviceCameraAnalyticsRecent.call_count == 1
 
         # Still short of the 900s interval.
         with patch(
@@ -575,16 +575,17 @@ class TestMVCollector:
             return_value=1_000.0 + 300,
         ):
             await mv_collector.collect(device)
-        assert mock_api.camera.getDeviceCameraAnalyticsZones.call_count == 1
+        assert mock_api.camera.getDeviceCameraAnalyticsRecent.call_count == 1
 
-        # Past the interval.
+        # Past the interval: a whole interval always crosses the camera's
+        # config-lane phase as well.
         with patch(
             "meraki_dashboard_exporter.collectors.devices.mv.time.time",
             return_value=1_000.0 + 901,
         ):
             await mv_collector.collect(device)
-        assert mock_api.camera.getDeviceCameraAnalyticsZones.call_count == 2
         assert mock_api.camera.getDeviceCameraAnalyticsRecent.call_count == 2
+        assert mock_api.camera.getDeviceCameraAnalyticsZones.call_count == 2
         assert mock_api.camera.getDeviceCameraQualityAndRetention.call_count == 2
 
     async def test_analytics_gating_is_per_camera(
@@ -902,6 +903,76 @@ class TestMVCollector:
         assert value_for(mv_collector._mv_audio_recording_enabled) == 0.0
         assert value_for(mv_collector._mv_restricted_bandwidth_mode_enabled) == 0.0
 
+    # ------------------------------------------------------------------
+    # Fast analytics lane / slow rotated config lane
+    # ------------------------------------------------------------------
+
+    async def test_config_lane_refreshes_a_rotating_slice_of_cameras(
+        self,
+        mv_collector: MVCollector,
+        mock_api: MagicMock,
+        mock_parent: MagicMock,
+        device: dict,
+    ) -> None:
+        """After the cold start each cycle fetches config for only a slice of the fleet."""
+        intervals = {EndpointGroupName.MV_CONFIG: 3600.0, EndpointGroupName.MV_SENSE_CONFIG: 3600.0}
+        mock_parent._group_interval.side_effect = lambda group: intervals.get(group, 900.0)
+        self._set_all_responses(mock_api)
+        mock_api.camera.getDeviceCameraSense = MagicMock(return_value={"senseEnabled": False})
+        cameras = [{**device, "serial": f"Q2CC-0000-{i:04d}"} for i in range(120)]
+
+        per_cycle = []
+        for cycle in range(13):  # cold start + one full hour at the 300s cadence
+            mock_api.camera.getDeviceCameraAnalyticsZones.reset_mock()
+            with patch(
+                "meraki_dashboard_exporter.collectors.devices.mv.time.time",
+                return_value=1_000.0 + cycle * 300,
+            ):
+                for camera in cameras:
+                    await mv_collector.collect(camera)
+            per_cycle.append(mock_api.camera.getDeviceCameraAnalyticsZones.call_count)
+
+        assert per_cycle[0] == len(cameras)
+        # Every camera is refreshed exactly once in the hour after the cold start,
+        # spread over the cycles instead of all at once.
+        assert sum(per_cycle[1:]) == len(cameras)
+        assert max(per_cycle[1:]) < len(cameras) // 4
+
+    async def test_recent_skipped_for_camera_without_zones_until_one_is_configured(
+        self,
+        mv_collector: MVCollector,
+        mock_api: MagicMock,
+        mock_parent: MagicMock,
+        device: dict,
+    ) -> None:
+        """No zones and an empty recent response: the fast lane stops calling recent."""
+        mock_api.camera.getDeviceCameraAnalyticsZones = self._zones()
+        mock_api.camera.getDeviceCameraAnalyticsRecent = self._recent()
+        mock_api.camera.getDeviceCameraQualityAndRetention = self._quality()
+        intervals = {EndpointGroupName.MV_CONFIG: 3600.0}
+        mock_parent._group_interval.side_effect = lambda group: intervals.get(group, 900.0)
+
+        for offset in (0, 901):
+            with patch(
+                "meraki_dashboard_exporter.collectors.devices.mv.time.time",
+                return_value=1_000.0 + offset,
+            ):
+                await mv_collector.collect(device)
+        assert mock_api.camera.getDeviceCameraAnalyticsRecent.call_count == 1
+        mock_parent._mark_group_ran.assert_called_with(EndpointGroupName.MV_ANALYTICS)
+
+        # The config lane later sees a zone: recent is fetched again.
+        mock_api.camera.getDeviceCameraAnalyticsZones = self._zones({
+            "zoneId": "1",
+            "label": "Door",
+        })
+        with patch(
+            "meraki_dashboard_exporter.collectors.devices.mv.time.time",
+            return_value=1_000.0 + 3600 + 901,
+        ):
+            await mv_collector.collect(device)
+        assert mock_api.camera.getDeviceCameraAnalyticsRecent.call_count == 2
+
     # ------------------------------------------------------------------
     # #305: MV Sense enablement
     # ------------------------------------------------------------------
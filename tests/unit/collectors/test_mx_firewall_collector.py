@@ -1521,3 +1521,117 @@ class TestMXFirewallCollector:
         assert mock_api.appliance.getNetworkApplianceFirewallL3FirewallRules.call_count == 1
         # But the new config-drift domains must have run.
         mock_api.appliance.getNetworkApplianceContentFiltering.assert_called_once()
+
+    # ------------------------------------------------------------------
+    # Payload-hash skip and configuration-change detection
+    # ------------------------------------------------------------------
+
+    async def test_unchanged_payload_only_refreshes_series_expiry(
+        self,
+        firewall_collector: MXFirewallCollector,
+        mock_api: MagicMock,
+        mock_parent: MagicMock,
+    ) -> None:
+        """An identical rule payload skips parsing/emission and refreshes its series."""
+        mock_parent._group_interval = MagicMock(return_value=0)
+        mock_parent._refresh_metrics = MagicMock(return_value=set())
+        self._set_l3_l7_responses(mock_api)
+
+        await firewall_collector.collect_for_network("org1", "Test Org", "N_1", "Office")
+        emitted = mock_parent._set_metric.call_count
+        assert emitted == 3
+        mock_parent._set_metric.reset_mock()
+
+        await firewall_collector.collect_for_network("org1", "Test Org", "N_1", "Office")
+
+        mock_parent._set_metric.assert_not_called()
+        series, _ttl = mock_parent._refresh_metrics.call_args[0]
+        assert len(series) == emitted
+
+        # A changed payload (or expired series) takes the full emit path again.
+        mock_api.appliance.getNetworkApplianceFirewallL7FirewallRules = MagicMock(
+            return_value={"rules": [{"policy": "deny", "type": "application"}]}
+        )
+        await firewall_collector.collect_for_network("org1", "Test Org", "N_1", "Office")
+        assert mock_parent._set_metric.call_count == 3
+
+    async def test_config_changes_stretch_interval_until_a_change_is_logged(
+        self,
+        firewall_collector: MXFirewallCollector,
+        mock_api: MagicMock,
+        mock_parent: MagicMock,
+    ) -> None:
+        """With the change log read, only networks with a logged change are re-fetched early."""
+        firewall_collector.settings.scheduler.config_change_resync_seconds = 21600
+        mock_api.organizations.getOrganizationConfigurationChanges = MagicMock(return_value=[])
+        self._set_l3_l7_responses(mock_api)
+        time_path = "meraki_dashboard_exporter.collectors.devices.mx_firewall.time.time"
+        l3 = mock_api.appliance.getNetworkApplianceFirewallL3FirewallRules
+
+        with patch(time_path, return_value=10_000.0):
+            await firewall_collector.collect_config_changes("org1")
+            for network_id in ("N_1", "N_2"):
+                await firewall_collector.collect_for_network("org1", "Org", network_id, network_id)
+        assert l3.call_count == 2
+        assert "timespan" in (
+            mock_api.organizations.getOrganizationConfigurationChanges.call_args.kwargs
+        )
+
+        # Past the 900s group interval: no change logged, so neither is due.
+        mock_api.organizations.getOrganizationConfigurationChanges = MagicMock(
+            return_value=[{"ts": "2026-01-01T00:00:00Z", "networkId": "N_2"}]
+        )
+        with patch(time_path, return_value=11_000.0):
+            await firewall_collector.collect_config_changes("org1")
+            for network_id in ("N_1", "N_2"):
+                await firewall_collector.collect_for_network("org1", "Org", network_id, network_id)
+
+        assert [c.args[0] for c in l3.call_args_list] == ["N_1", "N_2", "N_2"]
+        kwargs = mock_api.organizations.getOrganizationConfigurationChanges.call_args.kwargs
+        assert kwargs["t0"] == "1970-01-01T02:41:40Z"
+
+        # Past the resync interval everything is fetched again.
+        mock_api.organizations.getOrganizationConfigurationChanges = MagicMock(return_value=[])
+        with patch(time_path, return_value=11_000.0 + 21_600):
+            firewall_collector._config_changes_checked["org1"] = 11_000.0 + 21_000
+            await firewall_collector.collect_for_network("org1", "Org", "N_1", "N_1")
+        assert l3.call_count == 4
+
+    async def test_template_change_reaches_the_bound_networks(
+        self,
+        firewall_collector: MXFirewallCollector,
+        mock_api: MagicMock,
+        mock_parent: MagicMock,
+    ) -> None:
+        """A template change expires its bound networks; an unplaceable ID expires all."""
+        firewall_collector.settings.scheduler.config_change_resync_seconds = 21600
+        mock_api.organizations.getOrganizationConfigurationChanges = MagicMock(return_value=[])
+        self._set_l3_l7_responses(mock_api)
+        time_path = "meraki_dashboard_exporter.collectors.devices.mx_firewall.time.time"
+        l3 = mock_api.appliance.getNetworkApplianceFirewallL3FirewallRules
+        networks = [
+            {"id": "N_1", "configTemplateId": "L_T1"},
+            {"id": "N_2"},
+            {"id": "N_WIFI"},
+        ]
+
+        async def check_then_fetch(now: float, network_id: str) -> list[str]:
+            mock_api.organizations.getOrganizationConfigurationChanges = MagicMock(
+                return_value=[{"ts": "2026-01-01T00:00:00Z", "networkId": network_id}]
+            )
+            l3.reset_mock()
+            with patch(time_path, return_value=now):
+                firewall_collector._config_changes_checked["org1"] = now - 1_000
+                await firewall_collector.collect_config_changes("org1", networks)
+                for appliance in ("N_1", "N_2"):
+                    await firewall_collector.collect_for_network("org1", "Org", appliance, "x")
+            return [c.args[0] for c in l3.call_args_list]
+
+        with patch(time_path, return_value=10_000.0):
+            await firewall_collector.collect_config_changes("org1", networks)
+            for network_id in ("N_1", "N_2"):
+                await firewall_collector.collect_for_network("org1", "Org", network_id, "x")
+
+        assert await check_then_fetch(11_000.0, "L_T1") == ["N_1"]
+        assert await check_then_fetch(12_000.0, "N_WIFI") == []
+        assert await check_then_fetch(13_000.0, "L_UNKNOWN") == ["N_1", "N_2"]
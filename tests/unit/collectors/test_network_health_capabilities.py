@@ -0,0 +1,206 @@
+"""Tests for network-health capability pre-filtering and the negative-result cache."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from prometheus_client import REGISTRY
+
+from meraki_dashboard_exporter.collectors.network_health import NetworkHealthCollector
+from meraki_dashboard_exporter.collectors.network_health_collectors.capabilities import (
+    NetworkCapabilityCache,
+    is_unavailable_error,
+)
+from meraki_dashboard_exporter.core.scheduler import EndpointGroupName
+from tests.helpers.base import BaseCollectorTest
+from tests.helpers.factories import NetworkFactory, OrganizationFactory
+from tests.helpers.mock_api import HTTPError
+
+NOW = 1_760_000_000.0
+
+
+def _skipped(group: EndpointGroupName, reason: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "meraki_exporter_network_health_skipped_calls_total",
+            {"group": group.value, "reason": reason},
+        )
+        or 0.0
+    )
+
+
+class _AllDueScheduler:
+    """Scheduler double with every group due."""
+
+    def __init__(self) -> None:
+        self.marked: list[EndpointGroupName] = []
+
+    def should_run(self, group: EndpointGroupName, now: float | None = None) -> bool:
+        return True
+
+    def mark_ran(self, group: EndpointGroupName, now: float | None = None) -> None:
+        self.marked.append(group)
+
+    def ttl_seconds_for(self, group: EndpointGroupName) -> float:
+        return 1200.0
+
+    def interval_for(self, group: EndpointGroupName) -> float:
+        return 300.0
+
+
+class TestNetworkCapabilityCache:
+    """Known-unavailable pairs are skipped until their re-probe delay passes."""
+
+    def test_unavailable_pair_is_reprobed_after_the_delay(self) -> None:
+        """A pair stays known-unavailable for at least the base delay, then expires."""
+        cache = NetworkCapabilityCache(reprobe_seconds=3600)
+        cache.record_unavailable("N1", EndpointGroupName.NH_MESH, now=NOW)
+
+        assert cache.is_known_unavailable("N1", EndpointGroupName.NH_MESH, now=NOW + 3599)
+        assert not cache.is_known_unavailable("N2", EndpointGroupName.NH_MESH, now=NOW)
+        assert not cache.is_known_unavailable("N1", EndpointGroupName.NH_MESH, now=NOW + 4000)
+        assert len(cache) == 0
+
+    def test_available_result_clears_the_entry(self) -> None:
+        """Data from the pair drops it from the cache immediately."""
+        cache = NetworkCapabilityCache()
+        cache.record_unavailable("N1", EndpointGroupName.NH_BLUETOOTH, now=NOW)
+        cache.record_available("N1", EndpointGroupName.NH_BLUETOOTH)
+
+        assert not cache.is_known_unavailable("N1", EndpointGroupName.NH_BLUETOOTH, now=NOW)
+
+    def test_only_400_counts_as_unavailable(self) -> None:
+        """The status decides; 404s are left to the facade's negative cache."""
+        assert is_unavailable_error(HTTPError("400 Bad Request", 400))
+        assert not is_unavailable_error(HTTPError("404 Not Found", 404))
+        assert not is_unavailable_error(HTTPError("429 Too Many Requests, rate limit", 429))
+        assert not is_unavailable_error(HTTPError("500 error for network L_400", 500))
+
+
+class TestCapabilityFiltering(BaseCollectorTest):
+    """The bundle skips networks and groups that cannot return data."""
+
+    collector_class = NetworkHealthCollector
+
+    def _build(self, settings, isolated_registry, inventory, mock_api_builder):
+        org = OrganizationFactory.create(org_id="O1", name="Org")
+        api = mock_api_builder.with_organizations([org]).build()
+        inventory.api = api
+        collector = NetworkHealthCollector(
+            api=api,
+            settings=settings,
+            registry=isolated_registry,
+            inventory=inventory,
+            scheduler=_AllDueScheduler(),
+        )
+        collector.rf_health_collector.collect_org = AsyncMock(return_value=True)  # type: ignore[method-assign]
+        return collector
+
+    @staticmethod
+    def _instrument(collector) -> dict[str, list[str]]:
+        calls: dict[str, list[str]] = {}
+        for attr in (
+            "connection_stats_collector",
+            "data_rates_collector",
+            "bluetooth_collector",
+            "ssid_performance_collector",
+            "latency_stats_collector",
+            "air_marshal_collector",
+            "mesh_collector",
+        ):
+            seen = calls.setdefault(attr, [])
+
+            async def _collect(network, seen=seen):
+                seen.append(network["id"])
+
+            getattr(collector, attr).collect = _collect
+        return calls
+
+    @staticmethod
+    def _networks(*ids: str) -> list[dict[str, Any]]:
+        return [
+            dict(NetworkFactory.create(network_id=nid, product_types=["wireless"], org_id="O1"))
+            for nid in ids
+        ]
+
+    async def test_networks_without_aps_and_single_ap_mesh_are_skipped(
+        self, settings, isolated_registry, inventory, mock_api_builder
+    ):
+        """No APs skips the whole bundle; one AP skips mesh; both are counted."""
+        collector = self._build(settings, isolated_registry, inventory, mock_api_builder)
+        calls = self._instrument(collector)
+        collector.bluetooth_collector.scanning_enabled = AsyncMock(return_value=True)  # type: ignore[method-assign]
+        collector._fetch_networks_for_health = AsyncMock(return_value=self._networks("N1", "N2"))  # type: ignore[method-assign]
+        inventory.get_devices = AsyncMock(
+            return_value=[{"serial": "Q1", "networkId": "N1", "productType": "wireless"}]
+        )
+        before_no_aps = _skipped(EndpointGroupName.NH_LATENCY_STATS, "no_aps")
+        before_mesh = _skipped(EndpointGroupName.NH_MESH, "not_capable")
+
+        await collector._collect_org_network_health("O1", "Org")
+
+        assert calls["connection_stats_collector"] == ["N1"]
+        assert calls["mesh_collector"] == []
+        assert _skipped(EndpointGroupName.NH_LATENCY_STATS, "no_aps") - before_no_aps == 2.0
+        assert _skipped(EndpointGroupName.NH_MESH, "not_capable") - before_mesh == 1.0
+        assert EndpointGroupName.NH_MESH in collector.scheduler.marked
+
+    async def test_bluetooth_scanning_disabled_skips_clients_and_is_cached(
+        self, settings, isolated_registry, inventory, mock_api_builder
+    ):
+        """Scanning off skips the client call; the settings are read once per re-probe."""
+        collector = self._build(settings, isolated_registry, inventory, mock_api_builder)
+        calls = self._instrument(collector)
+        collector._fetch_networks_for_health = AsyncMock(return_value=self._networks("N1"))  # type: ignore[method-assign]
+        inventory.get_devices = AsyncMock(return_value=[])
+        collector.api.wireless.getNetworkWirelessBluetoothSettings = MagicMock(
+            return_value={"scanningEnabled": False}
+        )
+        collector.bluetooth_collector.api = collector.api
+
+        await collector._collect_org_network_health("O1", "Org")
+        await collector._collect_org_network_health("O1", "Org")
+
+        assert calls["bluetooth_collector"] == []
+        assert calls["data_rates_collector"] == ["N1", "N1"]
+        assert collector.api.wireless.getNetworkWirelessBluetoothSettings.call_count == 1
+
+    async def test_known_unavailable_pair_is_skipped_until_reprobe(
+        self, settings, isolated_registry, inventory, mock_api_builder
+    ):
+        """A group that returned 400 for a network is not called again next cycle."""
+        collector = self._build(settings, isolated_registry, inventory, mock_api_builder)
+        calls = self._instrument(collector)
+        collector.bluetooth_collector.scanning_enabled = AsyncMock(return_value=True)  # type: ignore[method-assign]
+        collector._fetch_networks_for_health = AsyncMock(return_value=self._networks("N1"))  # type: ignore[method-assign]
+        inventory.get_devices = AsyncMock(return_value=[])
+
+        collector.network_capabilities.record_unavailable("N1", EndpointGroupName.NH_DATA_RATES)
+        await collector._collect_org_network_health("O1", "Org")
+
+        assert calls["data_rates_collector"] == []
+        assert calls["connection_stats_collector"] == ["N1"]
+        assert _skipped(EndpointGroupName.NH_DATA_RATES, "known_unavailable") >= 1.0
+
+    async def test_subcollector_400_records_the_pair(
+        self, settings, isolated_registry, inventory, mock_api_builder
+    ):
+        """A 400 from the data-rates endpoint marks the pair known-unavailable; a 404 does not."""
+        collector = self._build(settings, isolated_registry, inventory, mock_api_builder)
+        network = {"id": "N1", "orgId": "O1", "name": "Net"}
+        collector.data_rates_collector._fetch_data_rate_history = AsyncMock(  # type: ignore[method-assign]
+            side_effect=HTTPError("404 Not Found", 404)
+        )
+        await collector.data_rates_collector.collect(network)
+        assert not collector.network_capabilities.is_known_unavailable(
+            "N1", EndpointGroupName.NH_DATA_RATES
+        )
+
+        collector.data_rates_collector._fetch_data_rate_history = AsyncMock(  # type: ignore[method-assign]
+            side_effect=HTTPError("400 Bad Request", 400)
+        )
+        await collector.data_rates_collector.collect(network)
+        assert collector.network_capabilities.is_known_unavailable(
+            "N1", EndpointGroupName.NH_DATA_RATES
+        )
@@ -106,13 +106,12 @@ async def test_mr_cpu_load_acquires_exactly_once_no_double() -> None:
 
 
 async def test_mt_get_org_name_fallback_acquires() -> None:
-    """MT _get_org_name direct fallback throttles when inventory has no match."""
+    """MT _get_org_name direct fallback throttles (and counts as a bypass) without inventory."""
     parent = MagicMock()
     parent.api = MagicMock()
     parent.api.organizations.getOrganization = MagicMock(return_value={"name": "OrgName"})
     parent.settings = MagicMock()
-    parent.inventory = MagicMock()
-    parent.inventory.get_organizations = AsyncMock(return_value=[])  # no cache match
+    parent.inventory = None
     parent.rate_limiter = _limiter()
     collector = MTCollector(parent)
 
@@ -120,6 +119,9 @@ async def test_mt_get_org_name_fallback_acquires() -> None:
 
     assert name == "OrgName"
     parent.rate_limiter.acquire.assert_awaited_once_with("123456", "getOrganization")
+    parent._track_inventory_bypass.assert_called_once_with(
+        "getOrganization", collector="MTCollector"
+    )
 
 
 async def test_mt_get_org_name_standalone_no_limiter() -> None:
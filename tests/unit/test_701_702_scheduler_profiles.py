@@ -248,7 +248,7 @@ async def test_discovery_uses_the_collector_manager_rate_limiter(
     monkeypatch.setenv("MERAKI_EXPORTER_MERAKI__ORG_ID", "123456")
     exporter = ExporterApp(Settings())
     exporter.collector_manager.collect_initial = AsyncMock()  # type: ignore[method-assign]
-    exporter._collector_loop = AsyncMock()  # type: ignore[method-assign]
+    exporter._dispatch_loop = AsyncMock()  # type: ignore[method-assign]
     exporter._scheduler_resolve_loop = AsyncMock()  # type: ignore[method-assign]
     exporter._wait_for_first_collection = AsyncMock()  # type: ignore[method-assign]
     discovery = MagicMock(run_discovery=AsyncMock(return_value={}))
@@ -10,9 +10,9 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from meraki_dashboard_exporter.app import ExporterApp
 from meraki_dashboard_exporter.collectors.clients import ClientsCollector
 from meraki_dashboard_exporter.core.api_models import NetworkClient
+from meraki_dashboard_exporter.core.dispatcher import CollectionDispatcher
 from meraki_dashboard_exporter.core.scheduler import EndpointGroupName, EndpointScheduler, OrgShape
 
 
@@ -110,36 +110,31 @@ def test_703_default_client_groups_sleep_until_clients_list_is_due() -> None:
 
 
 @pytest.mark.asyncio
-async def test_703_outer_loop_uses_the_client_due_interval_not_one_second_floor() -> None:
-    """The production outer loop sleeps 270s after default client local work succeeds."""
+async def test_703_dispatcher_uses_the_client_due_interval_not_one_second_floor() -> None:
+    """The dispatcher re-queues clients 270s out after default client local work succeeds."""
     settings = _settings(signal_quality_enabled=False)
     scheduler = EndpointScheduler(settings, _Limiter())  # type: ignore[arg-type]
     collector = _collector(settings)
     scheduler.register_groups(collector.get_endpoint_groups())
     scheduler.resolve(_shape(wireless_networks=1))
 
-    exporter = object.__new__(ExporterApp)
-    exporter._shutdown_event = asyncio.Event()
-    exporter.settings = settings  # type: ignore[assignment]
-    waits: list[float] = []
-
     async def run_once(_: object) -> None:
         now = time.monotonic()
         scheduler.mark_ran(EndpointGroupName.CLIENTS_LIST, now=now)
         scheduler.mark_ran(EndpointGroupName.CLIENTS_APP_USAGE, now=now)
 
-    async def sleep(seconds: float) -> None:
-        waits.append(seconds)
-        exporter._shutdown_event.set()
-
-    exporter.collector_manager = SimpleNamespace(  # type: ignore[assignment]
-        scheduler=scheduler, run_collector_once=run_once
+    dispatcher = CollectionDispatcher(
+        SimpleNamespace(scheduler=scheduler, run_collector_once=run_once),  # type: ignore[arg-type]
+        max_concurrency=1,
+        resolve_cap_seconds=3600.0,
     )
-    exporter._interruptible_sleep = sleep  # type: ignore[method-assign]
-
-    await exporter._collector_loop(collector, initial_run_completed=False)
+    dispatcher.add(collector)
+    started = time.monotonic()
+    dispatcher._dispatch_due(started)
+    await asyncio.gather(*dispatcher._running.values())
 
-    assert waits == [pytest.approx(270.0)]
+    name = type(collector).__name__
+    assert dispatcher._due[name] - started == pytest.approx(270.0, abs=1.0)
 
 
 @pytest.mark.asyncio
@@ -422,10 +422,19 @@ class TestAlertsCollector(BaseCollectorTest):
             return_value={"id": "456", "name": "Test Org"}
         )
         collector.api = api
+        bypass_labels = {"collector": "AlertsCollector", "endpoint": "getOrganization"}
+        before = isolated_registry.get_sample_value(
+            "meraki_exporter_collector_inventory_bypass_total", bypass_labels
+        )
 
         result = await collector._fetch_organizations_direct()
 
         assert result == [{"id": "456", "name": "Test Org"}]
+        # The direct fallback is counted as an inventory bypass for this collector.
+        after = isolated_registry.get_sample_value(
+            "meraki_exporter_collector_inventory_bypass_total", bypass_labels
+        )
+        assert (after or 0) - (before or 0) == 1
 
     async def test_collect_handles_missing_network_data(self, collector, mock_api_builder, metrics):
         """Test handling of alerts with missing network data."""
@@ -0,0 +1,168 @@
+"""Tests for opt-in request hedging in the API facade."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from prometheus_client import CollectorRegistry, Counter
+
+from meraki_dashboard_exporter.core import api_facade
+from meraki_dashboard_exporter.core.api_facade import MerakiApiFacade
+from meraki_dashboard_exporter.core.concurrency_limiter import AdaptiveConcurrencyLimiter
+
+HEDGED_OP = "getOrganizationDevicesAvailabilities"
+
+
+@pytest.fixture(autouse=True)
+def hedged_total(monkeypatch: pytest.MonkeyPatch) -> Iterator[Counter]:
+    """Fresh hedge state and an isolated hedge counter per test."""
+    counter = Counter("test_hedged", "test", ["operation", "result"], registry=CollectorRegistry())
+    monkeypatch.setattr(MerakiApiFacade, "_hedged_total", counter)
+    monkeypatch.setattr(api_facade, "_hedges", api_facade._HedgeTracker())
+    yield counter
+
+
+def _settings(**overrides: object) -> SimpleNamespace:
+    values: dict[str, object] = {
+        "max_retries": 0,
+        "per_fetch_deadline_seconds": 5,
+        "hedge_enabled": True,
+        "hedge_operations": [HEDGED_OP],
+        "hedge_budget_fraction": 0.5,
+        "hedge_min_delay_seconds": 0.05,
+    }
+    values.update(overrides)
+    return SimpleNamespace(api=SimpleNamespace(**values))
+
+
+def _slow_first_call() -> tuple[threading.Event, list[int], object]:
+    """SDK stub whose first call blocks until released; later calls return at once."""
+    release = threading.Event()
+    calls: list[int] = []
+
+    def request(org_id: str) -> list[dict[str, int]]:
+        calls.append(len(calls))
+        attempt = len(calls)
+        if attempt == 1:
+            release.wait(timeout=5)
+        return [{"attempt": attempt}]
+
+    return release, calls, request
+
+
+def _count(counter: Counter, result: str) -> float:
+    return counter.labels(operation=HEDGED_OP, result=result)._value.get()
+
+
+async def test_hedge_wins_when_the_primary_is_slow(hedged_total: Counter) -> None:
+    """A call still running after the hedge delay gets a second, rate-limited attempt."""
+    limiter = SimpleNamespace(acquire=AsyncMock(return_value=0.0))
+    facade = MerakiApiFacade(settings=_settings(), rate_limiter=limiter)
+    release, calls, request = _slow_first_call()
+
+    try:
+        result = await facade.call(HEDGED_OP, request, "123")
+    finally:
+        release.set()
+
+    assert result == [{"attempt": 2}]
+    assert len(calls) == 2
+    # One token for the original request and one charged for the hedge.
+    assert limiter.acquire.await_count == 2
+    assert _count(hedged_total, "won") == 1
+
+
+@pytest.mark.parametrize(
+    ("operation", "overrides"),
+    [
+        (HEDGED_OP, {"hedge_enabled": False}),
+        ("getOrganizationNetworks", {}),
+    ],
+)
+async def test_no_hedge_when_disabled_or_unlisted(
+    operation: str, overrides: dict[str, object], hedged_total: Counter
+) -> None:
+    """Hedging is opt-in and limited to the configured operations."""
+    facade = MerakiApiFacade(settings=_settings(**overrides))
+    release, calls, request = _slow_first_call()
+    threading.Timer(0.2, release.set).start()
+
+    assert await facade.call(operation, request, "123") == [{"attempt": 1}]
+    assert len(calls) == 1
+
+
+async def test_budget_cap_skips_the_hedge(hedged_total: Counter) -> None:
+    """Once hedges reach the budget fraction of calls, slow calls are not hedged."""
+    facade = MerakiApiFacade(settings=_settings(hedge_budget_fraction=0.01))
+    api_facade._hedges._hedges = 1.0
+    release, calls, request = _slow_first_call()
+    threading.Timer(0.2, release.set).start()
+
+    assert await facade.call(HEDGED_OP, request, "123") == [{"attempt": 1}]
+    assert len(calls) == 1
+    assert _count(hedged_total, "skipped_budget") == 1
+
+
+async def test_hedge_takes_its_own_concurrency_slot(hedged_total: Counter) -> None:
+    """Primary and hedge each hold a slot, so the limiter sees both requests."""
+    concurrency = AdaptiveConcurrencyLimiter(initial_limit=4, min_limit=1, max_limit=4)
+    inflight: list[int] = []
+
+    async def acquire(*_args: object) -> float:
+        inflight.append(concurrency.inflight)
+        return 0.0
+
+    limiter = SimpleNamespace(acquire=acquire, concurrency_limiter=concurrency)
+    facade = MerakiApiFacade(settings=_settings(), rate_limiter=limiter)
+    release, _calls, request = _slow_first_call()
+
+    try:
+        assert await facade.call(HEDGED_OP, request, "123") == [{"attempt": 2}]
+        # The hedge queued for its token while the primary held one slot, and
+        # the abandoned primary keeps its slot until its thread returns.
+        assert inflight == [0, 1]
+        assert concurrency.inflight == 1
+    finally:
+        release.set()
+
+
+async def test_no_budget_spent_when_the_primary_finishes_during_the_token_wait(
+    hedged_total: Counter,
+) -> None:
+    """A primary that completes while the hedge waits for a token sends no hedge."""
+    release, calls, request = _slow_first_call()
+
+    async def acquire(*_args: object) -> float:
+        if limiter.acquire_calls:
+            release.set()
+            await asyncio.sleep(0.05)
+        limiter.acquire_calls += 1
+        return 0.0
+
+    limiter = SimpleNamespace(acquire=acquire, acquire_calls=0)
+    facade = MerakiApiFacade(settings=_settings(), rate_limiter=limiter)
+
+    assert await facade.call(HEDGED_OP, request, "123") == [{"attempt": 1}]
+    assert len(calls) == 1
+    assert api_facade._hedges._hedges == 0
+    assert _count(hedged_total, "won") + _count(hedged_total, "lost") == 0
+
+
+def test_hedge_delay_follows_the_operation_p95() -> None:
+    """With enough samples the observed p95 replaces the minimum delay."""
+    tracker = api_facade._HedgeTracker()
+    settings = _settings(hedge_min_delay_seconds=0.5)
+    assert tracker.delay_for(HEDGED_OP, settings) == 0.5
+
+    for index in range(100):
+        tracker.observe(HEDGED_OP, float(index + 1) / 10)
+
+    assert tracker.delay_for(HEDGED_OP, settings) == pytest.approx(9.5)
+    assert tracker.delay_for("createNetwork", settings) is None
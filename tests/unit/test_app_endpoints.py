@@ -955,7 +955,7 @@ class TestStartupDiscoveryOffCriticalPath:
         # #631: _startup_collections now spawns one group-clocked loop per
         # collector plus the scheduler resolve loop — stub them so the test
         # exercises only discovery + initial collection ordering.
-        exporter._collector_loop = AsyncMock()  # type: ignore[method-assign]
+        exporter._dispatch_loop = AsyncMock()  # type: ignore[method-assign]
         exporter._scheduler_resolve_loop = AsyncMock()  # type: ignore[method-assign]
         exporter._wait_for_first_collection = AsyncMock()  # type: ignore[method-assign]
 
@@ -988,7 +988,7 @@ class TestStartupDiscoveryOffCriticalPath:
 
         exporter.collector_manager.collect_initial = AsyncMock()  # type: ignore[method-assign]
         exporter.collector_manager.validate_profile_selection = AsyncMock()  # type: ignore[method-assign]
-        exporter._collector_loop = AsyncMock()  # type: ignore[method-assign]
+        exporter._dispatch_loop = AsyncMock()  # type: ignore[method-assign]
         exporter._scheduler_resolve_loop = AsyncMock()  # type: ignore[method-assign]
         exporter._wait_for_first_collection = AsyncMock()  # type: ignore[method-assign]
         exporter._cardinality_monitor_loop = AsyncMock()  # type: ignore[method-assign]
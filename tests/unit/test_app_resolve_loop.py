@@ -172,7 +172,7 @@ class TestStartupWiresResolveLoop:
         """After startup a running _scheduler_resolve_loop task is tracked."""
         exporter = ExporterApp(test_settings)
         exporter.collector_manager.collect_initial = AsyncMock()  # type: ignore[method-assign]
-        exporter._collector_loop = AsyncMock()  # type: ignore[method-assign]
+        exporter._dispatch_loop = AsyncMock()  # type: ignore[method-assign]
         exporter._wait_for_first_collection = AsyncMock()  # type: ignore[method-assign]
 
         started = asyncio.Event()
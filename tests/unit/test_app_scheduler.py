@@ -2,10 +2,10 @@
 
 Covers the per-collector, group-clocked scheduler surface (#631):
 
-* ``_collector_loop`` happy path and its behavior when ``run_collector_once``
+* ``_dispatch_loop`` happy path and its behavior when ``run_collector_once``
   raises (logged and swallowed, no failure-count kill switch — see #528).
 * ``_startup_collections`` sequencing and background-task bookkeeping (one
-  ``_collector_loop`` task per collector, tracked in ``_collector_tasks``).
+  ``_dispatch_loop`` task driving every collector, kept in ``_dispatch_task``).
 * ``_wait_for_first_collection`` gating.
 * F-044: the ``_wait_for_first_collection`` task is tracked in
   ``_background_tasks`` and therefore cancelled on lifespan shutdown.
@@ -53,53 +53,49 @@ def _fake_collector(name: str = "FakeCollector", phase_offset: float = 0.0) -> A
 
 
 # ---------------------------------------------------------------------------
-# _collector_loop
+# _dispatch_loop
 # ---------------------------------------------------------------------------
 
 
-class TestCollectorLoop:
-    """Tests for ExporterApp._collector_loop()."""
+class TestDispatchLoop:
+    """Tests for ExporterApp._dispatch_loop()."""
 
     async def test_loop_runs_then_exits_on_shutdown(self, test_settings: Settings) -> None:
-        """The loop runs the collector and exits cleanly when shutdown is set."""
+        """The dispatcher runs each collector and exits cleanly when shutdown is set."""
         exporter = ExporterApp(test_settings)
-        exporter._interruptible_sleep = AsyncMock()  # type: ignore[method-assign]
-        collector = _fake_collector()
+        exporter.collector_manager.collectors = [_fake_collector()]
 
         calls = 0
 
         async def run_once(coll: Any, *, force: bool = False) -> None:
             nonlocal calls
             calls += 1
-            # Stop after the second successful cycle.
-            if calls >= 2:
-                exporter._shutdown_event.set()
+            exporter._shutdown_event.set()
 
         exporter.collector_manager.run_collector_once = run_once  # type: ignore[method-assign]
 
         await asyncio.wait_for(
-            exporter._collector_loop(collector, initial_run_completed=False),
+            exporter._dispatch_loop(initial_run_completed=False),
             timeout=5.0,
         )
-        assert calls >= 1
+        assert calls == 1
+        assert exporter._dispatcher is not None
 
     async def test_run_failure_is_logged_and_loop_continues(self, test_settings: Settings) -> None:
-        """A run_collector_once exception is swallowed (logged); the loop keeps running (#528).
+        """A run_collector_once exception is swallowed (logged); dispatch keeps going (#528).
 
         run_collector_once already swallows per-org/per-collector failures at its own
-        boundary (#509), so an exception reaching this loop is unexpected and never
-        accumulates a streak. Honest health signals live in /ready + failure_streak.
+        boundary (#509), so an exception reaching the dispatcher is unexpected and
+        never accumulates a streak. Honest health signals live in /ready + failure_streak.
         """
         exporter = ExporterApp(test_settings)
-        exporter._interruptible_sleep = AsyncMock()  # type: ignore[method-assign]
-        collector = _fake_collector()
+        exporter.collector_manager.collectors = [_fake_collector("A"), _fake_collector("B")]
 
-        calls = 0
+        ran: list[str] = []
 
         async def run_once(coll: Any, *, force: bool = False) -> None:
-            nonlocal calls
-            calls += 1
-            if calls >= 3:
+            ran.append(coll.__class__.__name__)
+            if len(ran) >= 2:
                 exporter._shutdown_event.set()
             raise RuntimeError("boom")
 
@@ -108,10 +104,10 @@ class TestCollectorLoop:
         # Should NOT raise even though every run fails - there is no failure-count
         # threshold left to trip.
         await asyncio.wait_for(
-            exporter._collector_loop(collector, initial_run_completed=False),
+            exporter._dispatch_loop(initial_run_completed=False),
             timeout=5.0,
         )
-        assert calls >= 3
+        assert sorted(ran) == ["A", "B"]
         assert exporter._shutdown_event.is_set()
 
     async def test_shutdown_before_first_run_skips_collection(
@@ -119,13 +115,13 @@ class TestCollectorLoop:
     ) -> None:
         """A shutdown set before entry (with a phase offset) exits before any run."""
         exporter = ExporterApp(test_settings)
-        collector = _fake_collector(phase_offset=100.0)
+        exporter.collector_manager.collectors = [_fake_collector(phase_offset=100.0)]
         run_mock = AsyncMock()
         exporter.collector_manager.run_collector_once = run_mock  # type: ignore[method-assign]
         exporter._shutdown_event.set()
 
         await asyncio.wait_for(
-            exporter._collector_loop(collector, initial_run_completed=True),
+            exporter._dispatch_loop(initial_run_completed=True),
             timeout=5.0,
         )
         run_mock.assert_not_awaited()
@@ -171,7 +167,7 @@ class TestWaitForFirstCollection:
 def _stub_startup(exporter: ExporterApp) -> None:
     """Stub the heavy pieces so _startup_collections runs fast."""
     exporter.collector_manager.collect_initial = AsyncMock()  # type: ignore[method-assign]
-    exporter._collector_loop = AsyncMock()  # type: ignore[method-assign]
+    exporter._dispatch_loop = AsyncMock()  # type: ignore[method-assign]
     # #617: the adaptive scheduler resolve loop is a long-running background
     # task; stub it here so startup-sequencing tests don't spin the real loop
     # (which would poll inventory/API forever and never drain).
@@ -182,7 +178,7 @@ class TestStartupCollections:
     """Tests for ExporterApp._startup_collections()."""
 
     async def test_runs_discovery_then_initial_collection(self, test_settings: Settings) -> None:
-        """Discovery runs, then the initial sequential collection completes."""
+        """Discovery runs, then the initial collection completes."""
         exporter = ExporterApp(test_settings)
         _stub_startup(exporter)
         exporter.collector_manager.validate_profile_selection = AsyncMock()  # type: ignore[method-assign]
@@ -198,9 +194,10 @@ class TestStartupCollections:
 
         exporter.collector_manager.collect_initial.assert_awaited_once()
         assert exporter._first_collection_complete is True
-        # One group-clocked loop task per instantiated collector.
-        assert exporter._collector_tasks
-        assert len(exporter._collector_tasks) == len(exporter.collector_manager.collectors)
+        # A single dispatcher task drives every instantiated collector.
+        assert exporter._dispatch_task is not None
+        await exporter._dispatch_task
+        exporter._dispatch_loop.assert_awaited_once_with(initial_run_completed=True)  # type: ignore[attr-defined]
 
     async def test_reraises_startup_configuration_error(self, test_settings: Settings) -> None:
         """Deterministic configuration faults abort startup rather than starting loops."""
@@ -219,7 +216,7 @@ class TestStartupCollections:
             with pytest.raises(StartupConfigurationError, match="fix configuration"):
                 await exporter._startup_collections()
 
-        assert not exporter._collector_tasks
+        assert exporter._dispatch_task is None
 
     async def test_transient_inventory_failure_is_swallowed_and_starts_loops(
         self, test_settings: Settings
@@ -239,7 +236,7 @@ class TestStartupCollections:
         ):
             await exporter._startup_collections()
 
-        assert exporter._collector_tasks
+        assert exporter._dispatch_task is not None
 
     async def test_wait_task_is_tracked_in_background_tasks(self, test_settings: Settings) -> None:
         """F-044: the _wait_for_first_collection task is tracked, not discarded."""
@@ -254,6 +254,110 @@ class TestProcessInBatchesWithErrors:
         assert results[2] == (3, "processed_3")
 
 
+class TestStreamingMode:
+    """Test the sliding-window (streaming) mode of process_in_batches_with_errors."""
+
+    async def test_slow_item_does_not_stall_other_slots(self):
+        """A slot is refilled as soon as any item completes, not at a batch barrier."""
+        release_slow = asyncio.Event()
+        order: list[int] = []
+
+        async def process_item(item: int) -> int:
+            if item == 0:
+                await release_slow.wait()
+            order.append(item)
+            if len(order) == 5:
+                release_slow.set()
+            return item * 2
+
+        results = await asyncio.wait_for(
+            process_in_batches_with_errors(
+                list(range(6)),
+                process_item,
+                batch_size=2,
+                delay_between_batches=0,
+                streaming=True,
+            ),
+            timeout=2.0,
+        )
+
+        # Items 1-5 all finished through the second slot while item 0 was blocked.
+        assert order == [1, 2, 3, 4, 5, 0]
+        assert results == [(i, i * 2) for i in range(6)]
+
+    async def test_concurrency_never_exceeds_slots(self):
+        """At most batch_size items are in flight at once."""
+        in_flight = 0
+        peak = 0
+
+        async def process_item(item: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001 * (item % 3))
+            in_flight -= 1
+            return item
+
+        results = await process_in_batches_with_errors(
+            list(range(20)), process_item, batch_size=4, delay_between_batches=0, streaming=True
+        )
+
+        assert peak == 4
+        assert [item for item, _ in results] == list(range(20))
+
+    async def test_starts_are_paced_by_tokens(self, monkeypatch):
+        """Starts after the first window wait for one pacing token each."""
+        sleeps: list[float] = []
+        clock = [0.0]
+
+        async def fake_sleep(seconds: float) -> None:
+            sleeps.append(round(seconds, 6))
+            clock[0] += seconds
+
+        monkeypatch.setattr(
+            "meraki_dashboard_exporter.core.batch_processing.asyncio.sleep", fake_sleep
+        )
+        monkeypatch.setattr(
+            "meraki_dashboard_exporter.core.batch_processing.time.monotonic", lambda: clock[0]
+        )
+
+        async def process_item(item: int) -> int:
+            return item
+
+        await process_in_batches_with_errors(
+            list(range(5)), process_item, batch_size=2, delay_between_batches=1.0, streaming=True
+        )
+
+        # 2 tokens per 1s batch spacing: items 2, 3, 4 start 0.5s apart.
+        assert sleeps == [0.5, 0.5, 0.5]
+
+    async def test_errors_and_base_exceptions_match_batched_contract(self):
+        """Exceptions are returned and reported; other BaseExceptions are dropped."""
+
+        class CustomBaseException(BaseException):
+            pass
+
+        errors: list[Exception] = []
+
+        async def process_item(item: int) -> str:
+            if item == 1:
+                raise CustomBaseException("Not an Exception")
+            if item == 2:
+                raise ValueError("Regular exception")
+            return f"processed_{item}"
+
+        results = await process_in_batches_with_errors(
+            [0, 1, 2, 3], process_item, batch_size=2, on_error=errors.append, streaming=True
+        )
+
+        assert results[0] == (0, "processed_0")
+        assert results[1][0] == 2
+        assert isinstance(results[1][1], ValueError)
+        assert results[2] == (3, "processed_3")
+        assert len(results) == 3
+        assert len(errors) == 1
+
+
 class TestProcessGroupedItems:
     """Test process_grouped_items functionality."""
 
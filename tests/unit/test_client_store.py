@@ -93,7 +93,7 @@ def test_update_clients_per_network_log_is_debug(store, force_debug_log_capture)
 
 
 def test_global_cap_blocks_new_clients_but_updates_existing(store):
-    """#533: a global cap on stored clients blocks NEW clients once reached.
+    """#533: under the ``refuse`` policy a full store blocks NEW clients.
 
     Updates to already-stored clients must still proceed even when the global
     cap is reached, and a warning must be logged when new clients are skipped.
@@ -101,6 +101,7 @@ def test_global_cap_blocks_new_clients_but_updates_existing(store):
 
     store.settings.clients.max_clients_total = 2
     store.max_clients_total = 2
+    store.eviction_policy = "refuse"
 
     c1 = _make_client("c1", "10.0.0.1")
     c2 = _make_client("c2", "10.0.0.2")
@@ -129,6 +130,92 @@ def test_global_cap_blocks_new_clients_but_updates_existing(store):
     assert retrieved.status == "Offline"
 
 
+def _fill(store, network_id: str, count: int, prefix: str) -> None:
+    """Apply one poll of ``count`` fresh clients to ``network_id``."""
+    clients = [_make_client(f"{prefix}{i:02d}", f"10.0.0.{i}") for i in range(count)]
+    store.update_clients(network_id, clients, network_name=network_id, org_id="O1")
+
+
+def test_lru_policy_evicts_least_recently_seen_across_networks(store):
+    """A full store admits new clients by evicting the least recently seen ones."""
+    store.max_clients_total = 4
+    store.eviction_policy = "lru"
+
+    _fill(store, "N_A", 2, "a")
+    _fill(store, "N_B", 2, "b")
+    # N_A is polled again and reports only a00: a01 is now the oldest entry.
+    store.update_clients("N_A", [_make_client("a00", "10.0.0.0")])
+
+    _fill(store, "N_C", 2, "c")
+
+    assert store.get_client("N_A", "a01") is None
+    assert store.get_client("N_B", "b00") is None
+    assert store.get_client("N_A", "a00") is not None
+    assert store.get_client("N_B", "b01") is not None
+    assert {c.id for c in store.get_network_clients("N_C")} == {"c00", "c01"}
+    stats = store.get_statistics()
+    assert stats["total_clients"] == 4
+    assert stats["evictions"]["lru"] == 2
+    assert stats["rejected_new_clients"] == 0
+
+
+def test_lru_policy_never_evicts_clients_from_the_same_poll(store):
+    """A single poll larger than the cap cannot churn its own clients."""
+    store.max_clients_total = 3
+    store.eviction_policy = "lru"
+
+    _fill(store, "N_A", 5, "a")
+
+    assert [c.id for c in store.get_network_clients("N_A")] == ["a00", "a01", "a02"]
+    stats = store.get_statistics()
+    assert stats["evictions"]["lru"] == 0
+    assert stats["rejected_new_clients"] == 2
+
+
+def test_fair_share_policy_evicts_from_the_largest_network(store):
+    """``fair_share`` takes room from the network furthest over its share."""
+    store.max_clients_total = 6
+    store.eviction_policy = "fair_share"
+
+    _fill(store, "N_BIG", 5, "g")
+    _fill(store, "N_SMALL", 1, "s")
+    # Three networks share a cap of 6: N_NEW may claim up to 2 clients, taken
+    # from N_BIG's least recently seen clients rather than from N_SMALL.
+    _fill(store, "N_NEW", 3, "n")
+
+    assert [c.id for c in store.get_network_clients("N_NEW")] == ["n00", "n01"]
+    assert len(store.get_network_clients("N_SMALL")) == 1
+    assert [c.id for c in store.get_network_clients("N_BIG")] == ["g02", "g03", "g04"]
+    stats = store.get_statistics()
+    assert stats["evictions"]["fair_share"] == 2
+    assert stats["rejected_new_clients"] == 1
+
+
+def test_fair_share_policy_recycles_own_clients_once_at_share(store):
+    """A network at its share only replaces its own least recently seen clients."""
+    store.max_clients_total = 4
+    store.eviction_policy = "fair_share"
+
+    _fill(store, "N_A", 2, "a")
+    _fill(store, "N_B", 2, "b")
+    store.update_clients("N_A", [_make_client("a09", "10.0.0.9")])
+
+    assert {c.id for c in store.get_network_clients("N_A")} == {"a01", "a09"}
+    assert len(store.get_network_clients("N_B")) == 2
+
+
+def test_stale_network_cleanup_counts_evictions(store):
+    """Stale-network cleanup keeps the recency index and eviction counters in step."""
+    _fill(store, "N1", 3, "c")
+    store._last_update["N1"] = time.time() - store.cache_ttl - 1
+
+    assert store.cleanup_stale_networks() == 1
+    stats = store.get_statistics()
+    assert stats["total_clients"] == 0
+    assert stats["evictions"]["stale_network"] == 3
+    assert not store._recency
+
+
 def test_get_statistics(store):
     """Check that statistics reporting aggregates correctly."""
 
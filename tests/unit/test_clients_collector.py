@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock, patch
+from urllib.parse import quote
 
 import pytest
 from structlog.testing import capture_logs
@@ -700,6 +701,49 @@ class TestClientsCollector(BaseCollectorTest):
             "123", "getNetworkWirelessSignalQualityHistory"
         )
 
+    async def test_signal_quality_cap_rotates_through_all_clients(
+        self, collector, mock_api_builder, metrics
+    ):
+        """Over the cap, successive runs query different clients until all were covered."""
+        collector.settings.clients.signal_quality_enabled = True
+
+        org = OrganizationFactory.create(org_id="123", name="Test Org")
+        network = NetworkFactory.create(network_id="N_123", name="Test Network", org_id=org["id"])
+        clients = [
+            ClientFactory.create(
+                client_id=f"c{i}",
+                mac=f"aa:bb:cc:dd:ee:{i:02d}",
+                recentDeviceConnection="Wireless",
+                ssid="Corporate",
+            )
+            for i in range(5)
+        ]
+        api = (
+            mock_api_builder
+            .with_organizations([org])
+            .with_networks([network], org_id=org["id"])
+            .with_custom_response("getNetworkClients", clients)
+            .build()
+        )
+        api.wireless.getNetworkWirelessSignalQualityHistory = MagicMock(
+            return_value=[{"rssi": -50, "snr": 40}]
+        )
+        self._update_collector_api(collector, api)
+        collector.settings.api.client_signal_quality_max_clients = 2
+
+        queried: set[str] = set()
+        for _ in range(3):
+            collector._last_signal_quality_by_network.clear()
+            api.wireless.getNetworkWirelessSignalQualityHistory.reset_mock()
+            with patch.object(collector.dns_resolver, "resolve_multiple") as mock_resolve:
+                mock_resolve.return_value = {}
+                await self.run_collector(collector)
+            calls = api.wireless.getNetworkWirelessSignalQualityHistory.call_args_list
+            assert len(calls) <= 2
+            queried.update(call.kwargs["clientId"] for call in calls)
+
+        assert queried == {f"c{i}" for i in range(5)}
+
     async def test_signal_quality_interval_gates_repeat_collection(
         self, collector, mock_api_builder, metrics
     ):
@@ -787,8 +831,8 @@ class TestClientsCollector(BaseCollectorTest):
         org = OrganizationFactory.create(org_id="123", name="Test Org")
         network = NetworkFactory.create(network_id="N_123", name="Test Network", org_id=org["id"])
 
-        # Create 2500 clients to test batching (batch size is 100, per #525 -- capped
-        # to avoid HTTP 414 URL-too-long risk from a 1000-client-ID query string)
+        # Create 2500 clients to test batching (packed up to the encoded URI budget,
+        # per #525, to avoid HTTP 414 URL-too-long from a long client-ID query string)
         clients = [ClientFactory.create(client_id=f"c{i}") for i in range(2500)]
 
         # Create application usage data for all clients
@@ -828,8 +872,9 @@ class TestClientsCollector(BaseCollectorTest):
             # Run collection
             await self.run_collector(collector)
 
-        # Verify batching worked correctly (2500 clients / 100 per batch = 25 calls)
-        assert call_count == 25
+        # 2500 short IDs encode to ~18.9k characters: five requests instead of
+        # the 25 a fixed 100-ID batch needed.
+        assert call_count == 5
 
         # Verify some metrics were set
         metrics.assert_gauge_value(
@@ -842,25 +887,26 @@ class TestClientsCollector(BaseCollectorTest):
             type="test_app",
         )
 
-    async def test_application_usage_batches_over_100_clients(
+    async def test_application_usage_batches_within_uri_budget(
         self, collector, mock_api_builder, metrics
     ):
-        """#525: client-ID batches must be capped well below 1000 (414 risk).
+        """#525: client-ID batches must stay within the encoded URI budget (414 risk).
 
-        150 clients must be split into multiple `getNetworkClientsApplicationUsage`
-        calls, each carrying no more than 100 client IDs.
+        1500 clients must be split into multiple `getNetworkClientsApplicationUsage`
+        calls, each carrying at most 1000 client IDs and at most
+        4000 characters of encoded `clients` parameter.
         """
         org = OrganizationFactory.create(org_id="123", name="Test Org")
         network = NetworkFactory.create(network_id="N_123", name="Test Network", org_id=org["id"])
 
-        clients = [ClientFactory.create(client_id=f"c{i}") for i in range(150)]
+        clients = [ClientFactory.create(client_id=f"c{i}") for i in range(1500)]
 
         app_usage_data = [
             {
                 "clientId": f"c{i}",
                 "applicationUsage": [{"application": "Test App", "received": 10, "sent": 20}],
             }
-            for i in range(150)
+            for i in range(1500)
         ]
 
         api = (
@@ -885,21 +931,22 @@ class TestClientsCollector(BaseCollectorTest):
             mock_resolve.return_value = {}
             await self.run_collector(collector)
 
-        # 150 clients must be split into more than one request.
+        # 1500 clients must be split into more than one request.
         assert len(call_batches) > 1
-        # Each individual batch must stay well below the old 1000-ID limit.
+        # Each individual batch must stay within the ID cap and the URI budget.
         for batch in call_batches:
-            assert len(batch) <= 100
+            assert len(batch) <= 1000
+            assert len(quote(",".join(batch), safe="")) <= 4000
         # All client IDs must be covered exactly once across the batches.
         assert sorted(cid for batch in call_batches for cid in batch) == sorted(
-            f"c{i}" for i in range(150)
+            f"c{i}" for i in range(1500)
         )
 
         metrics.assert_gauge_value(
             "meraki_client_application_usage_sent_bytes", 20000, client_id="c0", type="test_app"
         )
         metrics.assert_gauge_value(
-            "meraki_client_application_usage_sent_bytes", 20000, client_id="c149", type="test_app"
+            "meraki_client_application_usage_sent_bytes", 20000, client_id="c1499", type="test_app"
         )
 
     async def test_numeric_client_series_are_id_only(self, collector, mock_api_builder, metrics):
@@ -11,6 +11,8 @@ Covers:
 - The existing per-network ``app_usage`` / ``signal_quality`` interval gates read
   their interval from ``_group_interval(GROUP)`` (the scheduler), not the raw
   legacy setting.
+- ``clients_app_usage`` runs on its own group gate from the client store, so it
+  neither needs nor triggers a ``getNetworkClients`` fetch.
 """
 
 from __future__ import annotations
@@ -271,6 +273,81 @@ class TestClientsAppUsageIntervalSource(BaseCollectorTest):
         collector.api.networks.getNetworkClientsApplicationUsage.assert_called()
 
 
+class TestClientsAppUsageDecoupledFromList(BaseCollectorTest):
+    """clients_app_usage runs on its own group gate, reading the client store."""
+
+    collector_class = ClientsCollector
+
+    def _build(self, mock_api_builder, settings, isolated_registry, inventory, due):
+        """Build an enabled ClientsCollector whose scheduler admits only ``due`` groups."""
+        settings.clients.enabled = True
+        org = OrganizationFactory.create(org_id="123", name="Org")
+        net = NetworkFactory.create(network_id="N_123", name="Net", org_id="123")
+        clients = [ClientFactory.create(client_id="c1", mac="aa:bb:cc:dd:ee:01")]
+        api = (
+            mock_api_builder
+            .with_organizations([org])
+            .with_networks([net], org_id="123")
+            .with_custom_response("getNetworkClients", clients)
+            .with_custom_response("getNetworkClientsApplicationUsage", [])
+            .build()
+        )
+        inventory.api = api
+
+        sched = MagicMock()
+        sched.should_run.side_effect = lambda g, *a, **k: g in due
+        sched.ttl_seconds_for.return_value = 600.0
+        sched.interval_for.return_value = 0.0
+
+        collector = ClientsCollector(
+            api=api,
+            settings=settings,
+            registry=isolated_registry,
+            inventory=inventory,
+            scheduler=sched,
+        )
+        collector.api_helper.api = api
+        return collector
+
+    async def test_app_usage_only_cycle_reuses_stored_clients(
+        self, mock_api_builder, settings, isolated_registry, inventory
+    ) -> None:
+        """A heartbeat where only app usage is due costs no getNetworkClients call."""
+        collector = self._build(
+            mock_api_builder,
+            settings,
+            isolated_registry,
+            inventory,
+            due={EndpointGroupName.CLIENTS_LIST},
+        )
+        with patch.object(collector.dns_resolver, "resolve_multiple", return_value={}):
+            await collector.collect()
+            collector.api.networks.getNetworkClients.assert_called_once()
+            collector.api.networks.getNetworkClientsApplicationUsage.assert_not_called()
+
+            collector.scheduler.should_run.side_effect = lambda g, *a, **k: (
+                g is EndpointGroupName.CLIENTS_APP_USAGE
+            )
+            await collector.collect()
+
+        collector.api.networks.getNetworkClients.assert_called_once()
+        usage_call = collector.api.networks.getNetworkClientsApplicationUsage.call_args
+        assert usage_call.args[0] == "N_123"
+        assert usage_call.kwargs["clients"] == "c1"
+        marked = [c.args[0] for c in collector.scheduler.mark_ran.call_args_list]
+        assert marked.count(EndpointGroupName.CLIENTS_LIST) == 1
+        assert EndpointGroupName.CLIENTS_APP_USAGE in marked
+
+    async def test_nothing_due_skips_collection(
+        self, mock_api_builder, settings, isolated_registry, inventory
+    ) -> None:
+        """Neither group due ⇒ no organization or client calls at all."""
+        collector = self._build(mock_api_builder, settings, isolated_registry, inventory, due=set())
+        await collector.collect()
+        collector.api.networks.getNetworkClients.assert_not_called()
+        collector.api.networks.getNetworkClientsApplicationUsage.assert_not_called()
+
+
 class TestClientsSignalQualityIntervalSource(BaseCollectorTest):
     """signal_quality per-network gate reads its interval from _group_interval."""
 
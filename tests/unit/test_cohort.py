@@ -0,0 +1,135 @@
+"""Tests for budgeted rotating cohorts."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import math
+from types import SimpleNamespace
+
+from prometheus_client import REGISTRY
+
+from meraki_dashboard_exporter.core.cohort import CohortRotation, cohort_budget
+
+GROUP = "ms_packet_stats"
+NOW = 1_760_000_000.0
+INTERVAL = 600.0
+
+
+def _age(serial: str) -> float | None:
+    return REGISTRY.get_sample_value(
+        "meraki_exporter_cohort_data_age_seconds", {"group": GROUP, "serial": serial}
+    )
+
+
+def test_select_walks_every_entity_in_stable_slices() -> None:
+    """Each run takes the oldest ``budget`` entities; none waits over ceil(n/budget) runs."""
+    rotation = CohortRotation(GROUP)
+    entities = [f"Q{i:03d}" for i in range(10)]
+    rounds = math.ceil(len(entities) / 3)
+    picks: list[set[str]] = []
+
+    for run in range(3 * rounds):
+        now = NOW + run * INTERVAL
+        picked = rotation.select("O1", entities, 3, now=now)
+        assert len(picked) == 3
+        assert picked == [e for e in entities if e in picked]
+        for entity in picked:
+            rotation.mark_refreshed("O1", entity, now=now)
+        picks.append(set(picked))
+
+    for first in range(len(picks) - rounds + 1):
+        assert set().union(*picks[first : first + rounds]) == set(entities)
+
+
+def test_select_without_budget_returns_everything_and_forgets_departed() -> None:
+    """Entities leaving the list drop their age series."""
+    rotation = CohortRotation(GROUP)
+    assert rotation.select("O1", ["A", "B", "A", ""], 0, now=NOW) == ["A", "B"]
+    assert rotation.select("O1", ["A", "B"], 5, now=NOW) == ["A", "B"]
+    rotation.mark_refreshed("O1", "A", now=NOW)
+    rotation.mark_refreshed("O1", "B", now=NOW)
+
+    rotation.select("O1", ["A"], 5, now=NOW + 120)
+
+    assert _age("A") == 120.0
+    assert _age("B") is None
+
+
+def test_entity_age_is_exported_only_under_a_budget() -> None:
+    """Unbudgeted scopes feed only the group maximum; dropping the budget drops the series."""
+    rotation = CohortRotation(GROUP)
+    rotation.select("O1", ["A"], 0, now=NOW)
+    rotation.mark_refreshed("O1", "A", now=NOW)
+    rotation.select("O1", ["A"], 0, now=NOW + 60)
+    assert _age("A") is None
+    assert (
+        REGISTRY.get_sample_value("meraki_exporter_cohort_max_data_age_seconds", {"group": GROUP})
+        == 60.0
+    )
+
+    rotation.select("O1", ["A"], 1, now=NOW + 90)
+    assert _age("A") == 90.0
+    rotation.select("O1", ["A"], 0, now=NOW + 120)
+    assert _age("A") is None
+
+
+def test_failed_refresh_stays_first_in_line() -> None:
+    """An entity that was picked but not refreshed is picked again before the rest."""
+    rotation = CohortRotation(GROUP)
+    entities = ["A", "B", "C", "D"]
+    first = rotation.select("O1", entities, 2, now=NOW)
+    rotation.mark_refreshed("O1", first[0], now=NOW)
+
+    second = rotation.select("O1", entities, 2, now=NOW + INTERVAL)
+
+    assert first[1] in second
+    assert first[0] not in second
+
+
+def test_admit_bounds_each_window_to_the_budget() -> None:
+    """Per-entity admission grants ``budget`` entities per window and rotates them."""
+    rotation = CohortRotation(GROUP)
+    entities = [f"Q{i}" for i in range(6)]
+    seen: set[str] = set()
+
+    for window in range(3):
+        now = NOW - NOW % INTERVAL + window * INTERVAL + 1
+        admitted = [
+            e for e in entities if rotation.admit("O1", e, interval=INTERVAL, budget=2, now=now)
+        ]
+        assert len(admitted) == 2
+        for entity in admitted:
+            rotation.mark_refreshed("O1", entity, now=now)
+        # Refreshed entities are not admitted again within the same window.
+        assert not any(
+            rotation.admit("O1", e, interval=INTERVAL, budget=2, now=now + 60) for e in admitted
+        )
+        seen.update(admitted)
+
+    assert seen == set(entities)
+
+
+def test_admit_without_budget_admits_everything() -> None:
+    """No budget (or no interval) never blocks an entity."""
+    rotation = CohortRotation(GROUP)
+    assert all(rotation.admit("O1", f"Q{i}", interval=INTERVAL, budget=0) for i in range(5))
+    assert rotation.admit("O1", "Q9", interval=0, budget=1)
+
+
+def test_scale_ttl_covers_a_full_rotation() -> None:
+    """A budgeted group's TTL is multiplied by the number of slices in the scope."""
+    rotation = CohortRotation(GROUP)
+    rotation.select("O1", [f"Q{i}" for i in range(10)], 3, now=NOW)
+
+    assert rotation.scale_ttl("O1", 1200.0, 3) == 4800.0
+    assert rotation.scale_ttl("O1", 1200.0, 0) == 1200.0
+    assert rotation.scale_ttl("O1", None, 3) is None
+
+
+def test_cohort_budget_reads_scheduler_settings_tolerantly() -> None:
+    """Budgets come from ``scheduler.group_cohort_budgets``; anything else means none."""
+    settings = SimpleNamespace(scheduler=SimpleNamespace(group_cohort_budgets={GROUP: 50}))
+    assert cohort_budget(settings, GROUP) == 50
+    assert cohort_budget(settings, "mx_performance") == 0
+    assert cohort_budget(SimpleNamespace(), GROUP) == 0
@@ -0,0 +1,220 @@
+"""Tests for the adaptive (latency-gradient) SDK concurrency limiter."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+from prometheus_client import REGISTRY
+
+from meraki_dashboard_exporter.collectors.manager import calculate_collector_admission_limit
+from meraki_dashboard_exporter.core.api_facade import MerakiApiFacade
+from meraki_dashboard_exporter.core.concurrency_limiter import (
+    AdaptiveConcurrencyLimiter,
+    sdk_executor_workers,
+)
+
+
+class RateLimitedError(Exception):
+    """SDK-shaped 429."""
+
+    status = 429
+
+
+def _api(**overrides: object) -> SimpleNamespace:
+    values: dict[str, object] = {
+        "executor_workers": 10,
+        "concurrency_limit": 5,
+        "adaptive_concurrency_enabled": True,
+        "adaptive_concurrency_min": 2,
+        "adaptive_concurrency_max": 20,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_steady_latency_grows_the_limit_to_the_ceiling() -> None:
+    """Flat RTT keeps the gradient at 1, so the queue allowance grows the limit."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, min_limit=2, max_limit=12)
+    for _ in range(100):
+        limiter.record_rtt(0.2)
+
+    assert limiter.limit == 12
+    assert REGISTRY.get_sample_value("meraki_exporter_sdk_concurrency_limit") == 12
+
+
+def test_rising_latency_shrinks_the_limit() -> None:
+    """Short RTT above the long baseline pulls the limit down."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16, min_limit=2, max_limit=20)
+    for _ in range(20):
+        limiter.record_rtt(0.2)
+    grown = limiter.limit
+    for _ in range(20):
+        limiter.record_rtt(1.0)
+
+    assert limiter.limit < grown
+
+
+def test_throttle_cuts_multiplicatively_but_not_below_the_floor() -> None:
+    """Each 429 cuts the limit; the floor holds."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16, min_limit=3, max_limit=20)
+    limiter.record_throttle()
+    assert limiter.limit == 12
+    for _ in range(20):
+        limiter.record_throttle()
+    assert limiter.limit == 3
+
+
+async def test_slots_queue_beyond_the_limit_and_wake_on_growth() -> None:
+    """Callers past the limit wait; a raised limit admits them."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, min_limit=1, max_limit=4)
+    release = asyncio.Event()
+    entered: list[int] = []
+
+    async def call(index: int) -> None:
+        async with limiter.slot():
+            entered.append(index)
+            await release.wait()
+
+    tasks = [asyncio.create_task(call(i)) for i in range(3)]
+    await asyncio.sleep(0)
+    assert entered == [0]
+    assert REGISTRY.get_sample_value("meraki_exporter_sdk_inflight") == 1
+
+    limiter._set_limit(3)
+    await asyncio.sleep(0)
+    assert entered == [0, 1, 2]
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert limiter.inflight == 0
+
+
+async def test_cancelled_waiter_does_not_block_later_callers() -> None:
+    """A waiter cancelled in the queue is dropped, and its slot is not leaked."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, min_limit=1, max_limit=1)
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with limiter.slot():
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    release.set()
+    await holder
+    async with limiter.slot():
+        assert limiter.inflight == 1
+    assert limiter.inflight == 0
+
+
+def test_settings_size_the_executor_and_admission() -> None:
+    """Enabled: the pool is sized to the ceiling; disabled: executor_workers as before."""
+    enabled = SimpleNamespace(api=_api(), collectors=SimpleNamespace(max_concurrent_collectors=5))
+    disabled = SimpleNamespace(
+        api=_api(adaptive_concurrency_enabled=False),
+        collectors=SimpleNamespace(max_concurrent_collectors=5),
+    )
+
+    assert sdk_executor_workers(enabled) == 20
+    assert sdk_executor_workers(disabled) == 10
+    assert calculate_collector_admission_limit(enabled) == 4
+    assert calculate_collector_admission_limit(disabled) == 2
+    assert AdaptiveConcurrencyLimiter.from_settings(disabled) is None
+    limiter = AdaptiveConcurrencyLimiter.from_settings(enabled)
+    assert limiter is not None
+    assert (limiter.limit, limiter.min_limit, limiter.max_limit) == (10, 2, 20)
+
+
+async def test_facade_feeds_latency_and_429s_into_the_limiter(monkeypatch) -> None:
+    """The facade holds a slot per attempt, records per-page RTT and cuts on 429."""
+    monkeypatch.setattr("meraki_dashboard_exporter.core.api_facade.asyncio.sleep", _no_sleep)
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=2, max_limit=20)
+    recorded: list[float] = []
+    original = limiter.record_rtt
+
+    def spy(seconds: float) -> None:
+        recorded.append(seconds)
+        original(seconds)
+
+    limiter.record_rtt = spy  # type: ignore[method-assign]
+    rate_limiter = SimpleNamespace(
+        concurrency_limiter=limiter,
+        acquire=_no_acquire,
+        record_throttle_event=lambda *_args: None,
+    )
+    facade = MerakiApiFacade(
+        settings=SimpleNamespace(api=SimpleNamespace(max_retries=3, per_fetch_deadline_seconds=5)),
+        rate_limiter=rate_limiter,
+    )
+    attempts = 0
+
+    def flaky() -> list[int]:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise RateLimitedError
+        return [1]
+
+    await facade.call("getFlaky", flaky)
+
+    # 8 x 0.75 after the 429, then one flat-RTT sample nudges it up by < 1.
+    assert limiter.limit == 6
+    assert len(recorded) == 1
+    assert limiter.inflight == 0
+
+
+async def test_deadline_raises_on_time_but_keeps_the_slot_until_the_thread_returns() -> None:
+    """The caller times out at the deadline; the slot is freed only when the thread returns."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, min_limit=1, max_limit=1)
+    rate_limiter = SimpleNamespace(
+        concurrency_limiter=limiter,
+        acquire=_no_acquire,
+        record_throttle_event=lambda *_args: None,
+    )
+    facade = MerakiApiFacade(
+        settings=SimpleNamespace(
+            api=SimpleNamespace(max_retries=0, per_fetch_deadline_seconds=0.05)
+        ),
+        rate_limiter=rate_limiter,
+    )
+    released = threading.Event()
+
+    def slow() -> list[int]:
+        released.wait(1.0)
+        return [1]
+
+    with pytest.raises(TimeoutError):
+        await facade.call("getSlow", slow)
+
+    # Past the deadline, but the slow thread still holds the only slot.
+    assert not released.is_set()
+    assert limiter.inflight == 1
+    with pytest.raises(TimeoutError):
+        await facade.call("getQuick", lambda: [2])
+
+    released.set()
+    for _ in range(100):
+        if limiter.inflight == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert limiter.inflight == 0
+    assert await facade.call("getQuick", lambda: [2]) == [2]
+
+
+async def _no_sleep(_seconds: float) -> None:
+    return None
+
+
+async def _no_acquire(*_args: object) -> None:
+    return None
@@ -0,0 +1,198 @@
+"""Tests for the online endpoint-group cost model and its solver wiring."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from prometheus_client import REGISTRY
+
+from meraki_dashboard_exporter.core.api_facade import MerakiApiFacade
+from meraki_dashboard_exporter.core.cost_model import GroupCostModel
+from meraki_dashboard_exporter.core.scheduler import (
+    EndpointGroup,
+    EndpointGroupName,
+    EndpointScheduler,
+    OrgShape,
+    solve_intervals,
+)
+
+GROUP = EndpointGroupName.NH_DATA_RATES
+SHAPE = OrgShape(
+    org_id="1",
+    network_count=10,
+    wireless_network_count=10,
+    switch_network_count=0,
+    appliance_network_count=0,
+    sensor_network_count=0,
+    camera_network_count=0,
+    cellular_network_count=0,
+    device_count=10,
+    ap_count=10,
+    switch_count=0,
+    appliance_count=0,
+    physical_mx_count=0,
+    camera_count=0,
+    sensor_count=0,
+    cellular_count=0,
+)
+
+
+def _group(cost: float = 10.0) -> EndpointGroup:
+    return EndpointGroup(name=GROUP, priority=3, floor_seconds=300, cost_fn=lambda _s: cost)
+
+
+class RateLimitedError(Exception):
+    """SDK-shaped 429."""
+
+    status = 429
+
+
+def test_ewma_mean_variance_and_bounds():
+    """Executions fold into an EWMA; bounds widen with the spread."""
+    model = GroupCostModel(alpha=0.5, min_samples=2)
+    for calls, start in ((10.0, 0.0), (20.0, 10.0)):
+        model.begin(GROUP, now=start)
+        model.record_calls(GROUP, calls)
+        model.complete(GROUP, now=start + 4.0)
+
+    estimate = model.estimate(GROUP)
+    assert estimate is not None
+    assert estimate.samples == 2
+    assert estimate.mean_calls == pytest.approx(15.0)
+    assert estimate.variance_calls == pytest.approx(25.0)
+    assert estimate.mean_seconds == pytest.approx(4.0)
+    low, high = estimate.bounds()
+    assert low < 15.0 < high
+    assert model.measured_costs() == {GROUP: pytest.approx(15.0)}
+
+
+def test_measured_cost_needs_min_samples_and_failed_runs_are_dropped():
+    """A failed (never completed) execution is discarded on the next begin."""
+    model = GroupCostModel(alpha=0.3, min_samples=2)
+    model.begin(GROUP)
+    model.record_calls(GROUP, 99.0)
+    model.begin(GROUP)  # previous attempt failed: no mark_ran
+    model.record_calls(GROUP, 3.0)
+    model.complete(GROUP)
+
+    assert model.measured_cost(GROUP) is None
+    assert model.estimate(GROUP).mean_calls == 3.0  # type: ignore[union-attr]
+    assert model.complete(GROUP) is None
+
+
+@pytest.mark.asyncio
+async def test_facade_charges_pages_and_retries_to_the_open_group(monkeypatch):
+    """Retries and auto-paginated pages count, including from fan-out tasks."""
+    monkeypatch.setattr("asyncio.sleep", AsyncMock())
+    model = GroupCostModel(alpha=1.0, min_samples=1)
+    facade = MerakiApiFacade(
+        settings=SimpleNamespace(api=SimpleNamespace(max_retries=3, per_fetch_deadline_seconds=5))
+    )
+    attempts = 0
+
+    def flaky() -> list[int]:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise RateLimitedError
+        return [1]
+
+    def paginated(**_kwargs: object) -> list[int]:
+        return list(range(250))
+
+    model.begin(GROUP)
+    with model.measure(GROUP):
+        await facade.call("getFlaky", flaky)
+        await asyncio.gather(
+            asyncio.create_task(facade.call("getPaged", paginated, total_pages="all", perPage=100))
+        )
+    model.complete(GROUP)
+
+    # 1 throttled attempt + 1 success + 3 pages.
+    assert model.measured_cost(GROUP) == 5.0
+
+
+@pytest.mark.asyncio
+async def test_facade_outside_an_execution_is_not_charged():
+    """Calls outside an admitted execution (startup warming) cost nothing."""
+    model = GroupCostModel(alpha=1.0, min_samples=1)
+    facade = MerakiApiFacade()
+
+    async def untracked() -> None:
+        await facade.call("getOrganization", lambda: {"id": "1"})
+
+    await asyncio.create_task(untracked())
+    model.begin(GROUP)
+    model.complete(GROUP)
+    assert model.measured_cost(GROUP) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_groups_admitted_together_are_charged_per_fetch():
+    """Admitting several groups up front no longer charges every call to the last one."""
+    model = GroupCostModel(alpha=1.0, min_samples=1)
+    facade = MerakiApiFacade()
+    other = EndpointGroupName.NH_CONNECTION_STATS
+    model.begin(GROUP)
+    model.begin(other)
+
+    with model.measure(GROUP):
+        await facade.call("getOne", lambda: [1])
+    with model.measure(other):
+        for _ in range(3):
+            await facade.call("getOther", lambda: [1])
+    await facade.call("getShared", lambda: [1])
+    with model.measure(EndpointGroupName.MR_CPU_LOAD):
+        # Not admitted: nothing is open for this group, so nothing is charged.
+        await facade.call("getNotAdmitted", lambda: [1])
+    model.complete(GROUP)
+    model.complete(other)
+
+    assert model.measured_cost(GROUP) == 1.0
+    assert model.measured_cost(other) == 3.0
+    assert model.estimate(EndpointGroupName.MR_CPU_LOAD) is None
+
+
+def test_solver_prefers_measured_cost():
+    """A measured cost replaces cost_fn and is flagged on the solution."""
+    estimated = solve_intervals([_group(10.0)], SHAPE, 1.0, 1.0, {}, 4.0, 3600)
+    measured = solve_intervals([_group(10.0)], SHAPE, 1.0, 1.0, {}, 4.0, 3600, {GROUP: 40.0})
+
+    assert estimated[GROUP].cost_per_cycle == 10.0
+    assert estimated[GROUP].measured is False
+    assert measured[GROUP].cost_per_cycle == 40.0
+    assert measured[GROUP].measured is True
+    assert measured[GROUP].demand_rps == pytest.approx(40.0 / 300)
+
+
+def test_scheduler_resolves_with_measured_cost_and_exports_both():
+    """Once trusted, resolve() solves with measured cost; gauges expose both."""
+    settings = SimpleNamespace(
+        api=SimpleNamespace(rate_limit_requests_per_second=10.0, rate_limit_shared_fraction=1.0),
+        scheduler=SimpleNamespace(cost_model_min_samples=1, cost_model_alpha=1.0),
+        monitoring=SimpleNamespace(metric_ttl_multiplier=2.0),
+        collectors=SimpleNamespace(profile="full"),
+    )
+    limiter = SimpleNamespace(effective_rate_per_second=lambda: 10.0)
+    scheduler = EndpointScheduler(settings, limiter)  # type: ignore[arg-type]
+    scheduler.register_groups([_group(10.0)])
+    scheduler.resolve(SHAPE)
+    assert scheduler._solved[GROUP].cost_per_cycle == 10.0
+
+    scheduler.cost_model.begin(GROUP)
+    scheduler.cost_model.record_calls(GROUP, 30.0)
+    scheduler.mark_ran(GROUP)
+    scheduler.resolve(SHAPE)
+
+    assert scheduler._solved[GROUP].cost_per_cycle == 30.0
+    labels = {"group": str(GROUP)}
+    assert REGISTRY.get_sample_value("meraki_exporter_scheduler_estimated_cost_calls", labels) == 10
+    assert REGISTRY.get_sample_value("meraki_exporter_scheduler_measured_cost_calls", labels) == 30
+    assert REGISTRY.get_sample_value(
+        "meraki_exporter_scheduler_measured_demand_rps", labels
+    ) == pytest.approx(30.0 / 300)
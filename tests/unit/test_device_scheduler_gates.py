@@ -55,6 +55,7 @@ _EXPECTED_DEVICE_GROUPS = {
     EndpointGroupName.MX_SECURITY_EVENTS,
     EndpointGroupName.MX_FIREWALL_CONFIG,
     EndpointGroupName.MV_ANALYTICS,
+    EndpointGroupName.MV_CONFIG,
     EndpointGroupName.MG_UPLINK_STATUS,
     # Phase 4 (#285-#306)
     EndpointGroupName.MX_SECURITY_CONFIG,
@@ -172,8 +173,9 @@ class TestDeviceEndpointGroups:
         assert by_name[EndpointGroupName.MR_CONNECTION_STATS].cost_fn(shape) == 4
         # mx_firewall_config: 2 * A = 4
         assert by_name[EndpointGroupName.MX_FIREWALL_CONFIG].cost_fn(shape) == 4
-        # mv_analytics: 3 * MV = 18
-        assert by_name[EndpointGroupName.MV_ANALYTICS].cost_fn(shape) == 18
+        # mv_analytics: MV = 6 (recent only); mv_config: 2 * MV = 12
+        assert by_name[EndpointGroupName.MV_ANALYTICS].cost_fn(shape) == 6
+        assert by_name[EndpointGroupName.MV_CONFIG].cost_fn(shape) == 12
 
 
 class TestDeviceAvailabilityGate(BaseCollectorTest):
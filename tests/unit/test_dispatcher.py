@@ -0,0 +1,149 @@
+"""Tests for the central earliest-deadline-first collection dispatcher."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from prometheus_client import REGISTRY
+
+from meraki_dashboard_exporter.core.dispatcher import CollectionDispatcher
+
+
+def _collector(name: str, priority: int | None = None) -> Any:
+    """Build a collector stub declaring one gated group at ``priority``."""
+    groups = (
+        ()
+        if priority is None
+        else (SimpleNamespace(name=f"{name}_group", priority=priority, gated=True),)
+    )
+    return type(name, (), {"get_endpoint_groups": lambda self: groups})()
+
+
+class _Scheduler:
+    """Scheduler stub: every collector is next due ``due_in`` seconds out."""
+
+    def __init__(self, due_in: float | None = 60.0) -> None:
+        self.due_in = due_in
+
+    def seconds_until_due(self, groups: Any, now: float | None = None) -> float | None:
+        return self.due_in
+
+
+class _Runner:
+    """Runner stub recording run order; runs block until released."""
+
+    def __init__(self, scheduler: _Scheduler | None = None) -> None:
+        self.scheduler = scheduler or _Scheduler()
+        self.ran: list[str] = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def run_collector_once(self, collector: Any, *, force: bool = False) -> None:
+        self.ran.append(type(collector).__name__)
+        await self.release.wait()
+
+
+def _dispatcher(runner: _Runner, max_concurrency: int = 4) -> CollectionDispatcher:
+    return CollectionDispatcher(runner, max_concurrency=max_concurrency, resolve_cap_seconds=300.0)
+
+
+async def test_due_collectors_start_in_priority_then_deadline_order() -> None:
+    """Among due collectors, the most important group wins, then the earliest deadline."""
+    runner = _Runner()
+    dispatcher = _dispatcher(runner)
+    dispatcher.add(_collector("Low", priority=4))
+    dispatcher.add(_collector("High", priority=1))
+    dispatcher.add(_collector("Later", priority=1), delay_seconds=100.0)
+
+    assert dispatcher._dispatch_due(time.monotonic()) == 2
+    await asyncio.gather(*dispatcher._running.values())
+
+    assert runner.ran == ["High", "Low"]
+
+
+async def test_admission_limit_caps_concurrent_runs() -> None:
+    """Beyond the admission limit, due collectors stay queued until a slot frees."""
+    runner = _Runner()
+    runner.release.clear()
+    dispatcher = _dispatcher(runner, max_concurrency=1)
+    dispatcher.add(_collector("A", priority=1))
+    dispatcher.add(_collector("B", priority=2))
+
+    assert dispatcher._dispatch_due(time.monotonic()) == 1
+    assert list(dispatcher._running) == ["A"]
+    # Every slot is busy: the dispatcher waits for a completion, not a timer.
+    assert dispatcher._seconds_until_next(time.monotonic()) is None
+
+    runner.release.set()
+    await asyncio.gather(*dispatcher._running.values())
+    assert dispatcher._dispatch_due(time.monotonic()) == 1
+    await asyncio.gather(*dispatcher._running.values())
+    assert runner.ran == ["A", "B"]
+
+
+async def test_finished_run_is_requeued_at_next_due_with_floor_and_cap() -> None:
+    """The next dispatch follows seconds_until_due, floored at 1s and capped at resolve."""
+    for due_in, expected in ((60.0, 60.0), (0.0, 1.0), (None, 300.0), (900.0, 300.0)):
+        runner = _Runner(_Scheduler(due_in))
+        dispatcher = _dispatcher(runner)
+        dispatcher.add(_collector("A", priority=1))
+        started = time.monotonic()
+        dispatcher._dispatch_due(started)
+        await asyncio.gather(*dispatcher._running.values())
+
+        assert dispatcher._due["A"] - started == pytest.approx(expected, abs=0.5)
+
+
+async def test_reschedule_only_pulls_collectors_forward() -> None:
+    """A re-solve moves idle collectors earlier; stale heap entries are skipped."""
+    scheduler = _Scheduler(due_in=10.0)
+    runner = _Runner(scheduler)
+    dispatcher = _dispatcher(runner)
+    dispatcher.add(_collector("A", priority=1), delay_seconds=200.0)
+    first_due = dispatcher._due["A"]
+
+    dispatcher.reschedule()
+    assert dispatcher._due["A"] < first_due
+
+    scheduler.due_in = 250.0
+    pulled_due = dispatcher._due["A"]
+    dispatcher.reschedule()
+    assert dispatcher._due["A"] == pulled_due
+    # The superseded entry is dropped, so "A" is started once.
+    assert dispatcher._dispatch_due(first_due + 1.0) == 1
+
+
+async def test_run_exits_on_shutdown_and_counts_wakeups() -> None:
+    """run() returns once shutdown is set, cancelling in-flight collectors."""
+    runner = _Runner()
+    runner.release.clear()
+    dispatcher = _dispatcher(runner)
+    dispatcher.add(_collector("A", priority=1))
+    shutdown = asyncio.Event()
+
+    task = asyncio.create_task(dispatcher.run(shutdown))
+    while not runner.ran:
+        await asyncio.sleep(0)
+    shutdown.set()
+    await asyncio.wait_for(task, timeout=2.0)
+
+    assert runner.ran == ["A"]
+    assert not dispatcher._running
+    assert (
+        REGISTRY.get_sample_value(
+            "meraki_exporter_dispatcher_wakeups_total", {"result": "dispatched"}
+        )
+        == 1.0
+    )
+    assert (
+        REGISTRY.get_sample_value(
+            "meraki_exporter_dispatcher_lateness_seconds_count", {"collector": "A"}
+        )
+        == 1.0
+    )
@@ -2,12 +2,14 @@
 
 # ruff: noqa: S101
 
+import asyncio
+import time
 from unittest.mock import MagicMock
 
 import pytest
 
 from meraki_dashboard_exporter.core.config import Settings
-from meraki_dashboard_exporter.services.dns_resolver import DNSResolver
+from meraki_dashboard_exporter.services.dns_resolver import CacheEntry, DNSResolver
 
 
 @pytest.fixture
@@ -229,3 +231,127 @@ async def test_clear_cache_resets_resolution_time(resolver, monkeypatch):
     stats = resolver.get_cache_stats()
     assert stats["total_resolution_time"] == 0.0
     assert stats["cache_hit_ratio"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_refresh_ahead_renews_entry_in_background(resolver, monkeypatch):
+    """Near-expiry cache hits are served stale-free and re-resolved after the batch."""
+
+    names = iter(["old.example.com", "new.example.com"])
+    lookups: list[str] = []
+
+    async def fake_lookup(ip: str) -> str:
+        lookups.append(ip)
+        return next(names)
+
+    monkeypatch.setattr(resolver, "_perform_lookup", fake_lookup)
+    await resolver.resolve_hostname("1.1.1.1")
+    # Age the entry past the refresh-ahead point but not past its TTL.
+    resolver._cache["1.1.1.1"].timestamp -= resolver.cache_ttl * 0.9
+
+    result = await resolver.resolve_multiple([("c1", "1.1.1.1", None)])
+
+    # The batch itself is answered from cache without an inline lookup ...
+    assert result == {"1.1.1.1": "old"}
+    assert lookups == ["1.1.1.1"]
+    # ... and the background refresh renews the entry afterwards.
+    assert resolver._refresh_task is not None
+    await resolver._refresh_task
+    assert lookups == ["1.1.1.1", "1.1.1.1"]
+    assert resolver._cache["1.1.1.1"].hostname == "new"
+    assert not resolver._needs_refresh(resolver._cache["1.1.1.1"], time.time())
+    assert resolver.get_cache_stats()["refresh_ahead_lookups"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_existing_entry(resolver, monkeypatch):
+    """A failed background refresh leaves the still-valid entry in place."""
+
+    answers = iter(["host.example.com", None])
+
+    async def fake_lookup(ip: str) -> str | None:
+        return next(answers)
+
+    monkeypatch.setattr(resolver, "_perform_lookup", fake_lookup)
+    await resolver.resolve_hostname("1.1.1.1")
+    resolver._cache["1.1.1.1"].timestamp -= resolver.cache_ttl * 0.9
+
+    await resolver.resolve_multiple([("c1", "1.1.1.1", None)])
+    assert resolver._refresh_task is not None
+    await resolver._refresh_task
+
+    assert resolver._cache["1.1.1.1"].hostname == "host"
+    stats = resolver.get_cache_stats()
+    assert stats["refresh_ahead_failures"] == 1
+    assert stats["valid_entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_ahead_is_accounted_separately(resolver, monkeypatch):
+    """Background lookups keep their own time, and a still-negative entry is renewed."""
+
+    async def fake_lookup(ip: str) -> str | None:
+        await asyncio.sleep(0.01)
+        return None
+
+    monkeypatch.setattr(resolver, "_perform_lookup", fake_lookup)
+    await resolver.resolve_hostname("1.1.1.1")
+    foreground_time = resolver.get_cache_stats()["total_resolution_time"]
+    resolver._cache["1.1.1.1"].timestamp -= resolver.cache_ttl * 0.9
+
+    await resolver.resolve_multiple([("c1", "1.1.1.1", None)])
+    assert resolver._refresh_task is not None
+    await resolver._refresh_task
+
+    stats = resolver.get_cache_stats()
+    assert stats["total_resolution_time"] == foreground_time
+    assert stats["refresh_ahead_resolution_time"] > 0
+    assert stats["refresh_ahead_lookups"] == 1
+    assert stats["refresh_ahead_failures"] == 0
+    assert not resolver._needs_refresh(resolver._cache["1.1.1.1"], time.time())
+
+
+def test_refresh_ahead_disabled_at_full_ttl(resolver):
+    """A fraction of 1.0 turns refresh-ahead off."""
+    resolver.refresh_ahead_fraction = 1.0
+    entry = CacheEntry(hostname="h", timestamp=time.time() - resolver.cache_ttl * 0.99)
+
+    assert not resolver._needs_refresh(entry, time.time())
+
+
+@pytest.mark.asyncio
+async def test_cache_file_round_trip_preserves_ttls(monkeypatch, tmp_path):
+    """The persisted cache reloads with each entry's remaining TTL intact."""
+
+    monkeypatch.setenv("MERAKI_EXPORTER_MERAKI__API_KEY", "a" * 40)
+    monkeypatch.setenv("MERAKI_EXPORTER_CLIENTS__DNS_CACHE_FILE", str(tmp_path / "dns.json"))
+    first = DNSResolver(Settings())
+    now = time.time()
+    first._cache["1.1.1.1"] = CacheEntry(hostname="a", timestamp=now - 100)
+    first._cache["2.2.2.2"] = CacheEntry(hostname=None, timestamp=now - 10, ttl=600)
+    first._cache["3.3.3.3"] = CacheEntry(hostname="gone", timestamp=now - 700, ttl=600)
+    first.close()
+
+    second = DNSResolver(Settings())
+    try:
+        assert set(second._cache) == {"1.1.1.1", "2.2.2.2"}
+        assert second._cache["1.1.1.1"].timestamp == pytest.approx(now - 100)
+        assert second._cache["2.2.2.2"].ttl == 600
+        # Restored entries are cache hits: no lookup storm after a restart.
+        assert await second.resolve_hostname("1.1.1.1") == "a"
+        assert second.get_cache_stats()["cache_hits"] == 1
+    finally:
+        second.close()
+
+
+def test_cache_file_ignores_unknown_version(monkeypatch, tmp_path):
+    """A file written with another layout version is ignored, not misread."""
+
+    cache_file = tmp_path / "dns.json"
+    cache_file.write_text('{"version": 99, "entries": {"1.1.1.1": ["a", 0, null]}}')
+    monkeypatch.setenv("MERAKI_EXPORTER_MERAKI__API_KEY", "a" * 40)
+    monkeypatch.setenv("MERAKI_EXPORTER_CLIENTS__DNS_CACHE_FILE", str(cache_file))
+    resolver = DNSResolver(Settings())
+
+    assert resolver.cache_size == 0
+    resolver._executor.shutdown()
@@ -0,0 +1,112 @@
+"""Tests for weighted fair queuing of per-organization work items."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from prometheus_client import REGISTRY
+
+from meraki_dashboard_exporter.core.fair_queue import WeightedFairQueue
+
+
+async def _drain(queue: WeightedFairQueue, work: dict[str, int]) -> list[str]:
+    """Queue every org's items behind a held slot, then record admission order."""
+    order: list[str] = []
+    blocker = asyncio.Event()
+
+    async def hold() -> None:
+        async with queue.slot("blocker"):
+            await blocker.wait()
+
+    async def item(org_id: str) -> None:
+        async with queue.slot(org_id):
+            order.append(org_id)
+            await asyncio.sleep(0)
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    tasks = [
+        asyncio.create_task(item(org_id)) for org_id, count in work.items() for _ in range(count)
+    ]
+    await asyncio.sleep(0)
+    blocker.set()
+    await asyncio.gather(holder, *tasks)
+    return order
+
+
+async def test_large_org_does_not_starve_small_orgs() -> None:
+    """Items queued first by a big org are interleaved with later small orgs."""
+    queue = WeightedFairQueue("DeviceCollector", capacity=1)
+
+    order = await _drain(queue, {"big": 6, "small_a": 1, "small_b": 1})
+
+    # Both small orgs are admitted within the first round, not after all 6 big items.
+    assert order.index("small_a") <= 2
+    assert order.index("small_b") <= 2
+    assert order.count("big") == 6
+
+
+async def test_weights_share_slots_proportionally() -> None:
+    """A weight-2 org gets two admissions per weight-1 admission while both wait."""
+    queue = WeightedFairQueue("DeviceCollector", capacity=1, weights={"gold": 2.0})
+
+    order = await _drain(queue, {"bronze": 4, "gold": 8})
+
+    first_six = order[:6]
+    assert first_six.count("gold") == 4
+    assert first_six.count("bronze") == 2
+
+
+async def test_capacity_bounds_concurrency_and_metrics_are_exported() -> None:
+    """At most ``capacity`` items run; depth drains to zero and waits are observed."""
+    queue = WeightedFairQueue("OrganizationCollector", capacity=2)
+    running = 0
+    peak = 0
+
+    async def item(org_id: str) -> None:
+        nonlocal running, peak
+        async with queue.slot(org_id):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+    await asyncio.gather(*(item(org) for org in ("1", "1", "1", "2", "2")))
+
+    assert peak == 2
+    labels = {"collector": "OrganizationCollector", "org_id": "1"}
+    assert REGISTRY.get_sample_value("meraki_exporter_fair_queue_depth", labels) == 0
+    assert REGISTRY.get_sample_value("meraki_exporter_fair_queue_wait_seconds_count", labels) == 3
+
+
+async def test_cancelled_waiter_releases_nothing_and_is_skipped() -> None:
+    """Cancelling a queued item removes it without leaking or double-freeing a slot."""
+    queue = WeightedFairQueue("DeviceCollector", capacity=1)
+    release = asyncio.Event()
+    admitted: list[str] = []
+
+    async def item(org_id: str, wait: bool = False) -> None:
+        async with queue.slot(org_id):
+            admitted.append(org_id)
+            if wait:
+                await release.wait()
+
+    holder = asyncio.create_task(item("a", wait=True))
+    await asyncio.sleep(0)
+    doomed = asyncio.create_task(item("b"))
+    survivor = asyncio.create_task(item("c"))
+    await asyncio.sleep(0)
+    assert queue.queue_depth("b") == 1
+
+    doomed.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await doomed
+    assert queue.queue_depth("b") == 0
+
+    release.set()
+    await asyncio.gather(holder, survivor)
+    assert admitted == ["a", "c"]
+    assert queue._active == 0
@@ -0,0 +1,110 @@
+"""Tests for cursor-based incremental history fetching."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+from prometheus_client import REGISTRY
+
+from meraki_dashboard_exporter.core.history_cursor import (
+    HistoryCursorStore,
+    IntervalRing,
+    format_timestamp,
+    parse_timestamp,
+)
+
+ENDPOINT = "getOrganizationSwitchPortsUsageHistoryByDeviceByInterval"
+NOW = 1_760_000_000.0
+
+
+def _fetches(result: str) -> float | None:
+    return REGISTRY.get_sample_value(
+        "meraki_exporter_history_fetches_total", {"endpoint": ENDPOINT, "result": result}
+    )
+
+
+def test_first_poll_is_full_then_incremental_from_the_cursor() -> None:
+    """No cursor means the full window; after advancing, only t0 onwards is requested."""
+    store = HistoryCursorStore()
+
+    first = store.window("O1", ENDPOINT, timespan=3600, now=NOW)
+    assert first.params == {"timespan": 3600}
+    assert not first.incremental
+
+    store.advance("O1", ENDPOINT, NOW - 100)
+    second = store.window("O1", ENDPOINT, timespan=3600, now=NOW + 300)
+    assert second.params == {"t0": format_timestamp(NOW - 100)}
+    assert second.incremental
+    assert (_fetches("full"), _fetches("incremental")) == (1.0, 1.0)
+
+
+def test_poll_inside_the_interval_resolution_reuses_the_rings() -> None:
+    """Less than ``min_step`` since the cursor: nothing new can be complete."""
+    store = HistoryCursorStore()
+    store.window("O1", ENDPOINT, timespan=3600, min_step=300, now=NOW)
+    store.advance("O1", ENDPOINT, NOW)
+
+    window = store.window("O1", ENDPOINT, timespan=3600, min_step=300, now=NOW + 120)
+
+    assert window.params is None
+    assert _fetches("reused") == 1.0
+
+
+def test_gap_scope_change_and_reset_force_a_full_window() -> None:
+    """A gap of a whole window, a different scope, or an explicit reset start over."""
+    store = HistoryCursorStore()
+    store.window("O1", ENDPOINT, timespan=3600, scope="N1", now=NOW)
+    store.advance("O1", ENDPOINT, NOW)
+    store.ring("O1", ENDPOINT, ("Q1", "1"), maxlen=4).merge(NOW, 1)
+
+    assert store.window("O1", ENDPOINT, timespan=3600, scope="N1", now=NOW + 3600).params == {
+        "timespan": 3600
+    }
+    assert store.rings("O1", ENDPOINT) == {}
+
+    store.advance("O1", ENDPOINT, NOW + 3600)
+    assert "timespan" in (
+        store.window("O1", ENDPOINT, timespan=3600, scope="N2", now=NOW + 3700).params or {}
+    )
+
+    store.advance("O1", ENDPOINT, NOW + 3700)
+    store.reset("O1", ENDPOINT)
+    assert "timespan" in (
+        store.window("O1", ENDPOINT, timespan=3600, scope="N2", now=NOW + 3800).params or {}
+    )
+
+
+def test_ring_replaces_reported_intervals_orders_and_bounds() -> None:
+    """Same start replaces; samples stay ordered; maxlen and prune drop the oldest."""
+    ring = IntervalRing(maxlen=3)
+    for start, value in ((20.0, "b"), (10.0, "a"), (30.0, "c"), (30.0, "c2")):
+        ring.merge(start, value)
+    assert ring.values() == ["a", "b", "c2"]
+
+    ring.merge(40.0, "d")
+    assert ring.values() == ["b", "c2", "d"]
+
+    ring.prune(35.0)
+    assert ring.values() == ["d"]
+
+
+def test_prune_drops_series_not_seen_within_the_window() -> None:
+    """Series absent from every response for a whole window are forgotten."""
+    store = HistoryCursorStore()
+    store.window("O1", ENDPOINT, timespan=3600, now=NOW)
+    stale = store.ring("O1", ENDPOINT, "stale", maxlen=4)
+    stale.seen_at = NOW - 4000
+    live = store.ring("O1", ENDPOINT, "live", maxlen=4)
+    live.seen_at = NOW
+
+    store.prune("O1", ENDPOINT, NOW - 3600)
+
+    assert list(store.rings("O1", ENDPOINT)) == ["live"]
+
+
+def test_timestamps_round_trip_and_reject_garbage() -> None:
+    """ISO-8601 ``Z`` strings parse to epoch seconds; junk parses to None."""
+    assert parse_timestamp(format_timestamp(NOW)) == NOW
+    assert parse_timestamp("2026-07-03T09:00:00Z") == parse_timestamp("2026-07-03T09:00:00+00:00")
+    assert parse_timestamp("t") is None
+    assert parse_timestamp(None) is None
@@ -0,0 +1,93 @@
+"""Import-time benchmark guarding the lazy startup imports.
+
+Each check runs a fresh interpreter under ``python -X importtime`` so module
+caching in the test process cannot hide an eager import. The assertions are
+about *which* modules load (stable across machines), and the failure message
+lists the slowest imports to point at the regression.
+"""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import meraki_dashboard_exporter
+
+# Root that makes ``meraki_dashboard_exporter`` importable in the child process.
+_PACKAGE_ROOT = str(Path(meraki_dashboard_exporter.__file__).resolve().parents[1])
+
+_OTEL_SDK_MODULES = (
+    "grpc",
+    "opentelemetry.exporter.otlp.proto.grpc.trace_exporter",
+    "opentelemetry.instrumentation.fastapi",
+    "opentelemetry.sdk.trace",
+)
+
+
+def _import_profile(code: str) -> dict[str, int]:
+    """Run ``code`` under ``-X importtime``; return cumulative microseconds per module."""
+    env = {**os.environ, "PYTHONPATH": _PACKAGE_ROOT, "PYTHONDONTWRITEBYTECODE": "1"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+        check=True,
+    )
+    profile: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, module = line.removeprefix("import time:").split("|")
+        profile[module.strip()] = int(cumulative_us)
+    return profile
+
+
+def _slowest(profile: dict[str, int], count: int = 5) -> str:
+    ranked = sorted(profile.items(), key=lambda item: item[1], reverse=True)[:count]
+    return ", ".join(f"{module}={micros / 1e6:.3f}s" for module, micros in ranked)
+
+
+@pytest.mark.slow
+def test_cli_entrypoint_skips_server_and_sdk_imports() -> None:
+    """``--help``/``--check`` paths load neither uvicorn, the Meraki SDK nor OTel SDK."""
+    profile = _import_profile("import meraki_dashboard_exporter.__main__")
+
+    eager = [
+        module
+        for module in ("uvicorn", "meraki", "fastapi", *_OTEL_SDK_MODULES)
+        if module in profile
+    ]
+    assert not eager, f"eager imports {eager}; slowest: {_slowest(profile)}"
+
+
+@pytest.mark.slow
+def test_manager_imports_only_enabled_collectors() -> None:
+    """Importing the manager and loading one collector leaves the others unimported."""
+    profile = _import_profile(
+        "from meraki_dashboard_exporter.core.registry import import_collector_modules\n"
+        "import meraki_dashboard_exporter.collectors.manager\n"
+        "import_collector_modules({'alerts'})\n"
+        # importlib-driven imports are not reported by -X importtime itself.
+        "import sys\n"
+        "assert 'meraki_dashboard_exporter.collectors.alerts' in sys.modules\n"
+    )
+
+    eager = [
+        module
+        for module in (
+            "meraki_dashboard_exporter.collectors.device",
+            "meraki_dashboard_exporter.collectors.clients",
+            "meraki_dashboard_exporter.collectors.network_health",
+            *_OTEL_SDK_MODULES,
+        )
+        if module in profile
+    ]
+    assert not eager, f"eager imports {eager}; slowest: {_slowest(profile)}"
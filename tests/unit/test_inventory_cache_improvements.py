@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 import time
 from unittest.mock import MagicMock, patch
 
@@ -241,6 +243,55 @@ class TestWarmCache:
         assert org_id in inventory._networks
         assert org_id in inventory._devices
 
+    async def test_warm_cache_overlaps_orgs_and_tracks_warmed_ones(self, mock_api, mock_settings):
+        """Orgs warm concurrently; only orgs that fully warmed are reported as warm."""
+        orgs = OrganizationFactory.create_many(3)
+        mock_settings.collectors.cold_start_concurrency = 3
+        mock_api.organizations.getOrganizations.return_value = orgs
+        # Two orgs must be fetching at the same time to pass the barrier.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def networks_side_effect(oid, **kwargs):
+            if oid == orgs[2]["id"]:
+                raise Exception("API failure for org 2")
+            barrier.wait()
+            return NetworkFactory.create_many(1, org_id=oid)
+
+        mock_api.organizations.getOrganizationNetworks.side_effect = networks_side_effect
+        mock_api.organizations.getOrganizationDevices.return_value = []
+
+        inventory = OrganizationInventory(mock_api, mock_settings)
+        await inventory.warm_cache()
+
+        assert inventory.warmed_organizations() == {orgs[0]["id"], orgs[1]["id"]}
+
+    async def test_invalidate_all_waits_out_an_in_flight_fetch(self, mock_api, mock_settings):
+        """A fetch running during a global invalidation cannot re-store stale data after it."""
+        org_id = "org_1"
+        started = threading.Event()
+        release = threading.Event()
+
+        def networks_side_effect(oid, **kwargs):
+            started.set()
+            release.wait(timeout=5)
+            return NetworkFactory.create_many(1, org_id=oid)
+
+        mock_api.organizations.getOrganizationNetworks.side_effect = networks_side_effect
+        inventory = OrganizationInventory(mock_api, mock_settings)
+
+        fetch = asyncio.create_task(inventory.get_networks(org_id))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        invalidation = asyncio.create_task(inventory.invalidate())
+        await asyncio.sleep(0.05)
+        assert not invalidation.done()
+
+        release.set()
+        await fetch
+        await invalidation
+        assert org_id not in inventory._networks
+        assert org_id not in inventory._network_timestamps
+
 
 class TestCacheSizeMetrics:
     """Test that cache_size gauge is updated when cache entries are added."""
@@ -178,7 +178,7 @@ class TestCheckMode:
                 "meraki_dashboard_exporter.__main__.Settings",
                 return_value=_valid_settings(),
             ),
-            patch("meraki_dashboard_exporter.__main__.uvicorn.run") as mock_run,
+            patch("uvicorn.run") as mock_run,
         ):
             with pytest.raises(SystemExit) as exc_info:
                 main()
@@ -195,7 +195,7 @@ class TestCheckMode:
                 "meraki_dashboard_exporter.__main__.Settings",
                 return_value=_valid_settings(),
             ),
-            patch("meraki_dashboard_exporter.__main__.uvicorn.run"),
+            patch("uvicorn.run"),
         ):
             with pytest.raises(SystemExit):
                 main()
@@ -214,7 +214,7 @@ class TestCheckMode:
                 "meraki_dashboard_exporter.__main__.Settings",
                 side_effect=_make_other_validation_error(),
             ),
-            patch("meraki_dashboard_exporter.__main__.uvicorn.run") as mock_run,
+            patch("uvicorn.run") as mock_run,
         ):
             with pytest.raises(SystemExit) as exc_info:
                 main()
@@ -229,7 +229,7 @@ class TestCheckMode:
                 "meraki_dashboard_exporter.__main__.Settings",
                 return_value=_valid_settings(),
             ),
-            patch("meraki_dashboard_exporter.__main__.uvicorn.run"),
+            patch("uvicorn.run"),
             patch("meraki_dashboard_exporter.__main__._run_auth_probe") as mock_probe,
         ):
             with pytest.raises(SystemExit) as exc_info:
@@ -245,7 +245,7 @@ class TestCheckMode:
                 "meraki_dashboard_exporter.__main__.Settings",
                 return_value=_valid_settings(),
             ),
-            patch("meraki_dashboard_exporter.__main__.uvicorn.run"),
+            patch("uvicorn.run"),
             patch(
                 "meraki_dashboard_exporter.__main__._run_auth_probe",
                 return_value=True,
@@ -264,7 +264,7 @@ class TestCheckMode:
                 "meraki_dashboard_exporter.__main__.Settings",
                 return_value=_valid_settings(),
             ),
-            patch("meraki_dashboard_exporter.__main__.uvicorn.run"),
+            patch("uvicorn.run"),
             patch(
                 "meraki_dashboard_exporter.__main__._run_auth_probe",
                 return_value=False,
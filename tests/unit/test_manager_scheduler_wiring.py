@@ -17,6 +17,7 @@ depend on that lane being merged.
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -222,6 +223,43 @@ class TestCollectInitialResolve:
         mock_res.assert_awaited_once()
         assert order == ["warm", "resolve"]
 
+    @pytest.mark.asyncio
+    async def test_collect_initial_runs_collectors_concurrently_in_priority_order(self) -> None:
+        """Cold start overlaps collectors up to cold_start_concurrency, highest priority first."""
+        settings = _settings()
+        settings.collectors.cold_start_concurrency = 2
+        manager = _bare_manager(settings)
+        manager.inventory = MagicMock()
+        manager.inventory.warm_cache = AsyncMock()
+        manager.collectors = [
+            _fake_collector(name, (_group(group, priority=priority, floor=300),))
+            for name, group, priority in (
+                ("LowCollector", EndpointGroupName.MS_PORT_STATUS, 3),
+                ("HighCollector", EndpointGroupName.MX_UPLINK_STATUS, 1),
+                ("MidCollector", EndpointGroupName.MT_SENSOR_READINGS, 2),
+            )
+        ]
+        started: list[str] = []
+        running = 0
+        peak = 0
+
+        async def run_once(collector: Any, *, force: bool = False) -> None:
+            nonlocal running, peak
+            started.append(type(collector).__name__)
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        with (
+            patch.object(manager, "_resolve_and_log_schedule", AsyncMock()),
+            patch.object(manager, "run_collector_once", side_effect=run_once),
+        ):
+            await manager.collect_initial()
+
+        assert started == ["HighCollector", "MidCollector", "LowCollector"]
+        assert peak == 2
+
     @pytest.mark.asyncio
     async def test_over_budget_logs_warning_naming_low_priority_collectors(self) -> None:
         """Over-budget resolve warns and names the priority-3/4 collectors to disable."""
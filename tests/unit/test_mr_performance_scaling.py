@@ -0,0 +1,97 @@
+"""Scaling check for the MR CPU-load pipeline.
+
+The CPU-load batch resolves every response row through a serial index built
+once per org cycle, so the work grows linearly with the AP count. The check
+counts device-record reads for one batch at N and 4N APs: linear work reads
+exactly 4x as many, the old per-row scan of the batch (quadratic) read ~16x.
+"""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+
+from prometheus_client import CollectorRegistry, Gauge
+
+from meraki_dashboard_exporter.collectors.devices.mr.performance import MRPerformanceCollector
+
+
+class _CountingDevice(dict[str, Any]):
+    """Device record that counts its field reads into a shared tally."""
+
+    reads = 0
+
+    def __getitem__(self, key: str) -> Any:
+        type(self).reads += 1
+        return super().__getitem__(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        type(self).reads += 1
+        return super().get(key, default)
+
+
+def _collector() -> MRPerformanceCollector:
+    registry = CollectorRegistry()
+    parent = MagicMock()
+    parent.settings = MagicMock()
+    parent.rate_limiter = None
+    parent.inventory = None
+    parent._create_gauge = MagicMock(
+        side_effect=lambda name, description, labelnames: Gauge(
+            name.value if hasattr(name, "value") else name,
+            description,
+            labelnames,
+            registry=registry,
+        )
+    )
+    parent._group_ttl_seconds = MagicMock(return_value=None)
+    parent._set_metric = MagicMock()
+    return MRPerformanceCollector(parent)
+
+
+def _fleet(count: int) -> tuple[list[dict[str, Any]], list[dict[str, object]]]:
+    devices: list[dict[str, Any]] = [
+        _CountingDevice(serial=f"Q2MR-{i:06d}", model="MR46", networkId=f"N{i % 50}", name=f"ap{i}")
+        for i in range(count)
+    ]
+    # Reversed so a linear scan would have to walk most of the batch per row.
+    rows = [
+        {"serial": d["serial"], "history": [{"load": 10.0}, {"load": 42.5}]}
+        for d in reversed(devices)
+    ]
+    return devices, rows
+
+
+async def _batch_reads(count: int) -> int:
+    """Device-record reads for one batch of ``count`` APs; every AP is emitted."""
+    collector = _collector()
+    devices, rows = _fleet(count)
+    collector.api.wireless.getOrganizationWirelessDevicesSystemCpuLoadHistory = MagicMock(
+        return_value=rows
+    )
+    _CountingDevice.reads = 0
+    await collector._process_cpu_load_batch("O1", "Org", devices)
+    assert collector.parent._set_metric.call_count == count
+    return _CountingDevice.reads
+
+
+def test_cpu_load_columns_skip_rows_without_a_latest_load() -> None:
+    """The columnar pass keeps only rows with a serial and a latest load."""
+    serials, loads = MRPerformanceCollector._cpu_load_columns([
+        {"serial": "A", "history": [{"load": 1}, {"load": 2}]},
+        {"serial": "B", "history": []},
+        {"serial": "C", "history": [{"load": None}]},
+        {"history": [{"load": 5}]},
+    ])
+
+    assert (serials, loads) == (["A"], [2.0])
+
+
+async def test_cpu_load_batch_scales_linearly_with_ap_count() -> None:
+    """Four times the APs reads each device record the same number of times."""
+    small = await _batch_reads(250)
+    large = await _batch_reads(1_000)
+
+    assert large == 4 * small, f"250 APs: {small} reads, 1,000 APs: {large} reads"
@@ -575,17 +575,16 @@ class TestMTCollector(BaseCollectorTest):
         mt_collector._collect_org_sensors.assert_awaited_once_with("orgA", "A", due=True)
 
     async def test_get_org_name_prefers_inventory_cache(self, mt_collector):
-        """F-092: org name is resolved from the inventory cache, not a per-cycle getOrganization."""
+        """F-092: org name is resolved from the inventory directory, not a per-cycle getOrganization."""
         mock_inventory = MagicMock()
-        mock_inventory.get_organizations = AsyncMock(
-            return_value=[{"id": "orgA", "name": "Cached Org A"}]
-        )
+        mock_inventory.get_org_name = AsyncMock(return_value="Cached Org A")
         mt_collector.parent.inventory = mock_inventory
         mt_collector.api.organizations.getOrganization = MagicMock()
 
         name = await mt_collector._get_org_name("orgA")
 
         assert name == "Cached Org A"
+        mock_inventory.get_org_name.assert_awaited_once_with("orgA")
         mt_collector.api.organizations.getOrganization.assert_not_called()
 
 
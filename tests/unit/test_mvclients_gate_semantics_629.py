@@ -7,8 +7,8 @@ Covers two fan-out sites that previously marked their group ran unconditionally
 even when every ``@with_error_handling(continue_on_error=True)`` sub-fetch was
 swallowed to ``None``:
 
-- ``MVCollector.collect`` — the ``mv_analytics`` three-call fan-out (and the
-  single-call ``mv_sense_config`` site).
+- ``MVCollector.collect`` — the two-call ``mv_config`` lane, the
+  ``mv_analytics`` lane and the single-call ``mv_sense_config`` site.
 - ``ClientsCollector._collect_impl`` — the per-network ``getNetworkClients``
   fan-out for the ``clients_list`` group.
 
@@ -111,6 +111,7 @@ class TestMVGateSemantics:
         await mv_collector.collect(device)
 
         assert EndpointGroupName.MV_ANALYTICS not in self._marked_groups(mock_parent)
+        assert EndpointGroupName.MV_CONFIG not in self._marked_groups(mock_parent)
 
     async def test_analytics_marked_when_one_subfetch_succeeds(
         self,
@@ -119,7 +120,7 @@ class TestMVGateSemantics:
         mock_parent: MagicMock,
         device: dict[str, Any],
     ) -> None:
-        """Only zones succeeds (recent + quality fail) ⇒ mv_analytics marked."""
+        """Only zones succeeds (quality fails) ⇒ mv_config marked; failed recent ⇒ not analytics."""
         mock_api.camera.getDeviceCameraSense = MagicMock(side_effect=Exception("sense boom"))
         mock_api.camera.getDeviceCameraAnalyticsZones = MagicMock(
             return_value=[{"id": "0", "label": "Entrance", "type": ["person"]}]
@@ -133,7 +134,8 @@ class TestMVGateSemantics:
 
         await mv_collector.collect(device)
 
-        assert EndpointGroupName.MV_ANALYTICS in self._marked_groups(mock_parent)
+        assert EndpointGroupName.MV_CONFIG in self._marked_groups(mock_parent)
+        assert EndpointGroupName.MV_ANALYTICS not in self._marked_groups(mock_parent)
 
     async def test_analytics_marked_on_successful_empty(
         self,
@@ -162,6 +164,7 @@ class TestMVGateSemantics:
         await mv_collector.collect(device)
 
         assert EndpointGroupName.MV_ANALYTICS in self._marked_groups(mock_parent)
+        assert EndpointGroupName.MV_CONFIG in self._marked_groups(mock_parent)
 
     # ---- mv_sense_config (single fetch) --------------------------------
 
@@ -0,0 +1,183 @@
+"""Tests for the facade-level negative-result cache."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from meraki.exceptions import APIError
+from prometheus_client import REGISTRY
+
+from meraki_dashboard_exporter.core.api_facade import MerakiApiFacade
+from meraki_dashboard_exporter.core.negative_cache import (
+    NegativeCachedError,
+    NegativeResultCache,
+    negative_results,
+)
+
+OP = "getNetworkWirelessMeshStatuses"
+NOW = 1_760_000_000.0
+
+
+class _ApiError(Exception):
+    def __init__(self, status: int) -> None:
+        super().__init__(f"{status} error")
+        self.status = status
+
+
+def _settings(**overrides: object) -> SimpleNamespace:
+    values: dict[str, object] = {
+        "max_retries": 0,
+        "per_fetch_deadline_seconds": 5,
+        "negative_cache_enabled": True,
+        "negative_cache_base_seconds": 900.0,
+        "negative_cache_max_seconds": 3600.0,
+    }
+    values.update(overrides)
+    return SimpleNamespace(api=SimpleNamespace(**values))
+
+
+def _suppressed(operation: str = OP) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "meraki_exporter_api_negative_cache_suppressed_total", {"operation": operation}
+        )
+        or 0.0
+    )
+
+
+def test_reprobe_delay_doubles_up_to_the_cap() -> None:
+    """Each failed re-probe doubles the delay; the cap bounds it."""
+    cache = NegativeResultCache()
+    delays = []
+    now = NOW
+    for _ in range(4):
+        assert cache.record_failure(
+            OP, "N1", _ApiError(404), base_seconds=100, max_seconds=300, now=now
+        )
+        assert cache.suppressed(OP, "N1", now=now + 99) is not None
+        retry_at = cache._entries[(OP, "N1")].retry_at
+        delays.append(retry_at - now)
+        now = retry_at
+        assert cache.suppressed(OP, "N1", now=now) is None
+
+    jitter = delays[0] / 100
+    assert [round(d / jitter) for d in delays] == [100, 200, 300, 300]
+
+
+def test_only_benign_categories_are_cached() -> None:
+    """Only 404 is cached; 400, 5xx, auth and rate limiting are not."""
+    cache = NegativeResultCache()
+    for status, cached in ((404, True), (400, False), (500, False), (403, False), (429, False)):
+        assert (
+            cache.record_failure(
+                OP, f"N{status}", _ApiError(status), base_seconds=60, max_seconds=60
+            )
+            is cached
+        )
+
+
+def test_inventory_change_invalidates_the_entity() -> None:
+    """A changed or departed record drops its entity and leaves the others."""
+    cache = NegativeResultCache()
+    devices = [{"serial": "Q1", "networkId": "N1"}, {"serial": "Q2", "networkId": "N1"}]
+    cache.observe_inventory("devices", "O1", devices, "serial")
+    for entity in ("Q1", "Q2"):
+        cache.record_failure(OP, entity, _ApiError(404), base_seconds=60, max_seconds=60)
+
+    cache.observe_inventory("devices", "O1", devices, "serial")
+    assert len(cache) == 2
+
+    moved = [{"serial": "Q1", "networkId": "N2"}, {"serial": "Q2", "networkId": "N1"}]
+    assert cache.observe_inventory("devices", "O1", moved, "serial") == 1
+    assert cache.suppressed(OP, "Q2") is not None
+
+    cache.record_failure(OP, "Q1", _ApiError(404), base_seconds=60, max_seconds=60)
+    assert cache.observe_inventory("devices", "O1", moved[1:], "serial") == 1
+    assert cache.suppressed(OP, "Q1") is None
+    assert cache.suppressed(OP, "Q2") is not None
+
+
+async def test_facade_replays_a_cached_404_without_calling_the_sdk() -> None:
+    """A repeated read of a 404 pair is answered locally and counted."""
+    facade = MerakiApiFacade(settings=_settings())
+    calls: list[str] = []
+
+    def request(network_id: str) -> list[dict[str, str]]:
+        calls.append(network_id)
+        if network_id == "N1":
+            raise _ApiError(404)
+        return [{"serial": "Q1"}]
+
+    with pytest.raises(_ApiError):
+        await facade.call(OP, request, "N1")
+    with pytest.raises(NegativeCachedError) as replayed:
+        await facade.call(OP, request, "N1")
+    assert await facade.call(OP, request, "N2") == [{"serial": "Q1"}]
+
+    assert calls == ["N1", "N2"]
+    assert isinstance(replayed.value, APIError)
+    assert replayed.value.status == 404
+    assert "404" in str(replayed.value)
+    assert _suppressed() == 1.0
+
+
+async def test_facade_cache_is_opt_out_and_ignores_writes() -> None:
+    """Disabled caching and non-GET operations always reach the SDK."""
+    calls: list[str] = []
+
+    def request(network_id: str) -> None:
+        calls.append(network_id)
+        raise _ApiError(404)
+
+    disabled = MerakiApiFacade(settings=_settings(negative_cache_enabled=False))
+    enabled = MerakiApiFacade(settings=_settings())
+    for facade, operation in ((disabled, OP), (enabled, "updateNetworkWirelessSsid")):
+        for _ in range(2):
+            with pytest.raises(_ApiError):
+                await facade.call(operation, request, "N1")
+
+    assert len(calls) == 4
+    assert len(negative_results) == 0
+
+
+async def test_facade_cache_skips_org_level_and_batched_reads() -> None:
+    """Reads answering for many entities always reach the SDK."""
+    facade = MerakiApiFacade(settings=_settings())
+    calls: list[str] = []
+
+    def request(*args: object, **kwargs: object) -> None:
+        calls.append(str(args or kwargs))
+        raise _ApiError(404)
+
+    for _ in range(2):
+        with pytest.raises(_ApiError):
+            await facade.call("getOrganizationDevices", request, "O1")
+        with pytest.raises(_ApiError):
+            await facade.call(OP, request, networkId="N1", serials=["Q1", "Q2"])
+
+    assert len(calls) == 4
+    assert len(negative_results) == 0
+
+
+async def test_facade_cache_keeps_per_client_reads_apart() -> None:
+    """One client's 404 never suppresses another client on the same network."""
+    facade = MerakiApiFacade(settings=_settings())
+    operation = "getNetworkWirelessSignalQualityHistory"
+    calls: list[str] = []
+
+    def request(network_id: str, **kwargs: str) -> list[dict[str, int]]:
+        calls.append(kwargs["clientId"])
+        if kwargs["clientId"] == "A":
+            raise _ApiError(404)
+        return [{"snr": 30}]
+
+    for _ in range(2):
+        with pytest.raises(_ApiError):
+            await facade.call(operation, request, "N1", clientId="A", timespan=300)
+    assert await facade.call(operation, request, "N1", clientId="B", timespan=300) == [{"snr": 30}]
+
+    assert calls == ["A", "A", "B"]
+    assert len(negative_results) == 0
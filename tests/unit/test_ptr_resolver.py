@@ -0,0 +1,307 @@
+"""Tests for the event-loop PTR resolver backend, against a local stub DNS server."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import socket
+import struct
+import time
+from collections.abc import Callable
+
+import pytest
+
+from meraki_dashboard_exporter.core.config import Settings
+from meraki_dashboard_exporter.services.dns_resolver import DNSResolver
+from meraki_dashboard_exporter.services.ptr_resolver import (
+    AsyncPTRResolver,
+    PTRAnswer,
+    build_ptr_query,
+    parse_nameserver,
+    parse_ptr_response,
+    parse_resolv_conf,
+)
+
+
+def _encode_name(name: str) -> bytes:
+    out = bytearray()
+    for label in name.rstrip(".").split("."):
+        out.append(len(label))
+        out += label.encode("ascii")
+    return bytes(out) + b"\x00"
+
+
+def _answer(query: bytes, hostname: str | None, rcode: int = 0, truncated: bool = False) -> bytes:
+    """Build a response echoing the question, answering with a compressed PTR."""
+    query_id = struct.unpack_from("!H", query)[0]
+    question = query[12:]
+    flags = 0x8180 | rcode | (0x0200 if truncated else 0)
+    ancount = 1 if hostname and not truncated else 0
+    message = struct.pack("!HHHHHH", query_id, flags, 1, ancount, 0, 0) + question
+    if ancount:
+        rdata = _encode_name(hostname)  # type: ignore[arg-type]
+        # Owner name is a pointer to the question name at offset 12.
+        message += b"\xc0\x0c" + struct.pack("!HHIH", 12, 1, 300, len(rdata)) + rdata
+    return message
+
+
+def _qname(query: bytes) -> str:
+    labels = []
+    offset = 12
+    while query[offset]:
+        length = query[offset]
+        labels.append(query[offset + 1 : offset + 1 + length].decode())
+        offset += 1 + length
+    return ".".join(labels)
+
+
+def _ip_from_qname(qname: str) -> str:
+    return ".".join(reversed(qname.split(".")[:4]))
+
+
+class _StubDNS(asyncio.DatagramProtocol):
+    """UDP stub answering through ``handler(query) -> bytes | None``."""
+
+    def __init__(self, handler: Callable[[bytes], bytes | None]) -> None:
+        self.handler = handler
+        self.queries: list[str] = []
+        self.transport: asyncio.DatagramTransport | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def datagram_received(self, data: bytes, addr: tuple[str | int, ...]) -> None:
+        self.queries.append(_qname(data))
+        reply = self.handler(data)
+        if reply is not None:
+            assert self.transport is not None
+            self.transport.sendto(reply, addr)
+
+
+async def _start_stub(handler: Callable[[bytes], bytes | None]) -> tuple[_StubDNS, int]:
+    loop = asyncio.get_running_loop()
+    transport, protocol = await loop.create_datagram_endpoint(
+        lambda: _StubDNS(handler), local_addr=("127.0.0.1", 0)
+    )
+    # A burst of pipelined queries can overflow the default receive buffer of a
+    # single-threaded stub; a real nameserver is not the unit under test.
+    transport.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 22)
+    return protocol, transport.get_extra_info("sockname")[1]
+
+
+def _hosts_handler(query: bytes) -> bytes:
+    ip = _ip_from_qname(_qname(query))
+    if ip == "10.0.0.99":
+        return _answer(query, None, rcode=3)
+    return _answer(query, f"host-{ip.replace('.', '-')}.corp.example")
+
+
+def test_parse_resolv_conf(tmp_path):
+    """Nameserver lines are read in order; other directives are ignored."""
+    conf = tmp_path / "resolv.conf"
+    conf.write_text("# comment\nsearch corp.example\nnameserver 10.0.0.2\nnameserver ::1\n")
+
+    assert parse_resolv_conf(conf) == [("10.0.0.2", 53), ("::1", 53)]
+    assert parse_resolv_conf(tmp_path / "missing") == [("127.0.0.1", 53)]
+
+
+def test_parse_nameserver_ports():
+    """Explicit ports are honoured for IPv4 and bracketed IPv6 specs."""
+    assert parse_nameserver("10.0.0.2") == ("10.0.0.2", 53)
+    assert parse_nameserver("10.0.0.2:5353") == ("10.0.0.2", 5353)
+    assert parse_nameserver("[::1]:5353") == ("::1", 5353)
+    assert parse_nameserver("fe80::1") == ("fe80::1", 53)
+
+
+def test_parse_response_follows_compression():
+    """PTR rdata behind a compression pointer is decoded to the full name."""
+    query = build_ptr_query(7, "1.0.0.10.in-addr.arpa")
+    response = parse_ptr_response(_answer(query, "printer.corp.example"))
+
+    assert response.query_id == 7
+    assert response.qname == "1.0.0.10.in-addr.arpa"
+    assert response.hostname == "printer.corp.example"
+
+
+@pytest.mark.asyncio
+async def test_pipelines_many_queries_over_one_socket():
+    """Thousands of lookups share one socket and all resolve."""
+    stub, port = await _start_stub(_hosts_handler)
+    resolver = AsyncPTRResolver([("127.0.0.1", port)], timeout=2.0, attempts=1, max_inflight=256)
+    ips = [str(ipaddress.IPv4Address("10.1.0.0") + i) for i in range(1, 2001)]
+    try:
+        answers = await asyncio.gather(*(resolver.resolve(ip) for ip in ips))
+    finally:
+        resolver.close()
+        assert stub.transport is not None
+        stub.transport.close()
+
+    assert len(resolver._channels) == 0
+    assert [a.status for a in answers] == ["ok"] * len(ips)
+    assert answers[0].hostname == "host-10-1-0-1.corp.example"
+    assert len(stub.queries) == len(ips)
+
+
+@pytest.mark.asyncio
+async def test_nxdomain_is_negative():
+    """NXDOMAIN maps to a negative answer without retrying."""
+    stub, port = await _start_stub(_hosts_handler)
+    resolver = AsyncPTRResolver([("127.0.0.1", port)], timeout=1.0, attempts=3, max_inflight=4)
+    try:
+        answer = await resolver.resolve("10.0.0.99")
+    finally:
+        resolver.close()
+        assert stub.transport is not None
+        stub.transport.close()
+
+    assert answer.hostname is None
+    assert answer.status == "nxdomain"
+    assert answer.negative
+    assert len(stub.queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_retries_after_dropped_query():
+    """A dropped datagram is retried after the per-attempt timeout."""
+    seen = 0
+
+    def flaky(query: bytes) -> bytes | None:
+        nonlocal seen
+        seen += 1
+        return None if seen == 1 else _hosts_handler(query)
+
+    stub, port = await _start_stub(flaky)
+    resolver = AsyncPTRResolver([("127.0.0.1", port)], timeout=0.4, attempts=2, max_inflight=4)
+    try:
+        answer = await resolver.resolve("10.0.0.5")
+    finally:
+        resolver.close()
+        assert stub.transport is not None
+        stub.transport.close()
+
+    assert answer.status == "ok"
+    assert len(stub.queries) == 2
+
+
+@pytest.mark.asyncio
+async def test_closing_socket_is_reopened():
+    """A socket closed under the resolver is replaced instead of used."""
+    stub, port = await _start_stub(_hosts_handler)
+    resolver = AsyncPTRResolver([("127.0.0.1", port)], timeout=0.4, attempts=2, max_inflight=4)
+    try:
+        assert (await resolver.resolve("10.0.0.5")).status == "ok"
+        stale = resolver._channels[("127.0.0.1", port)]
+        assert stale.transport is not None
+        stale.transport.close()
+        answer = await resolver.resolve("10.0.0.6")
+        fresh = resolver._channels[("127.0.0.1", port)]
+    finally:
+        resolver.close()
+        assert stub.transport is not None
+        stub.transport.close()
+
+    assert answer.status == "ok"
+    assert fresh is not stale
+    assert len(stub.queries) == 2
+
+
+@pytest.mark.asyncio
+async def test_unresponsive_server_times_out():
+    """A silent nameserver yields a timeout within the configured budget."""
+    stub, port = await _start_stub(lambda _query: None)
+    resolver = AsyncPTRResolver([("127.0.0.1", port)], timeout=0.3, attempts=2, max_inflight=4)
+    started = time.monotonic()
+    try:
+        answer = await resolver.resolve("10.0.0.5")
+    finally:
+        resolver.close()
+        assert stub.transport is not None
+        stub.transport.close()
+
+    assert answer.status == "timeout"
+    assert time.monotonic() - started < 1.0
+
+
+@pytest.mark.asyncio
+async def test_truncated_answer_falls_back_to_tcp():
+    """A TC-flagged UDP answer is re-asked over TCP on the same port."""
+    stub, port = await _start_stub(lambda q: _answer(q, None, truncated=True))
+
+    async def handle_tcp(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        (length,) = struct.unpack("!H", await reader.readexactly(2))
+        reply = _answer(await reader.readexactly(length), "big.corp.example")
+        writer.write(struct.pack("!H", len(reply)) + reply)
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle_tcp, "127.0.0.1", port)
+    resolver = AsyncPTRResolver([("127.0.0.1", port)], timeout=2.0, attempts=1, max_inflight=4)
+    try:
+        answer = await resolver.resolve("10.0.0.7")
+    finally:
+        resolver.close()
+        server.close()
+        assert stub.transport is not None
+        stub.transport.close()
+
+    assert answer.status == "ok"
+    assert answer.hostname == "big.corp.example"
+
+
+@pytest.mark.asyncio
+async def test_dns_resolver_async_backend(monkeypatch):
+    """DNSResolver uses the async backend and caches negatives with their own TTL."""
+    stub, port = await _start_stub(_hosts_handler)
+    monkeypatch.setenv("MERAKI_EXPORTER_MERAKI__API_KEY", "a" * 40)
+    monkeypatch.setenv("MERAKI_EXPORTER_CLIENTS__DNS_RESOLVER_BACKEND", "async")
+    monkeypatch.setenv("MERAKI_EXPORTER_CLIENTS__DNS_NAMESERVERS", f"127.0.0.1:{port}")
+    monkeypatch.setenv("MERAKI_EXPORTER_CLIENTS__DNS_NEGATIVE_CACHE_TTL", "120")
+    resolver = DNSResolver(Settings())
+    try:
+        assert await resolver.resolve_hostname("10.0.0.5") == "host-10-0-0-5"
+        assert await resolver.resolve_hostname("10.0.0.99") is None
+        assert await resolver.resolve_hostname("10.0.0.99") is None
+    finally:
+        resolver.close()
+        assert stub.transport is not None
+        stub.transport.close()
+
+    assert stub.queries.count("99.0.0.10.in-addr.arpa") == 1
+    assert resolver._cache["10.0.0.99"].ttl == 120
+    assert resolver._cache["10.0.0.5"].ttl is None
+    # The negative entry expires on its own, shorter TTL.
+    resolver._cache["10.0.0.99"].timestamp -= 121
+    resolver._cache["10.0.0.5"].timestamp -= 121
+    assert not resolver._is_cache_valid(resolver._cache["10.0.0.99"])
+    assert resolver._is_cache_valid(resolver._cache["10.0.0.5"])
+
+
+@pytest.mark.asyncio
+async def test_dns_resolver_caches_transient_failures_briefly(monkeypatch):
+    """Timeouts and SERVFAIL use the short transient TTL, not the negative one."""
+    monkeypatch.setenv("MERAKI_EXPORTER_MERAKI__API_KEY", "a" * 40)
+    monkeypatch.setenv("MERAKI_EXPORTER_CLIENTS__DNS_RESOLVER_BACKEND", "async")
+    monkeypatch.setenv("MERAKI_EXPORTER_CLIENTS__DNS_NAMESERVERS", "127.0.0.1:53")
+    resolver = DNSResolver(Settings())
+    answers = {
+        "10.0.0.1": PTRAnswer(hostname=None, status="timeout"),
+        "10.0.0.2": PTRAnswer(hostname=None, status="servfail"),
+        "10.0.0.3": PTRAnswer(hostname=None, status="nxdomain"),
+    }
+
+    async def fake_resolve(ip: str) -> PTRAnswer:
+        return answers[ip]
+
+    assert resolver._ptr_resolver is not None
+    monkeypatch.setattr(resolver._ptr_resolver, "resolve", fake_resolve)
+    try:
+        for ip in answers:
+            assert await resolver.resolve_hostname(ip) is None
+    finally:
+        resolver.close()
+
+    assert resolver._cache["10.0.0.1"].ttl == resolver.transient_failure_ttl == 60
+    assert resolver._cache["10.0.0.2"].ttl == 60
+    assert resolver._cache["10.0.0.3"].ttl == resolver.negative_cache_ttl
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
@@ -186,7 +187,9 @@ class TestCollectorManagerReadiness:
         assert status == {
             "ready": False,
             "api_success": False,
+            "quorum": 1.0,
             "collectors": {},
+            "orgs": {"123456": {"inventory_warm": False, "groups": {}}},
         }
 
     def test_not_ready_until_every_gating_collector_succeeds(self, test_settings: Settings) -> None:
@@ -230,5 +233,40 @@ class TestCollectorManagerReadiness:
         assert status == {
             "ready": True,
             "api_success": True,
+            "quorum": 1.0,
             "collectors": {"DeviceCollector": True},
+            "orgs": {"123456": {"inventory_warm": False, "groups": {"grp": False}}},
         }
+
+    def test_quorum_allows_ready_before_every_collector_succeeds(
+        self, test_settings: Settings
+    ) -> None:
+        """With a quorum below 1.0, the slowest gating collectors no longer block readiness."""
+        test_settings.collectors.readiness_quorum = 0.5
+        manager = self._make_manager(test_settings, api_requests=5)
+        manager.collectors = [
+            _gating_collector("DeviceCollector"),
+            _gating_collector("AlertsCollector"),
+            _gating_collector("MTSensorCollector"),
+        ]
+
+        manager._collector_succeeded.add("DeviceCollector")
+        assert manager.is_ready is False
+
+        manager._collector_succeeded.add("AlertsCollector")
+        assert manager.is_ready is True
+        assert manager.get_readiness_status()["collectors"]["MTSensorCollector"] is False
+
+    def test_org_status_reports_warm_inventory_and_fresh_groups(
+        self, test_settings: Settings
+    ) -> None:
+        """Each org lists whether its inventory warmed and which gating groups are fresh."""
+        manager = self._make_manager(test_settings, api_requests=5)
+        manager.collectors = [_gating_collector("DeviceCollector")]
+        manager.inventory._warmed_orgs.add("123456")
+        manager.scheduler._last_ran["grp"] = time.monotonic()
+        manager.scheduler.interval_for = lambda group, org_id=None: 60.0  # type: ignore[assignment]
+
+        orgs = manager.get_readiness_status()["orgs"]
+
+        assert orgs == {"123456": {"inventory_warm": True, "groups": {"grp": True}}}
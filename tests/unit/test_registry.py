@@ -4,8 +4,11 @@ from __future__ import annotations
 
 from meraki_dashboard_exporter.core.collector import MetricCollector
 from meraki_dashboard_exporter.core.registry import (
+    COLLECTOR_MANIFEST,
     clear_registry,
+    collector_short_name,
     get_registered_collectors,
+    import_collector_modules,
     register_collector,
 )
 
@@ -131,3 +134,27 @@ class TestRegistry:
         assert TestCollector.__doc__ == "Test collector docstring."
         assert TestCollector.custom_attribute == "test"
         assert TestCollector.__name__ == "TestCollector"
+
+
+class TestCollectorManifest:
+    """The static manifest drives lazy collector imports."""
+
+    def test_manifest_matches_decorated_collectors(self) -> None:
+        """Every manifest entry names a collector class defined in its module."""
+        import importlib
+
+        for class_name, module in COLLECTOR_MANIFEST.items():
+            collector_module = importlib.import_module(
+                f"meraki_dashboard_exporter.collectors.{module}"
+            )
+            cls = getattr(collector_module, class_name)
+            assert issubclass(cls, MetricCollector)
+
+    def test_import_collector_modules_reports_inactive_collectors(self) -> None:
+        """Only active collectors are imported; the rest are returned as not imported."""
+        not_imported = import_collector_modules({"device", "alerts"})
+
+        assert "DeviceCollector" not in not_imported
+        assert "AlertsCollector" not in not_imported
+        assert set(not_imported) == set(COLLECTOR_MANIFEST) - {"DeviceCollector", "AlertsCollector"}
+        assert collector_short_name("MTSensorAlertsCollector") == "mtsensoralerts"
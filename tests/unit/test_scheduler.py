@@ -50,6 +50,7 @@ EXPECTED_GROUP_NAMES = [
     "mx_security_events",
     "mx_firewall_config",
     "mv_analytics",
+    "mv_config",
     "mg_uplink_status",
     "nh_channel_utilization",
     "nh_connection_stats",
@@ -674,6 +675,27 @@ class TestGateSemantics:
         # never mark_ran (fetch failed) -> still runnable immediately
         assert sched.should_run(g, now=5.0) is True
 
+    def test_expedite_opens_gate_once(self) -> None:
+        """An expedited group is due inside its interval, for exactly one run."""
+        sched = _make_scheduler()
+        sched.resolve(SMALL_SHAPE)
+        g = EndpointGroupName.NH_DATA_RATES
+        sched.mark_ran(g, now=1000.0)
+        assert sched.should_run(g, now=1010.0) is False
+        assert sched.expedite(g) is True
+        assert sched.is_expedited(g) is True
+        assert sched.next_due(g, now=1010.0) == 1010.0
+        assert sched.should_run(g, now=1010.0) is True
+        assert sched.is_expedited(g) is False
+        sched.mark_ran(g, now=1011.0)
+        assert sched.should_run(g, now=1020.0) is False
+
+    def test_expedite_ungated_or_unknown_group_is_noop(self) -> None:
+        """Ungated and unregistered groups are always due; nothing to expedite."""
+        sched = _make_scheduler()
+        assert sched.expedite(EndpointGroupName.INVENTORY_WARM) is False
+        assert sched.expedite(EndpointGroupName.MV_ANALYTICS) is False
+
 
 class TestTtlAndFastest:
     """ttl_seconds_for() and fastest_effective_interval_seconds()."""
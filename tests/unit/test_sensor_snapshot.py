@@ -0,0 +1,108 @@
+"""Tests for the shared per-org MT sensor-readings snapshot."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from meraki_dashboard_exporter.collectors.devices.mt import MTCollector
+from meraki_dashboard_exporter.services.sensor_snapshot import SensorReadingsSnapshot
+
+READINGS = [{"serial": "Q2MT-1", "readings": []}]
+
+
+async def test_concurrent_readers_share_one_fetch() -> None:
+    """Readers arriving while a fetch is in flight await it instead of refetching."""
+    snapshot = SensorReadingsSnapshot()
+    release = asyncio.Event()
+    calls: list[str] = []
+
+    async def fetch(org_id: str) -> list[dict[str, object]]:
+        calls.append(org_id)
+        await release.wait()
+        return READINGS
+
+    tasks = [asyncio.create_task(snapshot.get("O1", fetch, 60.0)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == ["O1"]
+    assert all(result is READINGS for result in results)
+
+
+async def test_snapshot_is_reused_within_the_cycle_only(monkeypatch) -> None:
+    """A snapshot younger than half the interval is reused; an older one is refetched."""
+    clock = [1000.0]
+    monkeypatch.setattr(
+        "meraki_dashboard_exporter.services.sensor_snapshot.time.monotonic", lambda: clock[0]
+    )
+    snapshot = SensorReadingsSnapshot()
+    fetch = AsyncMock(return_value=READINGS)
+
+    await snapshot.get("O1", fetch, 60.0)
+    clock[0] += 29.0
+    await snapshot.get("O1", fetch, 60.0)
+    assert fetch.await_count == 1
+
+    clock[0] += 2.0
+    await snapshot.get("O1", fetch, 60.0)
+    await snapshot.get("O2", fetch, 60.0)
+    assert fetch.await_count == 3
+
+    snapshot.invalidate("O1")
+    await snapshot.get("O1", fetch, 60.0)
+    assert fetch.await_count == 4
+
+
+async def test_failed_fetch_reaches_every_waiter_and_is_not_cached() -> None:
+    """A fetch error propagates to concurrent readers; the next read retries."""
+    snapshot = SensorReadingsSnapshot()
+    release = asyncio.Event()
+
+    async def failing(_org_id: str) -> list[dict[str, object]]:
+        await release.wait()
+        raise RuntimeError("boom")
+
+    tasks = [asyncio.create_task(snapshot.get("O1", failing, 60.0)) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    fetch = AsyncMock(return_value=READINGS)
+    assert await snapshot.get("O1", fetch, 60.0) is READINGS
+    fetch.assert_awaited_once_with("O1")
+
+
+async def test_mt_consumers_read_through_the_inventory_snapshot() -> None:
+    """Two MT consumers sharing an inventory issue one readings fetch per cycle."""
+    inventory = SimpleNamespace(sensor_readings=SensorReadingsSnapshot())
+    parent = SimpleNamespace(inventory=inventory, _group_interval=MagicMock(return_value=300.0))
+    consumers = []
+    for _ in range(2):
+        mt = MTCollector.as_standalone(api=MagicMock(), settings=MagicMock())
+        mt.parent = parent
+        mt._fetch_sensor_readings = AsyncMock(return_value=READINGS)
+        consumers.append(mt)
+
+    for mt in consumers:
+        assert await mt._get_sensor_readings("O1", inventory) is READINGS
+
+    assert consumers[0]._fetch_sensor_readings.await_count == 1
+    consumers[1]._fetch_sensor_readings.assert_not_awaited()
+
+
+@pytest.mark.parametrize("inventory", [None, SimpleNamespace(), MagicMock()])
+async def test_mt_without_a_snapshot_fetches_directly(inventory: object) -> None:
+    """No inventory (or a double without a real snapshot) falls back to a direct fetch."""
+    mt = MTCollector.as_standalone(api=MagicMock(), settings=MagicMock())
+    mt._fetch_sensor_readings = AsyncMock(return_value=READINGS)
+
+    assert await mt._get_sensor_readings("O1", inventory) is READINGS
+    mt._fetch_sensor_readings.assert_awaited_once_with("O1")
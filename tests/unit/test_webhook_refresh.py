@@ -0,0 +1,188 @@
+"""Tests for webhook-driven inventory invalidation and targeted re-polls."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from prometheus_client import REGISTRY
+
+from meraki_dashboard_exporter.core.scheduler import EndpointGroupName
+from meraki_dashboard_exporter.core.webhook_refresh import WebhookRefreshCoordinator
+
+
+class DeviceCollector:
+    """Owner of the availability and uplink groups."""
+
+    def get_endpoint_groups(self):
+        """Return the declared groups."""
+        return (
+            SimpleNamespace(name=EndpointGroupName.DEVICE_AVAILABILITY),
+            SimpleNamespace(name=EndpointGroupName.MX_UPLINK_STATUS),
+        )
+
+
+class ConfigCollector:
+    """Owner of the config group."""
+
+    def get_endpoint_groups(self):
+        """Return the declared groups."""
+        return (SimpleNamespace(name=EndpointGroupName.CONFIG_ORG),)
+
+
+def _settings(enabled: bool = True, debounce: float = 0.0, min_interval: int = 60):
+    return SimpleNamespace(
+        webhooks=SimpleNamespace(
+            refresh_on_events=enabled,
+            refresh_debounce_seconds=debounce,
+            refresh_min_interval_seconds=min_interval,
+        )
+    )
+
+
+def _runner(running: bool = False):
+    runner = MagicMock()
+    runner.collectors = [DeviceCollector(), ConfigCollector()]
+    runner.scheduler.expedite.return_value = True
+    runner.scheduler.is_expedited.return_value = False
+    runner.inventory.invalidate_kind = AsyncMock(return_value=True)
+    runner.is_collector_running.return_value = running
+    runner.run_collector_once = AsyncMock()
+    return runner
+
+
+def _repolls(group: EndpointGroupName, result: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "meraki_webhook_repolls_total", {"group": str(group), "result": result}
+    )
+    return value or 0.0
+
+
+async def _drain(tasks: set[asyncio.Task]) -> None:
+    await asyncio.gather(*tuple(tasks))
+
+
+@pytest.mark.asyncio
+async def test_burst_coalesces_into_one_targeted_repoll():
+    """Several device-down alerts become one invalidation pass and one run."""
+    runner = _runner()
+    tasks: set[asyncio.Task] = set()
+    coordinator = WebhookRefreshCoordinator(_settings(), runner, background_tasks=tasks)
+
+    assert coordinator.notify("org_1", "device_down") is True
+    assert coordinator.notify("org_1", "gateway_down") is True
+    assert coordinator.notify("org_2", "device_down") is True
+    await _drain(tasks)
+
+    runner.run_collector_once.assert_awaited_once_with(runner.collectors[0])
+    runner.scheduler.expedite.assert_called_once_with(EndpointGroupName.DEVICE_AVAILABILITY)
+    invalidated = [call.args for call in runner.inventory.invalidate_kind.await_args_list]
+    assert invalidated == [("availability", "org_1"), ("availability", "org_2")]
+    group = EndpointGroupName.DEVICE_AVAILABILITY
+    assert _repolls(group, "scheduled") == 1
+    assert _repolls(group, "coalesced") == 2
+    assert _repolls(group, "triggered") == 1
+    assert (
+        REGISTRY.get_sample_value(
+            "meraki_webhook_inventory_invalidations_total", {"type": "availability"}
+        )
+        == 2
+    )
+
+
+@pytest.mark.asyncio
+async def test_settings_change_invalidates_networks_and_devices():
+    """A settings change drops the org's networks and devices and re-polls config."""
+    runner = _runner()
+    tasks: set[asyncio.Task] = set()
+    coordinator = WebhookRefreshCoordinator(_settings(), runner, background_tasks=tasks)
+
+    coordinator.notify("org_1", "settings_changed")
+    await _drain(tasks)
+
+    invalidated = {call.args for call in runner.inventory.invalidate_kind.await_args_list}
+    assert invalidated == {("devices", "org_1"), ("networks", "org_1")}
+    runner.run_collector_once.assert_awaited_once_with(runner.collectors[1])
+
+
+@pytest.mark.asyncio
+async def test_unrouted_or_disabled_events_do_nothing():
+    """Unrouted alert types, disabled refresh and unowned groups queue nothing."""
+    runner = _runner()
+    runner.collectors = [ConfigCollector()]
+    tasks: set[asyncio.Task] = set()
+    settings = _settings()
+    coordinator = WebhookRefreshCoordinator(settings, runner, background_tasks=tasks)
+
+    assert coordinator.notify("org_1", "motion_detected") is False
+    # The availability groups' owner is not an active collector.
+    assert coordinator.notify("org_1", "device_down") is False
+    settings.webhooks.refresh_on_events = False
+    assert coordinator.notify("org_1", "settings_changed") is False
+    assert not tasks
+
+
+@pytest.mark.asyncio
+async def test_running_collector_defers_to_its_loop():
+    """A mid-run collector is not re-entered; the expedited gate waits for its loop."""
+    runner = _runner(running=True)
+    tasks: set[asyncio.Task] = set()
+    coordinator = WebhookRefreshCoordinator(_settings(), runner, background_tasks=tasks)
+
+    coordinator.notify("org_1", "uplink_status_change")
+    await _drain(tasks)
+
+    runner.scheduler.expedite.assert_called_once_with(EndpointGroupName.MX_UPLINK_STATUS)
+    runner.run_collector_once.assert_not_awaited()
+    assert _repolls(EndpointGroupName.MX_UPLINK_STATUS, "deferred") == 1
+
+
+@pytest.mark.asyncio
+async def test_run_that_leaves_the_gate_closed_is_pending():
+    """A run whose gate held (failure spacing, shedding) is not reported as triggered."""
+    runner = _runner()
+    runner.scheduler.is_expedited.return_value = True
+    tasks: set[asyncio.Task] = set()
+    coordinator = WebhookRefreshCoordinator(_settings(), runner, background_tasks=tasks)
+
+    coordinator.notify("org_1", "cellular_down")
+    await _drain(tasks)
+
+    runner.run_collector_once.assert_awaited_once_with(runner.collectors[0])
+    runner.scheduler.is_expedited.assert_called_once_with(EndpointGroupName.MX_UPLINK_STATUS)
+    assert _repolls(EndpointGroupName.MX_UPLINK_STATUS, "pending") == 1
+    assert _repolls(EndpointGroupName.MX_UPLINK_STATUS, "triggered") == 0
+
+
+@pytest.mark.asyncio
+async def test_repolls_are_rate_limited_per_collector():
+    """A re-poll inside the window is pushed to the end of the window."""
+    runner = _runner()
+    tasks: set[asyncio.Task] = set()
+    coordinator = WebhookRefreshCoordinator(
+        _settings(min_interval=60), runner, background_tasks=tasks
+    )
+    loop = asyncio.get_running_loop()
+
+    coordinator.notify("org_1", "device_down")
+    await _drain(tasks)
+    assert coordinator._delay_for("DeviceCollector", loop) == pytest.approx(60.0, abs=1.0)
+    assert coordinator._delay_for("ConfigCollector", loop) == 0.0
+
+    coordinator.notify("org_1", "device_down")
+    assert len(tasks) == 1
+    for task in tuple(tasks):
+        task.cancel()
+    await asyncio.gather(*tuple(tasks), return_exceptions=True)
+    runner.run_collector_once.assert_awaited_once()
+
+
+def test_notify_without_event_loop_is_skipped():
+    """Outside an event loop (sync callers) the refresh is skipped, not raised."""
+    coordinator = WebhookRefreshCoordinator(_settings(), _runner())
+
+    assert coordinator.notify("org_1", "device_down") is False